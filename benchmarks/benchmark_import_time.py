@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Benchmark de Tempo de Importação - Dataverse SDK
+
+Este benchmark mede o custo de importar o SDK e construir um cliente em
+processos Python novos, o que domina invocações curtas (AWS Lambda, CLI).
+Não precisa de credenciais nem de acesso à rede.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from datetime import datetime
+from typing import Any, Dict, List
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Cenários medidos, cada um em um processo novo
+SCENARIOS = {
+    "import_package": "import dataverse_sdk",
+    "import_exceptions": "from dataverse_sdk.exceptions import DataverseSDKError",
+    "import_sdk": "from dataverse_sdk import DataverseSDK",
+    "construct_sdk": (
+        "from dataverse_sdk import DataverseSDK\n"
+        "DataverseSDK(dataverse_url='https://benchmark.crm.dynamics.com', "
+        "client_id='benchmark', client_secret='benchmark', tenant_id='benchmark')"
+    ),
+    "import_cli": "import cli.main",
+}
+
+# Dependências pesadas que devem ser carregadas apenas quando usadas
+HEAVY_MODULES = ["msal", "urllib3", "dotenv", "pydantic", "httpx", "aiofiles", "rich", "typer"]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+exec(compile({code!r}, "<benchmark>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_probe(code: str) -> Dict[str, Any]:
+    """Executa um cenário em um processo novo e retorna o tempo medido."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(code=code, heavy=HEAVY_MODULES)],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def import_times(code: str) -> List[Dict[str, Any]]:
+    """Lê os módulos importados diretamente por um código com ``-X importtime``."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=ROOT),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        # Nomes de módulos aninhados são indentados
+        if name.startswith("  "):
+            continue
+        modules.append({
+            "module": name.strip(),
+            "self_ms": int(self_us) / 1000,
+            "cumulative_ms": int(cumulative_us) / 1000,
+        })
+    return modules
+
+
+def slowest_imports(code: str, top: int) -> List[Dict[str, Any]]:
+    """Lista os módulos com maior tempo cumulativo, sem os da inicialização do Python."""
+    startup = {module["module"] for module in import_times("pass")}
+    modules = [module for module in import_times(code) if module["module"] not in startup]
+    modules.sort(key=lambda m: m["cumulative_ms"], reverse=True)
+    return modules[:top]
+
+
+def run_benchmark(repeat: int, top: int) -> Dict[str, Any]:
+    """Executa todos os cenários e agrega os tempos."""
+    scenarios = {}
+
+    for name, code in SCENARIOS.items():
+        samples = [run_probe(code) for _ in range(repeat)]
+        times = [sample["seconds"] * 1000 for sample in samples]
+        scenarios[name] = {
+            "median_ms": statistics.median(times),
+            "min_ms": min(times),
+            "max_ms": max(times),
+            "loaded_modules": samples[-1]["loaded"],
+        }
+        print(
+            f"   {name:<20} mediana {scenarios[name]['median_ms']:8.1f} ms"
+            f"   (mín {scenarios[name]['min_ms']:.1f} ms)"
+            f"   carregados: {', '.join(samples[-1]['loaded']) or '-'}"
+        )
+
+    return {
+        "benchmark": "import_time",
+        "timestamp": datetime.now().isoformat(),
+        "python": sys.version.split()[0],
+        "repeat": repeat,
+        "scenarios": scenarios,
+        "slowest_imports": slowest_imports(SCENARIOS["import_sdk"], top),
+    }
+
+
+def main() -> None:
+    """Função principal do benchmark."""
+    parser = argparse.ArgumentParser(description="Mede o tempo de importação do Dataverse SDK")
+    parser.add_argument("--repeat", type=int, default=10, help="Processos por cenário")
+    parser.add_argument("--top", type=int, default=15, help="Módulos mais lentos listados")
+    parser.add_argument("--output", help="Arquivo JSON de resultados")
+    args = parser.parse_args()
+
+    print("⚡ BENCHMARK DE TEMPO DE IMPORTAÇÃO - DATAVERSE SDK")
+    print("=" * 60)
+
+    results = run_benchmark(args.repeat, args.top)
+
+    print(f"\n🐢 Importações mais lentas de 'from dataverse_sdk import DataverseSDK':")
+    for module in results["slowest_imports"]:
+        print(f"   {module['module']:<40} {module['cumulative_ms']:8.1f} ms")
+
+    filename = args.output or os.path.join(
+        os.path.dirname(__file__),
+        f"benchmark_import_time_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+    )
+    with open(filename, 'w') as f:
+        json.dump(results, f, indent=2)
+
+    print(f"\n💾 Resultados salvos em: {filename}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,423 @@
+#!/usr/bin/env python3
+"""
+Benchmark Offline de Overhead do SDK - Dataverse SDK
+
+Este benchmark mede o custo do próprio SDK sem credenciais nem rede: as
+requisições são atendidas em processo por um ``httpx.MockTransport`` que
+simula a Web API do Dataverse. Assim é possível medir, localmente ou no CI:
+
+- Overhead por requisição (SDK versus httpx puro sobre o mesmo transporte)
+- Construção e parsing de payloads ``$batch``
+- Throughput de paginação (``@odata.nextLink``)
+- Custo de despacho de hooks
+- Memória por registro
+
+Os resultados são gravados em JSON; com ``--baseline`` são comparados com uma
+execução anterior e o processo termina com código 1 se alguma métrica piorar
+além da tolerância.
+"""
+
+import argparse
+import asyncio
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List
+
+# Configuração para importar o SDK
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import httpx
+import structlog
+
+from dataverse_sdk import DataverseSDK, __version__
+from dataverse_sdk.batch import BatchPayload
+from dataverse_sdk.hooks import HookContext, HookType
+from dataverse_sdk.utils import Config
+
+
+DATAVERSE_URL = "https://benchmark.crm.dynamics.com"
+API_URL = f"{DATAVERSE_URL}/api/data/v9.2/"
+
+# Métricas em que um valor maior é melhor (as demais são custos)
+HIGHER_IS_BETTER = ("_per_second",)
+
+
+def make_record(index: int) -> Dict[str, Any]:
+    """Gera um registro de conta típico."""
+    return {
+        "@odata.etag": f'W/"{1000 + index}"',
+        "accountid": str(uuid.UUID(int=index)),
+        "name": f"Benchmark Account {index:06d}",
+        "accountnumber": f"BENCH{index:06d}",
+        "emailaddress1": f"benchmark{index}@example.com",
+        "revenue": 100000.0 + index,
+        "numberofemployees": 10 + index % 1000,
+        "statecode": 0,
+        "modifiedon": "2024-01-01T00:00:00Z",
+    }
+
+
+class MockDataverse:
+    """
+    Web API do Dataverse simulada em processo.
+
+    As respostas são pré-serializadas sempre que possível, para que o tempo
+    medido seja o do SDK e não o do servidor simulado.
+    """
+
+    def __init__(self, total_records: int, page_size: int) -> None:
+        self.total_records = total_records
+        self.page_size = page_size
+        self.requests = 0
+        self._record = json.dumps(make_record(1)).encode("utf-8")
+        self._page = json.dumps([make_record(i) for i in range(page_size)]).encode("utf-8")
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        """Atende uma requisição."""
+        self.requests += 1
+        path = request.url.path
+
+        if path.endswith("/$batch"):
+            return self._batch(request)
+        if path.endswith(")"):
+            return httpx.Response(
+                200, content=self._record, headers={"Content-Type": "application/json"}
+            )
+        return self._collection(request)
+
+    def _collection(self, request: httpx.Request) -> httpx.Response:
+        """Serve uma página da coleção, com ``@odata.nextLink`` se houver mais."""
+        offset = int(request.url.params.get("$skiptoken", 0))
+        remaining = self.total_records - offset
+        body = b'{"@odata.context":"' + API_URL.encode() + b'$metadata#accounts","value":'
+        body += self._page if remaining >= self.page_size else json.dumps(
+            [make_record(i) for i in range(max(remaining, 0))]
+        ).encode("utf-8")
+        if remaining > self.page_size:
+            next_link = f"{API_URL}accounts?$skiptoken={offset + self.page_size}"
+            body += b',"@odata.nextLink":"' + next_link.encode("utf-8") + b'"'
+        return httpx.Response(200, content=body + b"}", headers={"Content-Type": "application/json"})
+
+    def _batch(self, request: httpx.Request) -> httpx.Response:
+        """Responde a cada parte de um ``$batch`` com 204 e o ID criado."""
+        count = request.content.count(b"Content-Type: application/http")
+        boundary = "batchresponse_benchmark"
+        parts = []
+        for index in range(count):
+            parts.append(
+                f"--{boundary}\r\n"
+                "Content-Type: application/http\r\n"
+                "Content-Transfer-Encoding: binary\r\n\r\n"
+                "HTTP/1.1 204 No Content\r\n"
+                f"OData-EntityId: {API_URL}accounts({uuid.UUID(int=index)})\r\n\r\n"
+            )
+        parts.append(f"--{boundary}--\r\n")
+        return httpx.Response(
+            200,
+            content="".join(parts).encode("utf-8"),
+            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+        )
+
+
+class StaticTokenAuthenticator:
+    """Autenticador com token fixo (o benchmark não usa o MSAL)."""
+
+    async def get_token(self, *args: Any, **kwargs: Any) -> str:
+        return "benchmark-token"
+
+    async def clear_cache(self) -> None:
+        pass
+
+
+def create_sdk(mock: MockDataverse) -> DataverseSDK:
+    """Cria um SDK cujas requisições são atendidas pelo servidor simulado."""
+    sdk = DataverseSDK(
+        dataverse_url=DATAVERSE_URL,
+        client_id="benchmark",
+        client_secret="benchmark",
+        tenant_id="benchmark",
+        config=Config(transport=httpx.MockTransport(mock.handler), max_retries=0),
+    )
+    sdk.authenticator = sdk.client.authenticator = StaticTokenAuthenticator()
+    return sdk
+
+
+async def timed(operation: Callable[[], Awaitable[Any]], iterations: int, rounds: int) -> float:
+    """Executa uma operação em rodadas e retorna a mediana de segundos por iteração."""
+    samples = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            await operation()
+        samples.append((time.perf_counter() - start) / iterations)
+    return statistics.median(samples)
+
+
+def timed_sync(operation: Callable[[], Any], iterations: int, rounds: int) -> float:
+    """Versão síncrona de ``timed``."""
+    samples = []
+    for _ in range(rounds):
+        gc.collect()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            operation()
+        samples.append((time.perf_counter() - start) / iterations)
+    return statistics.median(samples)
+
+
+async def bench_request_overhead(args: argparse.Namespace) -> Dict[str, Any]:
+    """Overhead por requisição: ``client.get`` versus httpx puro no mesmo transporte."""
+    mock = MockDataverse(args.records, args.page_size)
+    url = f"{API_URL}accounts({uuid.UUID(int=1)})"
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(mock.handler)) as http:
+        async def raw_get() -> None:
+            (await http.get(url, headers={"Authorization": "Bearer benchmark-token"})).json()
+
+        raw = await timed(raw_get, args.requests, args.rounds)
+
+    async with create_sdk(mock) as sdk:
+        endpoint = f"accounts({uuid.UUID(int=1)})"
+        sdk_get = await timed(lambda: sdk.client.get(endpoint), args.requests, args.rounds)
+        sdk_read = await timed(
+            lambda: sdk.read("accounts", str(uuid.UUID(int=1))), args.requests, args.rounds
+        )
+
+    return {
+        "httpx_us": raw * 1e6,
+        "client_get_us": sdk_get * 1e6,
+        "sdk_read_us": sdk_read * 1e6,
+        "overhead_us": (sdk_get - raw) * 1e6,
+    }
+
+
+async def bench_batch(args: argparse.Namespace) -> Dict[str, Any]:
+    """Custo de montar e interpretar ``$batch`` e throughput de ``bulk_create``."""
+    mock = MockDataverse(args.records, args.page_size)
+    records = [make_record(i) for i in range(args.batch_size)]
+    for record in records:
+        del record["@odata.etag"], record["accountid"]
+    requests = [{"method": "POST", "url": "accounts", "body": record} for record in records]
+
+    async with create_sdk(mock) as sdk:
+        processor = sdk.batch_processor
+        build = timed_sync(
+            lambda: BatchPayload("batch_benchmark", [(None, requests)]).to_bytes(),
+            10, args.rounds,
+        )
+
+        response = mock._batch(httpx.Request(
+            "POST", f"{API_URL}$batch",
+            content=BatchPayload("batch_benchmark", [(None, requests)]).to_bytes(),
+        )).text
+        parse = timed_sync(lambda: processor._parse_batch_response(response), 10, args.rounds)
+
+        bulk_records = [dict(records[i % len(records)]) for i in range(args.bulk_records)]
+
+        async def bulk_create() -> None:
+            result = await sdk.bulk_create("accounts", bulk_records, batch_size=args.batch_size)
+            assert result.successful == args.bulk_records, result.errors[:1]
+
+        bulk = await timed(bulk_create, 1, args.rounds)
+
+    return {
+        "operations_per_batch": args.batch_size,
+        "build_us_per_operation": build / args.batch_size * 1e6,
+        "parse_us_per_operation": parse / args.batch_size * 1e6,
+        "bulk_create_records": args.bulk_records,
+        "bulk_create_records_per_second": args.bulk_records / bulk,
+    }
+
+
+async def bench_pagination(args: argparse.Namespace) -> Dict[str, Any]:
+    """Throughput de ``query_pages`` seguindo ``@odata.nextLink``."""
+    mock = MockDataverse(args.records, args.page_size)
+
+    async with create_sdk(mock) as sdk:
+        async def read_all() -> None:
+            count = 0
+            async for page in sdk.query_pages("accounts", page_size=args.page_size):
+                count += len(page)
+            assert count == args.records, count
+
+        seconds = await timed(read_all, 1, args.rounds)
+
+    return {
+        "records": args.records,
+        "page_size": args.page_size,
+        "records_per_second": args.records / seconds,
+        "us_per_page": seconds / -(-args.records // args.page_size) * 1e6,
+    }
+
+
+async def bench_hooks(args: argparse.Namespace) -> Dict[str, Any]:
+    """Custo de despacho de hooks, isolado e dentro de uma requisição."""
+    mock = MockDataverse(args.records, args.page_size)
+    endpoint = f"accounts({uuid.UUID(int=1)})"
+
+    def sync_hook(context: Any) -> None:
+        pass
+
+    async def async_hook(context: Any) -> None:
+        pass
+
+    async with create_sdk(mock) as sdk:
+        manager = sdk.hook_manager
+        baseline = await timed(lambda: sdk.client.get(endpoint), args.requests, args.rounds)
+        empty_dispatch = await timed(
+            lambda: manager.execute_hooks(HookType.BEFORE_REQUEST, HookContext(HookType.BEFORE_REQUEST)),
+            args.requests, args.rounds,
+        )
+
+        for index in range(args.hooks):
+            hook = sync_hook if index % 2 == 0 else async_hook
+            sdk.register_hook(HookType.BEFORE_REQUEST, hook)
+            sdk.register_hook(HookType.AFTER_RESPONSE, hook)
+        dispatch = await timed(
+            lambda: manager.execute_hooks(HookType.BEFORE_REQUEST, HookContext(HookType.BEFORE_REQUEST)),
+            args.requests, args.rounds,
+        )
+        with_hooks = await timed(lambda: sdk.client.get(endpoint), args.requests, args.rounds)
+
+    return {
+        "hooks_per_type": args.hooks,
+        "dispatch_us_without_hooks": empty_dispatch * 1e6,
+        "dispatch_us": dispatch * 1e6,
+        "us_per_hook_call": (dispatch - empty_dispatch) / args.hooks * 1e6,
+        "request_us_without_hooks": baseline * 1e6,
+        "request_us_with_hooks": with_hooks * 1e6,
+    }
+
+
+async def bench_memory(args: argparse.Namespace) -> Dict[str, Any]:
+    """Memória retida e de pico por registro ao materializar uma consulta paginada."""
+    mock = MockDataverse(args.records, args.page_size)
+
+    async with create_sdk(mock) as sdk:
+        # Aquecimento, para não medir caches e imports
+        async for _ in sdk.query_pages("accounts", page_size=args.page_size):
+            break
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            records: List[Dict[str, Any]] = []
+            async for page in sdk.query_pages("accounts", page_size=args.page_size):
+                records.extend(page)
+            current, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "records": len(records),
+        "retained_bytes_per_record": current / len(records),
+        "peak_bytes_per_record": peak / len(records),
+    }
+
+
+BENCHMARKS: Dict[str, Callable[[argparse.Namespace], Awaitable[Dict[str, Any]]]] = {
+    "request_overhead": bench_request_overhead,
+    "batch": bench_batch,
+    "pagination": bench_pagination,
+    "hooks": bench_hooks,
+    "memory": bench_memory,
+}
+
+
+def compare(results: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Lista as métricas que pioraram além da tolerância em relação ao baseline."""
+    regressions = []
+    for name, metrics in results["benchmarks"].items():
+        for metric, value in metrics.items():
+            previous = baseline.get("benchmarks", {}).get(name, {}).get(metric)
+            if not isinstance(previous, (int, float)) or not previous or metric in (
+                "records", "page_size", "operations_per_batch", "bulk_create_records", "hooks_per_type",
+            ):
+                continue
+            if metric.endswith(HIGHER_IS_BETTER):
+                change = previous / value - 1 if value else float("inf")
+            else:
+                change = value / previous - 1
+            print(f"   {name}.{metric:<34} {previous:14.2f} -> {value:14.2f}  ({change:+.1%})")
+            if change > tolerance:
+                regressions.append(f"{name}.{metric}")
+    return regressions
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Any]:
+    """Executa os benchmarks selecionados."""
+    results: Dict[str, Any] = {
+        "benchmark": "offline",
+        "timestamp": datetime.now().isoformat(),
+        "sdk_version": __version__,
+        "python": platform.python_version(),
+        "httpx": httpx.__version__,
+        "platform": platform.platform(),
+        "parameters": {
+            key: value for key, value in vars(args).items()
+            if key not in ("output", "baseline", "only")
+        },
+        "benchmarks": {},
+    }
+
+    for name in args.only or BENCHMARKS:
+        print(f"⏱️  {name}...", file=sys.stderr)
+        results["benchmarks"][name] = await BENCHMARKS[name](args)
+
+    return results
+
+
+def main() -> None:
+    """Função principal do benchmark."""
+    parser = argparse.ArgumentParser(description="Mede o overhead do Dataverse SDK sem rede")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), help="Benchmarks a executar")
+    parser.add_argument("--requests", type=int, default=500, help="Requisições por rodada")
+    parser.add_argument("--rounds", type=int, default=5, help="Rodadas (a mediana é reportada)")
+    parser.add_argument("--records", type=int, default=50000, help="Registros da coleção paginada")
+    parser.add_argument("--page-size", type=int, default=5000, help="Registros por página")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Operações por $batch")
+    parser.add_argument("--bulk-records", type=int, default=10000, help="Registros do bulk_create")
+    parser.add_argument("--hooks", type=int, default=10, help="Hooks registrados por tipo")
+    parser.add_argument("--log-level", default="WARNING", help="Nível de log do SDK durante a medição")
+    parser.add_argument("--output", help="Arquivo JSON de resultados (stdout se omitido)")
+    parser.add_argument("--baseline", help="JSON de uma execução anterior para comparação")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Piora relativa tolerada")
+    args = parser.parse_args()
+
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, args.log_level.upper()))
+    )
+
+    results = asyncio.run(run(args))
+
+    output = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(output + "\n")
+        print(f"💾 Resultados salvos em: {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        print(f"\n📊 Comparação com {args.baseline} (tolerância {args.tolerance:.0%}):", file=sys.stderr)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"❌ Regressões: {', '.join(regressions)}", file=sys.stderr)
+            sys.exit(1)
+        print("✅ Nenhuma regressão", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
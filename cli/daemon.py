@@ -0,0 +1,389 @@
+"""
+Session daemon for the Dataverse SDK CLI.
+
+The daemon keeps a Python process with warm ``DataverseSDK`` instances
+(tokens, HTTP connections, metadata caches) and runs CLI commands sent over
+a local Unix socket, so scripted invocations skip importing the SDK,
+token acquisition and TLS handshakes. It is opt-in: ``dv-cli daemon start``
+starts it and commands are forwarded only while ``DV_CLI_DAEMON=1`` is set,
+falling back to running locally only when the daemon cannot be reached.
+Once a command has been sent it is never run a second time locally. The
+client side only uses the standard library, so forwarding stays cheap.
+
+Requests are handled one at a time, since each one runs in the daemon's
+working directory and environment for the duration of the command.
+"""
+
+import asyncio
+import contextlib
+import io
+import json
+import os
+import shutil
+import socket
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+
+
+# Environment variables forwarded from the client to the daemon
+ENV_PREFIXES = ("DATAVERSE_", "AZURE_")
+
+# Maximum size of a request line
+MAX_REQUEST_BYTES = 1024 * 1024
+
+
+class DaemonUnavailableError(OSError):
+    """The daemon socket could not be connected to."""
+
+
+def default_socket_path() -> Path:
+    """Get the daemon socket path (``DV_CLI_SOCKET`` or ``~/.dataverse/cli.sock``)."""
+    return Path(os.getenv("DV_CLI_SOCKET") or Path.home() / ".dataverse" / "cli.sock")
+
+
+def daemon_enabled() -> bool:
+    """Check whether CLI commands should be forwarded to the daemon."""
+    return os.getenv("DV_CLI_DAEMON", "").lower() in ("true", "1", "yes")
+
+
+class SharedSDK:
+    """
+    SDK handle reused across commands.
+
+    ``async with`` opens the underlying SDK on first use and leaves it open
+    afterwards; every other attribute is the SDK's own.
+    """
+
+    def __init__(self, sdk: Any) -> None:
+        """Wrap a warm SDK."""
+        self._sdk = sdk
+        self._opened = False
+
+    def __getattr__(self, name: str) -> Any:
+        """Delegate to the SDK."""
+        return getattr(self._sdk, name)
+
+    async def __aenter__(self) -> Any:
+        """Open the SDK once."""
+        if not self._opened:
+            await self._sdk.__aenter__()
+            self._opened = True
+        return self._sdk
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Keep the SDK open for the next command."""
+
+    async def close(self) -> None:
+        """Close the SDK."""
+        if self._opened:
+            await self._sdk.__aexit__(None, None, None)
+            self._opened = False
+
+
+class Session:
+    """
+    Warm state of the daemon.
+
+    Holds an event loop running in a background thread and one SDK per set
+    of credentials. The CLI's ``create_sdk`` and ``run_async`` use it while
+    a command runs inside the daemon.
+    """
+
+    def __init__(self) -> None:
+        """Start the session event loop."""
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self.loop.run_forever, name="dv-cli-session", daemon=True)
+        self.thread.start()
+        self.sdks: Dict[Tuple[Optional[str], ...], SharedSDK] = {}
+        self.started_at = time.time()
+        self.requests = 0
+
+    def get_sdk(self, config: Any) -> SharedSDK:
+        """Get the warm SDK for the credentials of a CLI configuration."""
+        from dataverse_sdk import DataverseSDK
+
+        key = (config.dataverse_url, config.client_id, config.client_secret, config.tenant_id)
+        if key not in self.sdks:
+            self.sdks[key] = SharedSDK(DataverseSDK(
+                dataverse_url=config.dataverse_url,
+                client_id=config.client_id,
+                client_secret=config.client_secret,
+                tenant_id=config.tenant_id,
+            ))
+        return self.sdks[key]
+
+    def run(self, coroutine: Any) -> Any:
+        """Run a coroutine on the session loop and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def close(self) -> None:
+        """Close every SDK and stop the loop."""
+        for sdk in self.sdks.values():
+            try:
+                self.run(sdk.close())
+            except Exception:
+                pass
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout=5)
+
+
+def execute(session: Session, request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one CLI command inside the daemon.
+
+    Args:
+        session: Daemon session
+        request: Command line, working directory, environment and terminal
+            settings sent by the client
+
+    Returns:
+        Exit code and captured output of the command
+    """
+    import typer
+    from rich.console import Console
+
+    from . import main as cli
+
+    buffer = io.StringIO()
+    console = Console(
+        file=buffer,
+        force_terminal=request.get("tty", False),
+        width=request.get("width") or 80,
+    )
+    saved_console, saved_cwd, saved_env = cli.console, os.getcwd(), dict(os.environ)
+    saved_config = cli.cli_config
+
+    cli.console = console
+    # Credentials loaded by an earlier request must not leak into this one
+    cli.cli_config = cli.CLIConfig()
+    cli._session = session
+    try:
+        os.chdir(request.get("cwd") or saved_cwd)
+        for name in [n for n in os.environ if n.startswith(ENV_PREFIXES)]:
+            del os.environ[name]
+        os.environ.update(request.get("env") or {})
+
+        try:
+            # Help and usage messages are written to stdout/stderr directly
+            with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+                exit_code = cli.app(
+                    args=request["argv"], prog_name="dv-cli", standalone_mode=False
+                )
+            exit_code = exit_code if isinstance(exit_code, int) else 0
+        except typer.Exit as e:
+            exit_code = e.exit_code
+        except (typer.Abort, EOFError):
+            console.print("[red]Aborted (interactive prompts are not available through the daemon)[/red]")
+            exit_code = 1
+        except Exception as e:
+            # Usage errors carry their own message and exit code
+            message = e.format_message() if hasattr(e, "format_message") else str(e)
+            console.print(f"[red]Error: {message}[/red]")
+            exit_code = getattr(e, "exit_code", 1)
+    finally:
+        cli.console = saved_console
+        cli.cli_config = saved_config
+        cli._session = None
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+
+    session.requests += 1
+    return {"exit_code": exit_code, "output": buffer.getvalue()}
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    """Handles one client connection (one request line, one response line)."""
+
+    def handle(self) -> None:
+        """Read a request and write its response."""
+        line = self.rfile.readline(MAX_REQUEST_BYTES)
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError:
+            response = {"exit_code": 2, "output": "Invalid daemon request\n"}
+        else:
+            response = self.server.dispatch(request)
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class DaemonServer(socketserver.UnixStreamServer):
+    """Unix socket server of the CLI session daemon."""
+
+    def __init__(self, socket_path: Path, idle_timeout: float = 3600.0) -> None:
+        """
+        Bind the daemon socket.
+
+        Args:
+            socket_path: Path of the Unix socket (only the owner can connect)
+            idle_timeout: Seconds without requests before the daemon exits
+        """
+        if not socket_path.parent.exists():
+            socket_path.parent.mkdir(mode=0o700, parents=True)
+        if socket_path.exists():
+            socket_path.unlink()
+        super().__init__(str(socket_path), _Handler)
+        os.chmod(socket_path, 0o600)
+        self.socket_path = socket_path
+        self.timeout = idle_timeout
+        self.session = Session()
+        self.running = True
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Answer a control request or run a command."""
+        command = request.get("command", "run")
+        if command == "ping":
+            return {
+                "exit_code": 0,
+                "pid": os.getpid(),
+                "uptime": time.time() - self.session.started_at,
+                "requests": self.session.requests,
+                "sessions": len(self.session.sdks),
+            }
+        if command == "shutdown":
+            self.running = False
+            return {"exit_code": 0, "output": "Daemon stopped\n"}
+        return execute(self.session, request)
+
+    def handle_timeout(self) -> None:
+        """Exit after the idle timeout."""
+        self.running = False
+
+    def serve(self) -> None:
+        """Handle requests until shutdown or idle timeout."""
+        try:
+            while self.running:
+                self.handle_request()
+        finally:
+            self.session.close()
+            self.server_close()
+            if self.socket_path.exists():
+                self.socket_path.unlink()
+
+
+def send(request: Dict[str, Any], socket_path: Optional[Path] = None, timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Send a request to the daemon.
+
+    Args:
+        request: Request to send
+        socket_path: Daemon socket (default path if None)
+        timeout: Connection timeout in seconds (None waits for the command)
+
+    Returns:
+        Response of the daemon
+
+    Raises:
+        DaemonUnavailableError: If the daemon is not reachable
+        OSError: If the connection fails after the request was sent
+        ValueError: If the response is empty or malformed
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        try:
+            client.connect(str(socket_path or default_socket_path()))
+        except OSError as e:
+            raise DaemonUnavailableError(*e.args) from e
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        response = b""
+        while not response.endswith(b"\n"):
+            chunk = client.recv(65536)
+            if not chunk:
+                break
+            response += chunk
+    if not response:
+        raise ValueError("The daemon closed the connection without a response")
+    return json.loads(response)
+
+
+def forward(argv: List[str], socket_path: Optional[Path] = None) -> Optional[int]:
+    """
+    Run a command through the daemon.
+
+    Args:
+        argv: Command line arguments (without the program name)
+        socket_path: Daemon socket (default path if None)
+
+    Returns:
+        Exit code of the command, or None if the daemon is not reachable
+        (the command then has not run and may be run locally)
+    """
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "env": {k: v for k, v in os.environ.items() if k.startswith(ENV_PREFIXES)},
+        "tty": sys.stdout.isatty(),
+        "width": shutil.get_terminal_size().columns,
+    }
+    try:
+        response = send(request, socket_path)
+    except DaemonUnavailableError:
+        return None
+    except (OSError, ValueError) as e:
+        # The command may already have run, so it must not be retried locally
+        sys.stderr.write(f"Error: the CLI daemon did not complete the command: {e}\n")
+        return 1
+    sys.stdout.write(response.get("output", ""))
+    sys.stdout.flush()
+    return response.get("exit_code", 1)
+
+
+def start(socket_path: Optional[Path] = None, idle_timeout: float = 3600.0, wait: float = 10.0) -> int:
+    """
+    Start the daemon in a background process.
+
+    Args:
+        socket_path: Daemon socket (default path if None)
+        idle_timeout: Seconds without requests before the daemon exits
+        wait: Seconds to wait for the daemon to accept connections
+
+    Returns:
+        PID of the daemon process
+    """
+    socket_path = socket_path or default_socket_path()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "cli.daemon", str(socket_path), str(idle_timeout)],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(
+            filter(None, [str(Path(__file__).parent.parent), os.getenv("PYTHONPATH")])
+        )),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+    deadline = time.monotonic() + wait
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Daemon exited with code {process.returncode}")
+        try:
+            send({"command": "ping"}, socket_path, timeout=1.0)
+            return process.pid
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError("Daemon did not start in time")
+
+
+def run_cli() -> None:
+    """CLI entry point: forward to the daemon when enabled, else run locally."""
+    argv = sys.argv[1:]
+    if daemon_enabled() and argv[:1] != ["daemon"]:
+        exit_code = forward(argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    from .main import main
+
+    main()
+
+
+if __name__ == "__main__":
+    DaemonServer(Path(sys.argv[1]), float(sys.argv[2]) if len(sys.argv) > 2 else 3600.0).serve()
@@ -11,13 +11,15 @@ import asyncio
 import json
 import os
 import sys
+import time
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 import typer
+from dotenv import load_dotenv
 from rich.console import Console
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn, TimeElapsedColumn
 from rich.prompt import Prompt, Confirm
 from rich import print as rprint
 
@@ -26,6 +28,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from dataverse_sdk import DataverseSDK
 from dataverse_sdk.exceptions import DataverseSDKError
+from dataverse_sdk.importer import RecordReader, StreamingImporter
 from dataverse_sdk.models import QueryOptions, FetchXMLQuery
 
 
@@ -89,6 +92,7 @@ def load_config(config_file: Optional[Path] = None) -> None:
                 continue
     
     # Override with environment variables (they take precedence)
+    load_dotenv()
     cli_config.dataverse_url = os.getenv("DATAVERSE_URL", cli_config.dataverse_url)
     cli_config.client_id = os.getenv("AZURE_CLIENT_ID", cli_config.client_id)
     cli_config.client_secret = os.getenv("AZURE_CLIENT_SECRET", cli_config.client_secret)
@@ -112,8 +116,15 @@ def validate_config() -> None:
         raise typer.Exit(1)
 
 
+# Set while a command runs inside the session daemon (see cli/daemon.py)
+_session: Optional[Any] = None
+
+
 def create_sdk() -> DataverseSDK:
     """Create and return configured SDK instance."""
+    if _session is not None:
+        return _session.get_sdk(cli_config)
+    
     return DataverseSDK(
         dataverse_url=cli_config.dataverse_url,
         client_id=cli_config.client_id,
@@ -122,6 +133,13 @@ def create_sdk() -> DataverseSDK:
     )
 
 
+def run_async(coroutine: Any) -> Any:
+    """Run a command coroutine (on the daemon's event loop when inside the daemon)."""
+    if _session is not None:
+        return _session.run(coroutine)
+    return asyncio.run(coroutine)
+
+
 def format_output(data: Any, format_type: str = "table") -> None:
     """Format and display output data."""
     if format_type == "json":
@@ -304,7 +322,7 @@ def config_test() -> None:
             console.print(f"[red]✗ Connection failed: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(test_connection())
+    run_async(test_connection())
 
 
 # Entity commands
@@ -355,7 +373,7 @@ def entity_list(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(list_entities())
+    run_async(list_entities())
 
 
 @entity_app.command("get")
@@ -382,7 +400,7 @@ def entity_get(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(get_entity())
+    run_async(get_entity())
 
 
 @entity_app.command("create")
@@ -427,7 +445,7 @@ def entity_create(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(create_entity())
+    run_async(create_entity())
 
 
 @entity_app.command("update")
@@ -473,7 +491,7 @@ def entity_update(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(update_entity())
+    run_async(update_entity())
 
 
 @entity_app.command("delete")
@@ -501,7 +519,7 @@ def entity_delete(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(delete_entity())
+    run_async(delete_entity())
 
 
 # Bulk operations commands
@@ -509,60 +527,160 @@ bulk_app = typer.Typer(name="bulk", help="Bulk operations")
 app.add_typer(bulk_app)
 
 
-@bulk_app.command("create")
-def bulk_create(
-    entity_type: str = typer.Argument(..., help="Entity logical name"),
-    data_file: Path = typer.Option(..., "--file", "-f", help="JSON file with entities data"),
-    batch_size: Optional[int] = typer.Option(None, "--batch-size", help="Batch size"),
-    parallel: bool = typer.Option(True, "--parallel/--sequential", help="Execute batches in parallel"),
+def run_bulk_import(
+    operation: str,
+    entity_type: str,
+    data_file: Path,
+    file_format: Optional[str],
+    batch_size: Optional[int],
+    chunk_size: int,
+    parallel: bool,
+    dead_letter: Optional[Path],
+    key_fields: Optional[List[str]] = None,
+    validate: bool = False,
 ) -> None:
-    """Bulk create entities from JSON file."""
+    """Stream a data file into a bulk operation with a live progress bar."""
     validate_config()
     
     if not data_file.exists():
         console.print(f"[red]File not found: {data_file}[/red]")
         raise typer.Exit(1)
     
-    with open(data_file) as f:
-        entities_data = json.load(f)
-    
-    if not isinstance(entities_data, list):
-        console.print("[red]Data file must contain a JSON array of entities[/red]")
-        raise typer.Exit(1)
-    
-    async def bulk_create_entities():
+    async def bulk_import():
         try:
+            reader = RecordReader(data_file, format=file_format, mark_invalid=True)
             sdk = create_sdk()
             async with sdk:
                 with Progress(
                     SpinnerColumn(),
                     TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("{task.fields[records]} records"),
+                    TextColumn("{task.fields[rate]:.0f} rec/s"),
+                    TextColumn("[red]{task.fields[failed]} failed[/red]"),
+                    TimeElapsedColumn(),
                     console=console,
                 ) as progress:
-                    task = progress.add_task(f"Creating {len(entities_data)} entities...", total=None)
-                    
-                    result = await sdk.bulk_create(
-                        entity_type, entities_data, batch_size, parallel
+                    task = progress.add_task(
+                        f"Bulk {operation}...", total=reader.size or None, records=0, rate=0.0, failed=0
                     )
+                    started = time.monotonic()
                     
-                    progress.update(task, completed=True)
+                    def report(records: int, failed: int, position: int) -> None:
+                        elapsed = max(time.monotonic() - started, 1e-6)
+                        progress.update(
+                            task,
+                            completed=position,
+                            records=records,
+                            rate=records / elapsed,
+                            failed=failed,
+                        )
+                    
+                    importer = StreamingImporter(
+                        sdk,
+                        chunk_size=chunk_size,
+                        batch_size=batch_size,
+                        parallel=parallel,
+                        dead_letter=dead_letter,
+                        progress=report,
+                    )
+                    result = await importer.run(
+                        operation, entity_type, reader, key_fields=key_fields, validate=validate
+                    )
                 
-                console.print(f"[green]Bulk create completed[/green]")
+                console.print(f"[green]Bulk {operation} completed[/green]")
                 console.print(f"Total processed: {result.total_processed}")
                 console.print(f"Successful: {result.successful}")
                 console.print(f"Failed: {result.failed}")
                 console.print(f"Success rate: {result.success_rate:.1f}%")
                 
-                if result.has_errors and cli_config.verbose:
-                    console.print("\n[red]Errors:[/red]")
-                    for error in result.errors[:5]:  # Show first 5 errors
-                        console.print(f"  - {error}")
+                if result.has_errors and dead_letter:
+                    console.print(f"[yellow]Failed rows written to {dead_letter}[/yellow]")
         
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(bulk_create_entities())
+    run_async(bulk_import())
+
+
+FILE_HELP = "NDJSON, JSON array or CSV file (optionally .gz/.bz2)"
+
+
+@bulk_app.command("create")
+def bulk_create(
+    entity_type: str = typer.Argument(..., help="Entity set name"),
+    data_file: Path = typer.Option(..., "--file", "-f", help=FILE_HELP),
+    file_format: Optional[str] = typer.Option(None, "--format", help="ndjson, json or csv (default: from file name)"),
+    batch_size: Optional[int] = typer.Option(None, "--batch-size", help="Batch size"),
+    chunk_size: int = typer.Option(5000, "--chunk-size", help="Records read per bulk call"),
+    parallel: bool = typer.Option(True, "--parallel/--sequential", help="Execute batches in parallel"),
+    dead_letter: Optional[Path] = typer.Option(None, "--dead-letter", help="NDJSON file receiving failed rows"),
+    validate: bool = typer.Option(False, "--validate", help="Validate and convert rows with entity metadata"),
+) -> None:
+    """Bulk create entities streamed from a file."""
+    run_bulk_import(
+        "create", entity_type, data_file, file_format, batch_size, chunk_size, parallel,
+        dead_letter, validate=validate,
+    )
+
+
+@bulk_app.command("update")
+def bulk_update(
+    entity_type: str = typer.Argument(..., help="Entity set name"),
+    data_file: Path = typer.Option(..., "--file", "-f", help=f"{FILE_HELP}; rows need an id column"),
+    file_format: Optional[str] = typer.Option(None, "--format", help="ndjson, json or csv (default: from file name)"),
+    batch_size: Optional[int] = typer.Option(None, "--batch-size", help="Batch size"),
+    chunk_size: int = typer.Option(5000, "--chunk-size", help="Records read per bulk call"),
+    parallel: bool = typer.Option(True, "--parallel/--sequential", help="Execute batches in parallel"),
+    dead_letter: Optional[Path] = typer.Option(None, "--dead-letter", help="NDJSON file receiving failed rows"),
+    validate: bool = typer.Option(False, "--validate", help="Validate and convert rows with entity metadata"),
+) -> None:
+    """Bulk update entities streamed from a file."""
+    run_bulk_import(
+        "update", entity_type, data_file, file_format, batch_size, chunk_size, parallel,
+        dead_letter, validate=validate,
+    )
+
+
+@bulk_app.command("upsert")
+def bulk_upsert(
+    entity_type: str = typer.Argument(..., help="Entity set name"),
+    data_file: Path = typer.Option(..., "--file", "-f", help=FILE_HELP),
+    key: str = typer.Option(..., "--key", "-k", help="Alternate key fields (comma-separated)"),
+    file_format: Optional[str] = typer.Option(None, "--format", help="ndjson, json or csv (default: from file name)"),
+    batch_size: Optional[int] = typer.Option(None, "--batch-size", help="Batch size"),
+    chunk_size: int = typer.Option(5000, "--chunk-size", help="Records read per bulk call"),
+    parallel: bool = typer.Option(True, "--parallel/--sequential", help="Execute batches in parallel"),
+    dead_letter: Optional[Path] = typer.Option(None, "--dead-letter", help="NDJSON file receiving failed rows"),
+) -> None:
+    """Bulk upsert entities streamed from a file by alternate key."""
+    run_bulk_import(
+        "upsert", entity_type, data_file, file_format, batch_size, chunk_size, parallel,
+        dead_letter, key_fields=[k.strip() for k in key.split(",")],
+    )
+
+
+@bulk_app.command("delete")
+def bulk_delete(
+    entity_type: str = typer.Argument(..., help="Entity set name"),
+    data_file: Path = typer.Option(..., "--file", "-f", help=f"{FILE_HELP}; rows need an id column"),
+    file_format: Optional[str] = typer.Option(None, "--format", help="ndjson, json or csv (default: from file name)"),
+    batch_size: Optional[int] = typer.Option(None, "--batch-size", help="Batch size"),
+    chunk_size: int = typer.Option(5000, "--chunk-size", help="Records read per bulk call"),
+    parallel: bool = typer.Option(True, "--parallel/--sequential", help="Execute batches in parallel"),
+    dead_letter: Optional[Path] = typer.Option(None, "--dead-letter", help="NDJSON file receiving failed rows"),
+    confirm: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation"),
+) -> None:
+    """Bulk delete the entities listed in a file."""
+    if not confirm:
+        if not Confirm.ask(f"Are you sure you want to delete the {entity_type} listed in {data_file}?"):
+            console.print("Operation cancelled")
+            return
+    
+    run_bulk_import(
+        "delete", entity_type, data_file, file_format, batch_size, chunk_size, parallel, dead_letter,
+    )
 
 
 # FetchXML commands
@@ -600,7 +718,7 @@ def fetchxml_execute(
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(execute_fetchxml())
+    run_async(execute_fetchxml())
 
 
 # Export/Import commands
@@ -610,12 +728,20 @@ app.add_typer(data_app)
 
 @data_app.command("export")
 def data_export(
-    entity_type: str = typer.Argument(..., help="Entity logical name"),
-    output_file: Path = typer.Option(..., "--output", "-o", help="Output JSON file"),
+    entity_type: str = typer.Argument(..., help="Entity set name"),
+    output_file: Path = typer.Option(
+        ..., "--output", "-o", help="Output file (.ndjson, .json, .csv or .parquet, optionally .gz/.bz2)"
+    ),
     select: Optional[str] = typer.Option(None, "--select", help="Fields to select (comma-separated)"),
     filter: Optional[str] = typer.Option(None, "--filter", help="OData filter expression"),
+    format: Optional[str] = typer.Option(None, "--format", help="ndjson, json, csv or parquet (default: from file name)"),
+    compression: Optional[str] = typer.Option(
+        None, "--compression", help="gzip or bz2 (Parquet: snappy, zstd, ...)"
+    ),
+    resume: bool = typer.Option(False, "--resume", help="Continue an interrupted export"),
+    page_size: int = typer.Option(5000, "--page-size", help="Records per page"),
 ) -> None:
-    """Export entity data to JSON file."""
+    """Stream entity data to an NDJSON, JSON, CSV or Parquet file."""
     validate_config()
     
     async def export_data():
@@ -636,20 +762,100 @@ def data_export(
                 ) as progress:
                     task = progress.add_task("Exporting data...", total=None)
                     
-                    entities = await sdk.query_all(entity_type, options)
+                    result = await sdk.export(
+                        entity_type,
+                        output_file,
+                        options=options,
+                        format=format,
+                        compression=compression,
+                        resume=resume,
+                        page_size=page_size,
+                        progress=lambda count: progress.update(
+                            task, description=f"Exported {count} records..."
+                        ),
+                    )
                     
                     progress.update(task, completed=True)
                 
-                with open(output_file, "w") as f:
-                    json.dump(entities, f, indent=2, default=str)
-                
-                console.print(f"[green]Exported {len(entities)} records to {output_file}[/green]")
+                console.print(
+                    f"[green]Exported {result.records} records to {output_file} "
+                    f"({result.format}, {result.bytes_written} bytes)[/green]"
+                )
         
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
             raise typer.Exit(1)
     
-    asyncio.run(export_data())
+    run_async(export_data())
+
+
+# Session daemon commands
+daemon_app = typer.Typer(name="daemon", help="Session daemon keeping tokens and connections warm")
+app.add_typer(daemon_app)
+
+
+@daemon_app.command("start")
+def daemon_start(
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help="Unix socket path"),
+    idle_timeout: float = typer.Option(3600.0, "--idle-timeout", help="Seconds without requests before exiting"),
+    foreground: bool = typer.Option(False, "--foreground", help="Run in this process"),
+) -> None:
+    """Start the session daemon (commands use it while DV_CLI_DAEMON=1)."""
+    from cli import daemon
+    
+    socket_path = socket_path or daemon.default_socket_path()
+    try:
+        daemon.send({"command": "ping"}, socket_path, timeout=1.0)
+        console.print(f"[yellow]Daemon already running on {socket_path}[/yellow]")
+        return
+    except OSError:
+        pass
+    
+    if foreground:
+        console.print(f"[green]Daemon listening on {socket_path}[/green]")
+        daemon.DaemonServer(socket_path, idle_timeout).serve()
+        return
+    
+    try:
+        pid = daemon.start(socket_path, idle_timeout)
+    except RuntimeError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+    console.print(f"[green]Daemon started (pid {pid}) on {socket_path}[/green]")
+    console.print("Set DV_CLI_DAEMON=1 to run commands through it.")
+
+
+@daemon_app.command("stop")
+def daemon_stop(
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help="Unix socket path"),
+) -> None:
+    """Stop the session daemon."""
+    from cli import daemon
+    
+    try:
+        daemon.send({"command": "shutdown"}, socket_path, timeout=5.0)
+    except OSError:
+        console.print("[yellow]Daemon is not running[/yellow]")
+        return
+    console.print("[green]Daemon stopped[/green]")
+
+
+@daemon_app.command("status")
+def daemon_status(
+    socket_path: Optional[Path] = typer.Option(None, "--socket", help="Unix socket path"),
+) -> None:
+    """Show whether the session daemon is running."""
+    from cli import daemon
+    
+    try:
+        status = daemon.send({"command": "ping"}, socket_path, timeout=5.0)
+    except OSError:
+        console.print("[yellow]Daemon is not running[/yellow]")
+        raise typer.Exit(1)
+    console.print(f"[green]Daemon running[/green] (pid {status['pid']})")
+    console.print(f"Uptime: {status['uptime']:.0f}s")
+    console.print(f"Requests served: {status['requests']}")
+    console.print(f"Warm SDK sessions: {status['sessions']}")
 
 
 def main():
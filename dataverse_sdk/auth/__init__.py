@@ -7,18 +7,39 @@ with support for various authentication flows and token management.
 
 import asyncio
 import time
-from typing import Dict, Optional, Any
+from typing import TYPE_CHECKING, Dict, Optional, Any
 from urllib.parse import urlparse
 
-import msal
 import structlog
-from msal import ConfidentialClientApplication, PublicClientApplication
 
 from ..exceptions import AuthenticationError, ConfigurationError
 
+if TYPE_CHECKING:
+    from msal import ConfidentialClientApplication, PublicClientApplication
+
 
 logger = structlog.get_logger(__name__)
 
+# MSAL names imported on first token use (MSAL is slow to import)
+_MSAL_NAMES = ("ConfidentialClientApplication", "PublicClientApplication")
+
+
+def _import_msal() -> None:
+    """Import the MSAL application classes into this module."""
+    import msal
+    
+    for name in _MSAL_NAMES:
+        # Names already set (e.g. patched in tests) are kept
+        globals().setdefault(name, getattr(msal, name))
+
+
+def __getattr__(name: str) -> Any:
+    """Import MSAL when one of its classes is accessed."""
+    if name in _MSAL_NAMES:
+        _import_msal()
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class TokenCache:
     """Thread-safe token cache for storing and retrieving access tokens."""
@@ -137,7 +158,7 @@ class DataverseAuthenticator:
         self.scope = scope
         
         # Initialize MSAL application
-        self._app: Optional[ConfidentialClientApplication | PublicClientApplication] = None
+        self._app: Optional["ConfidentialClientApplication | PublicClientApplication"] = None
         self._token_cache = TokenCache()
         
         logger.info(
@@ -149,11 +170,12 @@ class DataverseAuthenticator:
             scope=scope,
         )
     
-    def _get_msal_app(self) -> ConfidentialClientApplication | PublicClientApplication:
+    def _get_msal_app(self) -> "ConfidentialClientApplication | PublicClientApplication":
         """Get or create MSAL application instance."""
         if self._app is None:
             # Configurar SSL e proxy ANTES de criar o app MSAL
             self._configure_ssl_and_proxy_environment()
+            _import_msal()
             
             if self.client_secret:
                 # Confidential client (with secret)
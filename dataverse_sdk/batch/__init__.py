@@ -6,21 +6,179 @@ parallel execution, and comprehensive error handling.
 """
 
 import asyncio
+import json
+import re
 import uuid
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from functools import lru_cache
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote, urljoin
 
 import structlog
+from tenacity import RetryError
 
 from ..client import AsyncDataverseClient
-from ..exceptions import BatchOperationError, ValidationError
+from ..exceptions import (
+    APIError,
+    BatchOperationError,
+    ConnectionError,
+    MetadataError,
+    RateLimitError,
+    TimeoutError,
+    ValidationError,
+)
 from ..hooks import HookContext, HookType
-from ..models import BatchRequest, BatchResponse, BulkOperationResult
-from ..utils import chunk_list
+from ..journal import FAILED, IN_FLIGHT, SUCCEEDED, TRANSIENT, BulkJournal
+from ..models import (
+    BatchRequest,
+    BatchResponse,
+    BulkOperationResult,
+    BulkUpsertResult,
+    RecordGraph,
+    UpsertResult,
+)
+from ..utils import chunk_list, format_alternate_key, generate_sequential_guid, to_json
 
 
 logger = structlog.get_logger(__name__)
 
+# Dataverse rejects request URLs longer than 32 KB
+_MAX_URL_LENGTH = 32768
+# Maximum number of records returned in a single page
+_MAX_PAGE_SIZE = 5000
+
+_BOUNDARY_PATTERN = re.compile(r"boundary=([^\s;\"]+)")
+_ENTITY_ID_PATTERN = re.compile(r"\(([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})\)$")
+
+
+_PART_HEADERS = b"Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n"
+
+
+@lru_cache(maxsize=256)
+def _request_template(
+    method: str,
+    headers: Tuple[Tuple[str, str], ...],
+    has_body: bool,
+) -> Tuple[bytes, bytes]:
+    """
+    Compile the bytes surrounding the URL of a request part.
+    
+    Requests of the same kind (e.g. every create of an entity set) share
+    their method and headers, so the encoded request line prefix and header
+    block are computed once and reused for every part.
+    
+    Returns:
+        Bytes before and after the request URL
+    """
+    suffix = [" HTTP/1.1\r\n"]
+    suffix.extend(f"{name}: {value}\r\n" for name, value in headers)
+    if has_body and not any(name == "Content-Type" for name, _ in headers):
+        suffix.append("Content-Type: application/json\r\n")
+    suffix.append("\r\n")
+    return f"{method} ".encode("utf-8"), "".join(suffix).encode("utf-8")
+
+
+class BatchPayload:
+    """
+    Multipart ``$batch`` request body encoded one part at a time.
+    
+    The payload is passed as streaming request content: each request part is
+    serialized straight to bytes when the HTTP client reads it, so building a
+    batch never holds more than one encoded part in memory. Iterating again
+    re-encodes the payload, which lets the client resend it on retries.
+    """
+    
+    def __init__(
+        self,
+        batch_boundary: str,
+        groups: List[Tuple[Optional[str], List[Dict[str, Any]]]],
+    ) -> None:
+        """
+        Initialize the payload.
+        
+        Args:
+            batch_boundary: Batch boundary identifier
+            groups: (changeset boundary, requests) pairs; requests of groups
+                without a changeset boundary are top-level batch parts
+        """
+        self.batch_boundary = batch_boundary
+        self.groups = groups
+    
+    @staticmethod
+    def encode_request(request: Dict[str, Any], delimiter: bytes) -> bytes:
+        """
+        Encode a single request as a MIME part.
+        
+        Args:
+            request: HTTP request (method, url, headers, body, content_id)
+            delimiter: Boundary delimiter line preceding the part
+            
+        Returns:
+            Encoded part
+        """
+        body = request.get("body")
+        prefix, suffix = _request_template(
+            request["method"],
+            tuple(request.get("headers", {}).items()),
+            bool(body),
+        )
+        
+        parts = [delimiter, _PART_HEADERS]
+        if request.get("content_id") is not None:
+            parts.append(f"Content-ID: {request['content_id']}\r\n".encode("utf-8"))
+        parts.extend([b"\r\n", prefix, request["url"].encode("utf-8"), suffix])
+        if body:
+            parts.append(to_json(body).encode("utf-8"))
+            parts.append(b"\r\n")
+        parts.append(b"\r\n")
+        
+        return b"".join(parts)
+    
+    def iter_parts(self) -> Iterator[bytes]:
+        """
+        Encode the payload part by part.
+        
+        This is deliberately not ``__iter__``: httpx treats sync iterables as
+        sync request content, which an ``AsyncClient`` refuses to send.
+        """
+        batch_delimiter = f"--{self.batch_boundary}\r\n".encode("utf-8")
+        
+        for changeset_boundary, requests in self.groups:
+            if changeset_boundary is None:
+                for request in requests:
+                    yield self.encode_request(request, batch_delimiter)
+                continue
+            
+            yield batch_delimiter + (
+                f"Content-Type: multipart/mixed; boundary={changeset_boundary}\r\n\r\n"
+            ).encode("utf-8")
+            changeset_delimiter = f"--{changeset_boundary}\r\n".encode("utf-8")
+            for request in requests:
+                yield self.encode_request(request, changeset_delimiter)
+            yield f"--{changeset_boundary}--\r\n\r\n".encode("utf-8")
+        
+        yield f"--{self.batch_boundary}--".encode("utf-8")
+    
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Stream the payload to an async HTTP client."""
+        for chunk in self.iter_parts():
+            yield chunk
+    
+    def to_bytes(self) -> bytes:
+        """Encode the whole payload at once."""
+        return b"".join(self.iter_parts())
+
 
 class BatchProcessor:
     """
@@ -40,6 +198,11 @@ class BatchProcessor:
         default_batch_size: int = 100,
         max_batch_size: int = 1000,
         max_parallel_batches: int = 5,
+        max_retries: int = 3,
+        backoff_factor: float = 1.0,
+        retry_status_codes: Optional[List[int]] = None,
+        retry_budget: Optional[int] = None,
+        continue_on_error: bool = True,
     ) -> None:
         """
         Initialize batch processor.
@@ -49,17 +212,35 @@ class BatchProcessor:
             default_batch_size: Default batch size for operations
             max_batch_size: Maximum allowed batch size
             max_parallel_batches: Maximum number of parallel batch executions
+            max_retries: Maximum number of re-batching rounds for failed operations
+            backoff_factor: Backoff multiplier between retry rounds
+            retry_status_codes: Status codes considered transient
+            retry_budget: Maximum number of operation retries per bulk operation
+                (unlimited if not specified)
+            continue_on_error: Whether non-transactional batches should keep
+                executing after an individual operation fails
         """
         self.client = client
         self.default_batch_size = default_batch_size
         self.max_batch_size = max_batch_size
         self.max_parallel_batches = max_parallel_batches
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.retry_status_codes = retry_status_codes or [429, 500, 502, 503, 504]
+        self.retry_budget = retry_budget
+        self.continue_on_error = continue_on_error
+        self._primary_id_attributes: Dict[str, str] = {}
+        
+        # Shared metadata cache (set by DataverseSDK), used for key lookups
+        self.metadata: Optional[Any] = None
         
         logger.debug(
             "Batch processor initialized",
             default_batch_size=default_batch_size,
             max_batch_size=max_batch_size,
             max_parallel_batches=max_parallel_batches,
+            max_retries=max_retries,
+            retry_budget=retry_budget,
         )
     
     def _create_batch_boundary(self) -> str:
@@ -75,7 +256,7 @@ class BatchProcessor:
         requests: List[Dict[str, Any]],
         batch_boundary: str,
         changeset_boundary: Optional[str] = None,
-    ) -> str:
+    ) -> "BatchPayload":
         """
         Build the batch request payload.
         
@@ -85,69 +266,41 @@ class BatchProcessor:
             changeset_boundary: Changeset boundary identifier for transactional operations
             
         Returns:
-            Batch payload string
-        """
-        lines = [f"--{batch_boundary}"]
-        
-        if changeset_boundary:
-            # Transactional changeset
-            lines.extend([
-                "Content-Type: multipart/mixed; boundary=" + changeset_boundary,
-                "",
-                f"--{changeset_boundary}",
-            ])
-        
-        for i, request in enumerate(requests):
-            if changeset_boundary and i > 0:
-                lines.append(f"--{changeset_boundary}")
-            elif not changeset_boundary and i > 0:
-                lines.append(f"--{batch_boundary}")
-            
-            # Request headers
-            lines.extend([
-                "Content-Type: application/http",
-                "Content-Transfer-Encoding: binary",
-                "",
-            ])
-            
-            # HTTP request line
-            method = request["method"]
-            url = request["url"]
-            lines.append(f"{method} {url} HTTP/1.1")
-            
-            # Request headers
-            headers = request.get("headers", {})
-            for header_name, header_value in headers.items():
-                lines.append(f"{header_name}: {header_value}")
-            
-            # Content-Type for requests with body
-            if request.get("body") and "Content-Type" not in headers:
-                lines.append("Content-Type: application/json")
-            
-            lines.append("")  # Empty line before body
-            
-            # Request body
-            if request.get("body"):
-                import json
-                lines.append(json.dumps(request["body"]))
-            
-            lines.append("")  # Empty line after request
-        
-        if changeset_boundary:
-            lines.extend([
-                f"--{changeset_boundary}--",
-                "",
-                f"--{batch_boundary}--",
-            ])
-        else:
-            lines.append(f"--{batch_boundary}--")
+            Streaming batch payload
+        """
+        return BatchPayload(batch_boundary, [(changeset_boundary, requests)])
+    
+    def _build_changesets_payload(
+        self,
+        changesets: List[List[Dict[str, Any]]],
+        batch_boundary: str,
+        changeset_boundaries: Optional[List[str]] = None,
+    ) -> "BatchPayload":
+        """
+        Build a batch payload made of one or more transactional changesets.
+        
+        Args:
+            changesets: Requests of each changeset
+            batch_boundary: Batch boundary identifier
+            changeset_boundaries: Boundary of each changeset (generated if not provided)
+            
+        Returns:
+            Streaming batch payload
+        """
+        if changeset_boundaries is None:
+            changeset_boundaries = [self._create_changeset_boundary() for _ in changesets]
         
-        return "\r\n".join(lines)
+        return BatchPayload(batch_boundary, list(zip(changeset_boundaries, changesets)))
     
     def _parse_batch_response(self, response_content: str) -> BatchResponse:
         """
         Parse batch response content.
         
+        Every HTTP response found in the multipart body (including responses
+        nested inside changesets) is recorded with its position in the batch
+        under ``index``, so callers can map results back to the requests that
+        produced them.
+        
         Args:
             response_content: Raw batch response content
             
@@ -157,54 +310,80 @@ class BatchProcessor:
         responses = []
         errors = []
         
-        # Simple parsing - in production, you'd want more robust parsing
-        parts = response_content.split("--")
+        lines = response_content.replace("\r\n", "\n").split("\n")
+        
+        # Boundary delimiters are announced by the first line of the body and
+        # by the Content-Type header of every nested changeset
+        boundaries = set(_BOUNDARY_PATTERN.findall(response_content))
+        for line in lines:
+            if line.startswith("--"):
+                boundaries.add(line.strip()[2:].rstrip("-"))
+                break
+        delimiters = {f"--{b}" for b in boundaries} | {f"--{b}--" for b in boundaries}
         
+        parts: List[List[str]] = []
+        current: List[str] = []
+        for line in lines:
+            if line.strip() in delimiters:
+                parts.append(current)
+                current = []
+            else:
+                current.append(line)
+        parts.append(current)
+        
+        index = 0
         for part in parts:
-            if "HTTP/1.1" in part:
-                lines = part.strip().split("\n")
-                status_line = None
-                headers = {}
-                body = ""
-                
-                # Find status line
-                for line in lines:
-                    if line.startswith("HTTP/1.1"):
-                        status_line = line
-                        break
-                
-                if status_line:
-                    status_code = int(status_line.split()[1])
-                    
-                    # Parse headers and body (simplified)
-                    in_body = False
-                    for line in lines:
-                        if in_body:
-                            body += line + "\n"
-                        elif line.strip() == "":
-                            in_body = True
-                        elif ":" in line and not in_body:
-                            key, value = line.split(":", 1)
-                            headers[key.strip()] = value.strip()
-                    
-                    response_data = {
-                        "status": status_code,
-                        "headers": headers,
-                        "body": body.strip(),
-                    }
-                    
-                    # Try to parse JSON body
-                    if body.strip():
-                        try:
-                            import json
-                            response_data["json"] = json.loads(body.strip())
-                        except json.JSONDecodeError:
-                            pass
-                    
-                    if status_code >= 400:
-                        errors.append(response_data)
-                    else:
-                        responses.append(response_data)
+            status_position = next(
+                (i for i, line in enumerate(part) if line.startswith("HTTP/1.1")),
+                None,
+            )
+            if status_position is None:
+                continue
+            
+            # MIME headers of the part (e.g. Content-ID) precede the status line
+            part_headers = {}
+            for line in part[:status_position]:
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    part_headers[key.strip()] = value.strip()
+            
+            status_code = int(part[status_position].split()[1])
+            
+            headers = {}
+            body_start = len(part)
+            for i in range(status_position + 1, len(part)):
+                line = part[i]
+                if line.strip() == "":
+                    body_start = i + 1
+                    break
+                if ":" in line:
+                    key, value = line.split(":", 1)
+                    headers[key.strip()] = value.strip()
+            
+            body = "\n".join(part[body_start:]).strip()
+            
+            response_data = {
+                "index": index,
+                "status": status_code,
+                "headers": headers,
+                "body": body,
+            }
+            if "Content-ID" in part_headers:
+                response_data["content_id"] = part_headers["Content-ID"]
+            
+            # Try to parse JSON body
+            if body:
+                try:
+                    response_data["json"] = json.loads(body)
+                except json.JSONDecodeError:
+                    pass
+            
+            if status_code >= 400:
+                errors.append(response_data)
+            else:
+                responses.append(response_data)
+            
+            index += 1
         
         return BatchResponse(responses=responses, errors=errors)
     
@@ -233,11 +412,86 @@ class BatchProcessor:
         if len(requests) > self.max_batch_size:
             raise ValidationError(f"Batch size {len(requests)} exceeds maximum {self.max_batch_size}")
         
+        batch_boundary = self._create_batch_boundary()
+        changeset_boundary = self._create_changeset_boundary() if transactional else None
+        payload = self._build_batch_payload(requests, batch_boundary, changeset_boundary)
+        
+        return await self._send_batch(
+            payload,
+            batch_boundary,
+            request_count=len(requests),
+            transactional=transactional,
+            continue_on_error=self.continue_on_error and not transactional,
+        )
+    
+    async def execute_changesets(
+        self,
+        changesets: List[List[Dict[str, Any]]],
+    ) -> BatchResponse:
+        """
+        Execute several transactional changesets in a single batch.
+        
+        Requests may carry a ``content_id`` so that later requests of the same
+        changeset can reference the entity they create as ``$<content_id>``.
+        
+        Args:
+            changesets: Requests of each changeset
+            
+        Returns:
+            Batch response with results and errors
+            
+        Raises:
+            BatchOperationError: If batch execution fails
+            ValidationError: If requests are invalid
+        """
+        request_count = sum(len(changeset) for changeset in changesets)
+        
+        if not request_count:
+            raise ValidationError("No requests provided for batch execution")
+        
+        if request_count > self.max_batch_size:
+            raise ValidationError(f"Batch size {request_count} exceeds maximum {self.max_batch_size}")
+        
+        batch_boundary = self._create_batch_boundary()
+        payload = self._build_changesets_payload(changesets, batch_boundary)
+        
+        return await self._send_batch(
+            payload,
+            batch_boundary,
+            request_count=request_count,
+            transactional=True,
+            continue_on_error=self.continue_on_error,
+        )
+    
+    async def _send_batch(
+        self,
+        payload: BatchPayload,
+        batch_boundary: str,
+        request_count: int,
+        transactional: bool,
+        continue_on_error: bool,
+    ) -> BatchResponse:
+        """
+        Send a batch payload and parse the response.
+        
+        Args:
+            payload: Streaming multipart batch payload
+            batch_boundary: Batch boundary identifier used in the payload
+            request_count: Number of requests in the payload
+            transactional: Whether the payload contains changesets
+            continue_on_error: Whether to ask the server to continue after failures
+            
+        Returns:
+            Batch response with results and errors
+            
+        Raises:
+            BatchOperationError: If batch execution fails
+        """
         # Execute before_batch hooks
         context = HookContext(
             hook_type=HookType.BEFORE_BATCH,
             metadata={
-                "request_count": len(requests),
+                "request_count": request_count,
                 "transactional": transactional,
             },
         )
@@ -246,26 +500,21 @@ class BatchProcessor:
             context = await self.client.hook_manager.execute_hooks(HookType.BEFORE_BATCH, context)
         
         try:
-            # Create boundaries
-            batch_boundary = self._create_batch_boundary()
-            changeset_boundary = self._create_changeset_boundary() if transactional else None
-            
-            # Build payload
-            payload = self._build_batch_payload(requests, batch_boundary, changeset_boundary)
-            
             # Set headers
             headers = {
                 "Content-Type": f"multipart/mixed; boundary={batch_boundary}",
                 "OData-Version": "4.0",
                 "OData-MaxVersion": "4.0",
             }
+            if continue_on_error:
+                headers["Prefer"] = "odata.continue-on-error"
             
             # Execute batch request
             response = await self.client._execute_request(
                 method="POST",
                 url=urljoin(self.client.api_base_url, "$batch"),
                 headers=headers,
-                content=payload.encode("utf-8"),
+                content=payload,
             )
             
             # Parse response
@@ -275,7 +524,7 @@ class BatchProcessor:
             after_context = HookContext(
                 hook_type=HookType.AFTER_BATCH,
                 metadata={
-                    "request_count": len(requests),
+                    "request_count": request_count,
                     "success_count": batch_response.success_count,
                     "error_count": batch_response.error_count,
                     "transactional": transactional,
@@ -287,7 +536,7 @@ class BatchProcessor:
             
             logger.info(
                 "Batch executed",
-                request_count=len(requests),
+                request_count=request_count,
                 success_count=batch_response.success_count,
                 error_count=batch_response.error_count,
                 transactional=transactional,
@@ -296,24 +545,245 @@ class BatchProcessor:
             return batch_response
             
         except Exception as e:
-            logger.error("Batch execution failed", error=str(e), request_count=len(requests))
+            logger.error("Batch execution failed", error=str(e), request_count=request_count)
             raise BatchOperationError(f"Batch execution failed: {str(e)}") from e
     
+    def _batch_failure_outcome(self, error: Exception) -> Dict[str, Any]:
+        """
+        Build the outcome shared by all operations of a batch that raised.
+        
+        Args:
+            error: Exception raised while executing the batch
+            
+        Returns:
+            Outcome dictionary with retry classification
+        """
+        cause: Optional[BaseException] = error
+        if isinstance(cause, BatchOperationError) and cause.__cause__ is not None:
+            cause = cause.__cause__
+        if isinstance(cause, RetryError):
+            cause = cause.last_attempt.exception()
+        
+        status_code = getattr(cause, "status_code", None)
+        if isinstance(cause, (ConnectionError, TimeoutError, RateLimitError)):
+            retryable = True
+        elif isinstance(cause, APIError) and status_code is not None:
+            retryable = status_code in self.retry_status_codes
+        else:
+            retryable = False
+        
+        return {
+            "status": status_code,
+            "error": str(error),
+            "retryable": retryable,
+            "retry_after": getattr(cause, "retry_after", None),
+            "batch_failure": True,
+        }
+    
+    def _is_retryable(self, outcome: Dict[str, Any]) -> bool:
+        """Check whether an operation outcome is a transient failure."""
+        if "retryable" in outcome:
+            return bool(outcome["retryable"])
+        return outcome.get("status") in self.retry_status_codes
+    
+    async def _execute_chunk(
+        self,
+        operations: List[Dict[str, Any]],
+        indices: List[int],
+        transactional: bool,
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Execute one chunk and return an outcome for each of its operations.
+        
+        Args:
+            operations: All operations of the bulk operation
+            indices: Indices of the operations included in this chunk
+            transactional: Whether the chunk is a transactional changeset
+            
+        Returns:
+            List of (operation index, outcome) pairs
+        """
+        try:
+            response = await self.execute_batch(
+                [operations[i] for i in indices], transactional
+            )
+        except Exception as e:
+            failure = self._batch_failure_outcome(e)
+            return [(i, failure) for i in indices]
+        
+        if transactional and response.errors:
+            # A failed changeset is rolled back as a whole
+            failure = dict(response.errors[0])
+            return [(i, failure) for i in indices]
+        
+        by_position = {r["index"]: r for r in response.responses + response.errors}
+        outcomes = []
+        for position, operation_index in enumerate(indices):
+            outcome = by_position.get(position)
+            if outcome is None:
+                # The server stopped processing the batch before this operation
+                outcome = {
+                    "status": None,
+                    "error": "Operation was not executed",
+                    "retryable": True,
+                }
+            outcomes.append((operation_index, outcome))
+        
+        return outcomes
+    
+    def _is_idempotent(self, operation: Dict[str, Any]) -> bool:
+        """Check whether an operation can safely be sent twice."""
+        if "idempotent" in operation:
+            return bool(operation["idempotent"])
+        return operation["method"] in ("GET", "PATCH", "PUT", "DELETE")
+    
+    def _outcome_entity_id(
+        self,
+        outcome: Dict[str, Any],
+        operation: Optional[Dict[str, Any]] = None,
+    ) -> Optional[str]:
+        """Extract the entity ID of a successful operation."""
+        entity_url = outcome.get("headers", {}).get("OData-EntityId", "")
+        match = _ENTITY_ID_PATTERN.search(entity_url)
+        if match is None and operation is not None:
+            # Fall back to the ID addressed by the operation itself
+            match = _ENTITY_ID_PATTERN.search(operation["url"])
+        return match.group(1) if match else None
+    
+    def _retry_delay(self, attempt: int, outcomes: List[Dict[str, Any]]) -> float:
+        """
+        Compute the wait before a retry round.
+        
+        Uses exponential backoff, extended to honour the largest Retry-After
+        hint returned by the failed operations.
+        """
+        delay = self.backoff_factor * (2 ** (attempt - 1))
+        
+        for outcome in outcomes:
+            retry_after = outcome.get("retry_after")
+            if retry_after is None:
+                retry_after = outcome.get("headers", {}).get("Retry-After")
+            try:
+                delay = max(delay, float(retry_after))
+            except (TypeError, ValueError):
+                continue
+        
+        return min(delay, 60.0)
+    
+    async def _wait_before_retry(
+        self,
+        attempt: int,
+        max_retries: int,
+        outcomes: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Execute retry hooks and wait before the next retry round.
+        
+        Args:
+            attempt: Retry round about to start (starting at 1)
+            max_retries: Maximum number of retry rounds
+            outcomes: Outcomes of the operations being retried
+        """
+        delay = self._retry_delay(attempt, outcomes)
+        
+        retry_context = HookContext(
+            hook_type=HookType.ON_RETRY,
+            metadata={
+                "attempt": attempt,
+                "max_attempts": max_retries,
+                "operations_count": len(outcomes),
+                "delay": delay,
+            },
+        )
+        if hasattr(self.client, "hook_manager"):
+            await self.client.hook_manager.execute_hooks(HookType.ON_RETRY, retry_context)
+        
+        logger.warning(
+            "Retrying failed bulk operations",
+            attempt=attempt,
+            operations_count=len(outcomes),
+            delay=delay,
+        )
+        
+        await asyncio.sleep(delay)
+    
+    def _record_failures(
+        self,
+        result: BulkOperationResult,
+        failures: List[Tuple[int, int, Dict[str, Any]]],
+        transient: bool,
+    ) -> None:
+        """
+        Record final failures in the bulk operation result.
+        
+        Operations sharing the same outcome (a batch that failed entirely or a
+        rolled back changeset) are reported as a single error entry.
+        """
+        groups: Dict[int, Tuple[int, List[int], Dict[str, Any]]] = {}
+        for batch_index, operation_index, outcome in failures:
+            group = groups.setdefault(id(outcome), (batch_index, [], outcome))
+            group[1].append(operation_index)
+        
+        for batch_index, operation_indices, outcome in groups.values():
+            result.failed += len(operation_indices)
+            
+            if outcome.get("batch_failure"):
+                # Batch failed entirely
+                error = {
+                    "batch_index": batch_index,
+                    "error": outcome["error"],
+                    "operations_count": len(operation_indices),
+                    "operation_indices": operation_indices,
+                }
+            elif len(operation_indices) > 1:
+                error = {
+                    "batch_index": batch_index,
+                    "error": outcome,
+                    "operations_count": len(operation_indices),
+                    "operation_indices": operation_indices,
+                }
+            else:
+                error = {
+                    "batch_index": batch_index,
+                    "operation_index": operation_indices[0],
+                    "error": outcome,
+                }
+            
+            result.errors.append(error)
+            if transient:
+                result.transient_errors.append(error)
+            else:
+                result.permanent_errors.append(error)
+    
     async def execute_bulk_operation(
         self,
         operations: List[Dict[str, Any]],
         batch_size: Optional[int] = None,
         parallel: bool = True,
         transactional: bool = False,
+        max_retries: Optional[int] = None,
+        retry_budget: Optional[int] = None,
+        journal: Optional[BulkJournal] = None,
+        on_outcome: Optional[Callable[[int, Dict[str, Any]], None]] = None,
     ) -> BulkOperationResult:
         """
         Execute bulk operations with auto-chunking.
         
+        Operations that fail with a transient error (throttling, 5xx, transport
+        failures or operations the server never executed) are re-batched and
+        retried with exponential backoff, while permanent errors are reported
+        immediately.
+        
         Args:
             operations: List of operations to execute
             batch_size: Size of each batch (uses default if not specified)
             parallel: Whether to execute batches in parallel
             transactional: Whether each batch should be transactional
+            max_retries: Maximum retry rounds (uses processor default if not specified)
+            retry_budget: Maximum operation retries (uses processor default if not specified)
+            journal: Checkpoint journal used to resume an interrupted operation
+            on_outcome: Callback receiving the operation index and its final
+                outcome; successful outcomes carry the created ``entity_id``
             
         Returns:
             Bulk operation result with statistics
@@ -323,124 +793,538 @@ class BatchProcessor:
         
         batch_size = batch_size or self.default_batch_size
         batch_size = min(batch_size, self.max_batch_size)
-        
-        # Split operations into chunks
-        chunks = chunk_list(operations, batch_size)
+        max_retries = self.max_retries if max_retries is None else max_retries
+        retry_budget = self.retry_budget if retry_budget is None else retry_budget
         
         logger.info(
             "Starting bulk operation",
             total_operations=len(operations),
-            batch_count=len(chunks),
+            batch_count=(len(operations) + batch_size - 1) // batch_size,
             batch_size=batch_size,
             parallel=parallel,
             transactional=transactional,
         )
         
         result = BulkOperationResult(total_processed=len(operations))
+        semaphore = asyncio.Semaphore(self.max_parallel_batches)
+        
+        pending = list(range(len(operations)))
+        resumed: set = set()
+        # Operations that may already have been applied by an earlier attempt
+        resent: set = set()
         
-        if parallel and len(chunks) > 1:
-            # Execute batches in parallel
-            semaphore = asyncio.Semaphore(self.max_parallel_batches)
-            
-            async def execute_chunk(chunk: List[Dict[str, Any]]) -> BatchResponse:
-                async with semaphore:
-                    return await self.execute_batch(chunk, transactional)
-            
-            # Execute all chunks
-            tasks = [execute_chunk(chunk) for chunk in chunks]
-            batch_responses = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for i, response in enumerate(batch_responses):
-                if isinstance(response, Exception):
-                    # Batch failed entirely
-                    chunk_size = len(chunks[i])
-                    result.failed += chunk_size
-                    result.errors.append({
-                        "batch_index": i,
-                        "error": str(response),
-                        "operations_count": chunk_size,
-                    })
+        if journal is not None:
+            states = journal.begin(operations)
+            pending = []
+            for index, state in enumerate(states):
+                if state in (SUCCEEDED, FAILED):
+                    result.skipped += 1
+                elif state == IN_FLIGHT:
+                    if self._is_idempotent(operations[index]):
+                        resumed.add(index)
+                        resent.add(index)
+                        pending.append(index)
+                    else:
+                        # The server may have applied this operation already
+                        result.uncertain.append(index)
                 else:
-                    # Process batch response
-                    result.successful += response.success_count
-                    result.failed += response.error_count
-                    
-                    # Add individual errors
-                    for error in response.errors:
-                        result.errors.append({
-                            "batch_index": i,
-                            "error": error,
-                        })
+                    pending.append(index)
+            result.total_processed = len(pending)
         
-        else:
-            # Execute batches sequentially
-            for i, chunk in enumerate(chunks):
-                try:
-                    response = await self.execute_batch(chunk, transactional)
-                    result.successful += response.success_count
-                    result.failed += response.error_count
-                    
-                    # Add individual errors
-                    for error in response.errors:
-                        result.errors.append({
-                            "batch_index": i,
-                            "error": error,
-                        })
+        async def execute_chunk(
+            batch_index: int,
+            indices: List[int],
+        ) -> Tuple[List[Tuple[int, int, Dict[str, Any]]], List[Tuple[int, int, Dict[str, Any]]]]:
+            async with semaphore:
+                chunk_id = None
+                if journal is not None:
+                    chunk_id = journal.mark_in_flight(operations, indices)
+                
+                outcomes = await self._execute_chunk(operations, indices, transactional)
+            
+            retry = []
+            permanent = []
+            journaled = []
+            for operation_index, outcome in outcomes:
+                status = outcome.get("status")
+                if (
+                    status == 404
+                    and operation_index in resumed
+                    and operations[operation_index]["method"] == "DELETE"
+                ):
+                    # Deleted by the run that was interrupted
+                    status = 204
+                    outcome = {"status": status, "headers": {}, "resumed": True}
+                elif (
+                    status == 412
+                    and operation_index in resent
+                    and operations[operation_index].get("create_only")
+                ):
+                    # Created by an earlier attempt whose response was lost
+                    status = 204
+                    outcome = {"status": status, "headers": {}, "resumed": True}
+                
+                if status is not None and status < 400:
+                    result.successful += 1
+                    outcome["entity_id"] = self._outcome_entity_id(
+                        outcome, operations[operation_index]
+                    )
+                    journaled.append((
+                        operation_index,
+                        SUCCEEDED,
+                        status,
+                        outcome["entity_id"],
+                        None,
+                    ))
+                elif self._is_retryable(outcome):
+                    retry.append((batch_index, operation_index, outcome))
+                    continue
+                else:
+                    permanent.append((batch_index, operation_index, outcome))
+                    journaled.append((
+                        operation_index,
+                        FAILED,
+                        status,
+                        None,
+                        str(outcome.get("error") or outcome.get("body")),
+                    ))
                 
-                except Exception as e:
-                    # Batch failed entirely
-                    chunk_size = len(chunk)
-                    result.failed += chunk_size
-                    result.errors.append({
-                        "batch_index": i,
-                        "error": str(e),
-                        "operations_count": chunk_size,
-                    })
+                if on_outcome is not None:
+                    on_outcome(operation_index, outcome)
+            
+            if journal is not None:
+                journal.record_outcomes(journaled, chunk_id)
+            
+            return retry, permanent
+        
+        attempt = 0
+        
+        while pending:
+            # Split operations into chunks
+            chunks = chunk_list(pending, batch_size)
+            
+            if parallel and len(chunks) > 1:
+                # Execute batches in parallel
+                chunk_results = await asyncio.gather(
+                    *(execute_chunk(i, chunk) for i, chunk in enumerate(chunks))
+                )
+            else:
+                # Execute batches sequentially
+                chunk_results = [
+                    await execute_chunk(i, chunk) for i, chunk in enumerate(chunks)
+                ]
+            
+            retry: List[Tuple[int, int, Dict[str, Any]]] = []
+            permanent: List[Tuple[int, int, Dict[str, Any]]] = []
+            for chunk_retry, chunk_permanent in chunk_results:
+                retry.extend(chunk_retry)
+                permanent.extend(chunk_permanent)
+            
+            self._record_failures(result, permanent, transient=False)
+            
+            if not retry:
+                break
+            
+            attempt += 1
+            allowed = len(retry) if attempt <= max_retries else 0
+            if retry_budget is not None:
+                allowed = min(allowed, max(retry_budget - result.retried, 0))
+            
+            # Operations that cannot be retried any more are final failures
+            self._record_failures(result, retry[allowed:], transient=True)
+            if journal is not None:
+                journal.record_outcomes([
+                    (
+                        operation_index,
+                        TRANSIENT,
+                        outcome.get("status"),
+                        None,
+                        str(outcome.get("error") or outcome.get("body")),
+                    )
+                    for _, operation_index, outcome in retry[allowed:]
+                ])
+            if on_outcome is not None:
+                for _, operation_index, outcome in retry[allowed:]:
+                    on_outcome(operation_index, outcome)
+            retry = retry[:allowed]
+            if not retry:
+                break
+            
+            result.retried += len(retry)
+            await self._wait_before_retry(
+                attempt, max_retries, [outcome for _, _, outcome in retry]
+            )
+            pending = sorted(operation_index for _, operation_index, _ in retry)
+            resent.update(pending)
+        
+        if journal is not None:
+            journal.complete()
         
         logger.info(
             "Bulk operation completed",
             total_processed=result.total_processed,
             successful=result.successful,
             failed=result.failed,
+            retried=result.retried,
+            skipped=result.skipped,
+            uncertain=len(result.uncertain),
             success_rate=result.success_rate,
         )
         
         return result
     
+    async def _execute_graph_batch(
+        self,
+        graphs: List[List[Tuple[RecordGraph, Optional[RecordGraph]]]],
+        graph_indices: List[int],
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """
+        Execute record graphs as one batch with one changeset per graph.
+        
+        Args:
+            graphs: Flattened (record, parent) pairs of every graph
+            graph_indices: Indices of the graphs included in this batch
+            
+        Returns:
+            List of (graph index, outcome) pairs
+        """
+        changesets = []
+        content_id = 0
+        for graph_index in graph_indices:
+            content_ids: Dict[int, int] = {}
+            requests = []
+            for record, parent in graphs[graph_index]:
+                content_id += 1
+                content_ids[id(record)] = content_id
+                
+                body = dict(record.data)
+                if parent is not None:
+                    # Bind to the parent created earlier in the same changeset
+                    body[f"{record.parent_binding}@odata.bind"] = f"${content_ids[id(parent)]}"
+                
+                requests.append({
+                    "method": "POST",
+                    "url": record.entity_type,
+                    "body": body,
+                    "content_id": str(content_id),
+                })
+            changesets.append(requests)
+        
+        try:
+            response = await self.execute_changesets(changesets)
+        except Exception as e:
+            failure = self._batch_failure_outcome(e)
+            return [(graph_index, failure) for graph_index in graph_indices]
+        
+        parsed = sorted(response.responses + response.errors, key=lambda r: r["index"])
+        
+        outcomes = []
+        position = 0
+        for graph_index, requests in zip(graph_indices, changesets):
+            if position >= len(parsed):
+                outcomes.append((graph_index, {
+                    "status": None,
+                    "error": "Changeset was not executed",
+                    "retryable": True,
+                }))
+                continue
+            
+            if parsed[position]["status"] >= 400:
+                # A failed changeset returns a single error response
+                outcomes.append((graph_index, parsed[position]))
+                position += 1
+                continue
+            
+            changeset_responses = parsed[position:position + len(requests)]
+            position += len(requests)
+            
+            by_content_id = {r.get("content_id"): r for r in changeset_responses}
+            for (record, _), request in zip(graphs[graph_index], requests):
+                record_response = by_content_id.get(request["content_id"])
+                if record_response is not None:
+                    record.entity_id = self._outcome_entity_id(record_response)
+            
+            outcomes.append((graph_index, changeset_responses[0]))
+        
+        return outcomes
+    
+    async def create_record_graphs(
+        self,
+        graphs: List[RecordGraph],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        max_retries: Optional[int] = None,
+    ) -> BulkOperationResult:
+        """
+        Create record graphs with their children in a single round trip.
+        
+        Each graph is sent as one transactional changeset in which children
+        bind to their parent by Content-ID, so a whole account with its
+        contacts and opportunities is created atomically without waiting for
+        the parent's ID. Several graphs are packed into each batch, and graphs
+        that fail transiently are retried as a whole.
+        
+        The IDs of the created records are set on ``RecordGraph.entity_id``.
+        
+        Args:
+            graphs: Record graphs to create
+            batch_size: Maximum number of records per batch
+            parallel: Whether to execute batches in parallel
+            max_retries: Maximum retry rounds (uses processor default if not specified)
+            
+        Returns:
+            Bulk operation result counted in records
+            
+        Raises:
+            ValidationError: If a graph is invalid or exceeds the maximum batch size
+        """
+        if not graphs:
+            return BulkOperationResult()
+        
+        batch_size = min(batch_size or self.default_batch_size, self.max_batch_size)
+        max_retries = self.max_retries if max_retries is None else max_retries
+        
+        flattened = [list(graph.iter_records()) for graph in graphs]
+        for graph_index, records in enumerate(flattened):
+            if len(records) > self.max_batch_size:
+                raise ValidationError(
+                    f"Record graph {graph_index} has {len(records)} records, "
+                    f"exceeding the maximum batch size {self.max_batch_size}"
+                )
+            for record, parent in records:
+                if parent is not None and not record.parent_binding:
+                    raise ValidationError(
+                        f"Child record of {parent.entity_type} in graph {graph_index} "
+                        "has no parent_binding"
+                    )
+        
+        result = BulkOperationResult(total_processed=sum(len(r) for r in flattened))
+        semaphore = asyncio.Semaphore(self.max_parallel_batches)
+        
+        async def execute_group(graph_indices: List[int]) -> List[Tuple[int, Dict[str, Any]]]:
+            async with semaphore:
+                return await self._execute_graph_batch(flattened, graph_indices)
+        
+        pending = list(range(len(graphs)))
+        attempt = 0
+        
+        while pending:
+            # Pack whole graphs into batches of at most batch_size records
+            groups: List[List[int]] = [[]]
+            group_size = 0
+            for graph_index in pending:
+                size = len(flattened[graph_index])
+                if groups[-1] and group_size + size > batch_size:
+                    groups.append([])
+                    group_size = 0
+                groups[-1].append(graph_index)
+                group_size += size
+            
+            if parallel and len(groups) > 1:
+                group_outcomes = await asyncio.gather(*(execute_group(g) for g in groups))
+            else:
+                group_outcomes = [await execute_group(g) for g in groups]
+            
+            retry: List[Tuple[int, int, Dict[str, Any]]] = []
+            for batch_index, outcomes in enumerate(group_outcomes):
+                for graph_index, outcome in outcomes:
+                    status = outcome.get("status")
+                    if status is not None and status < 400:
+                        result.successful += len(flattened[graph_index])
+                    elif self._is_retryable(outcome):
+                        retry.append((batch_index, graph_index, outcome))
+                    else:
+                        self._record_graph_failure(
+                            result, batch_index, graph_index,
+                            len(flattened[graph_index]), outcome, transient=False,
+                        )
+            
+            if not retry:
+                break
+            
+            attempt += 1
+            if attempt > max_retries:
+                for batch_index, graph_index, outcome in retry:
+                    self._record_graph_failure(
+                        result, batch_index, graph_index,
+                        len(flattened[graph_index]), outcome, transient=True,
+                    )
+                break
+            
+            result.retried += sum(len(flattened[g]) for _, g, _ in retry)
+            await self._wait_before_retry(
+                attempt, max_retries, [outcome for _, _, outcome in retry]
+            )
+            pending = sorted(graph_index for _, graph_index, _ in retry)
+        
+        logger.info(
+            "Record graphs created",
+            graph_count=len(graphs),
+            successful=result.successful,
+            failed=result.failed,
+            retried=result.retried,
+        )
+        
+        return result
+    
+    def _record_graph_failure(
+        self,
+        result: BulkOperationResult,
+        batch_index: int,
+        graph_index: int,
+        record_count: int,
+        outcome: Dict[str, Any],
+        transient: bool,
+    ) -> None:
+        """Record the final failure of a record graph."""
+        result.failed += record_count
+        error = {
+            "batch_index": batch_index,
+            "graph_index": graph_index,
+            "operations_count": record_count,
+            "error": outcome["error"] if outcome.get("batch_failure") else outcome,
+        }
+        result.errors.append(error)
+        if transient:
+            result.transient_errors.append(error)
+        else:
+            result.permanent_errors.append(error)
+    
+    async def get_primary_id_attribute(self, entity_type: str) -> str:
+        """
+        Resolve the primary ID attribute of an entity set from metadata.
+        
+        Args:
+            entity_type: Entity set name
+            
+        Returns:
+            Logical name of the primary ID attribute
+            
+        Raises:
+            MetadataError: If the entity set does not exist
+        """
+        if self.metadata is not None:
+            return await self.metadata.primary_id_attribute(entity_type)
+        
+        if entity_type not in self._primary_id_attributes:
+            response = await self.client.get(
+                "EntityDefinitions",
+                params={
+                    "$filter": f"EntitySetName eq '{entity_type}'",
+                    "$select": "PrimaryIdAttribute",
+                },
+            )
+            definitions = response.get("value", [])
+            if not definitions:
+                raise MetadataError(f"Entity set '{entity_type}' not found")
+            self._primary_id_attributes[entity_type] = definitions[0]["PrimaryIdAttribute"]
+        
+        return self._primary_id_attributes[entity_type]
+    
+    async def assign_primary_ids(
+        self,
+        entity_type: str,
+        entities: List[Dict[str, Any]],
+        primary_id_attribute: Optional[str] = None,
+        journal: Optional[BulkJournal] = None,
+    ) -> List[str]:
+        """
+        Assign client-generated primary keys to entities that have none.
+        
+        IDs are sequential-friendly GUIDs written into the primary ID
+        attribute of each entity dictionary, so related records can reference
+        them before the entities are created. With a journal, keys stored by
+        an interrupted run are reused by position and new keys are stored.
+        
+        Args:
+            entity_type: Entity set name
+            entities: Entity data, updated in place
+            primary_id_attribute: Primary ID attribute (resolved from metadata if not specified)
+            journal: Checkpoint journal holding the keys of the job
+            
+        Returns:
+            Primary key of every entity
+        """
+        attribute = primary_id_attribute or await self.get_primary_id_attribute(entity_type)
+        
+        if journal is not None:
+            # Keys of an interrupted run keep its operations matching the journal
+            for index, entity_id in journal.get_assigned_ids().items():
+                if index < len(entities) and not entities[index].get(attribute):
+                    entities[index][attribute] = entity_id
+        
+        entity_ids = []
+        for entity_data in entities:
+            if not entity_data.get(attribute):
+                entity_data[attribute] = generate_sequential_guid()
+            entity_ids.append(str(entity_data[attribute]))
+        
+        if journal is not None:
+            journal.record_assigned_ids(dict(enumerate(entity_ids)))
+        
+        return entity_ids
+    
     async def bulk_create(
         self,
         entity_type: str,
         entities: List[Dict[str, Any]],
         batch_size: Optional[int] = None,
         parallel: bool = True,
+        journal: Optional[BulkJournal] = None,
+        generate_ids: bool = False,
+        primary_id_attribute: Optional[str] = None,
     ) -> BulkOperationResult:
         """
         Bulk create entities.
         
+        With ``generate_ids``, primary keys are assigned client-side (see
+        :meth:`assign_primary_ids`) and each record is created with a
+        create-only upsert (``PATCH`` with ``If-None-Match: *``). Retrying a
+        create whose response was lost then finds the existing record instead
+        of creating a duplicate, which makes creates safe to retry and resume.
+        With a journal, the assigned keys are stored in it and reused when
+        the job is resumed, even from another process.
+        
         Args:
             entity_type: Entity logical name
             entities: List of entity data
             batch_size: Size of each batch
             parallel: Whether to execute batches in parallel
+            journal: Checkpoint journal used to resume an interrupted run
+            generate_ids: Whether to assign primary keys client-side
+            primary_id_attribute: Primary ID attribute (resolved from metadata if not specified)
             
         Returns:
             Bulk operation result
         """
         operations = []
         
-        for entity_data in entities:
-            operations.append({
-                "method": "POST",
-                "url": f"{entity_type}",
-                "body": entity_data,
-            })
+        if generate_ids:
+            attribute = primary_id_attribute or await self.get_primary_id_attribute(entity_type)
+            entity_ids = await self.assign_primary_ids(entity_type, entities, attribute, journal)
+            
+            for entity_id, entity_data in zip(entity_ids, entities):
+                operations.append({
+                    "method": "PATCH",
+                    "url": f"{entity_type}({entity_id})",
+                    "headers": {"If-None-Match": "*"},
+                    "body": {k: v for k, v in entity_data.items() if k != attribute},
+                    "create_only": True,
+                })
+        else:
+            for entity_data in entities:
+                operations.append({
+                    "method": "POST",
+                    "url": f"{entity_type}",
+                    "body": entity_data,
+                })
         
         return await self.execute_bulk_operation(
             operations,
             batch_size=batch_size,
             parallel=parallel,
             transactional=False,
+            journal=journal,
         )
     
     async def bulk_update(
@@ -449,6 +1333,7 @@ class BatchProcessor:
         updates: List[Dict[str, Any]],
         batch_size: Optional[int] = None,
         parallel: bool = True,
+        journal: Optional[BulkJournal] = None,
     ) -> BulkOperationResult:
         """
         Bulk update entities.
@@ -458,6 +1343,7 @@ class BatchProcessor:
             updates: List of updates (must include entity ID)
             batch_size: Size of each batch
             parallel: Whether to execute batches in parallel
+            journal: Checkpoint journal used to resume an interrupted run
             
         Returns:
             Bulk operation result
@@ -480,6 +1366,7 @@ class BatchProcessor:
             batch_size=batch_size,
             parallel=parallel,
             transactional=False,
+            journal=journal,
         )
     
     async def bulk_delete(
@@ -488,6 +1375,7 @@ class BatchProcessor:
         entity_ids: List[str],
         batch_size: Optional[int] = None,
         parallel: bool = True,
+        journal: Optional[BulkJournal] = None,
     ) -> BulkOperationResult:
         """
         Bulk delete entities.
@@ -497,6 +1385,7 @@ class BatchProcessor:
             entity_ids: List of entity IDs to delete
             batch_size: Size of each batch
             parallel: Whether to execute batches in parallel
+            journal: Checkpoint journal used to resume an interrupted run
             
         Returns:
             Bulk operation result
@@ -514,11 +1403,476 @@ class BatchProcessor:
             batch_size=batch_size,
             parallel=parallel,
             transactional=False,
+            journal=journal,
+        )
+    
+    async def _fetch_related_ids(
+        self,
+        primary_entity_type: str,
+        primary_entity_id: str,
+        relationship_name: str,
+        related_key: str,
+    ) -> Set[str]:
+        """
+        Read the IDs of the records linked to an entity through a relationship.
+        
+        Args:
+            primary_entity_type: Primary entity set name
+            primary_entity_id: Primary entity ID
+            relationship_name: Collection-valued navigation property
+            related_key: Primary ID attribute of the related entity
+            
+        Returns:
+            Lower-cased IDs of the related records
+        """
+        related_ids: Set[str] = set()
+        endpoint = f"{primary_entity_type}({primary_entity_id})/{relationship_name}"
+        params: Optional[Dict[str, Any]] = {"$select": related_key}
+        
+        while endpoint:
+            response = await self.client.get(endpoint, params=params)
+            related_ids.update(
+                str(record[related_key]).lower()
+                for record in response.get("value", [])
+                if record.get(related_key)
+            )
+            # The next link already carries the query options
+            endpoint = response.get("@odata.nextLink")
+            params = None
+        
+        return related_ids
+    
+    async def _partition_linked_pairs(
+        self,
+        primary_entity_type: str,
+        relationship_name: str,
+        related_entity_type: str,
+        pairs: List[Tuple[str, str]],
+    ) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]]]:
+        """
+        Split pairs into the ones already linked and the ones that are not.
+        
+        Existing links are read once per distinct primary entity, with the
+        reads running concurrently up to the parallel batch limit.
+        
+        Returns:
+            Linked pairs and unlinked pairs, in input order
+        """
+        related_key = await self.get_primary_id_attribute(related_entity_type)
+        semaphore = asyncio.Semaphore(self.max_parallel_batches)
+        
+        async def fetch(primary_id: str) -> Tuple[str, Set[str]]:
+            async with semaphore:
+                return primary_id, await self._fetch_related_ids(
+                    primary_entity_type, primary_id, relationship_name, related_key
+                )
+        
+        primary_ids = list(dict.fromkeys(primary_id for primary_id, _ in pairs))
+        existing = dict(await asyncio.gather(*(fetch(p) for p in primary_ids)))
+        
+        linked = []
+        unlinked = []
+        for primary_id, related_id in pairs:
+            if str(related_id).lower() in existing[primary_id]:
+                linked.append((primary_id, related_id))
+            else:
+                unlinked.append((primary_id, related_id))
+        
+        return linked, unlinked
+    
+    async def bulk_associate(
+        self,
+        primary_entity_type: str,
+        relationship_name: str,
+        related_entity_type: str,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        skip_existing: bool = False,
+        journal: Optional[BulkJournal] = None,
+    ) -> BulkOperationResult:
+        """
+        Bulk associate records through a relationship.
+        
+        Args:
+            primary_entity_type: Primary entity set name
+            relationship_name: Collection-valued navigation property of the primary entity
+            related_entity_type: Related entity set name
+            pairs: (primary entity ID, related entity ID) pairs
+            batch_size: Size of each batch
+            parallel: Whether to execute batches in parallel
+            skip_existing: Whether to read existing links first and skip
+                pairs that are already associated
+            journal: Checkpoint journal used to resume an interrupted run
+            
+        Returns:
+            Bulk operation result (pairs already linked are counted as skipped)
+        """
+        pairs = list(pairs)
+        linked: List[Tuple[str, str]] = []
+        if skip_existing and pairs:
+            linked, pairs = await self._partition_linked_pairs(
+                primary_entity_type, relationship_name, related_entity_type, pairs
+            )
+        
+        operations = [
+            {
+                "method": "POST",
+                "url": f"{primary_entity_type}({primary_id})/{relationship_name}/$ref",
+                "body": {
+                    "@odata.id": urljoin(
+                        self.client.api_base_url, f"{related_entity_type}({related_id})"
+                    ),
+                },
+            }
+            for primary_id, related_id in pairs
+        ]
+        
+        result = await self.execute_bulk_operation(
+            operations,
+            batch_size=batch_size,
+            parallel=parallel,
+            transactional=False,
+            journal=journal,
+        )
+        result.skipped += len(linked)
+        
+        return result
+    
+    async def bulk_disassociate(
+        self,
+        primary_entity_type: str,
+        relationship_name: str,
+        related_entity_type: str,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        skip_missing: bool = False,
+        journal: Optional[BulkJournal] = None,
+    ) -> BulkOperationResult:
+        """
+        Bulk disassociate records linked through a relationship.
+        
+        Args:
+            primary_entity_type: Primary entity set name
+            relationship_name: Collection-valued navigation property of the primary entity
+            related_entity_type: Related entity set name
+            pairs: (primary entity ID, related entity ID) pairs
+            batch_size: Size of each batch
+            parallel: Whether to execute batches in parallel
+            skip_missing: Whether to read existing links first and skip
+                pairs that are not associated
+            journal: Checkpoint journal used to resume an interrupted run
+            
+        Returns:
+            Bulk operation result (pairs not linked are counted as skipped)
+        """
+        pairs = list(pairs)
+        unlinked: List[Tuple[str, str]] = []
+        if skip_missing and pairs:
+            pairs, unlinked = await self._partition_linked_pairs(
+                primary_entity_type, relationship_name, related_entity_type, pairs
+            )
+        
+        operations = [
+            {
+                "method": "DELETE",
+                "url": f"{primary_entity_type}({primary_id})/{relationship_name}({related_id})/$ref",
+            }
+            for primary_id, related_id in pairs
+        ]
+        
+        result = await self.execute_bulk_operation(
+            operations,
+            batch_size=batch_size,
+            parallel=parallel,
+            transactional=False,
+            journal=journal,
+        )
+        result.skipped += len(unlinked)
+        
+        return result
+    
+    async def read_many(
+        self,
+        entity_type: str,
+        ids: List[Union[str, Dict[str, Any]]],
+        select: Optional[List[str]] = None,
+        primary_id_attribute: Optional[str] = None,
+        max_url_length: int = _MAX_URL_LENGTH,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read many records by ID or alternate key.
+        
+        Primary key IDs are grouped into filter queries using
+        ``Microsoft.Dynamics.CRM.In``, each sized to stay under the URL length
+        limit. Alternate keys (dictionaries) are read with ``$batch`` GETs.
+        All groups run concurrently.
+        
+        Args:
+            entity_type: Entity set name
+            ids: Primary key IDs or alternate key dictionaries
+            select: Fields to select
+            primary_id_attribute: Primary ID attribute (resolved from metadata if not specified)
+            max_url_length: Maximum length of a query URL
+            
+        Returns:
+            Records aligned with ``ids``; records that were not found are None
+            
+        Raises:
+            APIError: If a read fails for any reason other than a missing record
+        """
+        if not ids:
+            return []
+        
+        attribute = primary_id_attribute or await self.get_primary_id_attribute(entity_type)
+        if select and attribute not in select:
+            select = [*select, attribute]
+        
+        guid_keys = list(dict.fromkeys(
+            self._normalize_id(entity_id) for entity_id in ids if not isinstance(entity_id, dict)
+        ))
+        alternate_keys = list(dict.fromkeys(
+            self._alternate_key_tuple(key) for key in ids if isinstance(key, dict)
+        ))
+        
+        found_by_id, found_by_key = await asyncio.gather(
+            self._read_by_ids(entity_type, guid_keys, attribute, select, max_url_length),
+            self._read_by_alternate_keys(entity_type, alternate_keys, select),
+        )
+        
+        records = []
+        for entity_id in ids:
+            if isinstance(entity_id, dict):
+                records.append(found_by_key.get(self._alternate_key_tuple(entity_id)))
+            else:
+                records.append(found_by_id.get(self._normalize_id(entity_id)))
+        
+        logger.debug(
+            "Records read",
+            entity_type=entity_type,
+            requested=len(ids),
+            found=sum(1 for record in records if record is not None),
+        )
+        
+        return records
+    
+    @staticmethod
+    def _normalize_id(entity_id: Any) -> str:
+        """Normalize a GUID for comparisons."""
+        return str(entity_id).strip("{}").lower()
+    
+    @staticmethod
+    def _alternate_key_tuple(key: Dict[str, Any]) -> Tuple[Tuple[str, Any], ...]:
+        """Build a hashable, order-independent alternate key."""
+        return tuple(sorted(key.items()))
+    
+    async def _read_by_ids(
+        self,
+        entity_type: str,
+        entity_ids: List[str],
+        attribute: str,
+        select: Optional[List[str]],
+        max_url_length: int,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Read records by primary key with grouped filter queries."""
+        if not entity_ids:
+            return {}
+        
+        base_length = len(urljoin(self.client.api_base_url, entity_type)) + len("?$filter=")
+        if select:
+            base_length += len("&$select=") + len(quote(",".join(select)))
+        prefix = f"Microsoft.Dynamics.CRM.In(PropertyName='{attribute}',PropertyValues=["
+        base_length += len(quote(prefix + "])"))
+        
+        # Group IDs greedily so every query URL stays under the limit
+        groups: List[List[str]] = [[]]
+        length = base_length
+        for entity_id in entity_ids:
+            value_length = len(quote(f'"{entity_id}",'))
+            if groups[-1] and (
+                length + value_length > max_url_length or len(groups[-1]) >= _MAX_PAGE_SIZE
+            ):
+                groups.append([])
+                length = base_length
+            groups[-1].append(entity_id)
+            length += value_length
+        
+        semaphore = asyncio.Semaphore(self.max_parallel_batches)
+        
+        async def read_group(group: List[str]) -> List[Dict[str, Any]]:
+            params: Optional[Dict[str, Any]] = {
+                "$filter": prefix + ",".join(f'"{entity_id}"' for entity_id in group) + "])",
+            }
+            if select:
+                params["$select"] = ",".join(select)
+            
+            records = []
+            endpoint: Optional[str] = entity_type
+            async with semaphore:
+                while endpoint:
+                    response = await self.client.get(endpoint, params=params)
+                    records.extend(response.get("value", []))
+                    endpoint = response.get("@odata.nextLink")
+                    params = None
+            return records
+        
+        found = {}
+        for records in await asyncio.gather(*(read_group(group) for group in groups)):
+            for record in records:
+                if record.get(attribute):
+                    found[self._normalize_id(record[attribute])] = record
+        
+        return found
+    
+    async def _read_by_alternate_keys(
+        self,
+        entity_type: str,
+        keys: List[Tuple[Tuple[str, Any], ...]],
+        select: Optional[List[str]],
+    ) -> Dict[Tuple[Tuple[str, Any], ...], Dict[str, Any]]:
+        """Read records by alternate key with batched GET requests."""
+        if not keys:
+            return {}
+        
+        query = f"?$select={','.join(select)}" if select else ""
+        operations = [
+            {
+                "method": "GET",
+                "url": f"{entity_type}({format_alternate_key(dict(key))}){query}",
+            }
+            for key in keys
+        ]
+        
+        found = {}
+        failures: List[Dict[str, Any]] = []
+        
+        def on_outcome(operation_index: int, outcome: Dict[str, Any]) -> None:
+            status = outcome.get("status")
+            if status == 200 and outcome.get("json") is not None:
+                found[keys[operation_index]] = outcome["json"]
+            elif status != 404:
+                # Only a missing record means not found; throttling, server
+                # and authorization errors must not pass for one
+                failures.append(outcome)
+        
+        await self.execute_bulk_operation(operations, on_outcome=on_outcome)
+        
+        if failures:
+            outcome = failures[0]
+            body = outcome.get("json") if isinstance(outcome.get("json"), dict) else {}
+            message = outcome.get("error") or body.get("error", {}).get("message") or "Unknown error"
+            raise APIError(
+                f"Failed to read {len(failures)} of {len(keys)} records by alternate key: {message}",
+                status_code=outcome.get("status"),
+                response_data=body or None,
+            )
+        
+        return found
+    
+    async def bulk_upsert(
+        self,
+        entity_type: str,
+        records: List[Dict[str, Any]],
+        key_fields: List[str],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        primary_id_attribute: Optional[str] = None,
+    ) -> BulkUpsertResult:
+        """
+        Bulk upsert entities by alternate key.
+        
+        Each record is addressed by the alternate key built from its
+        ``key_fields``. Records repeating a key already seen in the same call
+        are merged into one upsert with the last record winning, so a key is
+        never written twice in parallel batches. Responses are requested with
+        only the primary ID selected, which tells created (201) from updated
+        (200) records.
+        
+        Args:
+            entity_type: Entity set name
+            records: Records to upsert, including their key fields
+            key_fields: Attributes forming the alternate key
+            batch_size: Size of each batch
+            parallel: Whether to execute batches in parallel
+            primary_id_attribute: Primary ID attribute (resolved from metadata if not specified)
+            
+        Returns:
+            Bulk upsert result with the outcome of every record
+            
+        Raises:
+            ValidationError: If a record is missing a key field
+        """
+        if not key_fields:
+            raise ValidationError("At least one key field is required for bulk upsert")
+        
+        for index, record in enumerate(records):
+            missing = [field for field in key_fields if record.get(field) is None]
+            if missing:
+                raise ValidationError(
+                    f"Record {index} is missing key fields: {', '.join(missing)}"
+                )
+        
+        # Deduplicate keys, keeping the position of the last record
+        winners: Dict[Tuple[Any, ...], int] = {}
+        for index, record in enumerate(records):
+            winners[tuple(record[field] for field in key_fields)] = index
+        
+        if not records:
+            return BulkUpsertResult()
+        
+        attribute = primary_id_attribute or await self.get_primary_id_attribute(entity_type)
+        
+        positions = sorted(winners.values())
+        operations = []
+        for position in positions:
+            record = records[position]
+            key = format_alternate_key({field: record[field] for field in key_fields})
+            operations.append({
+                "method": "PATCH",
+                "url": f"{entity_type}({key})?$select={attribute}",
+                "headers": {"Prefer": "return=representation"},
+                "body": {k: v for k, v in record.items() if k not in key_fields},
+            })
+        
+        outcomes: Dict[int, UpsertResult] = {}
+        
+        def on_outcome(operation_index: int, outcome: Dict[str, Any]) -> None:
+            status = outcome.get("status")
+            if status is None or status >= 400:
+                return
+            entity_id = outcome.get("entity_id") or (outcome.get("json") or {}).get(attribute)
+            outcomes[positions[operation_index]] = UpsertResult(
+                entity_id=entity_id or "",
+                created=status == 201,
+            )
+        
+        bulk_result = await self.execute_bulk_operation(
+            operations,
+            batch_size=batch_size,
+            parallel=parallel,
+            transactional=False,
+            on_outcome=on_outcome,
+        )
+        
+        created = sum(1 for outcome in outcomes.values() if outcome.created)
+        
+        return BulkUpsertResult(
+            **bulk_result.model_dump(),
+            # Duplicates share the outcome of the record that won their key
+            records=[
+                outcomes.get(winners[tuple(record[field] for field in key_fields)])
+                for record in records
+            ],
+            created=created,
+            updated=len(outcomes) - created,
+            duplicates=len(records) - len(winners),
         )
 
 
 # Convenience exports
 __all__ = [
     "BatchProcessor",
+    "BatchPayload",
 ]
 
@@ -0,0 +1,555 @@
+"""
+Caching utilities for the Dataverse SDK.
+
+This module provides a bounded single-flight cache that lets concurrent
+identical GET requests share one in-flight response, optionally keeping the
+result for a short time after it completes, an ETag cache that
+revalidates stored records with conditional requests, and a pluggable query
+result cache with in-memory and on-disk backends.
+"""
+
+import asyncio
+import copy
+import json
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple, Union
+from urllib.parse import urlsplit, urlunsplit
+
+import structlog
+
+
+logger = structlog.get_logger(__name__)
+
+
+# Result handed to joiners when the fetching caller is cancelled
+_ABANDONED = object()
+
+# Headers that change the response and therefore belong to the cache key
+_KEY_HEADERS = (
+    "accept",
+    "accept-language",
+    "callerobjectid",
+    "consistency",
+    "if-none-match",
+    "mscrm.callerid",
+    "prefer",
+)
+
+
+class SingleFlightCache:
+    """
+    Bounded single-flight cache for idempotent requests.
+
+    Concurrent calls with the same key share one fetch. With a ``ttl``,
+    the result is also served to calls made shortly after it completes.
+    The fetching caller receives the result itself; callers that joined it
+    or hit the TTL cache receive their own copies, so a plain call with no
+    concurrent duplicate costs no copy. Failures are never cached.
+    :meth:`invalidate` (called on writes) makes later calls fetch again
+    instead of joining or reusing earlier results.
+    """
+
+    def __init__(self, ttl: float = 0.0, max_entries: int = 1024) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a completed result stays cached (0 disables reuse)
+            max_entries: Maximum number of cached results
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+
+        self._in_flight: Dict[Hashable, List[Any]] = {}
+        self._results: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._generation = 0
+        self.metrics = {
+            "requests": 0,
+            "fetches": 0,
+            "coalesced": 0,
+            "hits": 0,
+        }
+
+    @property
+    def saved(self) -> int:
+        """Number of requests served without a fetch of their own."""
+        return self.metrics["coalesced"] + self.metrics["hits"]
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[Any, ...]:
+        """
+        Build the cache key of a request.
+
+        Args:
+            method: HTTP method
+            url: Absolute request URL
+            params: Query parameters
+            headers: Request headers (only those affecting the response are used)
+
+        Returns:
+            Hashable cache key
+        """
+        parts = urlsplit(url)
+        normalized_url = urlunsplit(
+            (parts.scheme.lower(), parts.netloc.lower(), parts.path, parts.query, "")
+        )
+        return (
+            method.upper(),
+            normalized_url,
+            tuple(sorted((str(k), str(v)) for k, v in (params or {}).items())),
+            tuple(sorted(
+                (name.lower(), str(value))
+                for name, value in (headers or {}).items()
+                if name.lower() in _KEY_HEADERS
+            )),
+        )
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get a result, sharing the fetch with identical concurrent calls.
+
+        Args:
+            key: Cache key (see :meth:`make_key`)
+            fetch: Coroutine function performing the request
+
+        Returns:
+            Fetched result (a copy unless this call performed the fetch)
+        """
+        self.metrics["requests"] += 1
+        key = (self._generation, key)
+
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if expires_at > time.monotonic():
+                self._results.move_to_end(key)
+                self.metrics["hits"] += 1
+                return copy.deepcopy(value)
+            del self._results[key]
+
+        flight = self._in_flight.get(key)
+        if flight is not None:
+            self.metrics["coalesced"] += 1
+            flight[1] += 1
+            # A cancelled caller must not cancel the fetch shared with others
+            value = await asyncio.shield(flight[0])
+            if value is not _ABANDONED:
+                return copy.deepcopy(value)
+            # The fetching caller was cancelled, so fetch without sharing
+            return await fetch()
+
+        self.metrics["fetches"] += 1
+        return await self._fetch(key, fetch)
+
+    async def _fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a fetch in the calling task, sharing it with later joiners."""
+        flight = [asyncio.get_running_loop().create_future(), 0]
+        self._in_flight[key] = flight
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            flight[0].set_result(_ABANDONED)
+            raise
+        except Exception as exc:
+            if flight[1]:
+                flight[0].set_exception(exc)
+            raise
+        finally:
+            if self._in_flight.get(key) is flight:
+                del self._in_flight[key]
+
+        keep = self.ttl > 0 and key[0] == self._generation
+        if flight[1] or keep:
+            # One snapshot, taken before the caller can change the result
+            snapshot = copy.deepcopy(value)
+            flight[0].set_result(snapshot)
+            if keep:
+                self._results[key] = (time.monotonic() + self.ttl, snapshot)
+                self._results.move_to_end(key)
+                while len(self._results) > self.max_entries:
+                    self._results.popitem(last=False)
+
+        return value
+
+    def invalidate(self) -> None:
+        """Drop cached results and stop new calls from joining in-flight fetches."""
+        self._generation += 1
+        self._results.clear()
+
+    def clear(self) -> None:
+        """Drop cached results and reset the metrics."""
+        self.invalidate()
+        for name in self.metrics:
+            self.metrics[name] = 0
+
+
+class ETagCache:
+    """
+    Memory-bounded LRU cache of records revalidated by ETag.
+
+    Responses carrying an ``@odata.etag`` are stored with their size. While
+    an entry is younger than the TTL of its entity set it is served without
+    a request; afterwards it is revalidated with ``If-None-Match`` and a
+    ``304 Not Modified`` response reuses the stored body. Least recently
+    used entries are evicted once the stored bodies exceed ``max_bytes``.
+
+    Example:
+        ```python
+        client.enable_etag_cache(entity_ttls={"transactioncurrencies": 300})
+        ```
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 16 * 1024 * 1024,
+        default_ttl: float = 0.0,
+        entity_ttls: Optional[Dict[str, float]] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of the stored response bodies
+            default_ttl: Seconds an entry is served without revalidation
+            entity_ttls: TTL overrides by entity set name
+        """
+        self.max_bytes = max_bytes
+        self.default_ttl = default_ttl
+        self.entity_ttls = dict(entity_ttls or {})
+
+        self._entries: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self.size = 0
+        self.metrics = {
+            "hits": 0,
+            "revalidated": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+
+    def __len__(self) -> int:
+        """Number of stored entries."""
+        return len(self._entries)
+
+    def ttl_for(self, entity_set: str) -> float:
+        """Get the TTL of an entity set."""
+        return self.entity_ttls.get(entity_set, self.default_ttl)
+
+    async def fetch(
+        self,
+        key: Hashable,
+        entity_set: str,
+        send: Callable[[Optional[str]], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get a record, revalidating a stored copy when one exists.
+
+        Args:
+            key: Cache key (see :meth:`SingleFlightCache.make_key`)
+            entity_set: Entity set of the request, used for its TTL
+            send: Coroutine function sending the request; it receives the
+                stored ETag to send as ``If-None-Match`` (or ``None``)
+
+        Returns:
+            Copy of the response JSON
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            if entry["expires_at"] > time.monotonic():
+                self.metrics["hits"] += 1
+                return copy.deepcopy(entry["body"])
+
+        response = await send(entry["etag"] if entry is not None else None)
+
+        if response.status_code == 304 and entry is not None:
+            self.metrics["revalidated"] += 1
+            entry["expires_at"] = time.monotonic() + self.ttl_for(entity_set)
+            return copy.deepcopy(entry["body"])
+
+        self.metrics["misses"] += 1
+        body = response.json() if response.content else {}
+        etag = body.get("@odata.etag") if isinstance(body, dict) else None
+
+        self._remove(key)
+        if etag and len(response.content) <= self.max_bytes:
+            self._entries[key] = {
+                "entity_set": entity_set,
+                "etag": etag,
+                "body": copy.deepcopy(body),
+                "size": len(response.content),
+                "expires_at": time.monotonic() + self.ttl_for(entity_set),
+            }
+            self.size += len(response.content)
+            while self.size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.size -= evicted["size"]
+                self.metrics["evictions"] += 1
+
+        return body
+
+    def invalidate(self, entity_set: Optional[str] = None) -> None:
+        """
+        Drop stored entries.
+
+        Args:
+            entity_set: Only drop entries of this entity set (all if None)
+        """
+        for key in [
+            key for key, entry in self._entries.items()
+            if entity_set is None or entry["entity_set"] == entity_set
+        ]:
+            self._remove(key)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry if present."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= entry["size"]
+
+
+class QueryCacheBackend(ABC):
+    """
+    Storage backend of the query result cache.
+
+    Backends store JSON-serializable results under string keys, tagged with
+    the entity set they were read from so writes can invalidate them.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get an unexpired result, or None."""
+
+    @abstractmethod
+    def set(self, key: str, entity_type: str, value: Any, ttl: float) -> None:
+        """Store a result for ``ttl`` seconds."""
+
+    @abstractmethod
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """Drop the results of an entity set (all if None)."""
+
+
+class MemoryQueryCache(QueryCacheBackend):
+    """In-memory LRU backend holding up to ``max_entries`` results."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            max_entries: Maximum number of stored results
+        """
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        """Number of stored results."""
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get an unexpired result, or None."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return copy.deepcopy(entry[2])
+
+    def set(self, key: str, entity_type: str, value: Any, ttl: float) -> None:
+        """Store a result for ``ttl`` seconds."""
+        self._entries[key] = (entity_type, time.monotonic() + ttl, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """Drop the results of an entity set (all if None)."""
+        if entity_type is None:
+            self._entries.clear()
+            return
+        for key in [k for k, entry in self._entries.items() if entry[0] == entity_type]:
+            del self._entries[key]
+
+
+class DiskQueryCache(QueryCacheBackend):
+    """
+    SQLite backend holding up to ``max_entries`` results on disk.
+
+    Results survive process restarts and can be shared by processes on the
+    same machine. Least recently used results are evicted first.
+    """
+
+    def __init__(self, path: Union[str, Path], max_entries: int = 4096) -> None:
+        """
+        Initialize the backend.
+
+        Args:
+            path: Path of the SQLite cache file
+            max_entries: Maximum number of stored results
+        """
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite connection and create the schema if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS query_cache ("
+                "key TEXT PRIMARY KEY, entity_type TEXT NOT NULL, value TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def close(self) -> None:
+        """Close the cache file."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def get(self, key: str) -> Optional[Any]:
+        """Get an unexpired result, or None."""
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, expires_at FROM query_cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        with conn:
+            if row[1] <= now:
+                conn.execute("DELETE FROM query_cache WHERE key = ?", (key,))
+                return None
+            conn.execute("UPDATE query_cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def set(self, key: str, entity_type: str, value: Any, ttl: float) -> None:
+        """Store a result for ``ttl`` seconds."""
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO query_cache "
+                "(key, entity_type, value, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+                (key, entity_type, json.dumps(value, separators=(",", ":")), now + ttl, now),
+            )
+            conn.execute(
+                "DELETE FROM query_cache WHERE key IN (SELECT key FROM query_cache "
+                "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """Drop the results of an entity set (all if None)."""
+        conn = self._connect()
+        with conn:
+            if entity_type is None:
+                conn.execute("DELETE FROM query_cache")
+            else:
+                conn.execute("DELETE FROM query_cache WHERE entity_type = ?", (entity_type,))
+
+
+class QueryCache:
+    """
+    Result cache for ``DataverseSDK.query``.
+
+    Results are keyed by entity set and the normalized OData parameters of
+    the query, kept for ``ttl`` seconds in a pluggable backend and, with
+    ``invalidate_on_write``, dropped when the SDK writes to their entity set.
+
+    Example:
+        ```python
+        sdk.enable_query_cache(backend=DiskQueryCache("queries.db"), ttl=30)
+        ```
+    """
+
+    def __init__(
+        self,
+        backend: Optional[QueryCacheBackend] = None,
+        ttl: float = 60.0,
+        invalidate_on_write: bool = True,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            backend: Storage backend (in-memory LRU if None)
+            ttl: Seconds a result stays cached
+            invalidate_on_write: Whether SDK writes drop results of their entity set
+        """
+        self.backend = backend or MemoryQueryCache()
+        self.ttl = ttl
+        self.invalidate_on_write = invalidate_on_write
+        self.metrics = {
+            "hits": 0,
+            "misses": 0,
+        }
+
+    @staticmethod
+    def make_key(entity_type: str, params: Dict[str, str]) -> str:
+        """
+        Build the cache key of a query.
+
+        Args:
+            entity_type: Entity set name
+            params: OData parameters (from ``QueryOptions.to_odata_params``)
+
+        Returns:
+            Cache key
+        """
+        normalized = {name: str(value).strip() for name, value in params.items()}
+        # Selected columns are unordered
+        if "$select" in normalized:
+            normalized["$select"] = ",".join(
+                sorted(column.strip() for column in normalized["$select"].split(","))
+            )
+        return entity_type + "?" + json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+
+    def get(self, entity_type: str, params: Dict[str, str]) -> Optional[Any]:
+        """Get the cached result of a query, or None."""
+        value = self.backend.get(self.make_key(entity_type, params))
+        self.metrics["hits" if value is not None else "misses"] += 1
+        return value
+
+    def set(self, entity_type: str, params: Dict[str, str], value: Any) -> None:
+        """Cache the result of a query."""
+        if self.ttl > 0:
+            self.backend.set(self.make_key(entity_type, params), entity_type, value, self.ttl)
+
+    def invalidate(self, entity_type: Optional[str] = None) -> None:
+        """
+        Drop cached results.
+
+        Args:
+            entity_type: Only drop results of this entity set (all if None)
+        """
+        self.backend.invalidate(entity_type)
+
+
+# Convenience exports
+__all__ = [
+    "SingleFlightCache",
+    "ETagCache",
+    "QueryCache",
+    "QueryCacheBackend",
+    "MemoryQueryCache",
+    "DiskQueryCache",
+]
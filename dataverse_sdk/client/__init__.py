@@ -6,9 +6,10 @@ retry logic, rate limiting, and hook integration.
 """
 
 import asyncio
+import re
 import time
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urljoin
+from typing import Any, AsyncIterable, AsyncIterator, Dict, List, Optional, Union
+from urllib.parse import urljoin, urlsplit
 
 import httpx
 import structlog
@@ -21,6 +22,7 @@ from tenacity import (
 )
 
 from ..auth import DataverseAuthenticator
+from ..cache import ETagCache, QueryCache, SingleFlightCache
 from ..exceptions import (
     APIError,
     AuthenticationError,
@@ -34,7 +36,7 @@ from ..hooks import (
     HookType,
     execute_global_hooks,
 )
-from ..utils import Config, build_url, handle_rate_limit
+from ..utils import Config, build_url, handle_rate_limit, to_json
 
 
 logger = structlog.get_logger(__name__)
@@ -82,6 +84,20 @@ class AsyncDataverseClient:
         self._client: Optional[httpx.AsyncClient] = None
         self._closed = False
         
+        # Identical concurrent GETs share one request
+        self.get_cache = SingleFlightCache(
+            ttl=self.config.get("get_cache_ttl", 0.0),
+            max_entries=self.config.get("get_cache_max_entries", 1024),
+        )
+        
+        # Conditional read cache (opt-in)
+        self.etag_cache: Optional[ETagCache] = None
+        if self.config.get("etag_cache", False):
+            self.enable_etag_cache()
+        
+        # Query result cache, set by DataverseSDK.enable_query_cache
+        self.query_cache: Optional[QueryCache] = None
+        
         logger.info(
             "Dataverse client initialized",
             dataverse_url=dataverse_url,
@@ -193,6 +209,11 @@ class AsyncDataverseClient:
             if ssl_context:
                 client_kwargs["verify"] = ssl_context
             
+            # Custom transport (e.g. an in-process mock for offline tests)
+            transport = self.config.get("transport")
+            if transport:
+                client_kwargs["transport"] = transport
+            
             self._client = httpx.AsyncClient(**client_kwargs)
             
             self._closed = False
@@ -231,7 +252,7 @@ class AsyncDataverseClient:
         headers: Optional[Dict[str, str]] = None,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-        content: Optional[bytes] = None,
+        content: Optional[Union[bytes, AsyncIterable[bytes]]] = None,
     ) -> httpx.Response:
         """
         Execute HTTP request with retry logic and hook integration.
@@ -242,7 +263,7 @@ class AsyncDataverseClient:
             headers: Request headers
             params: Query parameters
             json_data: JSON request body
-            content: Raw request content
+            content: Raw request content (bytes or a re-iterable async byte stream)
             
         Returns:
             HTTP response
@@ -252,6 +273,11 @@ class AsyncDataverseClient:
         """
         await self._ensure_client()
         
+        # Writes make cached GET results stale
+        is_write = method.upper() != "GET"
+        if is_write:
+            self._invalidate_caches(url)
+        
         # Prepare request data
         request_data = {
             "method": method.upper(),
@@ -293,14 +319,20 @@ class AsyncDataverseClient:
                 try:
                     start_time = time.time()
                     
+                    content = request_data["content"]
+                    if request_data["json"] is not None:
+                        # Serialized here so Decimal values keep their exact digits
+                        content = to_json(request_data["json"]).encode("utf-8")
+                    
                     # Make the request
                     response = await self._client.request(
                         method=request_data["method"],
                         url=request_data["url"],
                         headers=request_data["headers"],
-                        params=request_data["params"],
-                        json=request_data["json"],
-                        content=request_data["content"],
+                        # httpx >= 0.28 replaces the query string of the URL
+                        # (e.g. an @odata.nextLink) with params, even empty ones
+                        params=request_data["params"] or None,
+                        content=content,
                     )
                     
                     response_time = time.time() - start_time
@@ -365,8 +397,8 @@ class AsyncDataverseClient:
                     response_context = await execute_global_hooks(HookType.AFTER_RESPONSE, response_context)
                     response_context = await self.hook_manager.execute_hooks(HookType.AFTER_RESPONSE, response_context)
                     
-                    # Check for API errors
-                    if not response.is_success:
+                    # Check for API errors (304 answers a conditional read)
+                    if not response.is_success and response.status_code != 304:
                         error_data = response_data.get("json", {})
                         error_message = error_data.get("error", {}).get("message", f"HTTP {response.status_code}")
                         
@@ -376,6 +408,9 @@ class AsyncDataverseClient:
                             response_data=error_data,
                         )
                     
+                    if is_write:
+                        self._invalidate_caches(url)
+                    
                     return response
                     
                 except (httpx.ConnectError, httpx.ConnectTimeout) as e:
@@ -428,8 +463,127 @@ class AsyncDataverseClient:
             Response JSON data
         """
         url = urljoin(self.api_base_url, endpoint)
-        response = await self._execute_request("GET", url, headers, params)
-        return response.json() if response.content else {}
+        
+        if not self.config.get("get_single_flight", True):
+            return await self._get_json(url, headers, params)
+        
+        key = SingleFlightCache.make_key("GET", url, params, headers)
+        return await self.get_cache.get_or_fetch(
+            key, lambda: self._get_json(url, headers, params)
+        )
+    
+    async def get_pages(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Iterate over the pages of a collection, following ``@odata.nextLink``.
+        
+        Args:
+            endpoint: API endpoint (relative to base URL)
+            params: Query parameters of the first request
+            page_size: Records per page (``Prefer: odata.maxpagesize``)
+            headers: Additional headers
+            
+        Yields:
+            Records of each page
+        """
+        headers = dict(headers or {})
+        if page_size:
+            headers["Prefer"] = f"odata.maxpagesize={page_size}"
+        
+        response = await self.get(endpoint, params=params, headers=headers)
+        while True:
+            yield response.get("value", [])
+            next_link = response.get("@odata.nextLink")
+            if not next_link:
+                break
+            response = await self.get(next_link, headers=headers)
+    
+    async def _get_json(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Send a GET request and decode the response."""
+        conditional = any(name.lower() == "if-none-match" for name in (headers or {}))
+        if self.etag_cache is None or conditional:
+            response = await self._execute_request("GET", url, headers, params)
+            return response.json() if response.content else {}
+        
+        async def send(etag: Optional[str]) -> httpx.Response:
+            request_headers = dict(headers or {})
+            if etag:
+                request_headers["If-None-Match"] = etag
+            return await self._execute_request("GET", url, request_headers, params)
+        
+        return await self.etag_cache.fetch(
+            SingleFlightCache.make_key("GET", url, params, headers),
+            self._entity_set_of(url),
+            send,
+        )
+    
+    def enable_etag_cache(
+        self,
+        max_bytes: Optional[int] = None,
+        default_ttl: Optional[float] = None,
+        entity_ttls: Optional[Dict[str, float]] = None,
+    ) -> ETagCache:
+        """
+        Enable the ETag-aware conditional read cache.
+        
+        Records returned with an ``@odata.etag`` are stored and revalidated
+        with ``If-None-Match``, so unchanged records come back as ``304``.
+        
+        Args:
+            max_bytes: Maximum total size of stored bodies
+            default_ttl: Seconds an entry is served without revalidation
+            entity_ttls: TTL overrides by entity set name
+            
+        Returns:
+            The ETag cache
+        """
+        self.etag_cache = ETagCache(
+            max_bytes=max_bytes or self.config.get("etag_cache_max_bytes", 16 * 1024 * 1024),
+            default_ttl=(
+                default_ttl if default_ttl is not None
+                else self.config.get("etag_cache_ttl", 0.0)
+            ),
+            entity_ttls=(
+                entity_ttls if entity_ttls is not None
+                else self.config.get("etag_cache_entity_ttls", {})
+            ),
+        )
+        return self.etag_cache
+    
+    def _entity_set_of(self, url: str) -> str:
+        """Get the entity set (or function) name addressed by a URL."""
+        if url.startswith(self.api_base_url):
+            path = url[len(self.api_base_url):]
+        else:
+            path = urlsplit(url).path.rsplit("/api/data/", 1)[-1].split("/", 1)[-1]
+        return re.split(r"[(/?]", path, maxsplit=1)[0]
+    
+    def _invalidate_caches(self, url: str) -> None:
+        """Drop cached reads made stale by a write to the given URL."""
+        self.get_cache.invalidate()
+        if self.etag_cache is None and (
+            self.query_cache is None or not self.query_cache.invalidate_on_write
+        ):
+            return
+        
+        entity_set = self._entity_set_of(url)
+        # A $batch may write to any entity set
+        if entity_set == "$batch":
+            entity_set = None
+        if self.etag_cache is not None:
+            self.etag_cache.invalidate(entity_set)
+        if self.query_cache is not None and self.query_cache.invalidate_on_write:
+            self.query_cache.invalidate(entity_set)
     
     async def post(
         self,
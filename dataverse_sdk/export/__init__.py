@@ -0,0 +1,387 @@
+"""
+Streaming export of Dataverse tables to files.
+
+This module writes query results to NDJSON, JSON, CSV or Parquet files page
+by page as they arrive, so memory use does not grow with the table size.
+Text formats can be compressed and interrupted exports can be resumed from
+a checkpoint kept next to the output file.
+"""
+
+import asyncio
+import bz2
+import csv
+import gzip
+import io
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import aiofiles
+import structlog
+
+from ..client import AsyncDataverseClient
+from ..exceptions import ConfigurationError, ValidationError
+from ..models import ExportResult, QueryOptions
+
+
+logger = structlog.get_logger(__name__)
+
+
+FORMATS = ("ndjson", "json", "csv", "parquet")
+
+_FORMAT_SUFFIXES = {
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+    ".json": "json",
+    ".csv": "csv",
+    ".parquet": "parquet",
+}
+
+# Each page is compressed as a separate stream; concatenated gzip members
+# and bzip2 streams are valid files, so a partial file can be truncated at a
+# page boundary and appended to
+_COMPRESSORS: Dict[str, Callable[[bytes], bytes]] = {
+    "gzip": gzip.compress,
+    "bz2": bz2.compress,
+}
+
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".bz2": "bz2"}
+
+
+def detect_format(path: Union[str, Path]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Infer the format and compression of an export file from its name.
+
+    Args:
+        path: File path, e.g. ``accounts.ndjson.gz``
+
+    Returns:
+        Tuple of (format, compression), None where the name gives no hint
+    """
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    compression = _COMPRESSION_SUFFIXES.get(suffixes[-1]) if suffixes else None
+    if compression:
+        suffixes = suffixes[:-1]
+    return (_FORMAT_SUFFIXES.get(suffixes[-1]) if suffixes else None), compression
+
+
+def _dumps(record: Dict[str, Any]) -> str:
+    """Serialize a record as compact JSON."""
+    return json.dumps(record, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def _csv_value(value: Any) -> Any:
+    """Convert a record value to a CSV cell."""
+    if isinstance(value, (dict, list)):
+        return _dumps(value)
+    return value
+
+
+class StreamingExporter:
+    """
+    Exports query results to a file page by page.
+
+    Records are requested ordered by primary key (unless the query has its
+    own ``order_by``) and each page is appended to the file as soon as it
+    arrives. After every page a checkpoint with the file offset and last
+    primary key is written to ``<file>.checkpoint``; an export started with
+    ``resume=True`` truncates the file to that offset and continues after
+    the last exported record. The checkpoint is removed when the export
+    completes.
+
+    Parquet files get one row group per page and need ``pyarrow``; they
+    cannot be resumed because their footer is only written at the end.
+
+    Example:
+        ```python
+        exporter = StreamingExporter(sdk.client, sdk.metadata)
+        await exporter.export("accounts", "accounts.ndjson.gz", resume=True)
+        ```
+    """
+
+    def __init__(self, client: AsyncDataverseClient, metadata: Any) -> None:
+        """
+        Initialize the exporter.
+
+        Args:
+            client: Dataverse client instance
+            metadata: Metadata cache used to resolve primary ID attributes
+        """
+        self.client = client
+        self.metadata = metadata
+
+    async def export(
+        self,
+        entity_type: str,
+        path: Union[str, Path],
+        options: Optional[Union[QueryOptions, Dict[str, Any]]] = None,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        resume: bool = False,
+        page_size: int = 5000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> ExportResult:
+        """
+        Export the records of a query to a file.
+
+        Args:
+            entity_type: Entity set name
+            path: Output file
+            options: Query options (``top``/``skip`` are not supported)
+            format: ndjson, json, csv or parquet (inferred from the file name if None)
+            compression: gzip or bz2 for text formats, a Parquet codec for Parquet
+                (inferred from the file name if None)
+            resume: Continue a partial export from its checkpoint
+            page_size: Records per page
+            progress: Called with the number of exported records after each page
+
+        Returns:
+            Export result
+        """
+        path = Path(path)
+        detected_format, detected_compression = detect_format(path)
+        format = format or detected_format or "ndjson"
+        compression = compression or detected_compression
+        if format not in FORMATS:
+            raise ValidationError(f"Unsupported export format: {format}")
+        if format != "parquet" and compression and compression not in _COMPRESSORS:
+            raise ValidationError(f"Unsupported compression: {compression}")
+        if format == "parquet" and resume:
+            raise ValidationError("Parquet exports cannot be resumed")
+
+        if isinstance(options, dict):
+            options = QueryOptions(**options)
+        elif options is None:
+            options = QueryOptions()
+        if options.top is not None or options.skip is not None:
+            raise ValidationError("Exports do not support top or skip")
+
+        primary_id = await self.metadata.primary_id_attribute(entity_type)
+        params = options.to_odata_params()
+        if not options.order_by:
+            # Ordering by primary key lets a resumed export continue after the last record
+            params["$orderby"] = f"{primary_id} asc"
+            if options.select and primary_id not in options.select:
+                params["$select"] += f",{primary_id}"
+
+        checkpoint_path = path.with_name(path.name + ".checkpoint")
+        checkpoint = await self._load_checkpoint(checkpoint_path, path) if resume else None
+        if checkpoint:
+            if (checkpoint["format"], checkpoint["compression"]) != (format, compression):
+                raise ValidationError(
+                    "Export checkpoint does not match the requested format",
+                    details={"checkpoint": checkpoint},
+                )
+            if checkpoint["last_id"] is None and checkpoint["records"]:
+                raise ValidationError("Exports with a custom order_by cannot be resumed")
+            if checkpoint["last_id"]:
+                condition = f"{primary_id} gt {checkpoint['last_id']}"
+                params["$filter"] = (
+                    f"({params['$filter']}) and {condition}" if "$filter" in params else condition
+                )
+
+        logger.info(
+            "Export started",
+            entity_type=entity_type,
+            path=str(path),
+            format=format,
+            resumed=checkpoint is not None,
+        )
+
+        if format == "parquet":
+            records, size = await self._export_parquet(
+                entity_type, path, params, page_size, compression, options.select, progress
+            )
+        else:
+            records, size = await self._export_text(
+                entity_type,
+                path,
+                params,
+                page_size,
+                format,
+                compression,
+                checkpoint,
+                checkpoint_path,
+                primary_id if not options.order_by else None,
+                options.select,
+                progress,
+            )
+
+        logger.info("Export completed", entity_type=entity_type, path=str(path), record_count=records)
+        return ExportResult(
+            path=str(path),
+            format=format,
+            compression=compression,
+            records=records,
+            bytes_written=size,
+            resumed=checkpoint is not None,
+        )
+
+    async def _export_text(
+        self,
+        entity_type: str,
+        path: Path,
+        params: Dict[str, str],
+        page_size: int,
+        format: str,
+        compression: Optional[str],
+        checkpoint: Optional[Dict[str, Any]],
+        checkpoint_path: Path,
+        primary_id: Optional[str],
+        select: Optional[List[str]],
+        progress: Optional[Callable[[int], None]],
+    ) -> Tuple[int, int]:
+        """Stream pages to an NDJSON, JSON or CSV file with checkpoints."""
+        compress = _COMPRESSORS.get(compression) if compression else None
+        loop = asyncio.get_event_loop()
+        offset = checkpoint["offset"] if checkpoint else 0
+        records = checkpoint["records"] if checkpoint else 0
+        columns = checkpoint.get("columns") if checkpoint else None
+        if format == "csv" and columns is None and select:
+            columns = list(select)
+            if primary_id and primary_id not in columns:
+                columns.append(primary_id)
+
+        def encode(page: List[Dict[str, Any]], first: bool) -> str:
+            if format == "ndjson":
+                return "".join(_dumps(record) + "\n" for record in page)
+            if format == "json":
+                return ("[\n" if first else ",\n") + ",\n".join(_dumps(record) for record in page)
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction="ignore", lineterminator="\n")
+            if first:
+                writer.writeheader()
+            writer.writerows({k: _csv_value(v) for k, v in record.items()} for record in page)
+            return buffer.getvalue()
+
+        async def write(f: Any, text: str) -> int:
+            data = text.encode("utf-8")
+            if compress is not None:
+                data = await loop.run_in_executor(None, compress, data)
+            await f.write(data)
+            return len(data)
+
+        async with aiofiles.open(path, "r+b" if checkpoint else "wb") as f:
+            if checkpoint:
+                # Drop whatever was written after the last checkpointed page
+                await f.truncate(offset)
+                await f.seek(offset)
+
+            async for page in self.client.get_pages(entity_type, params=params, page_size=page_size):
+                if not page:
+                    continue
+                if format == "csv" and columns is None:
+                    columns = list(dict.fromkeys(key for record in page for key in record))
+                offset += await write(f, encode(page, offset == 0))
+                await f.flush()
+                records += len(page)
+
+                await self._save_checkpoint(checkpoint_path, {
+                    "format": format,
+                    "compression": compression,
+                    "offset": offset,
+                    "records": records,
+                    "last_id": str(page[-1].get(primary_id)) if primary_id else None,
+                    "columns": columns,
+                })
+                if progress is not None:
+                    progress(records)
+
+            if format == "json":
+                offset += await write(f, "\n]\n" if offset else "[]\n")
+            elif format == "csv" and offset == 0 and columns:
+                offset += await write(f, encode([], True))
+
+        checkpoint_path.unlink(missing_ok=True)
+        return records, offset
+
+    async def _export_parquet(
+        self,
+        entity_type: str,
+        path: Path,
+        params: Dict[str, str],
+        page_size: int,
+        compression: Optional[str],
+        select: Optional[List[str]],
+        progress: Optional[Callable[[int], None]],
+    ) -> Tuple[int, int]:
+        """Stream pages to a Parquet file, one row group per page."""
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ConfigurationError(
+                "Parquet export requires pyarrow: pip install crmadminbrasil-dataverse-sdk[parquet]"
+            ) from e
+
+        loop = asyncio.get_event_loop()
+        writer, schema, records = None, None, 0
+
+        def normalize(page: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            # Columns typed as strings also hold values of other types as text
+            text = {field.name for field in schema if pa.types.is_string(field.type)}
+            return [
+                {
+                    name: str(record[name]) if name in text and record.get(name) is not None
+                    and not isinstance(record[name], str) else record.get(name)
+                    for name in schema.names
+                }
+                for record in page
+            ]
+
+        try:
+            async for page in self.client.get_pages(entity_type, params=params, page_size=page_size):
+                if not page:
+                    continue
+                if writer is None:
+                    # The first page fixes the schema; columns that were all
+                    # null in it are stored as strings
+                    inferred = pa.Table.from_pylist(page).schema
+                    schema = pa.schema([
+                        pa.field(field.name, pa.string()) if pa.types.is_null(field.type) else field
+                        for field in inferred
+                    ])
+                    writer = pq.ParquetWriter(str(path), schema, compression=compression or "snappy")
+                table = pa.Table.from_pylist(normalize(page), schema=schema)
+                await loop.run_in_executor(None, writer.write_table, table)
+                records += len(page)
+                if progress is not None:
+                    progress(records)
+
+            if writer is None:
+                schema = pa.schema([pa.field(name, pa.string()) for name in select or []])
+                writer = pq.ParquetWriter(str(path), schema, compression=compression or "snappy")
+        finally:
+            if writer is not None:
+                writer.close()
+
+        return records, path.stat().st_size
+
+    @staticmethod
+    async def _load_checkpoint(checkpoint_path: Path, path: Path) -> Optional[Dict[str, Any]]:
+        """Read the checkpoint of a partial export, if it can be resumed."""
+        if not checkpoint_path.exists() or not path.exists():
+            return None
+        async with aiofiles.open(checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.loads(await f.read())
+        if path.stat().st_size < checkpoint["offset"]:
+            logger.warning("Export file is shorter than its checkpoint, starting over", path=str(path))
+            return None
+        return checkpoint
+
+    @staticmethod
+    async def _save_checkpoint(checkpoint_path: Path, checkpoint: Dict[str, Any]) -> None:
+        """Write the checkpoint of an export atomically."""
+        temp_file = checkpoint_path.with_suffix(checkpoint_path.suffix + ".tmp")
+        async with aiofiles.open(temp_file, "w", encoding="utf-8") as f:
+            await f.write(json.dumps(checkpoint))
+        os.replace(temp_file, checkpoint_path)
+
+
+# Convenience exports
+__all__ = [
+    "FORMATS",
+    "StreamingExporter",
+    "detect_format",
+]
@@ -0,0 +1,458 @@
+"""
+Streaming bulk import of records from files.
+
+This module reads NDJSON, JSON array and CSV files record by record
+(memory-mapped when the file is not compressed) and feeds them to the bulk
+operations in fixed-size chunks, so memory use does not grow with the file
+size. Rows that fail are written to a dead-letter file that can be imported
+again once fixed.
+"""
+
+import bz2
+import codecs
+import csv
+import gzip
+import json
+import mmap
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, IO, Iterator, List, Optional, Tuple, Union
+
+import aiofiles
+import structlog
+
+from ..exceptions import ValidationError
+from ..export import detect_format
+from ..models import BulkOperationResult, BulkUpsertResult
+
+
+logger = structlog.get_logger(__name__)
+
+
+OPERATIONS = ("create", "update", "upsert", "delete")
+
+# Annotations added to dead-letter rows; they are dropped when rows are read
+DEAD_LETTER_PREFIX = "@import."
+
+_OPENERS = {"gzip": gzip.open, "bz2": bz2.open}
+
+_JSON_CHUNK_SIZE = 1024 * 1024
+
+
+class _UndecodedLine:
+    """NDJSON line that is not valid JSON."""
+
+    __slots__ = ("text", "error")
+
+    def __init__(self, text: str, error: str) -> None:
+        """Keep the line text and the decoding error."""
+        self.text = text
+        self.error = error
+
+
+class RecordReader:
+    """
+    Iterates over the records of an NDJSON, JSON array or CSV file.
+
+    Uncompressed files are memory-mapped; gzip and bz2 files are
+    decompressed as a stream. Records are yielded with their 1-based row
+    number, and ``position`` reports the bytes of the file consumed so far
+    (of the compressed file, for compressed input). Empty CSV cells are
+    omitted from the records.
+
+    Rows that are not JSON objects (malformed NDJSON lines or other values)
+    raise :class:`ValidationError`, unless ``mark_invalid`` is set: they are
+    then yielded as ``{"@import.raw": ..., "@import.error": ...}`` so the
+    caller can dead-letter them and go on with the next row.
+
+    Example:
+        ```python
+        for row, record in RecordReader("accounts.csv.gz"):
+            ...
+        ```
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        mark_invalid: bool = False,
+    ) -> None:
+        """
+        Initialize the reader.
+
+        Args:
+            path: Input file
+            format: ndjson, json or csv (inferred from the file name if None)
+            compression: gzip or bz2 (inferred from the file name if None)
+            mark_invalid: Yield invalid rows with error annotations instead
+                of raising
+        """
+        self.path = Path(path)
+        self.mark_invalid = mark_invalid
+        detected_format, detected_compression = detect_format(self.path)
+        self.format = format or detected_format or "ndjson"
+        self.compression = compression or detected_compression
+        if self.format not in ("ndjson", "json", "csv"):
+            raise ValidationError(f"Unsupported import format: {self.format}")
+        if self.compression and self.compression not in _OPENERS:
+            raise ValidationError(f"Unsupported compression: {self.compression}")
+        self.size = self.path.stat().st_size
+        self.position = 0
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Yield (row number, record) pairs."""
+        with open(self.path, "rb") as raw:
+            if self.compression:
+                with _OPENERS[self.compression](raw, "rt", encoding="utf-8-sig", newline="") as text:
+                    yield from self._records(self._text_lines(text, raw), text, raw)
+            elif self.size == 0:
+                return
+            else:
+                with mmap.mmap(raw.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    yield from self._records(self._mapped_lines(mapped), None, mapped)
+
+    def _mapped_lines(self, mapped: mmap.mmap) -> Iterator[str]:
+        """Read lines of a memory-mapped file."""
+        first = True
+        while True:
+            line = mapped.readline()
+            if not line:
+                return
+            self.position = mapped.tell()
+            text = line.decode("utf-8")
+            if first:
+                text, first = text.lstrip("\ufeff"), False
+            yield text
+
+    def _text_lines(self, text: IO[str], raw: IO[bytes]) -> Iterator[str]:
+        """Read lines of a decompressed stream."""
+        for line in text:
+            self.position = raw.tell()
+            yield line
+
+    def _records(
+        self,
+        lines: Iterator[str],
+        text: Optional[IO[str]],
+        source: Any,
+    ) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Parse the records of the file."""
+        if self.format == "csv":
+            for row, record in enumerate(csv.DictReader(lines), start=1):
+                yield row, {k: v for k, v in record.items() if v not in ("", None) and k is not None}
+            return
+
+        if self.format == "json":
+            records = self._json_array(text.read if text else source.read, source)
+        else:
+            records = self._json_lines(lines)
+
+        for row, record in enumerate(records, start=1):
+            if isinstance(record, _UndecodedLine):
+                raw, error = record.text, f"Invalid JSON: {record.error}"
+            elif not isinstance(record, dict):
+                raw, error = record, "Not a JSON object"
+            elif f"{DEAD_LETTER_PREFIX}raw" in record:
+                # An invalid row replayed from a dead-letter file without a fix
+                raw, error = record[f"{DEAD_LETTER_PREFIX}raw"], "Invalid row was not fixed"
+            else:
+                yield row, {k: v for k, v in record.items() if not k.startswith(DEAD_LETTER_PREFIX)}
+                continue
+
+            if not self.mark_invalid:
+                raise ValidationError(f"Row {row}: {error}")
+            yield row, {
+                f"{DEAD_LETTER_PREFIX}raw": raw,
+                f"{DEAD_LETTER_PREFIX}error": {"message": error},
+            }
+
+    @staticmethod
+    def _json_lines(lines: Iterator[str]) -> Iterator[Any]:
+        """Decode NDJSON lines, keeping undecodable lines as markers."""
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                yield _UndecodedLine(line.rstrip("\r\n"), str(e))
+
+    def _json_array(self, read: Callable[[int], Any], source: Any) -> Iterator[Any]:
+        """Decode the elements of a JSON array without loading the whole file."""
+        decoder = json.JSONDecoder()
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+        buffer, position, started, eof = "", 0, False, False
+        while True:
+            while position < len(buffer) and buffer[position] in " \t\r\n\ufeff,":
+                position += 1
+            if position < len(buffer):
+                if not started:
+                    if buffer[position] != "[":
+                        raise ValidationError("JSON import files must contain an array of records")
+                    started, position = True, position + 1
+                    continue
+                if buffer[position] == "]":
+                    return
+                try:
+                    element, end = decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # A number at the end of the buffer may continue in the next chunk
+                    if end < len(buffer) or eof:
+                        buffer, position = buffer[end:], 0
+                        yield element
+                        continue
+            if eof:
+                raise ValidationError("Unexpected end of JSON array")
+            chunk = read(_JSON_CHUNK_SIZE)
+            eof = not chunk
+            if isinstance(chunk, bytes):
+                chunk = utf8.decode(chunk, final=eof)
+            buffer = buffer[position:] + chunk
+            position = 0
+            self.position = source.tell()
+
+
+class StreamingImporter:
+    """
+    Streams the records of a file into a bulk operation.
+
+    Records are read in chunks of ``chunk_size`` and each chunk goes through
+    the SDK bulk operation (with its batching, retries and parallelism)
+    before the next chunk is read. Failed rows are appended to the
+    dead-letter file as NDJSON with ``@import.row`` and ``@import.error``
+    annotations; the annotations are ignored when the file is imported
+    again. Rows that cannot be decoded are dead-lettered the same way, with
+    their original text in ``@import.raw``, and the import goes on.
+
+    Example:
+        ```python
+        importer = StreamingImporter(sdk, dead_letter="failed.ndjson")
+        result = await importer.run("create", "accounts", "accounts.csv", validate=True)
+        ```
+    """
+
+    def __init__(
+        self,
+        sdk: Any,
+        chunk_size: int = 5000,
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        dead_letter: Optional[Union[str, Path]] = None,
+        progress: Optional[Callable[[int, int, int], None]] = None,
+    ) -> None:
+        """
+        Initialize the importer.
+
+        Args:
+            sdk: Dataverse SDK instance
+            chunk_size: Records read and sent per bulk call
+            batch_size: Operations per batch request
+            parallel: Whether batches of a chunk run in parallel
+            dead_letter: NDJSON file receiving failed rows
+            progress: Called after each chunk with (records processed,
+                records failed, bytes read)
+        """
+        self.sdk = sdk
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.parallel = parallel
+        self.dead_letter = Path(dead_letter) if dead_letter else None
+        self.progress = progress
+
+    async def run(
+        self,
+        operation: str,
+        entity_type: str,
+        source: Union[str, Path, RecordReader],
+        key_fields: Optional[List[str]] = None,
+        validate: bool = False,
+    ) -> BulkOperationResult:
+        """
+        Import a file.
+
+        Rows of ``update`` and ``delete`` identify their record with an
+        ``id`` column or the primary ID attribute; ``upsert`` rows need the
+        ``key_fields``.
+
+        Args:
+            operation: create, update, upsert or delete
+            entity_type: Entity set name
+            source: Input file or reader (a reader given here dead-letters
+                invalid rows only if created with ``mark_invalid``)
+            key_fields: Alternate key attributes (upsert only)
+            validate: Encode rows with the schema-compiled encoder (create and
+                update), which also converts CSV text to typed values
+
+        Returns:
+            Aggregated counts of the import (errors are in the dead-letter file)
+        """
+        if operation not in OPERATIONS:
+            raise ValidationError(f"Unsupported bulk operation: {operation}")
+        if operation == "upsert" and not key_fields:
+            raise ValidationError("Upsert imports require key fields")
+
+        reader = source if isinstance(source, RecordReader) else RecordReader(source, mark_invalid=True)
+        primary_id = None
+        if operation in ("update", "delete"):
+            primary_id = await self.sdk.metadata.primary_id_attribute(entity_type)
+
+        total = BulkOperationResult()
+        dead_letter = None
+        if self.dead_letter:
+            self.dead_letter.parent.mkdir(parents=True, exist_ok=True)
+            dead_letter = await aiofiles.open(self.dead_letter, "w", encoding="utf-8")
+
+        started = time.monotonic()
+        try:
+            chunk: List[Tuple[int, Dict[str, Any]]] = []
+            for row in reader:
+                chunk.append(row)
+                if len(chunk) >= self.chunk_size:
+                    await self._import_chunk(operation, entity_type, chunk, key_fields, validate, primary_id, total, dead_letter)
+                    chunk = []
+                    self._report(total, reader)
+            if chunk:
+                await self._import_chunk(operation, entity_type, chunk, key_fields, validate, primary_id, total, dead_letter)
+            self._report(total, reader)
+        finally:
+            if dead_letter is not None:
+                await dead_letter.close()
+
+        logger.info(
+            "Streaming import completed",
+            operation=operation,
+            entity_type=entity_type,
+            total=total.total_processed,
+            failed=total.failed,
+            duration=time.monotonic() - started,
+        )
+        return total
+
+    def _report(self, total: BulkOperationResult, reader: RecordReader) -> None:
+        """Report progress after a chunk."""
+        if self.progress is not None:
+            self.progress(total.total_processed, total.failed, reader.position)
+
+    async def _import_chunk(
+        self,
+        operation: str,
+        entity_type: str,
+        chunk: List[Tuple[int, Dict[str, Any]]],
+        key_fields: Optional[List[str]],
+        validate: bool,
+        primary_id: Optional[str],
+        total: BulkOperationResult,
+        dead_letter: Any,
+    ) -> None:
+        """Send one chunk and dead-letter its failed rows."""
+        failures: Dict[int, Any] = {}
+        sent: List[int] = []
+        payload: List[Any] = []
+
+        for position, (_, record) in enumerate(chunk):
+            if f"{DEAD_LETTER_PREFIX}error" in record:
+                # Marked invalid by the reader
+                failures[position] = record[f"{DEAD_LETTER_PREFIX}error"]
+                continue
+            if operation in ("update", "delete"):
+                entity_id = record.get("id") or record.get(primary_id)
+                if not entity_id:
+                    failures[position] = {"message": f"Missing id or {primary_id}"}
+                    continue
+                if operation == "delete":
+                    payload.append(entity_id)
+                else:
+                    payload.append(dict(
+                        {k: v for k, v in record.items() if k not in ("id", primary_id)}, id=entity_id
+                    ))
+            elif operation == "upsert":
+                missing = [field for field in key_fields if record.get(field) is None]
+                if missing:
+                    failures[position] = {"message": f"Missing key fields: {', '.join(missing)}"}
+                    continue
+                payload.append(dict(record))
+            else:
+                payload.append(dict(record))
+            sent.append(position)
+
+        result = None
+        if payload:
+            if operation == "create":
+                result = await self.sdk.bulk_create(
+                    entity_type, payload, self.batch_size, self.parallel, validate=validate
+                )
+            elif operation == "update":
+                result = await self.sdk.bulk_update(
+                    entity_type, payload, self.batch_size, self.parallel, validate=validate
+                )
+            elif operation == "upsert":
+                result = await self.sdk.bulk_upsert(
+                    entity_type, payload, key_fields, self.batch_size, self.parallel
+                )
+            else:
+                result = await self.sdk.bulk_delete(
+                    entity_type, payload, self.batch_size, self.parallel
+                )
+
+            for index, error in self._failed_operations(result, payload, key_fields).items():
+                failures[sent[index]] = error
+
+            total.successful += len(payload) - len(set(failures) & set(sent))
+            total.retried += result.retried
+            total.skipped += result.skipped
+
+        total.total_processed += len(chunk)
+        total.failed += len(failures)
+
+        if dead_letter is not None and failures:
+            lines = []
+            for position in sorted(failures):
+                row, record = chunk[position]
+                lines.append(json.dumps(dict(
+                    record,
+                    **{f"{DEAD_LETTER_PREFIX}row": row, f"{DEAD_LETTER_PREFIX}error": failures[position]},
+                ), default=str, ensure_ascii=False) + "\n")
+            await dead_letter.write("".join(lines))
+            await dead_letter.flush()
+
+    @staticmethod
+    def _failed_operations(
+        result: BulkOperationResult,
+        payload: List[Any],
+        key_fields: Optional[List[str]],
+    ) -> Dict[int, Any]:
+        """Map the errors of a bulk result to payload positions."""
+        # Upserts send one operation per distinct key, for its last record
+        operations = list(range(len(payload)))
+        if isinstance(result, BulkUpsertResult):
+            winners: Dict[Tuple[Any, ...], int] = {}
+            for index, record in enumerate(payload):
+                winners[tuple(record[field] for field in key_fields)] = index
+            operations = sorted(winners.values())
+
+        failed: Dict[int, Any] = {}
+        for error in result.errors:
+            for index in error.get("operation_indices") or [error.get("operation_index")]:
+                if index is not None and index < len(operations):
+                    failed[operations[index]] = error.get("error")
+
+        if isinstance(result, BulkUpsertResult):
+            # Duplicates of a failed key failed with it
+            for index, outcome in enumerate(result.records):
+                if outcome is None:
+                    key = tuple(payload[index][field] for field in key_fields)
+                    failed.setdefault(index, failed.get(winners[key]))
+        return failed
+
+
+# Convenience exports
+__all__ = [
+    "OPERATIONS",
+    "RecordReader",
+    "StreamingImporter",
+]
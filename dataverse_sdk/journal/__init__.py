@@ -0,0 +1,396 @@
+"""
+Checkpoint journal for long-running bulk operations.
+
+This module provides a durable, opt-in journal backed by a local SQLite
+database. The journal records chunk ranges and per-record outcomes as batches
+finish, so an interrupted bulk operation can resume from its last checkpoint
+instead of starting from zero.
+"""
+
+import hashlib
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import structlog
+
+from ..exceptions import ValidationError
+
+
+logger = structlog.get_logger(__name__)
+
+
+# Record states stored in the journal
+PENDING = 0
+IN_FLIGHT = 1
+SUCCEEDED = 2
+FAILED = 3
+TRANSIENT = 4
+
+_STATE_NAMES = {
+    PENDING: "pending",
+    IN_FLIGHT: "in_flight",
+    SUCCEEDED: "succeeded",
+    FAILED: "failed",
+    TRANSIENT: "transient",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    total INTEGER NOT NULL,
+    fingerprint TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    completed_at REAL
+);
+CREATE TABLE IF NOT EXISTS chunks (
+    job_id TEXT NOT NULL,
+    chunk_id INTEGER NOT NULL,
+    first_index INTEGER NOT NULL,
+    last_index INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (job_id, chunk_id)
+);
+CREATE TABLE IF NOT EXISTS records (
+    job_id TEXT NOT NULL,
+    op_index INTEGER NOT NULL,
+    state INTEGER NOT NULL,
+    fingerprint TEXT,
+    status_code INTEGER,
+    entity_id TEXT,
+    error TEXT,
+    PRIMARY KEY (job_id, op_index)
+);
+CREATE TABLE IF NOT EXISTS assigned_ids (
+    job_id TEXT NOT NULL,
+    op_index INTEGER NOT NULL,
+    entity_id TEXT NOT NULL,
+    PRIMARY KEY (job_id, op_index)
+);
+"""
+
+
+def operation_fingerprint(operation: Dict[str, Any]) -> str:
+    """
+    Compute a stable fingerprint for a batch operation.
+
+    Args:
+        operation: Operation dictionary (method, url, body)
+
+    Returns:
+        Hex digest identifying the operation
+    """
+    payload = json.dumps(
+        [operation.get("method"), operation.get("url"), operation.get("body")],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=8).hexdigest()
+
+
+class BulkJournal:
+    """
+    SQLite-backed checkpoint journal for bulk operations.
+
+    A journal is identified by a file path and a job ID. Passing the same
+    journal to a bulk operation after a crash skips the records that already
+    completed. Records that were in flight when the process died are retried
+    only when their operation is idempotent; otherwise they are reported as
+    uncertain so they can be reconciled instead of being duplicated.
+
+    Example:
+        ```python
+        with BulkJournal("nightly.journal", job_id="accounts-2024-01-01") as journal:
+            result = await sdk.bulk_create("accounts", records, journal=journal)
+        ```
+    """
+
+    def __init__(self, path: Union[str, Path], job_id: str) -> None:
+        """
+        Initialize the journal.
+
+        Args:
+            path: Path of the SQLite journal file
+            job_id: Identifier of the bulk job within the journal
+        """
+        self.path = Path(path)
+        self.job_id = job_id
+        self._conn: Optional[sqlite3.Connection] = None
+        self._next_chunk_id = 0
+
+    def __enter__(self) -> "BulkJournal":
+        """Context manager entry."""
+        self._connect()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Context manager exit."""
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite connection and create the schema if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def begin(self, operations: List[Dict[str, Any]]) -> bytearray:
+        """
+        Start or resume the job for the given operations.
+
+        Args:
+            operations: All operations of the bulk job
+
+        Returns:
+            State of every operation indexed by position (see module constants)
+
+        Raises:
+            ValidationError: If the operations do not match the journaled job
+        """
+        conn = self._connect()
+        now = time.time()
+        fingerprint = self._job_fingerprint(operations)
+
+        row = conn.execute(
+            "SELECT total, fingerprint FROM jobs WHERE job_id = ?", (self.job_id,)
+        ).fetchone()
+
+        if row is None:
+            with conn:
+                conn.execute(
+                    "INSERT INTO jobs (job_id, total, fingerprint, created_at, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (self.job_id, len(operations), fingerprint, now, now),
+                )
+            logger.info("Bulk journal started", job_id=self.job_id, total=len(operations))
+            return bytearray(len(operations))
+
+        total, stored_fingerprint = row
+        if total != len(operations) or stored_fingerprint != fingerprint:
+            raise ValidationError(
+                f"Journal job '{self.job_id}' was recorded for different operations "
+                f"({total} journaled, {len(operations)} provided)"
+            )
+
+        states = bytearray(len(operations))
+        for op_index, state, record_fingerprint in conn.execute(
+            "SELECT op_index, state, fingerprint FROM records WHERE job_id = ?",
+            (self.job_id,),
+        ):
+            # Records that may have reached the server must still describe
+            # the same operation, otherwise resuming could corrupt data
+            if state == IN_FLIGHT and record_fingerprint != operation_fingerprint(
+                operations[op_index]
+            ):
+                raise ValidationError(
+                    f"Operation {op_index} changed since it was journaled for job "
+                    f"'{self.job_id}'"
+                )
+            states[op_index] = state
+
+        chunk_row = conn.execute(
+            "SELECT MAX(chunk_id) FROM chunks WHERE job_id = ?", (self.job_id,)
+        ).fetchone()
+        self._next_chunk_id = (chunk_row[0] or 0) + 1
+
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET updated_at = ?, completed_at = NULL WHERE job_id = ?",
+                (now, self.job_id),
+            )
+
+        logger.info(
+            "Bulk journal resumed",
+            job_id=self.job_id,
+            total=len(operations),
+            succeeded=states.count(SUCCEEDED),
+            in_flight=states.count(IN_FLIGHT),
+        )
+        return states
+
+    def mark_in_flight(
+        self,
+        operations: List[Dict[str, Any]],
+        indices: List[int],
+    ) -> int:
+        """
+        Record that a chunk of operations is about to be sent.
+
+        Args:
+            operations: All operations of the bulk job
+            indices: Indices of the operations in the chunk
+
+        Returns:
+            Chunk ID to pass to :meth:`record_outcomes`
+        """
+        conn = self._connect()
+        chunk_id = self._next_chunk_id
+        self._next_chunk_id += 1
+
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO chunks "
+                "(job_id, chunk_id, first_index, last_index, size, state, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, 'in_flight', ?)",
+                (self.job_id, chunk_id, indices[0], indices[-1], len(indices), time.time()),
+            )
+            conn.executemany(
+                "INSERT INTO records (job_id, op_index, state, fingerprint) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (job_id, op_index) DO UPDATE SET state = excluded.state, "
+                "fingerprint = excluded.fingerprint",
+                [
+                    (self.job_id, i, IN_FLIGHT, operation_fingerprint(operations[i]))
+                    for i in indices
+                ],
+            )
+
+        return chunk_id
+
+    def record_outcomes(
+        self,
+        outcomes: List[Tuple[int, int, Optional[int], Optional[str], Optional[str]]],
+        chunk_id: Optional[int] = None,
+    ) -> None:
+        """
+        Record per-operation outcomes.
+
+        Args:
+            outcomes: (index, state, status code, entity ID, error) tuples
+            chunk_id: Chunk to mark as completed
+        """
+        conn = self._connect()
+
+        with conn:
+            conn.executemany(
+                "UPDATE records SET state = ?, status_code = ?, entity_id = ?, error = ? "
+                "WHERE job_id = ? AND op_index = ?",
+                [
+                    (state, status_code, entity_id, error, self.job_id, index)
+                    for index, state, status_code, entity_id, error in outcomes
+                ],
+            )
+            if chunk_id is not None:
+                conn.execute(
+                    "UPDATE chunks SET state = 'completed', updated_at = ? "
+                    "WHERE job_id = ? AND chunk_id = ?",
+                    (time.time(), self.job_id, chunk_id),
+                )
+
+    def complete(self) -> None:
+        """Mark the job as completed."""
+        conn = self._connect()
+        now = time.time()
+        with conn:
+            conn.execute(
+                "UPDATE jobs SET updated_at = ?, completed_at = ? WHERE job_id = ?",
+                (now, now, self.job_id),
+            )
+
+    def summary(self) -> Dict[str, int]:
+        """
+        Get the number of journaled records per state.
+
+        Returns:
+            Mapping of state name to record count
+        """
+        conn = self._connect()
+        counts = {name: 0 for name in _STATE_NAMES.values()}
+        for state, count in conn.execute(
+            "SELECT state, COUNT(*) FROM records WHERE job_id = ? GROUP BY state",
+            (self.job_id,),
+        ):
+            counts[_STATE_NAMES.get(state, str(state))] = count
+        return counts
+
+    def get_entity_ids(self) -> Dict[int, str]:
+        """
+        Get the entity IDs of successfully created records.
+
+        Returns:
+            Mapping of operation index to entity ID
+        """
+        conn = self._connect()
+        return {
+            op_index: entity_id
+            for op_index, entity_id in conn.execute(
+                "SELECT op_index, entity_id FROM records "
+                "WHERE job_id = ? AND state = ? AND entity_id IS NOT NULL",
+                (self.job_id, SUCCEEDED),
+            )
+        }
+
+    def record_assigned_ids(self, entity_ids: Dict[int, str]) -> None:
+        """
+        Store client-generated primary keys so a resumed job reuses them.
+
+        IDs already stored for an operation are kept.
+
+        Args:
+            entity_ids: Mapping of operation index to primary key
+        """
+        conn = self._connect()
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO assigned_ids (job_id, op_index, entity_id) "
+                "VALUES (?, ?, ?)",
+                [(self.job_id, index, entity_id) for index, entity_id in entity_ids.items()],
+            )
+
+    def get_assigned_ids(self) -> Dict[int, str]:
+        """
+        Get the client-generated primary keys stored for the job.
+
+        Returns:
+            Mapping of operation index to primary key
+        """
+        conn = self._connect()
+        return dict(conn.execute(
+            "SELECT op_index, entity_id FROM assigned_ids WHERE job_id = ?",
+            (self.job_id,),
+        ))
+
+    def reset(self) -> None:
+        """Remove every record of the job from the journal."""
+        conn = self._connect()
+        with conn:
+            for table in ("jobs", "chunks", "records", "assigned_ids"):
+                conn.execute(f"DELETE FROM {table} WHERE job_id = ?", (self.job_id,))
+        self._next_chunk_id = 0
+
+    @staticmethod
+    def _job_fingerprint(operations: List[Dict[str, Any]]) -> str:
+        """Fingerprint a job by its size and boundary operations."""
+        if not operations:
+            return "empty"
+        return "-".join([
+            str(len(operations)),
+            operation_fingerprint(operations[0]),
+            operation_fingerprint(operations[-1]),
+        ])
+
+
+# Convenience exports
+__all__ = [
+    "BulkJournal",
+    "operation_fingerprint",
+    "PENDING",
+    "IN_FLIGHT",
+    "SUCCEEDED",
+    "FAILED",
+    "TRANSIENT",
+]
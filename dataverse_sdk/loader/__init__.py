@@ -0,0 +1,174 @@
+"""
+Read coalescing for the Dataverse SDK.
+
+This module implements the DataLoader pattern for single-record reads:
+reads arriving within a short window are collected, identical keys are
+deduplicated, and each group is fetched with one batched query whose results
+are fanned back out to every awaiting caller.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from ..batch import BatchProcessor
+from ..exceptions import EntityNotFoundError
+
+
+logger = structlog.get_logger(__name__)
+
+
+GroupKey = Tuple[str, Optional[Tuple[str, ...]]]
+
+
+class ReadLoader:
+    """
+    Coalesces concurrent single-record reads into batched queries.
+
+    Reads are grouped by entity type and selected fields. The first read of a
+    group starts a timer of ``max_delay_ms``; when it fires (or the group
+    reaches ``max_batch_size`` distinct IDs) the group is loaded with
+    :meth:`BatchProcessor.read_many`. Callers receive their own copy of the
+    record, or :class:`EntityNotFoundError` if it does not exist.
+
+    Example:
+        ```python
+        loader = ReadLoader(sdk.batch_processor, max_delay_ms=5)
+        accounts = await asyncio.gather(*(loader.load("accounts", i) for i in ids))
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_processor: BatchProcessor,
+        max_delay_ms: float = 2.0,
+        max_batch_size: int = 1000,
+    ) -> None:
+        """
+        Initialize the loader.
+
+        Args:
+            batch_processor: Batch processor used to read the records
+            max_delay_ms: Time to collect reads before sending a group
+            max_batch_size: Maximum number of distinct IDs per group
+        """
+        self.batch_processor = batch_processor
+        self.max_delay_ms = max_delay_ms
+        self.max_batch_size = max_batch_size
+
+        self._pending: Dict[GroupKey, Dict[str, asyncio.Future]] = {}
+        self._timers: Dict[GroupKey, asyncio.TimerHandle] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self.metrics = {
+            "requests": 0,
+            "deduplicated": 0,
+            "batches": 0,
+        }
+
+    async def load(
+        self,
+        entity_type: str,
+        entity_id: str,
+        select: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Load a record, sharing the request with concurrent reads.
+
+        Args:
+            entity_type: Entity set name
+            entity_id: Entity ID
+            select: Fields to select
+
+        Returns:
+            Entity data
+
+        Raises:
+            EntityNotFoundError: If the entity is not found
+        """
+        loop = asyncio.get_running_loop()
+        key: GroupKey = (entity_type, tuple(select) if select else None)
+        normalized = str(entity_id).strip("{}").lower()
+
+        self.metrics["requests"] += 1
+        group = self._pending.setdefault(key, {})
+        future = group.get(normalized)
+
+        if future is not None:
+            self.metrics["deduplicated"] += 1
+        else:
+            future = loop.create_future()
+            group[normalized] = future
+
+            if len(group) >= self.max_batch_size:
+                self._dispatch(key)
+            elif len(group) == 1:
+                self._timers[key] = loop.call_later(
+                    self.max_delay_ms / 1000, self._dispatch, key
+                )
+
+        # A cancelled caller must not cancel the read shared with others
+        record = await asyncio.shield(future)
+        return dict(record)
+
+    async def flush(self) -> None:
+        """Send every pending group now and wait for all loads to finish."""
+        for key in list(self._pending):
+            self._dispatch(key)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self, key: GroupKey) -> None:
+        """Start loading a pending group."""
+        timer = self._timers.pop(key, None)
+        if timer is not None:
+            timer.cancel()
+
+        group = self._pending.pop(key, None)
+        if not group:
+            return
+
+        task = asyncio.ensure_future(self._load_group(key, group))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_group(
+        self,
+        key: GroupKey,
+        group: Dict[str, asyncio.Future],
+    ) -> None:
+        """Load a group of records and resolve the waiting callers."""
+        entity_type, select = key
+        entity_ids = list(group)
+        self.metrics["batches"] += 1
+
+        try:
+            records = await self.batch_processor.read_many(
+                entity_type, entity_ids, list(select) if select else None
+            )
+        except Exception as e:
+            for future in group.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for entity_id, record in zip(entity_ids, records):
+            future = group[entity_id]
+            if future.done():
+                continue
+            if record is None:
+                future.set_exception(EntityNotFoundError(entity_type, entity_id))
+            else:
+                future.set_result(record)
+
+        logger.debug(
+            "Coalesced reads loaded",
+            entity_type=entity_type,
+            record_count=len(entity_ids),
+        )
+
+
+# Convenience exports
+__all__ = [
+    "ReadLoader",
+]
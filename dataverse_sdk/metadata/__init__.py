@@ -0,0 +1,692 @@
+"""
+Metadata cache for the Dataverse SDK.
+
+This module keeps entity and attribute definitions in memory, indexed for
+constant-time lookups of entity set names, primary keys and attribute types,
+and optionally persists them to disk per organization and version so later
+processes start without downloading them again. Persisted definitions are
+kept current with ``RetrieveMetadataChanges``, which only returns what
+changed since the stored ``ClientVersionStamp``.
+"""
+
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
+from urllib.parse import urlsplit
+
+import structlog
+
+from ..client import AsyncDataverseClient
+from ..exceptions import APIError, MetadataError
+from ..utils import chunk_list
+
+
+logger = structlog.get_logger(__name__)
+
+
+ENTITY_PROPERTIES = (
+    "MetadataId",
+    "LogicalName",
+    "SchemaName",
+    "EntitySetName",
+    "LogicalCollectionName",
+    "PrimaryIdAttribute",
+    "PrimaryNameAttribute",
+    "ObjectTypeCode",
+    "IsCustomEntity",
+    "IsActivity",
+    "ChangeTrackingEnabled",
+)
+
+ATTRIBUTE_PROPERTIES = (
+    "MetadataId",
+    "LogicalName",
+    "SchemaName",
+    "AttributeType",
+    "AttributeOf",
+    "IsPrimaryId",
+    "IsPrimaryName",
+    "IsCustomAttribute",
+    "IsValidForCreate",
+    "IsValidForUpdate",
+    "IsValidForRead",
+    "RequiredLevel",
+)
+
+# Type-specific attribute properties, loaded with casts of the Attributes collection
+TYPED_ATTRIBUTE_PROPERTIES = (
+    ("StringAttributeMetadata", "MaxLength"),
+    ("MemoAttributeMetadata", "MaxLength"),
+    ("IntegerAttributeMetadata", "MinValue,MaxValue"),
+    ("BigIntAttributeMetadata", "MinValue,MaxValue"),
+    ("DecimalAttributeMetadata", "Precision,MinValue,MaxValue"),
+    ("DoubleAttributeMetadata", "Precision,MinValue,MaxValue"),
+    ("MoneyAttributeMetadata", "Precision,MinValue,MaxValue"),
+    ("DateTimeAttributeMetadata", "Format"),
+    ("LookupAttributeMetadata", "Targets"),
+)
+
+OPTION_SET_ATTRIBUTE_TYPES = (
+    "PicklistAttributeMetadata",
+    "StateAttributeMetadata",
+    "StatusAttributeMetadata",
+    "MultiSelectPicklistAttributeMetadata",
+)
+
+# Number of entity names per $filter when loading selected entities
+_FILTER_CHUNK_SIZE = 40
+
+# Error raised by RetrieveMetadataChanges when the version stamp is too old
+_EXPIRED_VERSION_STAMP = "0x80044352"
+
+
+class MetadataCache:
+    """
+    Indexed cache of entity and attribute definitions.
+
+    Entity definitions are bulk-loaded with a single ``EntityDefinitions``
+    request (``$select`` of the properties above, optionally expanding
+    attributes); attributes of other entities are loaded the first time they
+    are needed. Entities can be looked up by logical name or entity set name.
+
+    With a ``path``, definitions are persisted as JSON in that directory in a
+    file named after the organization host, and reused by later processes
+    without any request. A restored cache is not checked against the server
+    on load; :meth:`refresh` brings it up to date (including after an
+    organization upgrade) from its stored version stamp.
+
+    Example:
+        ```python
+        cache = MetadataCache(sdk.client, path="~/.cache/dataverse")
+        entity_set = await cache.entity_set_name("account")  # "accounts"
+        ```
+    """
+
+    def __init__(
+        self,
+        client: AsyncDataverseClient,
+        path: Optional[Union[str, Path]] = None,
+    ) -> None:
+        """
+        Initialize the metadata cache.
+
+        Args:
+            client: Dataverse client instance
+            path: Directory where definitions are persisted (memory only if None)
+        """
+        self.client = client
+        self.path = Path(path).expanduser() if path else None
+
+        self.entities: Dict[str, Dict[str, Any]] = {}
+        self.entity_sets: Dict[str, str] = {}
+        self.attributes: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.definitions: Dict[str, Dict[str, Any]] = {}
+        self.schemas: Set[str] = set()
+        self.complete = False
+        self.version_stamp: Optional[str] = None
+
+        self._lock = asyncio.Lock()
+        self._restored = False
+
+    # Lookups
+
+    async def resolve(self, name: str) -> str:
+        """
+        Resolve an entity logical name or entity set name to the logical name.
+
+        Args:
+            name: Entity logical name or entity set name
+
+        Returns:
+            Entity logical name
+
+        Raises:
+            MetadataError: If the entity does not exist
+        """
+        logical_name = self._lookup(name)
+        if logical_name is None:
+            await self.load()
+            logical_name = self._lookup(name)
+        if logical_name is None:
+            raise MetadataError(f"Entity '{name}' not found")
+        return logical_name
+
+    async def get_entity(self, name: str) -> Dict[str, Any]:
+        """
+        Get the definition of an entity.
+
+        Args:
+            name: Entity logical name or entity set name
+
+        Returns:
+            Entity definition
+        """
+        return self.entities[await self.resolve(name)]
+
+    async def get_definition(self, name: str) -> Dict[str, Any]:
+        """
+        Get the full definition of an entity, as returned by the server.
+
+        Args:
+            name: Entity logical name or entity set name
+
+        Returns:
+            Entity definition with all properties
+        """
+        logical_name = await self.resolve(name)
+        if logical_name not in self.definitions:
+            async with self._lock:
+                if logical_name not in self.definitions:
+                    definition = await self.client.get(
+                        f"EntityDefinitions(LogicalName='{logical_name}')"
+                    )
+                    self.definitions[logical_name] = definition
+                    self._index_entity(
+                        {key: definition[key] for key in ENTITY_PROPERTIES if key in definition}
+                    )
+                    self._persist()
+        return self.definitions[logical_name]
+
+    async def entity_set_name(self, name: str) -> str:
+        """Get the entity set name of an entity."""
+        return (await self.get_entity(name))["EntitySetName"]
+
+    async def primary_id_attribute(self, name: str) -> str:
+        """Get the primary ID attribute of an entity."""
+        return (await self.get_entity(name))["PrimaryIdAttribute"]
+
+    async def get_attributes(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the attribute definitions of an entity.
+
+        Args:
+            name: Entity logical name or entity set name
+
+        Returns:
+            Attribute definitions by logical name
+        """
+        logical_name = await self.resolve(name)
+        if logical_name not in self.attributes:
+            await self._load_attributes(logical_name)
+        return self.attributes[logical_name]
+
+    async def get_attribute(self, name: str, attribute_name: str) -> Dict[str, Any]:
+        """
+        Get the definition of an attribute.
+
+        Args:
+            name: Entity logical name or entity set name
+            attribute_name: Attribute logical name
+
+        Returns:
+            Attribute definition
+
+        Raises:
+            MetadataError: If the attribute does not exist
+        """
+        attributes = await self.get_attributes(name)
+        if attribute_name not in attributes:
+            raise MetadataError(f"Attribute '{attribute_name}' not found on '{name}'")
+        return attributes[attribute_name]
+
+    async def get_schema(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get attribute definitions with their type-specific properties.
+
+        In addition to :meth:`get_attributes`, attributes carry their length
+        and range limits, ``Format``, lookup ``Targets`` with the
+        ``Navigation`` property per target, and ``Options`` (option values by
+        lower-cased label) for option sets. Loaded once per entity.
+
+        Args:
+            name: Entity logical name or entity set name
+
+        Returns:
+            Attribute definitions by logical name
+        """
+        logical_name = await self.resolve(name)
+        attributes = await self.get_attributes(logical_name)
+        if logical_name in self.schemas:
+            return attributes
+
+        base = f"EntityDefinitions(LogicalName='{logical_name}')"
+        requests = [
+            self._get_all(
+                f"{base}/Attributes/Microsoft.Dynamics.CRM.{type_name}",
+                {"$select": f"LogicalName,{properties}"},
+            )
+            for type_name, properties in TYPED_ATTRIBUTE_PROPERTIES
+        ]
+        requests.extend(
+            self._get_all(
+                f"{base}/Attributes/Microsoft.Dynamics.CRM.{type_name}",
+                {
+                    "$select": "LogicalName",
+                    "$expand": "OptionSet($select=Options),GlobalOptionSet($select=Options)",
+                },
+            )
+            for type_name in OPTION_SET_ATTRIBUTE_TYPES
+        )
+        requests.append(self._get_all(
+            f"{base}/ManyToOneRelationships",
+            {
+                "$select": "ReferencingAttribute,ReferencedEntity,"
+                "ReferencingEntityNavigationPropertyName",
+            },
+        ))
+        *typed, relationships = await asyncio.gather(*requests)
+
+        type_names = [type_name for type_name, _ in TYPED_ATTRIBUTE_PROPERTIES]
+        type_names.extend(OPTION_SET_ATTRIBUTE_TYPES)
+        for type_name, values in zip(type_names, typed):
+            for value in values:
+                attribute = attributes.get(value.get("LogicalName"))
+                if attribute is None:
+                    continue
+                option_set = value.pop("OptionSet", None)
+                global_option_set = value.pop("GlobalOptionSet", None)
+                attribute.update(
+                    {k: v for k, v in value.items() if not k.startswith("@odata")}
+                )
+                if type_name in OPTION_SET_ATTRIBUTE_TYPES:
+                    attribute["MultiSelect"] = type_name == "MultiSelectPicklistAttributeMetadata"
+                    attribute["Options"] = {
+                        self._option_label(option): option["Value"]
+                        for option in (option_set or global_option_set or {}).get("Options", [])
+                    }
+
+        for relationship in relationships:
+            attribute = attributes.get(relationship["ReferencingAttribute"])
+            if attribute is not None:
+                attribute.setdefault("Navigation", {})[relationship["ReferencedEntity"]] = (
+                    relationship["ReferencingEntityNavigationPropertyName"]
+                )
+
+        self.schemas.add(logical_name)
+        self._persist()
+        return attributes
+
+    @staticmethod
+    def _option_label(option: Dict[str, Any]) -> str:
+        """Get the lower-cased label of an option (its value if unlabeled)."""
+        label = ((option.get("Label") or {}).get("UserLocalizedLabel") or {}).get("Label")
+        return (label or str(option["Value"])).lower()
+
+    async def attribute_type(self, name: str, attribute_name: str) -> str:
+        """Get the ``AttributeType`` of an attribute."""
+        return (await self.get_attribute(name, attribute_name))["AttributeType"]
+
+    def _lookup(self, name: str) -> Optional[str]:
+        """Find the logical name of an entity without loading anything."""
+        if name in self.entities:
+            return name
+        return self.entity_sets.get(name)
+
+    # Loading
+
+    async def load(
+        self,
+        entity_types: Optional[Iterable[str]] = None,
+        attributes: bool = False,
+    ) -> None:
+        """
+        Bulk-load entity definitions.
+
+        Without ``entity_types``, every entity is loaded with one request and
+        the cache is marked complete. Definitions already persisted on disk
+        are reused instead.
+
+        Args:
+            entity_types: Logical names of the entities to load (all if None)
+            attributes: Whether to expand the attributes of the loaded entities
+        """
+        async with self._lock:
+            await self._restore()
+
+            names = None if entity_types is None else [
+                name for name in entity_types
+                if name not in self.entities
+                or (attributes and name not in self.attributes)
+            ]
+            if names is None and self.complete and not attributes:
+                return
+            if names == []:
+                return
+
+            params = {"$select": ",".join(ENTITY_PROPERTIES)}
+            if attributes:
+                params["$expand"] = f"Attributes($select={','.join(ATTRIBUTE_PROPERTIES)})"
+
+            if names is None:
+                definitions = await self._get_all("EntityDefinitions", params)
+                self.complete = True
+            else:
+                definitions = []
+                for chunk in chunk_list(names, _FILTER_CHUNK_SIZE):
+                    chunk_params = dict(params)
+                    chunk_params["$filter"] = " or ".join(
+                        f"LogicalName eq '{name}'" for name in chunk
+                    )
+                    definitions.extend(await self._get_all("EntityDefinitions", chunk_params))
+
+            for definition in definitions:
+                self._index_entity(definition)
+
+            logger.debug(
+                "Entity metadata loaded",
+                entity_count=len(definitions),
+                attributes=attributes,
+            )
+            self._persist()
+
+    async def _load_attributes(self, logical_name: str) -> None:
+        """Load the attribute definitions of one entity."""
+        async with self._lock:
+            if logical_name in self.attributes:
+                return
+            attributes = await self._get_all(
+                f"EntityDefinitions(LogicalName='{logical_name}')/Attributes",
+                {"$select": ",".join(ATTRIBUTE_PROPERTIES)},
+            )
+            self.attributes[logical_name] = {
+                attribute["LogicalName"]: attribute for attribute in attributes
+            }
+            self._persist()
+
+    async def _get_all(self, endpoint: str, params: Dict[str, str]) -> List[Dict[str, Any]]:
+        """Get every page of a metadata collection."""
+        response = await self.client.get(endpoint, params=params)
+        values = list(response.get("value", []))
+        while response.get("@odata.nextLink"):
+            response = await self.client.get(response["@odata.nextLink"])
+            values.extend(response.get("value", []))
+        return values
+
+    def _index_entity(self, definition: Dict[str, Any]) -> None:
+        """Add an entity definition to the indexes."""
+        definition = dict(definition)
+        attributes = definition.pop("Attributes", None)
+        logical_name = definition["LogicalName"]
+
+        previous = self.entities.get(logical_name)
+        if previous and previous.get("EntitySetName") != definition.get("EntitySetName"):
+            self.entity_sets.pop(previous.get("EntitySetName"), None)
+
+        self.entities[logical_name] = definition
+        if definition.get("EntitySetName"):
+            self.entity_sets[definition["EntitySetName"]] = logical_name
+        if attributes is not None:
+            self.attributes[logical_name] = {
+                attribute["LogicalName"]: attribute for attribute in attributes
+            }
+
+    async def refresh(self, attributes: bool = True) -> Dict[str, int]:
+        """
+        Synchronize the cache with ``RetrieveMetadataChanges``.
+
+        The first call downloads every entity (and its attributes) and stores
+        the returned ``ServerVersionStamp``. Later calls send it back as
+        ``ClientVersionStamp`` and only apply the definitions changed or
+        deleted since then. If the server no longer accepts the stamp, a full
+        synchronization is done instead.
+
+        Args:
+            attributes: Whether to synchronize attribute definitions
+
+        Returns:
+            Number of entities changed and of entities and attributes deleted
+        """
+        async with self._lock:
+            await self._restore()
+
+            try:
+                response = await self._retrieve_metadata_changes(attributes)
+            except APIError as e:
+                if self.version_stamp is None or not self._is_expired_stamp(e):
+                    raise
+                logger.info("Metadata version stamp expired, synchronizing all definitions")
+                self.version_stamp = None
+                response = await self._retrieve_metadata_changes(attributes)
+
+            full = self.version_stamp is None
+            if full:
+                self.entities.clear()
+                self.entity_sets.clear()
+                self.attributes.clear()
+                self.definitions.clear()
+                self.schemas.clear()
+
+            changed = response.get("EntityMetadata") or []
+            for definition in changed:
+                self._merge_entity(definition, attributes)
+
+            deleted_entities, deleted_attributes = self._apply_deleted(
+                response.get("DeletedMetadata") or {}
+            )
+
+            if full:
+                self.complete = True
+            self.version_stamp = response.get("ServerVersionStamp")
+            self._persist()
+
+            logger.debug(
+                "Metadata changes applied",
+                full=full,
+                changed_entities=len(changed),
+                deleted_entities=deleted_entities,
+                deleted_attributes=deleted_attributes,
+            )
+            return {
+                "changed_entities": len(changed),
+                "deleted_entities": deleted_entities,
+                "deleted_attributes": deleted_attributes,
+            }
+
+    async def _retrieve_metadata_changes(self, attributes: bool) -> Dict[str, Any]:
+        """Call RetrieveMetadataChanges with the stored version stamp."""
+        query: Dict[str, Any] = {
+            "Properties": {"AllProperties": False, "PropertyNames": list(ENTITY_PROPERTIES)},
+        }
+        if attributes:
+            query["Properties"]["PropertyNames"].append("Attributes")
+            query["AttributeQuery"] = {
+                "Properties": {
+                    "AllProperties": False,
+                    "PropertyNames": list(ATTRIBUTE_PROPERTIES),
+                },
+            }
+
+        params = {"@q": json.dumps(query, separators=(",", ":"))}
+        if self.version_stamp is None:
+            endpoint = "RetrieveMetadataChanges(Query=@q)"
+        else:
+            endpoint = (
+                "RetrieveMetadataChanges(Query=@q,ClientVersionStamp=@s,"
+                "DeletedMetadataFilters=@d)"
+            )
+            params["@s"] = f"'{self.version_stamp}'"
+            params["@d"] = "Microsoft.Dynamics.CRM.DeletedMetadataFilters'All'"
+
+        return await self.client.get(endpoint, params=params)
+
+    @staticmethod
+    def _is_expired_stamp(error: APIError) -> bool:
+        """Check whether an error reports an expired version stamp."""
+        code = str(error.response_data.get("error", {}).get("code", ""))
+        return _EXPIRED_VERSION_STAMP in code.lower() or "ExpiredVersionStamp" in str(error)
+
+    def _merge_entity(self, definition: Dict[str, Any], attributes: bool) -> None:
+        """Update a cached entity with a changed definition."""
+        definition = {key: value for key, value in definition.items() if value is not None}
+        changed_attributes = definition.pop("Attributes", None)
+
+        logical_name = definition.get("LogicalName") or self._logical_name_by_id(
+            definition.get("MetadataId")
+        )
+        if logical_name is None:
+            return
+
+        merged = dict(self.entities.get(logical_name, {}))
+        merged.update(definition)
+        merged["LogicalName"] = logical_name
+        self._index_entity(merged)
+        self.definitions.pop(logical_name, None)
+        self.schemas.discard(logical_name)
+
+        if attributes and changed_attributes is not None:
+            cached = self.attributes.setdefault(logical_name, {})
+            by_id = {
+                attribute.get("MetadataId"): name for name, attribute in cached.items()
+            }
+            for attribute in changed_attributes:
+                attribute = {k: v for k, v in attribute.items() if v is not None}
+                name = attribute.get("LogicalName") or by_id.get(attribute.get("MetadataId"))
+                if name is not None:
+                    cached[name] = {**cached.get(name, {}), **attribute, "LogicalName": name}
+
+    def _apply_deleted(self, deleted: Dict[str, Any]) -> Tuple[int, int]:
+        """Remove deleted entities and attributes from the cache."""
+        # Serialized as parallel Keys (filter names) and Values (MetadataId lists)
+        deleted_ids: Dict[str, Set[str]] = {}
+        for key, values in zip(deleted.get("Keys") or [], deleted.get("Values") or []):
+            deleted_ids.setdefault(key, set()).update(values or [])
+
+        entity_ids = deleted_ids.get("Entity", set())
+        attribute_ids = deleted_ids.get("Attribute", set())
+
+        deleted_entities = 0
+        for metadata_id in entity_ids:
+            logical_name = self._logical_name_by_id(metadata_id)
+            if logical_name is not None:
+                self._drop_entity(logical_name)
+                deleted_entities += 1
+
+        deleted_attributes = 0
+        if attribute_ids:
+            for attributes in self.attributes.values():
+                for name in [
+                    name for name, attribute in attributes.items()
+                    if attribute.get("MetadataId") in attribute_ids
+                ]:
+                    del attributes[name]
+                    deleted_attributes += 1
+
+        return deleted_entities, deleted_attributes
+
+    def _logical_name_by_id(self, metadata_id: Optional[str]) -> Optional[str]:
+        """Find the logical name of an entity by its MetadataId."""
+        if metadata_id is None:
+            return None
+        for logical_name, definition in self.entities.items():
+            if definition.get("MetadataId") == metadata_id:
+                return logical_name
+        return None
+
+    def _drop_entity(self, logical_name: str) -> None:
+        """Remove an entity from every index."""
+        definition = self.entities.pop(logical_name, None)
+        if definition is not None:
+            self.entity_sets.pop(definition.get("EntitySetName"), None)
+        self.attributes.pop(logical_name, None)
+        self.definitions.pop(logical_name, None)
+        self.schemas.discard(logical_name)
+
+    def invalidate(self, logical_name: Optional[str] = None) -> None:
+        """
+        Drop cached definitions so they are loaded again.
+
+        Args:
+            logical_name: Only drop this entity (all if None)
+        """
+        if logical_name is None:
+            self.entities.clear()
+            self.entity_sets.clear()
+            self.attributes.clear()
+            self.definitions.clear()
+            self.schemas.clear()
+            self.complete = False
+            self.version_stamp = None
+        else:
+            self._drop_entity(logical_name)
+        self._persist()
+
+    # Persistence
+
+    async def _restore(self) -> None:
+        """Read persisted definitions once, without contacting the server."""
+        if self._restored or self.path is None:
+            return
+        self._restored = True
+
+        cache_file = self.cache_file
+        if not cache_file.exists():
+            return
+        try:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            logger.warning("Failed to read metadata cache", path=str(cache_file), error=str(e))
+            return
+
+        self.restore_state(data)
+        logger.debug(
+            "Metadata cache restored",
+            path=str(cache_file),
+            entity_count=len(self.entities),
+        )
+
+    @property
+    def cache_file(self) -> Path:
+        """Path of the persisted cache of this organization."""
+        if self.path is None:
+            raise MetadataError("Metadata cache has no path")
+        host = urlsplit(self.client.dataverse_url).netloc.replace(":", "_")
+        return self.path / f"{host}.json"
+
+    def restore_state(self, data: Dict[str, Any]) -> None:
+        """Replace the cached definitions with a persisted state."""
+        self.entities.clear()
+        self.entity_sets.clear()
+        self.attributes = {
+            name: dict(attributes) for name, attributes in data.get("attributes", {}).items()
+        }
+        self.definitions = dict(data.get("definitions", {}))
+        self.schemas = set(data.get("schemas", []))
+        for definition in data.get("entities", {}).values():
+            self._index_entity(definition)
+        self.complete = data.get("complete", False)
+        self.version_stamp = data.get("version_stamp")
+
+    def dump_state(self) -> Dict[str, Any]:
+        """Get the cached definitions as a JSON-serializable state."""
+        return {
+            "saved_at": time.time(),
+            "complete": self.complete,
+            "version_stamp": self.version_stamp,
+            "entities": self.entities,
+            "attributes": self.attributes,
+            "definitions": self.definitions,
+            "schemas": sorted(self.schemas),
+        }
+
+    def _persist(self) -> None:
+        """Write the cached definitions to disk."""
+        if self.path is None or not self._restored:
+            return
+        cache_file = self.cache_file
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = cache_file.with_suffix(".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self.dump_state(), f, separators=(",", ":"))
+        os.replace(temp_file, cache_file)
+
+
+# Convenience exports
+__all__ = [
+    "MetadataCache",
+    "ENTITY_PROPERTIES",
+    "ATTRIBUTE_PROPERTIES",
+]
@@ -0,0 +1,584 @@
+"""
+Local SQLite mirror of Dataverse tables.
+
+This module replicates selected tables into a local SQLite database. Each
+table is filled with a full load and then kept current with change tracking
+or ``modifiedon`` watermark syncs, and simple queries are answered from the
+local copy without calling the Web API.
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import structlog
+
+from ..client import AsyncDataverseClient
+from ..exceptions import ValidationError
+from ..models import QueryOptions, QueryResult
+from ..sync import ChangeTracker, SyncStateStore, WatermarkExtractor
+
+
+logger = structlog.get_logger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mirror_tables (
+    entity_type TEXT PRIMARY KEY,
+    primary_id TEXT NOT NULL,
+    generation INTEGER NOT NULL DEFAULT 0,
+    synced_at REAL
+);
+CREATE TABLE IF NOT EXISTS mirror_state (
+    key TEXT PRIMARY KEY,
+    state TEXT NOT NULL
+);
+"""
+
+_NAME = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# Tokens of the supported $filter subset
+_TOKEN = re.compile(
+    r"\s*(?:"
+    r"(?P<string>'(?:[^']|'')*')"
+    r"|(?P<datetime>\d{4}-\d{2}-\d{2}T[0-9:.]+(?:Z|[+-]\d{2}:\d{2})?)"
+    r"|(?P<guid>[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})"
+    r"|(?P<number>-?\d+(?:\.\d+)?)"
+    r"|(?P<punct>[(),])"
+    r"|(?P<word>[A-Za-z_][A-Za-z0-9_]*)"
+    r")"
+)
+
+_COMPARISONS = {"eq": "=", "ne": "!=", "gt": ">", "ge": ">=", "lt": "<", "le": "<="}
+
+_FUNCTIONS = {
+    "contains": "'%' || {} || '%'",
+    "startswith": "{} || '%'",
+    "endswith": "'%' || {}",
+}
+
+
+def _quote(name: str) -> str:
+    """Quote a validated SQLite identifier."""
+    if not _NAME.match(name):
+        raise ValidationError(f"Invalid table or column name: {name}")
+    return f'"{name}"'
+
+
+class _FilterTranslator:
+    """Translates a subset of OData ``$filter`` to SQLite over JSON rows."""
+
+    def __init__(self, expression: str, column: Any) -> None:
+        """Tokenize a filter; ``column`` maps column names to SQL expressions."""
+        self.tokens = self._tokenize(expression)
+        self.position = 0
+        self.column = column
+        self.params: List[Any] = []
+
+    @staticmethod
+    def _tokenize(expression: str) -> List[Tuple[str, str]]:
+        """Split a filter into (kind, text) tokens."""
+        tokens, position = [], 0
+        expression = expression.strip()
+        while position < len(expression):
+            match = _TOKEN.match(expression, position)
+            if not match or match.end() == position:
+                raise ValidationError(f"Unsupported filter near: {expression[position:]}")
+            tokens.append((match.lastgroup, match.group(match.lastgroup)))
+            position = match.end()
+        return tokens
+
+    def translate(self) -> Tuple[str, List[Any]]:
+        """Get the SQL condition and its parameters."""
+        sql = self._or()
+        if self.position != len(self.tokens):
+            raise ValidationError(f"Unsupported filter token: {self.tokens[self.position][1]}")
+        return sql, self.params
+
+    def _peek(self) -> Tuple[Optional[str], Optional[str]]:
+        """Get the next token without consuming it."""
+        return self.tokens[self.position] if self.position < len(self.tokens) else (None, None)
+
+    def _take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        """Consume the next token, optionally requiring its text."""
+        token = self._peek()
+        if token[0] is None or (value is not None and token[1] != value):
+            raise ValidationError(f"Unsupported filter: expected {value or 'operand'}")
+        self.position += 1
+        return token
+
+    def _or(self) -> str:
+        """Parse ``or`` expressions."""
+        sql = self._and()
+        while self._peek() == ("word", "or"):
+            self._take()
+            sql = f"({sql} OR {self._and()})"
+        return sql
+
+    def _and(self) -> str:
+        """Parse ``and`` expressions."""
+        sql = self._not()
+        while self._peek() == ("word", "and"):
+            self._take()
+            sql = f"({sql} AND {self._not()})"
+        return sql
+
+    def _not(self) -> str:
+        """Parse ``not`` and parenthesized expressions."""
+        if self._peek() == ("word", "not"):
+            self._take()
+            return f"NOT {self._not()}"
+        if self._peek() == ("punct", "("):
+            self._take()
+            sql = self._or()
+            self._take(")")
+            return f"({sql})"
+        return self._comparison()
+
+    def _comparison(self) -> str:
+        """Parse a comparison or string function call."""
+        kind, value = self._take()
+        if kind == "word" and value in _FUNCTIONS and self._peek() == ("punct", "("):
+            self._take("(")
+            column = self.column(self._take()[1])
+            self._take(",")
+            pattern = self._literal()
+            if isinstance(self.params[-1], str):
+                self.params[-1] = re.sub(r"([\\%_])", r"\\\1", self.params[-1])
+            self._take(")")
+            return f"{column} LIKE {_FUNCTIONS[value].format(pattern)} ESCAPE '\\'"
+        if kind != "word":
+            raise ValidationError(f"Unsupported filter operand: {value}")
+
+        column = self.column(value)
+        operator = self._take()[1]
+        if operator not in _COMPARISONS:
+            raise ValidationError(f"Unsupported filter operator: {operator}")
+        if self._peek() == ("word", "null"):
+            self._take()
+            if operator not in ("eq", "ne"):
+                raise ValidationError("null can only be compared with eq or ne")
+            return f"{column} IS {'NOT ' if operator == 'ne' else ''}NULL"
+        return f"{column} {_COMPARISONS[operator]} {self._literal()}"
+
+    def _literal(self) -> str:
+        """Parse a literal into a query parameter."""
+        kind, value = self._take()
+        if kind == "string":
+            self.params.append(value[1:-1].replace("''", "'"))
+        elif kind == "number":
+            self.params.append(float(value) if "." in value else int(value))
+        elif kind == "word" and value in ("true", "false"):
+            self.params.append(1 if value == "true" else 0)
+        elif kind == "guid":
+            self.params.append(value.lower())
+        elif kind == "datetime":
+            self.params.append(value)
+        else:
+            raise ValidationError(f"Unsupported filter literal: {value}")
+        return "?"
+
+
+class _MirrorStateStore(SyncStateStore):
+    """
+    Sync state kept in the mirror database.
+
+    Writes join the mirror's open transaction, so sync positions are
+    committed together with the rows they describe.
+    """
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        """Initialize the state store on an open mirror connection."""
+        self.conn = conn
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a sync, or None if it never ran."""
+        row = self.conn.execute("SELECT state FROM mirror_state WHERE key = ?", (key,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        """Store the state of a sync."""
+        self.conn.execute(
+            "INSERT OR REPLACE INTO mirror_state (key, state) VALUES (?, ?)",
+            (key, json.dumps(state)),
+        )
+
+    def delete(self, key: str) -> None:
+        """Forget the state of a sync."""
+        self.conn.execute("DELETE FROM mirror_state WHERE key = ?", (key,))
+
+
+class DataverseMirror:
+    """
+    Replicates Dataverse tables into a local SQLite database.
+
+    Tables are registered with :meth:`add_table`. The first :meth:`sync` of
+    a table performs a full load; later syncs apply only the changes, using
+    change tracking delta links or, for tables without change tracking, a
+    ``modifiedon`` watermark (which cannot see deletions; use :meth:`reload`
+    to rebuild such a table). Records are stored as JSON, so columns listed
+    in ``indexes`` get SQLite expression indexes and :meth:`query` answers
+    ``QueryOptions`` with a simple ``$filter`` (comparisons, ``and``/``or``/
+    ``not``, ``contains``/``startswith``/``endswith``) locally.
+
+    Example:
+        ```python
+        mirror = sdk.create_mirror("reference.db")
+        mirror.add_table("transactioncurrencies", indexes=["isocurrencycode"])
+        await mirror.sync()
+        result = mirror.query("transactioncurrencies", {"filter": "isocurrencycode eq 'EUR'"})
+        ```
+    """
+
+    def __init__(
+        self,
+        client: AsyncDataverseClient,
+        metadata: Any,
+        path: Union[str, Path] = ":memory:",
+    ) -> None:
+        """
+        Initialize the mirror.
+
+        Args:
+            client: Dataverse client instance
+            metadata: Metadata cache used to resolve primary ID attributes
+            path: Path of the SQLite database (in memory by default)
+        """
+        self.client = client
+        self.metadata = metadata
+        self.path = path
+        self.tables: Dict[str, Dict[str, Any]] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+        self._locks: Dict[str, asyncio.Lock] = {}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the SQLite connection and create the schema if needed."""
+        if self._conn is None:
+            if str(self.path) != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def close(self) -> None:
+        """Close the mirror database."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def add_table(
+        self,
+        entity_type: str,
+        select: Optional[List[str]] = None,
+        indexes: Optional[Sequence[Union[str, Sequence[str]]]] = None,
+        track_changes: bool = True,
+        filter: Optional[str] = None,
+        watermark_attribute: str = "modifiedon",
+        page_size: int = 5000,
+    ) -> None:
+        """
+        Register a table to mirror.
+
+        Args:
+            entity_type: Entity set name
+            select: Columns to mirror (all columns if None)
+            indexes: Columns to index; a sequence of columns creates a composite index
+            track_changes: Sync with change tracking (watermark sync otherwise)
+            filter: Rows to mirror (watermark sync only)
+            watermark_attribute: Datetime attribute of watermark syncs
+            page_size: Records per page
+        """
+        table = _quote(entity_type)
+        if filter and track_changes:
+            raise ValidationError("Change tracking syncs cannot be filtered")
+
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "id TEXT PRIMARY KEY, data TEXT NOT NULL, generation INTEGER NOT NULL)"
+            )
+            for index in indexes or []:
+                columns = [index] if isinstance(index, str) else list(index)
+                name = _quote(f"ix_{entity_type}_{'_'.join(columns)}")
+                expressions = ", ".join(self._column(column) for column in columns)
+                conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({expressions})")
+
+        self.tables[entity_type] = {
+            "select": select,
+            "track_changes": track_changes,
+            "filter": filter,
+            "watermark_attribute": watermark_attribute,
+            "page_size": page_size,
+        }
+
+    async def sync(self, entity_type: Optional[str] = None) -> Dict[str, int]:
+        """
+        Bring mirrored tables up to date.
+
+        Args:
+            entity_type: Table to sync (every registered table if None)
+
+        Returns:
+            Number of changes applied per table
+        """
+        names = [entity_type] if entity_type else list(self.tables)
+        counts = await asyncio.gather(*(self._sync_table(name) for name in names))
+        return dict(zip(names, counts))
+
+    async def reload(self, entity_type: str) -> int:
+        """
+        Rebuild a table with a new full load.
+
+        Args:
+            entity_type: Table to reload
+
+        Returns:
+            Number of records loaded
+        """
+        conn = self._connect()
+        with conn:
+            _MirrorStateStore(conn).delete(self._state_key(entity_type))
+        return await self._sync_table(entity_type)
+
+    async def sync_forever(self, interval: float = 60.0) -> None:
+        """
+        Sync every registered table periodically until cancelled.
+
+        Args:
+            interval: Seconds between syncs
+        """
+        while True:
+            try:
+                await self.sync()
+            except Exception as e:
+                logger.warning("Mirror sync failed", error=str(e))
+            await asyncio.sleep(interval)
+
+    def get(self, entity_type: str, entity_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a mirrored record by ID.
+
+        Args:
+            entity_type: Entity set name
+            entity_id: Primary ID of the record
+
+        Returns:
+            The record, or None if it is not in the mirror
+        """
+        row = self._connect().execute(
+            f"SELECT data FROM {self._table(entity_type)} WHERE id = ?", (entity_id.lower(),)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        entity_type: str,
+        options: Optional[Union[QueryOptions, Dict[str, Any]]] = None,
+    ) -> QueryResult:
+        """
+        Query a mirrored table.
+
+        Supports ``select``, ``filter`` (the subset described on the class),
+        ``order_by``, ``top``, ``skip`` and ``count``; ``expand`` is rejected.
+
+        Args:
+            entity_type: Entity set name
+            options: Query options
+
+        Returns:
+            Query result with the matching records
+        """
+        if isinstance(options, dict):
+            options = QueryOptions(**options)
+        elif options is None:
+            options = QueryOptions()
+        if options.expand:
+            raise ValidationError("The mirror does not support $expand")
+
+        table = self._table(entity_type)
+        where, params = "", []
+        if options.filter:
+            where, params = _FilterTranslator(options.filter, self._column).translate()
+            where = f" WHERE {where}"
+
+        sql = f"SELECT data FROM {table}{where}"
+        if options.order_by:
+            terms = []
+            for term in options.order_by:
+                parts = term.split()
+                direction = parts[1].upper() if len(parts) > 1 else "ASC"
+                if direction not in ("ASC", "DESC") or len(parts) > 2:
+                    raise ValidationError(f"Invalid order by: {term}")
+                terms.append(f"{self._column(parts[0])} {direction}")
+            sql += f" ORDER BY {', '.join(terms)}"
+        if options.top is not None or options.skip:
+            sql += " LIMIT ? OFFSET ?"
+            params_page = [options.top if options.top is not None else -1, options.skip or 0]
+        else:
+            params_page = []
+
+        conn = self._connect()
+        records = [json.loads(row[0]) for row in conn.execute(sql, params + params_page)]
+        if options.select:
+            records = [{k: r.get(k) for k in options.select} for r in records]
+
+        count = None
+        if options.count:
+            count = conn.execute(f"SELECT COUNT(*) FROM {table}{where}", params).fetchone()[0]
+        return QueryResult(value=records, count=count)
+
+    def count(self, entity_type: str) -> int:
+        """Get the number of mirrored records of a table."""
+        return self._connect().execute(f"SELECT COUNT(*) FROM {self._table(entity_type)}").fetchone()[0]
+
+    def _table(self, entity_type: str) -> str:
+        """Get the quoted name of a registered table."""
+        if entity_type not in self.tables:
+            raise ValidationError(f"Table is not mirrored: {entity_type}")
+        return _quote(entity_type)
+
+    @staticmethod
+    def _column(name: str) -> str:
+        """Get the SQL expression of a record column (indexes must match it exactly)."""
+        _quote(name)
+        return f"json_extract(data, '$.{name}')"
+
+    @staticmethod
+    def _state_key(entity_type: str) -> str:
+        """Get the sync state key of a table."""
+        return f"mirror:{entity_type}"
+
+    async def _sync_table(self, entity_type: str) -> int:
+        """Sync one table, one sync at a time."""
+        table = self._table(entity_type)
+        lock = self._locks.setdefault(entity_type, asyncio.Lock())
+        async with lock:
+            config = self.tables[entity_type]
+            conn = self._connect()
+            store = _MirrorStateStore(conn)
+            key = self._state_key(entity_type)
+
+            row = conn.execute(
+                "SELECT primary_id, generation FROM mirror_tables WHERE entity_type = ?",
+                (entity_type,),
+            ).fetchone()
+            if row:
+                primary_id, generation = row
+            else:
+                primary_id, generation = await self.metadata.primary_id_attribute(entity_type), 0
+
+            # A full load stamps its rows with a new generation; rows of older
+            # generations that it did not see are deleted when it completes.
+            # Watermark states do not say whether a load is complete, so a
+            # marker is kept beside them until then
+            loading_key = f"{key}:full_load"
+            state = store.get(key)
+            full_load = state is None
+            if full_load:
+                generation += 1
+            elif state.get("full_load") or state.get("partitions") or store.get(loading_key):
+                full_load = True
+
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO mirror_tables (entity_type, primary_id, generation, synced_at) "
+                    "VALUES (?, ?, ?, (SELECT synced_at FROM mirror_tables WHERE entity_type = ?))",
+                    (entity_type, primary_id, generation, entity_type),
+                )
+                if full_load:
+                    store.set(loading_key, {"generation": generation})
+
+            def upsert(records: List[Dict[str, Any]]) -> None:
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO {table} (id, data, generation) VALUES (?, ?, ?)",
+                    [
+                        (str(r[primary_id]).lower(), json.dumps(r), generation)
+                        for r in records if r.get(primary_id)
+                    ],
+                )
+
+            count = 0
+            try:
+                if config["track_changes"]:
+                    tracker = ChangeTracker(self.client, store)
+                    pending: List[Dict[str, Any]] = []
+                    async for change in tracker.changes(
+                        entity_type,
+                        select=config["select"],
+                        primary_id_attribute=primary_id,
+                        page_size=config["page_size"],
+                        key=key,
+                    ):
+                        if change.full_load and not full_load:
+                            # The delta link expired and a new full load started
+                            upsert(pending)
+                            pending = []
+                            full_load = True
+                            generation += 1
+                            conn.execute(
+                                "UPDATE mirror_tables SET generation = ? WHERE entity_type = ?",
+                                (generation, entity_type),
+                            )
+                            store.set(loading_key, {"generation": generation})
+                        if change.is_delete:
+                            upsert(pending)
+                            pending = []
+                            conn.execute(f"DELETE FROM {table} WHERE id = ?", (str(change.entity_id).lower(),))
+                        else:
+                            pending.append(change.record)
+                        count += 1
+                        if len(pending) >= config["page_size"]:
+                            # Every stored position refers to consumed changes,
+                            # so committing here never skips a record
+                            upsert(pending)
+                            pending = []
+                            conn.commit()
+                    upsert(pending)
+                else:
+                    extractor = WatermarkExtractor(
+                        self.client,
+                        store,
+                        entity_type,
+                        primary_id,
+                        select=config["select"],
+                        filter=config["filter"],
+                        watermark_attribute=config["watermark_attribute"],
+                        page_size=config["page_size"],
+                        key=key,
+                    )
+
+                    async def sink(records: List[Dict[str, Any]]) -> None:
+                        upsert(records)
+                        conn.commit()
+
+                    count = await extractor.run(sink)
+
+                if full_load:
+                    conn.execute(f"DELETE FROM {table} WHERE generation < ?", (generation,))
+                    store.delete(loading_key)
+                conn.execute(
+                    "UPDATE mirror_tables SET synced_at = ? WHERE entity_type = ?",
+                    (time.time(), entity_type),
+                )
+                conn.commit()
+            except BaseException:
+                # Positions may be ahead of uncommitted rows; the next sync
+                # resumes from the last commit
+                conn.rollback()
+                raise
+
+            logger.info("Mirror table synced", entity_type=entity_type, full_load=full_load, change_count=count)
+            return count
+
+
+# Convenience exports
+__all__ = [
+    "DataverseMirror",
+]
@@ -6,7 +6,7 @@ of Dataverse entities and API responses.
 """
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 from uuid import UUID
 
 from pydantic import BaseModel, Field, validator
@@ -324,13 +324,59 @@ class AssociationRequest(BaseModel):
     related_entity_type: str
 
 
+class RecordGraph(BaseModel):
+    """
+    Record to create together with the child records that reference it.
+    
+    Children bind to their parent through ``parent_binding``, the single-valued
+    navigation property of the child that points to the parent (for example
+    ``parentcustomerid_account`` for contacts of an account).
+    """
+    
+    entity_type: str = Field(..., description="Entity set name")
+    data: Dict[str, Any] = Field(default_factory=dict, description="Record data")
+    parent_binding: Optional[str] = Field(
+        None, description="Navigation property binding this record to its parent"
+    )
+    children: List["RecordGraph"] = Field(default_factory=list, description="Child records")
+    entity_id: Optional[str] = Field(None, description="ID of the created record")
+    
+    def iter_records(
+        self,
+        parent: Optional["RecordGraph"] = None,
+    ) -> Iterator[Tuple["RecordGraph", Optional["RecordGraph"]]]:
+        """Iterate over (record, parent) pairs, parents before children."""
+        yield self, parent
+        for child in self.children:
+            yield from child.iter_records(self)
+    
+    @property
+    def record_count(self) -> int:
+        """Total number of records in the graph."""
+        return 1 + sum(child.record_count for child in self.children)
+
+
 class BulkOperationResult(BaseModel):
     """Result of a bulk operation."""
     
     total_processed: int = 0
     successful: int = 0
     failed: int = 0
+    retried: int = Field(0, description="Number of operation retries performed")
     errors: List[Dict[str, Any]] = Field(default_factory=list)
+    permanent_errors: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Errors that were not retried (e.g. 4xx)"
+    )
+    transient_errors: List[Dict[str, Any]] = Field(
+        default_factory=list, description="Transient errors left after all retries"
+    )
+    skipped: int = Field(
+        0, description="Operations already applied (completed in a previous run or already linked)"
+    )
+    uncertain: List[int] = Field(
+        default_factory=list,
+        description="Operations interrupted in flight that may already have been applied",
+    )
     
     @property
     def success_rate(self) -> float:
@@ -345,6 +391,117 @@ class BulkOperationResult(BaseModel):
         return self.failed > 0
 
 
+class BulkUpsertResult(BulkOperationResult):
+    """Result of a bulk upsert with the outcome of every record."""
+    
+    records: List[Optional[UpsertResult]] = Field(
+        default_factory=list,
+        description="Outcome per input record (None if the record failed)",
+    )
+    created: int = Field(0, description="Number of records created")
+    updated: int = Field(0, description="Number of existing records updated")
+    duplicates: int = Field(0, description="Records superseded by a later record with the same key")
+
+
+class LookupReference(BaseModel):
+    """Lookup from the records of an import dataset to another dataset."""
+    
+    field: str = Field(..., description="Record field holding the source key of the referenced record")
+    target: str = Field(..., description="Name of the referenced dataset")
+    navigation_property: Optional[str] = Field(
+        None, description="Single-valued navigation property (resolved from metadata if omitted)"
+    )
+    attribute: Optional[str] = Field(
+        None, description="Lookup attribute logical name (defaults to field)"
+    )
+    deferred: bool = Field(
+        False, description="Set the lookup with an update after all records are created"
+    )
+
+
+class ImportDataset(BaseModel):
+    """Records of one table to import with the import planner."""
+    
+    entity_type: str = Field(..., description="Entity set name")
+    records: List[Dict[str, Any]] = Field(default_factory=list)
+    name: Optional[str] = Field(None, description="Dataset name (defaults to entity_type)")
+    logical_name: Optional[str] = Field(
+        None, description="Entity logical name used to read relationship metadata"
+    )
+    key_field: Optional[str] = Field(
+        None, description="Record field holding the source key referenced by lookups"
+    )
+    key_field_is_column: bool = Field(
+        False,
+        description="Whether the key field is a Dataverse column sent with the record "
+        "(otherwise it is removed from the create body)",
+    )
+    lookups: List[LookupReference] = Field(default_factory=list)
+    
+    @property
+    def dataset_name(self) -> str:
+        """Name identifying the dataset in the import plan."""
+        return self.name or self.entity_type
+
+
+class ImportResult(BaseModel):
+    """Result of a planned multi-table import."""
+    
+    waves: List[List[str]] = Field(default_factory=list, description="Datasets imported per wave")
+    results: Dict[str, BulkOperationResult] = Field(default_factory=dict)
+    deferred: Optional[BulkOperationResult] = Field(
+        None, description="Result of the deferred lookup updates (unresolved ones as failures)"
+    )
+    entity_ids: Dict[str, Dict[str, str]] = Field(
+        default_factory=dict, description="Created IDs per dataset keyed by source key"
+    )
+    
+    @property
+    def successful(self) -> int:
+        """Number of records created successfully."""
+        return sum(result.successful for result in self.results.values())
+    
+    @property
+    def failed(self) -> int:
+        """Number of records that failed or could not be resolved."""
+        return sum(result.failed for result in self.results.values())
+    
+    @property
+    def has_errors(self) -> bool:
+        """Check if there were any errors."""
+        return self.failed > 0 or bool(self.deferred and self.deferred.has_errors)
+
+
+class RecordChange(BaseModel):
+    """A record created, updated or deleted since the last sync."""
+    
+    change_type: str = Field(..., description="'upsert' for new or updated records, 'delete' otherwise")
+    entity_id: Optional[str] = Field(None, description="Primary key of the record")
+    record: Dict[str, Any] = Field(default_factory=dict, description="Record data (empty for deletes)")
+    full_load: bool = Field(
+        False, description="Whether the change comes from a full load rather than a delta"
+    )
+    
+    @property
+    def is_delete(self) -> bool:
+        """Check if the record was deleted."""
+        return self.change_type == "delete"
+
+
+class ExportResult(BaseModel):
+    """Result of a streaming export."""
+    
+    path: str = Field(..., description="Path of the exported file")
+    format: str = Field(..., description="File format (ndjson, csv or parquet)")
+    compression: Optional[str] = Field(None, description="Compression codec, if any")
+    records: int = Field(0, description="Records in the file, including resumed ones")
+    bytes_written: int = Field(0, description="Size of the file")
+    resumed: bool = Field(False, description="Whether a partial export was continued")
+
+
+RecordGraph.model_rebuild()
+
+
 # Common entity models (can be extended by users)
 
 class Account(Entity):
@@ -386,7 +543,14 @@ __all__ = [
     "FetchXMLQuery",
     "UpsertResult",
     "AssociationRequest",
+    "RecordGraph",
     "BulkOperationResult",
+    "BulkUpsertResult",
+    "LookupReference",
+    "ImportDataset",
+    "ImportResult",
+    "RecordChange",
+    "ExportResult",
     "Account",
     "Contact",
 ]
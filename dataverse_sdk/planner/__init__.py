@@ -0,0 +1,400 @@
+"""
+Relationship-aware import planner for the Dataverse SDK.
+
+This module orders the tables of a multi-table import from their lookup
+relationships and loads every independent group of tables (a wave) in
+parallel through the batch processor, binding lookups to the IDs created by
+earlier waves.
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+
+from ..batch import BatchProcessor
+from ..exceptions import ValidationError
+from ..models import BulkOperationResult, ImportDataset, ImportResult, LookupReference
+
+
+logger = structlog.get_logger(__name__)
+
+
+class ImportPlanner:
+    """
+    Plans and runs imports of several related tables.
+
+    Tables are sorted topologically by their lookups so that referenced
+    records are always created first, and tables without dependencies on each
+    other are created in the same wave. Lookups that would form a cycle,
+    including a table referencing itself, must be deferred: they are set with
+    an update once every record has been created. A dataset's ``key_field``
+    is treated as a source-only key and removed from the create body unless
+    ``key_field_is_column`` is set.
+
+    Example:
+        ```python
+        planner = ImportPlanner(sdk.batch_processor, [
+            ImportDataset(entity_type="accounts", key_field="source_id", records=accounts),
+            ImportDataset(
+                entity_type="contacts",
+                key_field="source_id",
+                records=contacts,
+                lookups=[
+                    LookupReference(
+                        field="account_source_id",
+                        target="accounts",
+                        navigation_property="parentcustomerid_account",
+                    ),
+                ],
+            ),
+        ])
+        result = await planner.run()
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_processor: BatchProcessor,
+        datasets: List[ImportDataset],
+    ) -> None:
+        """
+        Initialize the import planner.
+
+        Args:
+            batch_processor: Batch processor used to create the records
+            datasets: Datasets to import
+
+        Raises:
+            ValidationError: If dataset names are not unique
+        """
+        self.batch_processor = batch_processor
+        self.datasets: Dict[str, ImportDataset] = {}
+
+        for dataset in datasets:
+            if dataset.dataset_name in self.datasets:
+                raise ValidationError(f"Duplicate import dataset '{dataset.dataset_name}'")
+            self.datasets[dataset.dataset_name] = dataset
+
+    async def resolve_relationships(self) -> None:
+        """
+        Complete lookups from relationship metadata.
+
+        For every dataset with a ``logical_name``, the many-to-one relationships
+        of the entity are read. Declared lookups without a navigation property
+        get it from the matching relationship, and record fields named after a
+        lookup attribute that references another dataset become lookups.
+
+        Raises:
+            ValidationError: If a declared lookup matches no relationship
+        """
+        by_logical_name = {
+            dataset.logical_name: name
+            for name, dataset in self.datasets.items()
+            if dataset.logical_name
+        }
+
+        for name, dataset in self.datasets.items():
+            if not dataset.logical_name:
+                continue
+
+            response = await self.batch_processor.client.get(
+                f"EntityDefinitions(LogicalName='{dataset.logical_name}')/ManyToOneRelationships",
+                params={
+                    "$select": "ReferencingAttribute,ReferencedEntity,"
+                    "ReferencingEntityNavigationPropertyName",
+                },
+            )
+            relationships = {
+                (rel["ReferencingAttribute"], rel["ReferencedEntity"]):
+                    rel["ReferencingEntityNavigationPropertyName"]
+                for rel in response.get("value", [])
+            }
+
+            declared = {lookup.field for lookup in dataset.lookups}
+            for lookup in dataset.lookups:
+                if lookup.navigation_property:
+                    continue
+                target = self.datasets.get(lookup.target)
+                key = (lookup.attribute or lookup.field, target.logical_name if target else None)
+                if key not in relationships:
+                    raise ValidationError(
+                        f"No relationship found for lookup '{lookup.field}' of dataset '{name}'"
+                    )
+                lookup.navigation_property = relationships[key]
+
+            fields: set = set()
+            for record in dataset.records:
+                fields.update(record)
+
+            for (attribute, referenced), navigation_property in relationships.items():
+                target = by_logical_name.get(referenced)
+                if target is None or attribute not in fields or attribute in declared:
+                    continue
+                dataset.lookups.append(LookupReference(
+                    field=attribute,
+                    target=target,
+                    navigation_property=navigation_property,
+                    deferred=target == name,
+                ))
+                declared.add(attribute)
+
+        logger.debug("Import relationships resolved", datasets=list(self.datasets))
+
+    def plan(self) -> List[List[str]]:
+        """
+        Compute the import waves.
+
+        Returns:
+            Dataset names per wave, in execution order
+
+        Raises:
+            ValidationError: If lookups are incomplete or form a cycle
+        """
+        dependencies: Dict[str, set] = {name: set() for name in self.datasets}
+
+        for name, dataset in self.datasets.items():
+            for lookup in dataset.lookups:
+                target = self.datasets.get(lookup.target)
+                if target is None:
+                    raise ValidationError(
+                        f"Lookup '{lookup.field}' of dataset '{name}' references "
+                        f"unknown dataset '{lookup.target}'"
+                    )
+                if not lookup.navigation_property:
+                    raise ValidationError(
+                        f"Lookup '{lookup.field}' of dataset '{name}' has no navigation "
+                        "property; declare it or call resolve_relationships()"
+                    )
+                if not target.key_field:
+                    raise ValidationError(
+                        f"Dataset '{lookup.target}' is referenced by '{name}' but has no key_field"
+                    )
+                if lookup.target == name and not lookup.deferred:
+                    raise ValidationError(
+                        f"Self-referencing lookup '{lookup.field}' of dataset '{name}' "
+                        "must be deferred"
+                    )
+                if not lookup.deferred:
+                    dependencies[name].add(lookup.target)
+
+        waves = []
+        remaining = dict(dependencies)
+        done: set = set()
+        while remaining:
+            wave = sorted(name for name, deps in remaining.items() if deps <= done)
+            if not wave:
+                raise ValidationError(
+                    "Import datasets have cyclic lookups: "
+                    f"{', '.join(sorted(remaining))}; defer one of the lookups"
+                )
+            waves.append(wave)
+            done.update(wave)
+            for name in wave:
+                del remaining[name]
+
+        return waves
+
+    async def run(
+        self,
+        batch_size: Optional[int] = None,
+        resolve_relationships: bool = True,
+    ) -> ImportResult:
+        """
+        Run the import.
+
+        Args:
+            batch_size: Batch size for operations
+            resolve_relationships: Whether to read relationship metadata first
+
+        Returns:
+            Import result with per-dataset results and created IDs
+        """
+        if resolve_relationships and any(d.logical_name for d in self.datasets.values()):
+            await self.resolve_relationships()
+
+        waves = self.plan()
+        result = ImportResult(
+            waves=waves,
+            entity_ids={name: {} for name in self.datasets},
+        )
+
+        logger.info(
+            "Starting planned import",
+            datasets=len(self.datasets),
+            records=sum(len(d.records) for d in self.datasets.values()),
+            waves=len(waves),
+        )
+
+        for wave in waves:
+            wave_results = await asyncio.gather(
+                *(self._import_dataset(name, result.entity_ids, batch_size) for name in wave)
+            )
+            result.results.update(zip(wave, wave_results))
+
+        deferred, positions, unresolved = self._deferred_operations(result.entity_ids)
+        if deferred or unresolved:
+            result.deferred = (
+                await self.batch_processor.execute_bulk_operation(deferred, batch_size)
+                if deferred else BulkOperationResult()
+            )
+
+            # Report failures by dataset and record position
+            for error in result.deferred.errors:
+                if "operation_index" in error:
+                    error["dataset"], error["record_index"] = positions[error["operation_index"]]
+                if "operation_indices" in error:
+                    error["record_indices"] = [positions[i] for i in error["operation_indices"]]
+
+            for name, index, message in unresolved:
+                error = {"dataset": name, "record_index": index, "error": message}
+                result.deferred.failed += 1
+                result.deferred.errors.append(error)
+                result.deferred.permanent_errors.append(error)
+            result.deferred.total_processed += len(unresolved)
+
+        logger.info(
+            "Planned import completed",
+            successful=result.successful,
+            failed=result.failed,
+        )
+
+        return result
+
+    async def _import_dataset(
+        self,
+        name: str,
+        entity_ids: Dict[str, Dict[str, str]],
+        batch_size: Optional[int],
+    ) -> BulkOperationResult:
+        """Create the records of one dataset, binding lookups to created IDs."""
+        dataset = self.datasets[name]
+        operations = []
+        positions = []
+        unresolved: List[Tuple[int, str]] = []
+
+        for index, record in enumerate(dataset.records):
+            body, error = self._build_body(dataset, record, entity_ids)
+            if error:
+                unresolved.append((index, error))
+                continue
+            operations.append({"method": "POST", "url": dataset.entity_type, "body": body})
+            positions.append(index)
+
+        created = entity_ids[name]
+
+        def on_outcome(operation_index: int, outcome: Dict[str, Any]) -> None:
+            entity_id = outcome.get("entity_id")
+            record = dataset.records[positions[operation_index]]
+            if entity_id and dataset.key_field and dataset.key_field in record:
+                created[str(record[dataset.key_field])] = entity_id
+
+        result = await self.batch_processor.execute_bulk_operation(
+            operations, batch_size, on_outcome=on_outcome
+        )
+
+        # Report failures by record position in the dataset
+        for error in result.errors:
+            if "operation_index" in error:
+                error["record_index"] = positions[error["operation_index"]]
+            if "operation_indices" in error:
+                error["record_indices"] = [positions[i] for i in error["operation_indices"]]
+
+        for index, message in unresolved:
+            error = {"record_index": index, "error": message}
+            result.failed += 1
+            result.errors.append(error)
+            result.permanent_errors.append(error)
+        result.total_processed = len(dataset.records)
+
+        logger.info(
+            "Import dataset completed",
+            dataset=name,
+            successful=result.successful,
+            failed=result.failed,
+        )
+
+        return result
+
+    def _build_body(
+        self,
+        dataset: ImportDataset,
+        record: Dict[str, Any],
+        entity_ids: Dict[str, Dict[str, str]],
+    ) -> Tuple[Dict[str, Any], Optional[str]]:
+        """Build the create body of a record, resolving non-deferred lookups."""
+        excluded = {lookup.field for lookup in dataset.lookups}
+        if dataset.key_field and not dataset.key_field_is_column:
+            # A source-only key is not a column of the table
+            excluded.add(dataset.key_field)
+        body = {key: value for key, value in record.items() if key not in excluded}
+
+        for lookup in dataset.lookups:
+            source_key = record.get(lookup.field)
+            if lookup.deferred or source_key is None:
+                continue
+            target_id = entity_ids[lookup.target].get(str(source_key))
+            if target_id is None:
+                return body, (
+                    f"Unresolved reference '{source_key}' to dataset '{lookup.target}' "
+                    f"in field '{lookup.field}'"
+                )
+            target_set = self.datasets[lookup.target].entity_type
+            body[f"{lookup.navigation_property}@odata.bind"] = f"/{target_set}({target_id})"
+
+        return body, None
+
+    def _deferred_operations(
+        self,
+        entity_ids: Dict[str, Dict[str, str]],
+    ) -> Tuple[List[Dict[str, Any]], List[Tuple[str, int]], List[Tuple[str, int, str]]]:
+        """
+        Build the updates setting deferred lookups between created records.
+
+        Returns the operations, the dataset and record position of each
+        operation, and the deferred references that could not be resolved.
+        """
+        operations = []
+        positions: List[Tuple[str, int]] = []
+        unresolved: List[Tuple[str, int, str]] = []
+
+        for name, dataset in self.datasets.items():
+            deferred = [lookup for lookup in dataset.lookups if lookup.deferred]
+            if not deferred or not dataset.key_field:
+                continue
+
+            for index, record in enumerate(dataset.records):
+                entity_id = entity_ids[name].get(str(record.get(dataset.key_field)))
+                if entity_id is None:
+                    continue
+
+                body = {}
+                for lookup in deferred:
+                    source_key = record.get(lookup.field)
+                    if source_key is None:
+                        continue
+                    target_id = entity_ids[lookup.target].get(str(source_key))
+                    if target_id is None:
+                        unresolved.append((name, index, (
+                            f"Unresolved reference '{source_key}' to dataset '{lookup.target}' "
+                            f"in field '{lookup.field}'"
+                        )))
+                        continue
+                    target_set = self.datasets[lookup.target].entity_type
+                    body[f"{lookup.navigation_property}@odata.bind"] = f"/{target_set}({target_id})"
+
+                if body:
+                    operations.append({
+                        "method": "PATCH",
+                        "url": f"{dataset.entity_type}({entity_id})",
+                        "body": body,
+                    })
+                    positions.append((name, index))
+
+        return operations, positions, unresolved
+
+
+# Convenience exports
+__all__ = [
+    "ImportPlanner",
+]
@@ -0,0 +1,447 @@
+"""
+Schema-compiled record encoders for the Dataverse SDK.
+
+This module compiles attribute metadata into a per-entity encoder once, then
+reuses it to validate and coerce every record before it is sent: values are
+converted to their Web API representation, limits are checked locally, and
+attributes that cannot be written are dropped.
+"""
+
+import math
+import uuid
+from datetime import date, datetime, timezone
+from decimal import ROUND_HALF_EVEN, Decimal, InvalidOperation
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+import structlog
+
+from ..exceptions import MetadataError, ValidationError
+from ..metadata import MetadataCache
+from ..models import EntityReference
+
+
+logger = structlog.get_logger(__name__)
+
+
+# Converts a value to the (key, value) pair written to the payload
+Converter = Callable[[Any], Tuple[str, Any]]
+
+_STRING_TYPES = ("String", "Memo")
+_INTEGER_TYPES = ("Integer", "BigInt")
+_DECIMAL_TYPES = ("Decimal", "Money")
+_OPTION_SET_TYPES = ("Picklist", "State", "Status")
+_LOOKUP_TYPES = ("Lookup", "Customer", "Owner")
+
+
+class EncodedRecords(NamedTuple):
+    """Records encoded by :meth:`EntityEncoder.encode_many`."""
+
+    records: List[Dict[str, Any]]
+    indices: List[int]
+    rejected: List[Dict[str, Any]]
+
+
+class EntityEncoder:
+    """
+    Validates and encodes records of one entity.
+
+    Built by :class:`SchemaCompiler` from attribute metadata. Values are
+    coerced as follows:
+
+    - strings are checked against ``MaxLength``
+    - integers, decimals and money are range-checked; decimals are rounded
+      to the attribute precision
+    - dates and datetimes become ISO 8601 (UTC for naive datetimes)
+    - option sets accept values or labels; multi-select option sets accept lists
+    - lookups accept a GUID (single-target lookups), an ``EntityReference``,
+      a ``(entity, id)`` tuple or ``{"entity": ..., "id": ...}`` and are
+      written as ``<navigation property>@odata.bind``
+
+    Attributes that are unknown or not valid for the operation are dropped;
+    keys containing ``@`` (annotations and explicit binds) are kept as-is.
+    """
+
+    def __init__(
+        self,
+        entity_type: str,
+        attributes: Dict[str, Dict[str, Any]],
+        entity_sets: Dict[str, str],
+    ) -> None:
+        """
+        Compile the encoder.
+
+        Args:
+            entity_type: Entity logical name
+            attributes: Attribute definitions with type-specific properties
+            entity_sets: Entity set names by logical name (for lookup targets)
+        """
+        self.entity_type = entity_type
+        self._logical_names = {entity_set: name for name, entity_set in entity_sets.items()}
+
+        self._create: Dict[str, Converter] = {}
+        self._update: Dict[str, Converter] = {}
+        for name, attribute in attributes.items():
+            converter = self._compile(name, attribute, entity_sets)
+            if converter is None:
+                continue
+            if attribute.get("IsValidForCreate", True):
+                self._create[name] = converter
+            if attribute.get("IsValidForUpdate", True):
+                self._update[name] = converter
+
+    def encode(self, record: Dict[str, Any], for_update: bool = False) -> Dict[str, Any]:
+        """
+        Encode a record.
+
+        Args:
+            record: Record data by attribute logical name
+            for_update: Whether the record is an update (create otherwise)
+
+        Returns:
+            Payload ready to be sent
+
+        Raises:
+            ValidationError: If any value is invalid
+        """
+        payload, errors = self._encode(record, for_update)
+        if errors:
+            raise ValidationError(
+                f"Invalid {self.entity_type} record: {'; '.join(errors)}",
+                details={"errors": errors},
+            )
+        return payload
+
+    def encode_many(
+        self,
+        records: Iterable[Dict[str, Any]],
+        for_update: bool = False,
+    ) -> EncodedRecords:
+        """
+        Encode records, separating the invalid ones.
+
+        Args:
+            records: Records to encode
+            for_update: Whether the records are updates (creates otherwise)
+
+        Returns:
+            Encoded valid records with their input positions, and rejected
+            records as ``{"index": ..., "errors": [...]}``
+        """
+        encoded = EncodedRecords([], [], [])
+        for index, record in enumerate(records):
+            payload, errors = self._encode(record, for_update)
+            if errors:
+                encoded.rejected.append({"index": index, "errors": errors})
+            else:
+                encoded.records.append(payload)
+                encoded.indices.append(index)
+
+        if encoded.rejected:
+            logger.debug(
+                "Records rejected by schema validation",
+                entity_type=self.entity_type,
+                rejected_count=len(encoded.rejected),
+            )
+        return encoded
+
+    def _encode(
+        self,
+        record: Dict[str, Any],
+        for_update: bool,
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Encode a record and collect its errors."""
+        converters = self._update if for_update else self._create
+        payload: Dict[str, Any] = {}
+        errors: List[str] = []
+
+        for key, value in record.items():
+            if "@" in key:
+                payload[key] = value
+                continue
+            converter = converters.get(key)
+            if converter is None:
+                continue
+            try:
+                name, encoded = converter(value)
+            except (ValueError, TypeError, InvalidOperation) as e:
+                errors.append(f"{key}: {e}")
+                continue
+            payload[name] = encoded
+
+        return payload, errors
+
+    # Compilation
+
+    def _compile(
+        self,
+        name: str,
+        attribute: Dict[str, Any],
+        entity_sets: Dict[str, str],
+    ) -> Optional[Converter]:
+        """Build the converter of an attribute (None if it cannot be written)."""
+        attribute_type = attribute.get("AttributeType")
+        if attribute.get("AttributeOf"):
+            return None
+
+        if attribute_type in _STRING_TYPES:
+            return _nullable(name, _string_converter(attribute.get("MaxLength")))
+        if attribute_type in _INTEGER_TYPES:
+            return _nullable(name, _integer_converter(
+                attribute.get("MinValue"), attribute.get("MaxValue")
+            ))
+        if attribute_type in _DECIMAL_TYPES:
+            return _nullable(name, _decimal_converter(
+                attribute.get("Precision"), attribute.get("MinValue"), attribute.get("MaxValue")
+            ))
+        if attribute_type == "Double":
+            return _nullable(name, _double_converter(
+                attribute.get("MinValue"), attribute.get("MaxValue")
+            ))
+        if attribute_type == "Boolean":
+            return _nullable(name, _boolean)
+        if attribute_type == "DateTime":
+            return _nullable(name, _datetime_converter(attribute.get("Format") == "DateOnly"))
+        if attribute_type in _OPTION_SET_TYPES:
+            return _nullable(name, _option_converter(attribute.get("Options")))
+        if attribute_type == "Virtual" and attribute.get("MultiSelect"):
+            option = _option_converter(attribute.get("Options"))
+            return _nullable(name, lambda values: ",".join(
+                str(option(value)) for value in _as_list(values)
+            ))
+        if attribute_type == "Uniqueidentifier":
+            return _nullable(name, lambda value: str(uuid.UUID(str(value))))
+        if attribute_type in _LOOKUP_TYPES:
+            return self._lookup_converter(name, attribute, entity_sets)
+        return None
+
+    def _lookup_converter(
+        self,
+        name: str,
+        attribute: Dict[str, Any],
+        entity_sets: Dict[str, str],
+    ) -> Optional[Converter]:
+        """Build the converter of a lookup attribute."""
+        targets = [target for target in attribute.get("Targets") or [] if target in entity_sets]
+        if not targets:
+            return None
+        navigation = attribute.get("Navigation") or {}
+
+        def convert(value: Any) -> Tuple[str, Any]:
+            if value is None:
+                if len(targets) > 1:
+                    raise ValueError("clearing a polymorphic lookup requires a target")
+                return f"{navigation.get(targets[0], name)}@odata.bind", None
+
+            if isinstance(value, EntityReference):
+                target, entity_id = value.entity_type, value.entity_id
+            elif isinstance(value, dict):
+                target = value.get("entity") or value.get("entity_type")
+                entity_id = value.get("id") or value.get("entity_id")
+            elif isinstance(value, (tuple, list)) and len(value) == 2:
+                target, entity_id = value
+            elif len(targets) == 1:
+                target, entity_id = targets[0], value
+            else:
+                raise ValueError(f"lookup to one of {targets} requires a target entity")
+
+            target = self._logical_names.get(target, target)
+            if target not in targets:
+                raise ValueError(f"'{target}' is not a valid target ({', '.join(targets)})")
+
+            entity_id = str(uuid.UUID(str(entity_id)))
+            return (
+                f"{navigation.get(target, name)}@odata.bind",
+                f"/{entity_sets[target]}({entity_id})",
+            )
+
+        return convert
+
+
+def _nullable(name: str, convert: Callable[[Any], Any]) -> Converter:
+    """Wrap a value converter, passing None through."""
+    def converter(value: Any) -> Tuple[str, Any]:
+        return name, None if value is None else convert(value)
+    return converter
+
+
+def _as_list(values: Any) -> List[Any]:
+    """Get multi-select values as a list."""
+    if isinstance(values, str):
+        return [value.strip() for value in values.split(",") if value.strip()]
+    return list(values)
+
+
+def _check_range(value: Any, minimum: Optional[float], maximum: Optional[float]) -> Any:
+    """Check a number against the attribute limits."""
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{value} is below the minimum {minimum}")
+    if maximum is not None and value > maximum:
+        raise ValueError(f"{value} is above the maximum {maximum}")
+    return value
+
+
+def _string_converter(max_length: Optional[int]) -> Callable[[Any], str]:
+    """Build a string converter with a length check."""
+    def convert(value: Any) -> str:
+        value = value if isinstance(value, str) else str(value)
+        if max_length is not None and len(value) > max_length:
+            raise ValueError(f"length {len(value)} exceeds the maximum {max_length}")
+        return value
+    return convert
+
+
+def _integer_converter(
+    minimum: Optional[int],
+    maximum: Optional[int],
+) -> Callable[[Any], int]:
+    """Build an integer converter with a range check."""
+    def convert(value: Any) -> int:
+        if isinstance(value, bool):
+            raise TypeError("expected an integer, got a boolean")
+        if isinstance(value, float) and not value.is_integer():
+            raise ValueError(f"{value} is not an integer")
+        return _check_range(int(value), minimum, maximum)
+    return convert
+
+
+def _decimal_converter(
+    precision: Optional[int],
+    minimum: Optional[float],
+    maximum: Optional[float],
+) -> Callable[[Any], Decimal]:
+    """Build a decimal converter rounding to the attribute precision."""
+    exponent = Decimal(1).scaleb(-precision) if precision is not None else None
+
+    def convert(value: Any) -> Decimal:
+        if isinstance(value, bool):
+            raise TypeError("expected a number, got a boolean")
+        number = Decimal(str(value))
+        if not number.is_finite():
+            raise ValueError(f"{value} is not a finite number")
+        if exponent is not None:
+            number = number.quantize(exponent, rounding=ROUND_HALF_EVEN)
+        # Kept as Decimal so the request body carries the exact digits
+        return _check_range(number, minimum, maximum)
+    return convert
+
+
+def _double_converter(
+    minimum: Optional[float],
+    maximum: Optional[float],
+) -> Callable[[Any], float]:
+    """Build a floating point converter with a range check."""
+    def convert(value: Any) -> float:
+        if isinstance(value, bool):
+            raise TypeError("expected a number, got a boolean")
+        number = float(value)
+        if not math.isfinite(number):
+            raise ValueError(f"{value} is not a finite number")
+        return _check_range(number, minimum, maximum)
+    return convert
+
+
+def _boolean(value: Any) -> bool:
+    """Convert a boolean, accepting common string and integer forms."""
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str) and value.strip().lower() in ("true", "false", "1", "0", "yes", "no"):
+        return value.strip().lower() in ("true", "1", "yes")
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def _datetime_converter(date_only: bool) -> Callable[[Any], str]:
+    """Build a converter producing ISO 8601 dates or UTC datetimes."""
+    def convert(value: Any) -> str:
+        if isinstance(value, str):
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if isinstance(value, datetime):
+            if date_only:
+                return value.date().isoformat()
+            if value.tzinfo is None:
+                value = value.replace(tzinfo=timezone.utc)
+            return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+        if isinstance(value, date):
+            return value.isoformat() if date_only else f"{value.isoformat()}T00:00:00Z"
+        raise TypeError(f"expected a date or datetime, got {type(value).__name__}")
+    return convert
+
+
+def _option_converter(options: Optional[Dict[str, int]]) -> Callable[[Any], int]:
+    """Build an option set converter accepting values or labels."""
+    values = set(options.values()) if options else None
+
+    def convert(value: Any) -> int:
+        if isinstance(value, str) and options and value.strip().lower() in options:
+            return options[value.strip().lower()]
+        if isinstance(value, bool):
+            raise TypeError("expected an option value, got a boolean")
+        number = int(value)
+        if values is not None and number not in values:
+            raise ValueError(f"{value!r} is not a valid option")
+        return number
+    return convert
+
+
+class SchemaCompiler:
+    """
+    Compiles and caches an :class:`EntityEncoder` per entity.
+
+    Encoders are rebuilt when the metadata of their entity changes.
+
+    Example:
+        ```python
+        encoder = await sdk.schema.get_encoder("accounts")
+        payload = encoder.encode({"name": "Contoso", "primarycontactid": contact_id})
+        ```
+    """
+
+    def __init__(self, metadata: MetadataCache) -> None:
+        """
+        Initialize the compiler.
+
+        Args:
+            metadata: Metadata cache providing the attribute definitions
+        """
+        self.metadata = metadata
+        self._encoders: Dict[str, EntityEncoder] = {}
+
+    async def get_encoder(self, entity_type: str) -> EntityEncoder:
+        """
+        Get the encoder of an entity, compiling it on first use.
+
+        Args:
+            entity_type: Entity logical name or entity set name
+
+        Returns:
+            Entity encoder
+        """
+        logical_name = await self.metadata.resolve(entity_type)
+        encoder = self._encoders.get(logical_name)
+        if encoder is not None and logical_name in self.metadata.schemas:
+            return encoder
+
+        attributes = await self.metadata.get_schema(logical_name)
+        entity_sets = {}
+        for attribute in attributes.values():
+            for target in attribute.get("Targets") or []:
+                if target not in entity_sets:
+                    try:
+                        entity_sets[target] = await self.metadata.entity_set_name(target)
+                    except MetadataError:
+                        # Targets without an entity set cannot be bound
+                        continue
+
+        encoder = EntityEncoder(logical_name, attributes, entity_sets)
+        self._encoders[logical_name] = encoder
+        logger.debug("Entity encoder compiled", entity_type=logical_name)
+        return encoder
+
+
+# Convenience exports
+__all__ = [
+    "EntityEncoder",
+    "EncodedRecords",
+    "SchemaCompiler",
+]
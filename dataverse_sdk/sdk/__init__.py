@@ -0,0 +1,1489 @@
+"""
+High-level SDK interface for Microsoft Dataverse.
+
+This module defines ``DataverseSDK``, which wires the authenticator, HTTP
+client, batch processor and metadata cache together. Feature modules used by
+a single method (export, import, mirror, import planning, read coalescing)
+are imported by that method, so they are only loaded when used.
+"""
+
+import os
+import ssl
+import warnings
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import structlog
+
+from ..auth import DataverseAuthenticator
+from ..batch import BatchProcessor
+from ..cache import DiskQueryCache, MemoryQueryCache, QueryCache, QueryCacheBackend
+from ..client import AsyncDataverseClient
+from ..exceptions import (
+    ConfigurationError,
+    EntityNotFoundError,
+    ValidationError,
+)
+from ..hooks import HookManager
+from ..journal import BulkJournal
+from ..metadata import MetadataCache
+from ..writer import WriteBatcher, current_write_batcher
+from ..models import (
+    QueryOptions,
+    QueryResult,
+    FetchXMLQuery,
+    UpsertResult,
+    BulkOperationResult,
+    BulkUpsertResult,
+    RecordGraph,
+    ImportDataset,
+    ImportResult,
+    RecordChange,
+    ExportResult,
+)
+from ..schema import EncodedRecords, EntityEncoder, SchemaCompiler
+from ..sync import ChangeTracker, FileStateStore, MemoryStateStore, SyncStateStore, WatermarkExtractor
+from ..utils import Config, extract_entity_id, format_alternate_key, is_guid
+
+if TYPE_CHECKING:
+    from ..loader import ReadLoader
+    from ..mirror import DataverseMirror
+
+
+logger = structlog.get_logger(__name__)
+
+# Whether the process-wide settings below were applied
+_environment_configured = False
+
+
+def _configure_environment() -> None:
+    """
+    Apply process-wide settings once, when the first SDK is constructed.
+    
+    Loads variables from a ``.env`` file and applies the global SSL
+    configuration for corporate environments. This used to run when the
+    package was imported; importing the SDK no longer changes the process.
+    """
+    global _environment_configured
+    if _environment_configured:
+        return
+    _environment_configured = True
+    
+    # Load environment variables
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    # ===== CONFIGURAÇÃO SSL GLOBAL =====
+    # Configurar variáveis de ambiente SSL
+    os.environ['PYTHONHTTPSVERIFY'] = '0'
+    os.environ['CURL_CA_BUNDLE'] = ''
+    os.environ['REQUESTS_CA_BUNDLE'] = ''
+    os.environ['SSL_VERIFY'] = 'false'
+    
+    # Suprimir warnings SSL
+    warnings.filterwarnings('ignore')
+    
+    # Aplicar monkey patches SSL antes de criar o cliente MSAL
+    try:
+        import urllib3
+        urllib3.disable_warnings()
+        
+        # Salvar funções originais ANTES do patch
+        original_create_default_context = ssl.create_default_context
+        
+        # Criar contexto SSL inseguro
+        def create_insecure_ssl_context(*args, **kwargs):
+            context = original_create_default_context(*args, **kwargs)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+            try:
+                context.set_ciphers('DEFAULT@SECLEVEL=1')
+            except Exception:
+                pass
+            return context
+        
+        # Patch urllib3
+        if hasattr(urllib3.util, 'ssl_'):
+            urllib3.util.ssl_.create_urllib3_context = create_insecure_ssl_context
+        
+        # Patch ssl module
+        ssl.create_default_context = create_insecure_ssl_context
+        
+    except Exception:
+        pass  # Continuar mesmo se falhar
+
+
+class DataverseSDK:
+    """
+    Main SDK class providing high-level interface to Microsoft Dataverse.
+    
+    This class integrates all SDK components and provides a simple, intuitive
+    interface for common Dataverse operations.
+    """
+    
+    def __init__(
+        self,
+        dataverse_url: Optional[str] = None,
+        client_id: Optional[str] = None,
+        client_secret: Optional[str] = None,
+        tenant_id: Optional[str] = None,
+        authority: Optional[str] = None,
+        scope: Optional[str] = None,
+        config: Optional[Config] = None,
+        hook_manager: Optional[HookManager] = None,
+        # Proxy settings
+        proxy_url: Optional[str] = None,
+        proxy_username: Optional[str] = None,
+        proxy_password: Optional[str] = None,
+        # SSL settings
+        verify_ssl: Optional[bool] = None,
+        ssl_cert_file: Optional[str] = None,
+        ssl_key_file: Optional[str] = None,
+        ssl_ca_bundle: Optional[str] = None,
+        disable_ssl_warnings: Optional[bool] = None,
+        trust_env: Optional[bool] = None,
+    ) -> None:
+        """
+        Initialize the Dataverse SDK.
+        
+        Args:
+            dataverse_url: Dataverse environment URL
+            client_id: Azure AD application client ID
+            client_secret: Azure AD application client secret
+            tenant_id: Azure AD tenant ID
+            authority: Authority URL (optional)
+            scope: OAuth scope (optional)
+            config: Configuration object (optional)
+            hook_manager: Hook manager for extensibility (optional)
+            
+            # Proxy settings (for corporate environments)
+            proxy_url: Proxy server URL (e.g., "http://proxy.company.com:8080")
+            proxy_username: Proxy authentication username
+            proxy_password: Proxy authentication password
+            
+            # SSL settings (for corporate environments)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            ssl_cert_file: Path to client certificate file
+            ssl_key_file: Path to client private key file
+            ssl_ca_bundle: Path to CA bundle file for SSL verification
+            disable_ssl_warnings: Whether to disable SSL warnings (default: False)
+            trust_env: Whether to trust environment proxy settings (default: True)
+        """
+        _configure_environment()
+        
+        # Try to load configuration from file if not provided
+        config_data = {}
+        if not all([dataverse_url, client_id, tenant_id]):
+            config_data = self._load_config_file()
+        
+        # Load configuration from parameters, environment, or config file
+        self.dataverse_url = dataverse_url or os.getenv("DATAVERSE_URL") or config_data.get("dataverse_url")
+        self.client_id = client_id or os.getenv("AZURE_CLIENT_ID") or config_data.get("client_id")
+        self.client_secret = client_secret or os.getenv("AZURE_CLIENT_SECRET") or config_data.get("client_secret")
+        self.tenant_id = tenant_id or os.getenv("AZURE_TENANT_ID") or config_data.get("tenant_id")
+        self.authority = authority or os.getenv("AZURE_AUTHORITY") or config_data.get("authority")
+        self.scope = scope or os.getenv("AZURE_SCOPE") or config_data.get("scope")
+        
+        # Ensure dataverse_url has proper format
+        if self.dataverse_url and not self.dataverse_url.startswith(('http://', 'https://')):
+            self.dataverse_url = f"https://{self.dataverse_url}"
+        
+        # Validate required configuration
+        if not all([self.dataverse_url, self.client_id, self.tenant_id]):
+            missing_configs = []
+            if not self.dataverse_url:
+                missing_configs.append("dataverse_url")
+            if not self.client_id:
+                missing_configs.append("client_id")
+            if not self.tenant_id:
+                missing_configs.append("tenant_id")
+            
+            raise ConfigurationError(
+                f"Missing required configuration: {', '.join(missing_configs)}. "
+                "Please provide them as parameters, environment variables, or in a "
+                "dataverse-config.json file in the current directory."
+            )
+        
+        # Initialize configuration with corporate environment settings
+        config_overrides = {}
+        
+        # Apply proxy settings
+        if proxy_url is not None:
+            config_overrides["proxy_url"] = proxy_url
+        if proxy_username is not None:
+            config_overrides["proxy_username"] = proxy_username
+        if proxy_password is not None:
+            config_overrides["proxy_password"] = proxy_password
+        
+        # Apply SSL settings
+        if verify_ssl is not None:
+            config_overrides["verify_ssl"] = verify_ssl
+        if ssl_cert_file is not None:
+            config_overrides["ssl_cert_file"] = ssl_cert_file
+        if ssl_key_file is not None:
+            config_overrides["ssl_key_file"] = ssl_key_file
+        if ssl_ca_bundle is not None:
+            config_overrides["ssl_ca_bundle"] = ssl_ca_bundle
+        if disable_ssl_warnings is not None:
+            config_overrides["disable_ssl_warnings"] = disable_ssl_warnings
+        if trust_env is not None:
+            config_overrides["trust_env"] = trust_env
+        
+        # Initialize components
+        self.config = config or Config(**config_overrides)
+        if config_overrides and config:
+            # Apply overrides to existing config
+            self.config.update(**config_overrides)
+        
+        self.hook_manager = hook_manager or HookManager()
+        
+        # Initialize authenticator
+        self.authenticator = DataverseAuthenticator(
+            client_id=self.client_id,
+            tenant_id=self.tenant_id,
+            dataverse_url=self.dataverse_url,
+            client_secret=self.client_secret,
+            authority=self.authority,
+            scope=self.scope,
+            verify_ssl=self.config.get("verify_ssl", True),
+            disable_ssl_warnings=self.config.get("disable_ssl_warnings", False),
+            ssl_ca_bundle=self.config.get("ssl_ca_bundle"),
+            ssl_cert_file=self.config.get("ssl_cert_file"),
+            ssl_key_file=self.config.get("ssl_key_file"),
+            proxy_url=self.config.get("proxy_url"),
+            proxy_username=self.config.get("proxy_username"),
+            proxy_password=self.config.get("proxy_password"),
+        )
+        
+        # Initialize client
+        self.client = AsyncDataverseClient(
+            dataverse_url=self.dataverse_url,
+            authenticator=self.authenticator,
+            config=self.config,
+            hook_manager=self.hook_manager,
+        )
+        
+        # Initialize batch processor
+        self.batch_processor = BatchProcessor(
+            client=self.client,
+            default_batch_size=self.config.get("default_batch_size", 100),
+            max_batch_size=self.config.get("max_batch_size", 1000),
+            max_parallel_batches=self.config.get("max_parallel_batches", 5),
+            max_retries=self.config.get("batch_max_retries", 3),
+            backoff_factor=self.config.get("backoff_factor", 1.0),
+            retry_status_codes=self.config.get("retry_status_codes"),
+            retry_budget=self.config.get("batch_retry_budget"),
+            continue_on_error=self.config.get("batch_continue_on_error", True),
+        )
+        
+        # Entity and attribute definitions, shared with the batch processor
+        self.metadata = MetadataCache(self.client, path=self.config.get("metadata_cache_path"))
+        self.batch_processor.metadata = self.metadata
+        self.schema = SchemaCompiler(self.metadata)
+        
+        # Default store of incremental sync positions
+        sync_state_path = self.config.get("sync_state_path")
+        self.sync_state: SyncStateStore = (
+            FileStateStore(sync_state_path) if sync_state_path else MemoryStateStore()
+        )
+        
+        # Optional coalescing of concurrent single-record reads
+        self.read_loader: Optional["ReadLoader"] = None
+        if self.config.get("coalesce_reads", False):
+            self.enable_read_coalescing(self.config.get("coalesce_window_ms", 2.0))
+        
+        # Optional query result cache
+        if self.config.get("query_cache", False):
+            cache_path = self.config.get("query_cache_path")
+            self.enable_query_cache(
+                backend=DiskQueryCache(
+                    cache_path, max_entries=self.config.get("query_cache_max_entries", 256)
+                ) if cache_path else None,
+            )
+        
+        logger.info(
+            "Dataverse SDK initialized",
+            dataverse_url=self.dataverse_url,
+            client_id=self.client_id,
+            tenant_id=self.tenant_id,
+            proxy_configured=bool(self.config.get("proxy_url")),
+            ssl_verification=self.config.get("verify_ssl", True),
+        )
+    
+    async def __aenter__(self) -> "DataverseSDK":
+        """Async context manager entry."""
+        await self.client.__aenter__()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit."""
+        if self.read_loader is not None:
+            await self.read_loader.flush()
+        await self.client.__aexit__(exc_type, exc_val, exc_tb)
+    
+    def batching(self, max_delay_ms: float = 10.0, max_size: int = 100) -> WriteBatcher:
+        """
+        Start a write-behind auto-batching session.
+        
+        Inside ``async with sdk.batching(...)``, ``create``, ``update`` and
+        ``delete`` calls are queued and sent as ``$batch`` requests. Each call
+        still returns its own result or raises its own error, and every
+        queued write is flushed when the block exits.
+        
+        Args:
+            max_delay_ms: Time to collect writes before sending them
+            max_size: Maximum number of writes per batch
+            
+        Returns:
+            Write batcher to use as an async context manager
+            
+        Example:
+            ```python
+            async with sdk.batching(max_delay_ms=20, max_size=200):
+                ids = await asyncio.gather(
+                    *(sdk.create("accounts", account) for account in accounts)
+                )
+            ```
+        """
+        return WriteBatcher(self.batch_processor, max_delay_ms=max_delay_ms, max_size=max_size)
+    
+    def enable_read_coalescing(self, max_delay_ms: float = 2.0) -> None:
+        """
+        Coalesce concurrent ``read`` calls into batched queries.
+        
+        Reads of the same entity type and fields arriving within
+        ``max_delay_ms`` are deduplicated and fetched with a single query,
+        and each caller receives its own result. Reads with ``expand`` and
+        reads by anything other than a GUID are not coalesced.
+        
+        Args:
+            max_delay_ms: Time to collect reads before sending them
+        """
+        from ..loader import ReadLoader
+        
+        self.read_loader = ReadLoader(
+            self.batch_processor,
+            max_delay_ms=max_delay_ms,
+            max_batch_size=self.config.get("max_batch_size", 1000),
+        )
+    
+    def enable_query_cache(
+        self,
+        backend: Optional[QueryCacheBackend] = None,
+        ttl: Optional[float] = None,
+        invalidate_on_write: Optional[bool] = None,
+    ) -> QueryCache:
+        """
+        Cache ``query`` results keyed by their normalized OData parameters.
+        
+        Args:
+            backend: Storage backend (in-memory LRU if None)
+            ttl: Seconds a result stays cached
+            invalidate_on_write: Whether writes drop results of their entity set
+            
+        Returns:
+            The query cache, which also supports explicit ``invalidate()``
+        """
+        self.client.query_cache = QueryCache(
+            backend=backend or MemoryQueryCache(self.config.get("query_cache_max_entries", 256)),
+            ttl=ttl if ttl is not None else self.config.get("query_cache_ttl", 60.0),
+            invalidate_on_write=(
+                invalidate_on_write if invalidate_on_write is not None
+                else self.config.get("query_cache_invalidate_on_write", True)
+            ),
+        )
+        return self.client.query_cache
+    
+    def create_mirror(self, path: Union[str, Path] = ":memory:") -> "DataverseMirror":
+        """
+        Create a local SQLite mirror of tables of this environment.
+        
+        Args:
+            path: Path of the SQLite database (in memory by default)
+            
+        Returns:
+            The mirror; register tables with ``add_table`` and call ``sync``
+            
+        Example:
+            ```python
+            mirror = sdk.create_mirror("reference.db")
+            mirror.add_table("transactioncurrencies", indexes=["isocurrencycode"])
+            await mirror.sync()
+            euro = mirror.query("transactioncurrencies", {"filter": "isocurrencycode eq 'EUR'"})
+            ```
+        """
+        from ..mirror import DataverseMirror
+        
+        return DataverseMirror(self.client, self.metadata, path)
+    
+    @property
+    def query_cache(self) -> Optional[QueryCache]:
+        """Query result cache, if enabled."""
+        return self.client.query_cache
+    
+    # CRUD Operations
+    
+    async def create(
+        self,
+        entity_type: str,
+        data: Dict[str, Any],
+        return_record: bool = False,
+    ) -> Union[str, Dict[str, Any]]:
+        """
+        Create a new entity.
+        
+        Args:
+            entity_type: Entity logical name
+            data: Entity data
+            return_record: Whether to return the created record
+            
+        Returns:
+            Entity ID or full record if return_record=True
+        """
+        headers = {}
+        if return_record:
+            headers["Prefer"] = "return=representation"
+        
+        batcher = current_write_batcher()
+        if batcher is not None:
+            outcome = await batcher.submit({
+                "method": "POST",
+                "url": entity_type,
+                "headers": headers,
+                "body": data,
+            })
+            return outcome.get("json", {}) if return_record else outcome.get("entity_id")
+        
+        response = await self.client.post(entity_type, data, headers=headers)
+        
+        if return_record:
+            return response
+        else:
+            # Extract entity ID from Location header or response
+            entity_id = response.get("id") or extract_entity_id(
+                response.get("@odata.id", "")
+            )
+            return entity_id
+    
+    async def read(
+        self,
+        entity_type: str,
+        entity_id: str,
+        select: Optional[List[str]] = None,
+        expand: Optional[List[str]] = None,
+    ) -> Dict[str, Any]:
+        """
+        Read an entity by ID.
+        
+        Args:
+            entity_type: Entity logical name
+            entity_id: Entity ID
+            select: Fields to select
+            expand: Related entities to expand
+            
+        Returns:
+            Entity data
+            
+        Raises:
+            EntityNotFoundError: If entity is not found
+        """
+        # Coalesced reads filter on GUIDs; alternate keys and malformed IDs
+        # are read on their own so they cannot fail the other reads
+        if self.read_loader is not None and not expand and is_guid(entity_id):
+            return await self.read_loader.load(entity_type, entity_id, select)
+        
+        params = {}
+        
+        if select:
+            params["$select"] = ",".join(select)
+        
+        if expand:
+            params["$expand"] = ",".join(expand)
+        
+        try:
+            endpoint = f"{entity_type}({entity_id})"
+            return await self.client.get(endpoint, params=params)
+        except Exception as e:
+            if "404" in str(e) or "Not Found" in str(e):
+                raise EntityNotFoundError(entity_type, entity_id) from e
+            raise
+    
+    async def read_many(
+        self,
+        entity_type: str,
+        ids: List[Union[str, Dict[str, Any]]],
+        select: Optional[List[str]] = None,
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Read many entities by ID or alternate key.
+        
+        IDs are grouped into a few filter queries (or ``$batch`` GETs for
+        alternate keys) that run concurrently, instead of one request per
+        record.
+        
+        Args:
+            entity_type: Entity set name
+            ids: Entity IDs or alternate key dictionaries
+            select: Fields to select
+            
+        Returns:
+            Entities aligned with ``ids``; None marks records that were not found
+            
+        Example:
+            ```python
+            accounts = await sdk.read_many("accounts", account_ids, select=["name"])
+            missing = [i for i, a in zip(account_ids, accounts) if a is None]
+            ```
+        """
+        return await self.batch_processor.read_many(entity_type, ids, select)
+    
+    async def update(
+        self,
+        entity_type: str,
+        entity_id: str,
+        data: Dict[str, Any],
+        return_record: bool = False,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update an entity.
+        
+        Args:
+            entity_type: Entity logical name
+            entity_id: Entity ID
+            data: Update data
+            return_record: Whether to return the updated record
+            
+        Returns:
+            Updated record if return_record=True, None otherwise
+        """
+        headers = {}
+        if return_record:
+            headers["Prefer"] = "return=representation"
+        
+        endpoint = f"{entity_type}({entity_id})"
+        
+        batcher = current_write_batcher()
+        if batcher is not None:
+            outcome = await batcher.submit({
+                "method": "PATCH",
+                "url": endpoint,
+                "headers": headers,
+                "body": data,
+            })
+            return outcome.get("json", {}) if return_record else None
+        
+        response = await self.client.patch(endpoint, data, headers=headers)
+        
+        return response if return_record else None
+    
+    async def delete(self, entity_type: str, entity_id: str) -> None:
+        """
+        Delete an entity.
+        
+        Args:
+            entity_type: Entity logical name
+            entity_id: Entity ID
+        """
+        endpoint = f"{entity_type}({entity_id})"
+        
+        batcher = current_write_batcher()
+        if batcher is not None:
+            await batcher.submit({"method": "DELETE", "url": endpoint})
+            return
+        
+        await self.client.delete(endpoint)
+    
+    async def upsert(
+        self,
+        entity_type: str,
+        data: Dict[str, Any],
+        alternate_key: Optional[Dict[str, Any]] = None,
+        return_record: bool = False,
+    ) -> Union[UpsertResult, Dict[str, Any]]:
+        """
+        Upsert (create or update) an entity.
+        
+        Args:
+            entity_type: Entity logical name
+            data: Entity data
+            alternate_key: Alternate key for upsert
+            return_record: Whether to return the record
+            
+        Returns:
+            UpsertResult or full record if return_record=True
+        """
+        headers = {
+            "Prefer": "return=representation" if return_record else "return=minimal",
+        }
+        
+        if alternate_key:
+            endpoint = f"{entity_type}({format_alternate_key(alternate_key)})"
+        else:
+            endpoint = entity_type
+        
+        response = await self.client.patch(endpoint, data, headers=headers)
+        
+        # Determine if entity was created or updated
+        # This is typically indicated by the response status or headers
+        created = response.get("@odata.context", "").endswith("/$entity")
+        
+        if return_record:
+            return response
+        else:
+            entity_id = response.get("id") or extract_entity_id(
+                response.get("@odata.id", "")
+            )
+            return UpsertResult(entity_id=entity_id, created=created)
+    
+    # Query Operations
+    
+    async def query(
+        self,
+        entity_type: str,
+        options: Optional[Union[QueryOptions, Dict[str, Any]]] = None,
+    ) -> QueryResult:
+        """
+        Query entities with OData options.
+        
+        Args:
+            entity_type: Entity logical name
+            options: Query options
+            
+        Returns:
+            Query result with entities and metadata
+        """
+        if isinstance(options, dict):
+            options = QueryOptions(**options)
+        elif options is None:
+            options = QueryOptions()
+        
+        params = options.to_odata_params()
+        cache = self.client.query_cache
+        
+        response = cache.get(entity_type, params) if cache is not None else None
+        if response is None:
+            response = await self.client.get(entity_type, params=params)
+            if cache is not None:
+                cache.set(entity_type, params, response)
+        
+        return QueryResult(**response)
+    
+    async def query_all(
+        self,
+        entity_type: str,
+        options: Optional[Union[QueryOptions, Dict[str, Any]]] = None,
+        max_records: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Query all entities with automatic pagination.
+        
+        Args:
+            entity_type: Entity logical name
+            options: Query options
+            max_records: Maximum number of records to retrieve
+            
+        Returns:
+            List of all matching entities
+        """
+        all_entities = []
+        current_options = options
+        records_retrieved = 0
+        
+        while True:
+            result = await self.query(entity_type, current_options)
+            all_entities.extend(result.value)
+            records_retrieved += len(result.value)
+            
+            # Check limits
+            if max_records and records_retrieved >= max_records:
+                all_entities = all_entities[:max_records]
+                break
+            
+            # Check for more pages
+            if not result.has_more:
+                break
+            
+            # Prepare next page options
+            if isinstance(current_options, QueryOptions):
+                current_options = QueryOptions(
+                    select=current_options.select,
+                    filter=current_options.filter,
+                    order_by=current_options.order_by,
+                    expand=current_options.expand,
+                    count=current_options.count,
+                )
+            else:
+                current_options = QueryOptions()
+            
+            # Extract skip value from next link
+            # This is a simplified implementation
+            if result.next_link:
+                import urllib.parse as urlparse
+                parsed = urlparse.urlparse(result.next_link)
+                query_params = urlparse.parse_qs(parsed.query)
+                if "$skip" in query_params:
+                    current_options.skip = int(query_params["$skip"][0])
+        
+        return all_entities
+    
+    async def query_pages(
+        self,
+        entity_type: str,
+        options: Optional[Union[QueryOptions, Dict[str, Any]]] = None,
+        page_size: int = 5000,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """
+        Stream the pages of a query, following ``@odata.nextLink``.
+        
+        Unlike ``query_all``, only one page is held in memory at a time.
+        
+        Args:
+            entity_type: Entity set name
+            options: Query options
+            page_size: Records per page
+            
+        Yields:
+            Records of each page
+        """
+        if isinstance(options, dict):
+            options = QueryOptions(**options)
+        elif options is None:
+            options = QueryOptions()
+        
+        async for page in self.client.get_pages(
+            entity_type, params=options.to_odata_params(), page_size=page_size
+        ):
+            yield page
+    
+    async def fetch_xml(self, fetch_xml: Union[str, FetchXMLQuery]) -> List[Dict[str, Any]]:
+        """
+        Execute FetchXML query.
+        
+        Args:
+            fetch_xml: FetchXML query string or FetchXMLQuery object
+            
+        Returns:
+            List of entities matching the query
+        """
+        if isinstance(fetch_xml, FetchXMLQuery):
+            fetch_xml = fetch_xml.to_fetchxml()
+        
+        # The query runs against the entity set of its root entity
+        import xml.etree.ElementTree as ET
+        
+        try:
+            entity = ET.fromstring(fetch_xml).find("entity")
+        except ET.ParseError as e:
+            raise ValidationError(f"Invalid FetchXML: {e}") from e
+        if entity is None or not entity.get("name"):
+            raise ValidationError("FetchXML must contain an <entity name=...> element")
+        entity_set = await self.metadata.entity_set_name(entity.get("name"))
+        
+        # URL encode the FetchXML
+        import urllib.parse
+        encoded_fetch_xml = urllib.parse.quote(fetch_xml)
+        
+        endpoint = f"{entity_set}?fetchXml={encoded_fetch_xml}"
+        response = await self.client.get(endpoint)
+        
+        return response.get("value", [])
+    
+    async def export(
+        self,
+        entity_type: str,
+        path: Union[str, Path],
+        options: Optional[Union[QueryOptions, Dict[str, Any]]] = None,
+        format: Optional[str] = None,
+        compression: Optional[str] = None,
+        resume: bool = False,
+        page_size: int = 5000,
+        progress: Optional[Callable[[int], None]] = None,
+    ) -> ExportResult:
+        """
+        Stream the records of a query to an NDJSON, JSON, CSV or Parquet file.
+        
+        Pages are written as they arrive instead of being collected in
+        memory. The format and compression are inferred from the file name
+        (e.g. ``accounts.ndjson.gz``) unless given. With ``resume=True`` an
+        interrupted text export continues from its last completed page.
+        
+        Args:
+            entity_type: Entity set name
+            path: Output file
+            options: Query options
+            format: ndjson, json, csv or parquet
+            compression: gzip or bz2 (text formats) or a Parquet codec
+            resume: Continue a partial export from its checkpoint
+            page_size: Records per page
+            progress: Called with the number of exported records after each page
+            
+        Returns:
+            Export result
+        """
+        from ..export import StreamingExporter
+        
+        exporter = StreamingExporter(self.client, self.metadata)
+        return await exporter.export(
+            entity_type,
+            path,
+            options=options,
+            format=format,
+            compression=compression,
+            resume=resume,
+            page_size=page_size,
+            progress=progress,
+        )
+    
+    async def import_file(
+        self,
+        operation: str,
+        entity_type: str,
+        path: Union[str, Path],
+        key_fields: Optional[List[str]] = None,
+        validate: bool = False,
+        chunk_size: int = 5000,
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        dead_letter: Optional[Union[str, Path]] = None,
+        progress: Optional[Callable[[int, int, int], None]] = None,
+    ) -> BulkOperationResult:
+        """
+        Stream an NDJSON, JSON array or CSV file into a bulk operation.
+        
+        The file is read in chunks of ``chunk_size`` records, so memory use
+        does not depend on its size. Failed rows are written to
+        ``dead_letter`` (NDJSON) and can be imported again once fixed.
+        
+        Args:
+            operation: create, update, upsert or delete
+            entity_type: Entity set name
+            path: Input file (format and compression inferred from its name)
+            key_fields: Alternate key attributes (upsert only)
+            validate: Validate and convert rows with the schema-compiled encoder
+            chunk_size: Records read per bulk call
+            batch_size: Operations per batch request
+            parallel: Whether batches run in parallel
+            dead_letter: File receiving failed rows
+            progress: Called after each chunk with (processed, failed, bytes read)
+            
+        Returns:
+            Aggregated counts of the import
+        """
+        from ..importer import StreamingImporter
+        
+        importer = StreamingImporter(
+            self,
+            chunk_size=chunk_size,
+            batch_size=batch_size,
+            parallel=parallel,
+            dead_letter=dead_letter,
+            progress=progress,
+        )
+        return await importer.run(operation, entity_type, path, key_fields=key_fields, validate=validate)
+    
+    async def sync_changes(
+        self,
+        entity_type: str,
+        select: Optional[List[str]] = None,
+        state_store: Optional[SyncStateStore] = None,
+        page_size: int = 5000,
+    ) -> AsyncIterator[RecordChange]:
+        """
+        Stream the records changed since the last sync of an entity.
+        
+        The first run yields every record (``full_load=True``) and stores the
+        change tracking delta link; later runs yield only new, updated and
+        deleted records. The position is saved after every consumed page, so
+        an interrupted sync resumes from its last completed page.
+        
+        Args:
+            entity_type: Entity set name (change tracking must be enabled)
+            select: Columns to track
+            state_store: Store of the sync position (``sdk.sync_state`` if None)
+            page_size: Records per page
+            
+        Yields:
+            Record changes
+            
+        Example:
+            ```python
+            store = FileStateStore("sync-state.json")
+            async for change in sdk.sync_changes("accounts", ["name"], store):
+                if change.is_delete:
+                    remove(change.entity_id)
+                else:
+                    save(change.entity_id, change.record)
+            ```
+        """
+        tracker = ChangeTracker(self.client, state_store or self.sync_state)
+        primary_id_attribute = await self.metadata.primary_id_attribute(entity_type)
+        async for change in tracker.changes(
+            entity_type,
+            select=select,
+            primary_id_attribute=primary_id_attribute,
+            page_size=page_size,
+        ):
+            yield change
+    
+    async def extract_incremental(
+        self,
+        entity_type: str,
+        sink: Callable[[List[Dict[str, Any]]], Awaitable[Any]],
+        select: Optional[List[str]] = None,
+        filter: Optional[str] = None,
+        watermark_attribute: str = "modifiedon",
+        overlap: float = 60.0,
+        partitions: int = 1,
+        state_store: Optional[SyncStateStore] = None,
+        page_size: int = 5000,
+    ) -> int:
+        """
+        Extract the records modified since the last run, by high-water mark.
+        
+        For tables without change tracking. Each page is passed to ``sink``
+        and the watermark is stored only once the sink returns. Runs re-read
+        ``overlap`` seconds before the watermark, so sinks should upsert.
+        
+        Args:
+            entity_type: Entity set name
+            sink: Coroutine function receiving each page of records
+            select: Columns to extract
+            filter: Additional OData filter
+            watermark_attribute: Datetime attribute holding the modification time
+            overlap: Seconds re-read before the watermark
+            partitions: Parallel time partitions for the first (backfill) run
+            state_store: Store of the watermark (``sdk.sync_state`` if None)
+            page_size: Records per page
+            
+        Returns:
+            Number of records passed to the sink
+        """
+        extractor = WatermarkExtractor(
+            self.client,
+            state_store or self.sync_state,
+            entity_type,
+            await self.metadata.primary_id_attribute(entity_type),
+            select=select,
+            filter=filter,
+            watermark_attribute=watermark_attribute,
+            overlap=overlap,
+            page_size=page_size,
+        )
+        return await extractor.run(sink, partitions=partitions)
+    
+    # Association Operations
+    
+    async def associate(
+        self,
+        primary_entity_type: str,
+        primary_entity_id: str,
+        relationship_name: str,
+        related_entity_type: str,
+        related_entity_id: str,
+    ) -> None:
+        """
+        Associate two entities.
+        
+        Args:
+            primary_entity_type: Primary entity logical name
+            primary_entity_id: Primary entity ID
+            relationship_name: Relationship name
+            related_entity_type: Related entity logical name
+            related_entity_id: Related entity ID
+        """
+        endpoint = f"{primary_entity_type}({primary_entity_id})/{relationship_name}/$ref"
+        
+        data = {
+            "@odata.id": f"{self.client.api_base_url}{related_entity_type}({related_entity_id})"
+        }
+        
+        await self.client.post(endpoint, data)
+    
+    async def disassociate(
+        self,
+        primary_entity_type: str,
+        primary_entity_id: str,
+        relationship_name: str,
+        related_entity_id: Optional[str] = None,
+    ) -> None:
+        """
+        Disassociate entities.
+        
+        Args:
+            primary_entity_type: Primary entity logical name
+            primary_entity_id: Primary entity ID
+            relationship_name: Relationship name
+            related_entity_id: Related entity ID (for many-to-many relationships)
+        """
+        if related_entity_id:
+            endpoint = f"{primary_entity_type}({primary_entity_id})/{relationship_name}({related_entity_id})/$ref"
+        else:
+            endpoint = f"{primary_entity_type}({primary_entity_id})/{relationship_name}/$ref"
+        
+        await self.client.delete(endpoint)
+    
+    # Bulk Operations
+    
+    async def bulk_create(
+        self,
+        entity_type: str,
+        entities: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        journal: Optional[BulkJournal] = None,
+        generate_ids: bool = False,
+        validate: bool = False,
+    ) -> BulkOperationResult:
+        """
+        Bulk create entities.
+        
+        Args:
+            entity_type: Entity logical name
+            entities: List of entity data
+            batch_size: Batch size for operations
+            parallel: Whether to execute batches in parallel
+            journal: Checkpoint journal used to resume an interrupted run
+            generate_ids: Whether to assign primary keys client-side, making
+                retries idempotent (the assigned IDs are written into ``entities``)
+            validate: Whether to encode the entities with the schema-compiled
+                encoder first; invalid entities are reported as failures
+                without being sent
+            
+        Returns:
+            Bulk operation result
+        """
+        if not validate:
+            return await self.batch_processor.bulk_create(
+                entity_type, entities, batch_size, parallel, journal, generate_ids
+            )
+        
+        if generate_ids:
+            # Keys are assigned by position in ``entities`` (reusing those of
+            # an interrupted journaled run) before rejected entities are dropped
+            await self.batch_processor.assign_primary_ids(entity_type, entities, journal=journal)
+        encoder = await self.schema.get_encoder(entity_type)
+        encoded = encoder.encode_many(entities)
+        result = await self.batch_processor.bulk_create(
+            entity_type, encoded.records, batch_size, parallel, journal, generate_ids
+        )
+        return self._merge_rejected(result, encoded)
+    
+    async def bulk_associate(
+        self,
+        primary_entity_type: str,
+        relationship_name: str,
+        related_entity_type: str,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        skip_existing: bool = False,
+    ) -> BulkOperationResult:
+        """
+        Bulk associate entities.
+        
+        Args:
+            primary_entity_type: Primary entity set name
+            relationship_name: Relationship (collection-valued navigation property) name
+            related_entity_type: Related entity set name
+            pairs: (primary entity ID, related entity ID) pairs
+            batch_size: Batch size for operations
+            parallel: Whether to execute batches in parallel
+            skip_existing: Whether to skip pairs that are already associated
+            
+        Returns:
+            Bulk operation result
+            
+        Example:
+            ```python
+            await sdk.bulk_associate(
+                "lists", "listcontact_association", "contacts",
+                [(list_id, contact_id) for contact_id in contact_ids],
+                skip_existing=True,
+            )
+            ```
+        """
+        return await self.batch_processor.bulk_associate(
+            primary_entity_type,
+            relationship_name,
+            related_entity_type,
+            pairs,
+            batch_size,
+            parallel,
+            skip_existing,
+        )
+    
+    async def bulk_disassociate(
+        self,
+        primary_entity_type: str,
+        relationship_name: str,
+        related_entity_type: str,
+        pairs: Iterable[Tuple[str, str]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        skip_missing: bool = False,
+    ) -> BulkOperationResult:
+        """
+        Bulk disassociate entities.
+        
+        Args:
+            primary_entity_type: Primary entity set name
+            relationship_name: Relationship (collection-valued navigation property) name
+            related_entity_type: Related entity set name
+            pairs: (primary entity ID, related entity ID) pairs
+            batch_size: Batch size for operations
+            parallel: Whether to execute batches in parallel
+            skip_missing: Whether to skip pairs that are not associated
+            
+        Returns:
+            Bulk operation result
+        """
+        return await self.batch_processor.bulk_disassociate(
+            primary_entity_type,
+            relationship_name,
+            related_entity_type,
+            pairs,
+            batch_size,
+            parallel,
+            skip_missing,
+        )
+    
+    async def bulk_upsert(
+        self,
+        entity_type: str,
+        records: List[Dict[str, Any]],
+        key_fields: List[str],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+    ) -> BulkUpsertResult:
+        """
+        Bulk upsert entities by alternate key.
+        
+        Args:
+            entity_type: Entity set name
+            records: Records to upsert, including their key fields
+            key_fields: Attributes forming the alternate key
+            batch_size: Batch size for operations
+            parallel: Whether to execute batches in parallel
+            
+        Returns:
+            Bulk upsert result with created/updated outcome per record
+            
+        Example:
+            ```python
+            result = await sdk.bulk_upsert(
+                "accounts", records, key_fields=["accountnumber"]
+            )
+            print(result.created, result.updated, result.duplicates)
+            ```
+        """
+        return await self.batch_processor.bulk_upsert(
+            entity_type, records, key_fields, batch_size, parallel
+        )
+    
+    async def assign_primary_ids(
+        self,
+        entity_type: str,
+        entities: List[Dict[str, Any]],
+    ) -> List[str]:
+        """
+        Assign client-generated primary keys to entities before creating them.
+        
+        Useful to build records that reference each other and batch them
+        without waiting for the referenced records to be created.
+        
+        Args:
+            entity_type: Entity set name
+            entities: Entity data, updated in place
+            
+        Returns:
+            Primary key of every entity
+        """
+        return await self.batch_processor.assign_primary_ids(entity_type, entities)
+    
+    async def bulk_update(
+        self,
+        entity_type: str,
+        updates: List[Dict[str, Any]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        journal: Optional[BulkJournal] = None,
+        validate: bool = False,
+    ) -> BulkOperationResult:
+        """
+        Bulk update entities.
+        
+        Args:
+            entity_type: Entity logical name
+            updates: List of updates (must include entity ID)
+            batch_size: Batch size for operations
+            parallel: Whether to execute batches in parallel
+            journal: Checkpoint journal used to resume an interrupted run
+            validate: Whether to encode the updates with the schema-compiled
+                encoder first; invalid updates are reported as failures
+                without being sent
+            
+        Returns:
+            Bulk operation result
+        """
+        if not validate:
+            return await self.batch_processor.bulk_update(
+                entity_type, updates, batch_size, parallel, journal
+            )
+        
+        encoder = await self.schema.get_encoder(entity_type)
+        encoded = encoder.encode_many(
+            ({k: v for k, v in update.items() if k != "id"} for update in updates),
+            for_update=True,
+        )
+        records = [
+            dict(record, id=updates[index].get("id"))
+            for record, index in zip(encoded.records, encoded.indices)
+        ]
+        result = await self.batch_processor.bulk_update(
+            entity_type, records, batch_size, parallel, journal
+        )
+        return self._merge_rejected(result, encoded)
+    
+    @staticmethod
+    def _merge_rejected(
+        result: BulkOperationResult,
+        encoded: EncodedRecords,
+    ) -> BulkOperationResult:
+        """Map a bulk result back to input positions and add rejected records."""
+        if not encoded.rejected:
+            return result
+        
+        positions = encoded.indices
+        for error in result.errors:
+            if "operation_index" in error:
+                error["operation_index"] = positions[error["operation_index"]]
+            if "operation_indices" in error:
+                error["operation_indices"] = [positions[i] for i in error["operation_indices"]]
+        result.uncertain = [positions[i] for i in result.uncertain]
+        
+        for rejected in encoded.rejected:
+            error = {
+                "operation_index": rejected["index"],
+                "error": {"validation_errors": rejected["errors"]},
+            }
+            result.errors.append(error)
+            result.permanent_errors.append(error)
+        result.failed += len(encoded.rejected)
+        result.total_processed += len(encoded.rejected)
+        return result
+    
+    async def get_encoder(self, entity_type: str) -> EntityEncoder:
+        """
+        Get the schema-compiled encoder of an entity.
+        
+        Args:
+            entity_type: Entity logical name or entity set name
+            
+        Returns:
+            Encoder validating and coercing records of the entity
+        """
+        return await self.schema.get_encoder(entity_type)
+    
+    async def bulk_delete(
+        self,
+        entity_type: str,
+        entity_ids: List[str],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+        journal: Optional[BulkJournal] = None,
+    ) -> BulkOperationResult:
+        """
+        Bulk delete entities.
+        
+        Args:
+            entity_type: Entity logical name
+            entity_ids: List of entity IDs to delete
+            batch_size: Batch size for operations
+            parallel: Whether to execute batches in parallel
+            journal: Checkpoint journal used to resume an interrupted run
+            
+        Returns:
+            Bulk operation result
+        """
+        return await self.batch_processor.bulk_delete(
+            entity_type, entity_ids, batch_size, parallel, journal
+        )
+    
+    async def create_record_graphs(
+        self,
+        graphs: List[Union[RecordGraph, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        parallel: bool = True,
+    ) -> BulkOperationResult:
+        """
+        Create parent records together with their children.
+        
+        Each graph is created atomically in one changeset, with children bound
+        to their parent by Content-ID reference. Created IDs are set on the
+        ``entity_id`` of each ``RecordGraph``.
+        
+        Args:
+            graphs: Record graphs (or dictionaries with the same fields)
+            batch_size: Maximum number of records per batch
+            parallel: Whether to execute batches in parallel
+            
+        Returns:
+            Bulk operation result
+            
+        Example:
+            ```python
+            account = RecordGraph(
+                entity_type="accounts",
+                data={"name": "Contoso"},
+                children=[
+                    RecordGraph(
+                        entity_type="contacts",
+                        data={"lastname": "Smith"},
+                        parent_binding="parentcustomerid_account",
+                    ),
+                ],
+            )
+            await sdk.create_record_graphs([account])
+            print(account.entity_id, account.children[0].entity_id)
+            ```
+        """
+        graphs = [
+            graph if isinstance(graph, RecordGraph) else RecordGraph(**graph)
+            for graph in graphs
+        ]
+        return await self.batch_processor.create_record_graphs(
+            graphs, batch_size, parallel
+        )
+    
+    async def import_datasets(
+        self,
+        datasets: List[Union[ImportDataset, Dict[str, Any]]],
+        batch_size: Optional[int] = None,
+        resolve_relationships: bool = True,
+    ) -> ImportResult:
+        """
+        Import several related tables in dependency order.
+        
+        Tables are sorted from their lookups (completed from relationship
+        metadata for datasets with a ``logical_name``) and each wave of
+        independent tables is created in parallel, with lookups bound to the
+        IDs created by earlier waves.
+        
+        Args:
+            datasets: Datasets to import (or dictionaries with the same fields)
+            batch_size: Batch size for operations
+            resolve_relationships: Whether to read relationship metadata
+            
+        Returns:
+            Import result with per-dataset results and created IDs
+        """
+        from ..planner import ImportPlanner
+        
+        planner = ImportPlanner(
+            self.batch_processor,
+            [
+                dataset if isinstance(dataset, ImportDataset) else ImportDataset(**dataset)
+                for dataset in datasets
+            ],
+        )
+        return await planner.run(batch_size, resolve_relationships)
+    
+    # Metadata Operations
+    
+    async def get_entity_metadata(self, entity_type: str) -> Dict[str, Any]:
+        """
+        Get metadata for an entity.
+        
+        Definitions are cached (see ``sdk.metadata``), so repeated calls do
+        not reach the server.
+        
+        Args:
+            entity_type: Entity logical name or entity set name
+            
+        Returns:
+            Entity metadata
+        """
+        return await self.metadata.get_definition(entity_type)
+    
+    async def get_attribute_metadata(
+        self, entity_type: str, attribute_name: str
+    ) -> Dict[str, Any]:
+        """
+        Get metadata for an attribute.
+        
+        The attributes of an entity are loaded together once and cached
+        (see ``sdk.metadata``); the returned definition holds the properties
+        in ``ATTRIBUTE_PROPERTIES``.
+        
+        Args:
+            entity_type: Entity logical name or entity set name
+            attribute_name: Attribute logical name
+            
+        Returns:
+            Attribute metadata
+        """
+        return await self.metadata.get_attribute(entity_type, attribute_name)
+    
+    
+    def _load_config_file(self) -> Dict[str, Any]:
+        """
+        Load configuration from dataverse-config.json file.
+        
+        Searches for configuration file in multiple locations:
+        1. Current working directory
+        2. User home directory
+        3. XDG config directory
+        
+        Returns:
+            Configuration dictionary or empty dict if no file found
+        """
+        import json
+        from pathlib import Path
+        
+        # Possible config file locations
+        config_locations = [
+            Path.cwd() / "dataverse-config.json",
+            Path.home() / ".dataverse-config.json",
+            Path.home() / ".config" / "dataverse" / "config.json",
+        ]
+        
+        for config_path in config_locations:
+            if config_path.exists():
+                try:
+                    with open(config_path, 'r', encoding='utf-8') as f:
+                        config_data = json.load(f)
+                    
+                    logger.info(
+                        "Configuration loaded from file",
+                        config_file=str(config_path)
+                    )
+                    return config_data
+                    
+                except (json.JSONDecodeError, IOError) as e:
+                    logger.warning(
+                        "Failed to load configuration file",
+                        config_file=str(config_path),
+                        error=str(e)
+                    )
+                    continue
+        
+        logger.debug("No configuration file found in standard locations")
+        return {}
+    
+    # Utility Methods
+    
+    def register_hook(self, hook_type, hook_func, priority: int = 0) -> None:
+        """Register a hook function."""
+        self.hook_manager.register_hook(hook_type, hook_func, priority)
+    
+    def unregister_hook(self, hook_type, hook_func) -> bool:
+        """Unregister a hook function."""
+        return self.hook_manager.unregister_hook(hook_type, hook_func)
+    
+    async def clear_auth_cache(self) -> None:
+        """Clear authentication token cache."""
+        await self.authenticator.clear_cache()
+
+
+# Convenience exports
+__all__ = ["DataverseSDK"]
@@ -0,0 +1,536 @@
+"""
+Incremental synchronization for the Dataverse SDK.
+
+This module streams the records changed since the last run of a sync,
+using change tracking delta links or, for tables without change tracking, a
+``modifiedon`` high-water mark, and persists the sync position in a
+pluggable state store so interrupted runs resume where they stopped.
+"""
+
+import asyncio
+import json
+import os
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import structlog
+
+from ..client import AsyncDataverseClient
+from ..exceptions import APIError, ConfigurationError
+from ..models import RecordChange
+
+
+logger = structlog.get_logger(__name__)
+
+
+class SyncStateStore(ABC):
+    """Storage of sync positions (delta links, watermarks) by sync key."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a sync, or None if it never ran."""
+
+    @abstractmethod
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        """Store the state of a sync."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Forget the state of a sync, so the next run starts over."""
+
+
+class MemoryStateStore(SyncStateStore):
+    """State store kept in memory for the lifetime of the process."""
+
+    def __init__(self) -> None:
+        """Initialize the state store."""
+        self._states: Dict[str, Dict[str, Any]] = {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a sync, or None if it never ran."""
+        state = self._states.get(key)
+        return dict(state) if state is not None else None
+
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        """Store the state of a sync."""
+        self._states[key] = dict(state)
+
+    def delete(self, key: str) -> None:
+        """Forget the state of a sync, so the next run starts over."""
+        self._states.pop(key, None)
+
+
+class FileStateStore(SyncStateStore):
+    """
+    State store persisted as a JSON file.
+
+    Every update rewrites the file atomically, so a crash never leaves a
+    partially written state behind.
+    """
+
+    def __init__(self, path: Union[str, Path]) -> None:
+        """
+        Initialize the state store.
+
+        Args:
+            path: Path of the JSON state file
+        """
+        self.path = Path(path)
+        self._states: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Read the state file on first use."""
+        if self._states is None:
+            self._states = {}
+            if self.path.exists():
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._states = json.load(f)
+        return self._states
+
+    def _save(self) -> None:
+        """Write the state file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_file = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(temp_file, "w", encoding="utf-8") as f:
+            json.dump(self._load(), f, indent=2)
+        os.replace(temp_file, self.path)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the state of a sync, or None if it never ran."""
+        state = self._load().get(key)
+        return dict(state) if state is not None else None
+
+    def set(self, key: str, state: Dict[str, Any]) -> None:
+        """Store the state of a sync."""
+        self._load()[key] = dict(state)
+        self._save()
+
+    def delete(self, key: str) -> None:
+        """Forget the state of a sync, so the next run starts over."""
+        if self._load().pop(key, None) is not None:
+            self._save()
+
+
+class ChangeTracker:
+    """
+    Streams record changes with change tracking delta links.
+
+    The first run sends ``Prefer: odata.track-changes`` and yields every
+    record as a full load; the delta link returned with the last page is
+    stored. Later runs follow the stored delta link and yield only new,
+    updated and deleted (``$deletedEntity``) records. The position is saved
+    after each page has been consumed, so a failed run resumes from the last
+    completed page (changes of the page in progress are yielded again). An
+    expired delta link starts a new full load.
+
+    Example:
+        ```python
+        tracker = ChangeTracker(sdk.client, FileStateStore("sync-state.json"))
+        async for change in tracker.changes("accounts", select=["name"]):
+            ...
+        ```
+    """
+
+    def __init__(self, client: AsyncDataverseClient, state_store: SyncStateStore) -> None:
+        """
+        Initialize the change tracker.
+
+        Args:
+            client: Dataverse client instance
+            state_store: Store of the delta links
+        """
+        self.client = client
+        self.state_store = state_store
+
+    @staticmethod
+    def state_key(entity_type: str, select: Optional[List[str]] = None) -> str:
+        """Get the state key of a sync (delta links depend on the selected columns)."""
+        return f"changes:{entity_type}:{','.join(sorted(select or []))}"
+
+    async def changes(
+        self,
+        entity_type: str,
+        select: Optional[List[str]] = None,
+        primary_id_attribute: Optional[str] = None,
+        page_size: int = 5000,
+        key: Optional[str] = None,
+    ) -> AsyncIterator[RecordChange]:
+        """
+        Stream the changes since the last sync.
+
+        Args:
+            entity_type: Entity set name (change tracking must be enabled)
+            select: Columns to track
+            primary_id_attribute: Primary ID attribute used to fill ``entity_id``
+            page_size: Records per page
+            key: State key (derived from the entity type and columns if None)
+
+        Yields:
+            Record changes
+
+        Raises:
+            ConfigurationError: If the last page carries no delta link
+                (change tracking is not enabled for the table)
+        """
+        key = key or self.state_key(entity_type, select)
+        headers = {"Prefer": f"odata.track-changes,odata.maxpagesize={page_size}"}
+        state = self.state_store.get(key) or {}
+
+        if state.get("next_link"):
+            link, full_load = state["next_link"], state.get("full_load", False)
+        elif state.get("delta_link"):
+            link, full_load = state["delta_link"], False
+        else:
+            link, full_load = entity_type, True
+        params = {"$select": ",".join(select)} if select and link == entity_type else None
+
+        logger.info("Change sync started", entity_type=entity_type, full_load=full_load)
+        count = 0
+
+        while True:
+            try:
+                response = await self.client.get(link, params=params, headers=headers)
+            except APIError as e:
+                if full_load or not self._is_expired(e):
+                    raise
+                logger.warning("Delta link expired, starting a full load", entity_type=entity_type)
+                self.state_store.delete(key)
+                link, full_load = entity_type, True
+                params = {"$select": ",".join(select)} if select else None
+                continue
+
+            for item in response.get("value", []):
+                count += 1
+                yield self._change(item, primary_id_attribute, full_load)
+
+            next_link = response.get("@odata.nextLink")
+            if next_link:
+                state = {"next_link": next_link, "full_load": full_load}
+                self.state_store.set(key, state)
+                link, params = next_link, None
+                continue
+
+            delta_link = response.get("@odata.deltaLink")
+            if not delta_link:
+                # Without a delta link the next run could only repeat the full load
+                self.state_store.delete(key)
+                raise ConfigurationError(
+                    f"Change tracking is not enabled for {entity_type}: "
+                    "the response carried no delta link"
+                )
+
+            self.state_store.set(key, {"delta_link": delta_link, "synced_at": time.time()})
+            break
+
+        logger.info(
+            "Change sync completed",
+            entity_type=entity_type,
+            full_load=full_load,
+            change_count=count,
+        )
+
+    @staticmethod
+    def _change(
+        item: Dict[str, Any],
+        primary_id_attribute: Optional[str],
+        full_load: bool,
+    ) -> RecordChange:
+        """Convert a delta response item to a record change."""
+        if "$deletedEntity" in item.get("@odata.context", "") or item.get("reason") == "deleted":
+            return RecordChange(change_type="delete", entity_id=item.get("id"), full_load=full_load)
+        return RecordChange(
+            change_type="upsert",
+            entity_id=item.get(primary_id_attribute) if primary_id_attribute else None,
+            record=item,
+            full_load=full_load,
+        )
+
+    @staticmethod
+    def _is_expired(error: APIError) -> bool:
+        """Check whether an error reports an expired or invalid delta token."""
+        message = error.message.lower()
+        return error.status_code == 410 or ("token" in message and (
+            "expired" in message or "invalid" in message
+        ))
+
+
+# Called with each page of records; returning acknowledges the page
+Sink = Callable[[List[Dict[str, Any]]], Awaitable[Any]]
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Parse an OData datetime value."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _format_datetime(value: datetime) -> str:
+    """Format a datetime as an OData literal."""
+    return value.astimezone(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _delivered_ids(state: Dict[str, Any]) -> List[str]:
+    """Get the keys already delivered at a stored watermark."""
+    if "delivered_ids" in state:
+        return list(state["delivered_ids"] or [])
+    # States written before delivered keys were tracked hold only the last key
+    return [state["last_id"]] if state.get("last_id") else []
+
+
+class WatermarkExtractor:
+    """
+    Incremental extraction by ``modifiedon`` high-water mark.
+
+    For tables without change tracking. Records are read in
+    ``(modifiedon, primary key)`` order, page by page, and each page is
+    handed to a sink. The watermark (the last record's ``modifiedon`` and
+    primary key) is stored only after the sink returns, so a failing sink
+    never loses records.
+
+    Each run starts ``overlap`` seconds before the stored watermark to pick
+    up records committed late, so records may be delivered more than once
+    and sinks should upsert. Without overlap, a run restarts at the
+    watermark's own second and skips only the records already delivered in
+    it, which are kept in the state by primary key.
+
+    The first run can be split into time partitions extracted in parallel;
+    the sink is then called concurrently, and an interrupted backfill resumes
+    each partition from its own watermark.
+
+    Example:
+        ```python
+        extractor = WatermarkExtractor(
+            sdk.client, FileStateStore("state.json"), "new_readings", "new_readingid"
+        )
+        await extractor.run(write_to_warehouse, partitions=8)
+        ```
+    """
+
+    def __init__(
+        self,
+        client: AsyncDataverseClient,
+        state_store: SyncStateStore,
+        entity_type: str,
+        primary_id_attribute: str,
+        select: Optional[List[str]] = None,
+        filter: Optional[str] = None,
+        watermark_attribute: str = "modifiedon",
+        overlap: float = 60.0,
+        page_size: int = 5000,
+        key: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the extractor.
+
+        Args:
+            client: Dataverse client instance
+            state_store: Store of the watermark
+            entity_type: Entity set name
+            primary_id_attribute: Primary ID attribute, used to break ties
+            select: Columns to extract (the watermark and key are always added)
+            filter: Additional OData filter
+            watermark_attribute: Datetime attribute holding the modification time
+            overlap: Seconds re-read before the watermark on every run
+            page_size: Records per page
+            key: State key (derived from the entity type if None)
+        """
+        self.client = client
+        self.state_store = state_store
+        self.entity_type = entity_type
+        self.primary_id_attribute = primary_id_attribute
+        self.select = select
+        self.filter = filter
+        self.watermark_attribute = watermark_attribute
+        self.overlap = timedelta(seconds=overlap)
+        self.page_size = page_size
+        self.key = key or f"watermark:{entity_type}:{watermark_attribute}"
+
+    @property
+    def watermark(self) -> Optional[datetime]:
+        """Stored high-water mark, or None before the first run."""
+        state = self.state_store.get(self.key) or {}
+        return _parse_datetime(state["watermark"]) if state.get("watermark") else None
+
+    async def run(self, sink: Sink, partitions: int = 1) -> int:
+        """
+        Extract the records modified since the stored watermark.
+
+        Args:
+            sink: Coroutine function receiving each page of records
+            partitions: Number of parallel partitions for the first run
+
+        Returns:
+            Number of records handed to the sink
+        """
+        state = self.state_store.get(self.key)
+
+        if (state is None and partitions > 1) or (state and state.get("partitions")):
+            return await self._backfill(sink, partitions, state)
+
+        lower, delivered = None, None
+        if state and state.get("watermark"):
+            watermark = _parse_datetime(state["watermark"])
+            lower = watermark - self.overlap
+            if not self.overlap:
+                delivered = (watermark, _delivered_ids(state))
+
+        def commit(position: Tuple[datetime, List[str]]) -> None:
+            current = self.state_store.get(self.key) or {}
+            if current.get("watermark") and position[0] < _parse_datetime(current["watermark"]):
+                return
+            self.state_store.set(self.key, {
+                "watermark": _format_datetime(position[0]),
+                "delivered_ids": position[1],
+            })
+
+        count = await self._extract(sink, lower, None, delivered, commit)
+        logger.info("Watermark extraction completed", entity_type=self.entity_type, record_count=count)
+        return count
+
+    async def _backfill(
+        self,
+        sink: Sink,
+        partitions: int,
+        state: Optional[Dict[str, Any]],
+    ) -> int:
+        """Run the first extraction as parallel time partitions."""
+        if not state:
+            upper = datetime.now(timezone.utc)
+            first = await self._first_modified()
+            if first is None or partitions < 2:
+                bounds = [first or upper, upper]
+            else:
+                step = (upper - first) / partitions
+                bounds = [first + step * i for i in range(partitions)] + [upper]
+            state = {
+                "upper": _format_datetime(upper),
+                "partitions": [
+                    {"lower": _format_datetime(bounds[i]), "upper": _format_datetime(bounds[i + 1])}
+                    for i in range(len(bounds) - 1)
+                ],
+            }
+            # The first partition also takes records at its exact lower bound
+            state["partitions"][0]["lower"] = None
+            self.state_store.set(self.key, state)
+
+        def committer(partition: Dict[str, Any]) -> Callable[[Tuple[datetime, List[str]]], None]:
+            def commit(position: Tuple[datetime, List[str]]) -> None:
+                partition["watermark"] = _format_datetime(position[0])
+                partition["delivered_ids"] = position[1]
+                self.state_store.set(self.key, state)
+            return commit
+
+        async def extract(partition: Dict[str, Any]) -> int:
+            if partition.get("done"):
+                return 0
+            lower, delivered = partition.get("lower"), None
+            lower = _parse_datetime(lower) if lower else None
+            if partition.get("watermark"):
+                lower = _parse_datetime(partition["watermark"])
+                delivered = (lower, _delivered_ids(partition))
+            count = await self._extract(
+                sink, lower, _parse_datetime(partition["upper"]), delivered, committer(partition)
+            )
+            partition["done"] = True
+            self.state_store.set(self.key, state)
+            return count
+
+        counts = await asyncio.gather(*(extract(p) for p in state["partitions"]))
+
+        # Later runs continue from the end of the backfill
+        self.state_store.set(self.key, {"watermark": state["upper"], "delivered_ids": []})
+        logger.info(
+            "Watermark backfill completed",
+            entity_type=self.entity_type,
+            partitions=len(state["partitions"]),
+            record_count=sum(counts),
+        )
+        return sum(counts)
+
+    async def _first_modified(self) -> Optional[datetime]:
+        """Get the earliest watermark value of the table."""
+        params = {
+            "$select": self.watermark_attribute,
+            "$orderby": f"{self.watermark_attribute} asc",
+            "$top": "1",
+        }
+        if self.filter:
+            params["$filter"] = self.filter
+        response = await self.client.get(self.entity_type, params=params)
+        records = response.get("value", [])
+        if not records or not records[0].get(self.watermark_attribute):
+            return None
+        return _parse_datetime(records[0][self.watermark_attribute])
+
+    async def _extract(
+        self,
+        sink: Sink,
+        lower: Optional[datetime],
+        upper: Optional[datetime],
+        delivered: Optional[Tuple[datetime, List[str]]],
+        commit: Callable[[Tuple[datetime, List[str]]], None],
+    ) -> int:
+        """
+        Stream a watermark range to the sink, committing after each page.
+
+        ``delivered`` holds a watermark and the primary keys already delivered
+        at exactly that time; those records are skipped. Each commit receives
+        the last watermark of the page and every key delivered at it, since
+        the server's ordering of keys within one second cannot be relied on.
+        """
+        attribute = self.watermark_attribute
+        conditions = [f"({self.filter})"] if self.filter else []
+        if lower is not None:
+            conditions.append(f"{attribute} ge {_format_datetime(lower)}")
+        if upper is not None:
+            conditions.append(f"{attribute} lt {_format_datetime(upper)}")
+
+        params = {"$orderby": f"{attribute} asc,{self.primary_id_attribute} asc"}
+        if conditions:
+            params["$filter"] = " and ".join(conditions)
+        if self.select:
+            columns = list(self.select)
+            for column in (attribute, self.primary_id_attribute):
+                if column not in columns:
+                    columns.append(column)
+            params["$select"] = ",".join(columns)
+
+        last, ids = delivered if delivered is not None else (None, [])
+        skip = set(ids)
+        ids = list(ids)
+        count = 0
+        async for page in self.client.get_pages(self.entity_type, params, self.page_size):
+            positions = [self._position(r) for r in page]
+            records = [r for r, p in zip(page, positions) if p[0] != last or p[1] not in skip]
+            if records:
+                await sink(records)
+                count += len(records)
+            if not page:
+                continue
+            if positions[-1][0] != last:
+                last, ids, skip = positions[-1][0], [], set()
+            for position in positions:
+                if position[0] == last and position[1] not in skip:
+                    skip.add(position[1])
+                    ids.append(position[1])
+            commit((last, list(ids)))
+        return count
+
+    def _position(self, record: Dict[str, Any]) -> Tuple[datetime, str]:
+        """Get the (watermark, primary key) position of a record."""
+        return (
+            _parse_datetime(record[self.watermark_attribute]),
+            str(record.get(self.primary_id_attribute, "")),
+        )
+
+
+# Convenience exports
+__all__ = [
+    "SyncStateStore",
+    "MemoryStateStore",
+    "FileStateStore",
+    "ChangeTracker",
+    "WatermarkExtractor",
+]
@@ -6,10 +6,16 @@ including retry logic, configuration management, and helper functions.
 """
 
 import asyncio
+import json
 import os
+import re
+import threading
 import time
+import uuid
+from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
-from urllib.parse import urljoin, urlparse
+from urllib.parse import quote, urljoin, urlparse
 
 import structlog
 from tenacity import (
@@ -39,6 +45,7 @@ class Config:
             "max_connections": 100,
             "max_keepalive_connections": 20,
             "keepalive_expiry": 30,
+            "transport": None,  # Custom httpx transport (e.g. httpx.MockTransport)
             
             # Timeout settings (in seconds)
             "connect_timeout": 10.0,
@@ -54,6 +61,28 @@ class Config:
             # Batch settings
             "default_batch_size": 100,
             "max_batch_size": 1000,
+            "max_parallel_batches": 5,
+            "batch_max_retries": 3,
+            "batch_retry_budget": None,
+            "batch_continue_on_error": True,
+            
+            # Read coalescing settings
+            "coalesce_reads": False,
+            "coalesce_window_ms": 2.0,
+            "get_single_flight": True,
+            "get_cache_ttl": 0.0,
+            "get_cache_max_entries": 1024,
+            "etag_cache": False,
+            "etag_cache_max_bytes": 16 * 1024 * 1024,
+            "etag_cache_ttl": 0.0,
+            "etag_cache_entity_ttls": {},
+            "query_cache": False,
+            "query_cache_ttl": 60.0,
+            "query_cache_max_entries": 256,
+            "query_cache_path": None,
+            "query_cache_invalidate_on_write": True,
+            "metadata_cache_path": None,
+            "sync_state_path": None,
             
             # Proxy settings
             "proxy_url": None,
@@ -105,6 +134,22 @@ class Config:
             "RETRY_STATUS_CODES": ("retry_status_codes", lambda x: [int(i) for i in x.split(",")]),
             "DEFAULT_BATCH_SIZE": ("default_batch_size", int),
             "MAX_BATCH_SIZE": ("max_batch_size", int),
+            "MAX_PARALLEL_BATCHES": ("max_parallel_batches", int),
+            "BATCH_MAX_RETRIES": ("batch_max_retries", int),
+            "BATCH_RETRY_BUDGET": ("batch_retry_budget", int),
+            "COALESCE_READS": ("coalesce_reads", lambda x: x.lower() in ("true", "1", "yes")),
+            "COALESCE_WINDOW_MS": ("coalesce_window_ms", float),
+            "GET_SINGLE_FLIGHT": ("get_single_flight", lambda x: x.lower() in ("true", "1", "yes")),
+            "GET_CACHE_TTL": ("get_cache_ttl", float),
+            "GET_CACHE_MAX_ENTRIES": ("get_cache_max_entries", int),
+            "ETAG_CACHE": ("etag_cache", lambda x: x.lower() in ("true", "1", "yes")),
+            "ETAG_CACHE_MAX_BYTES": ("etag_cache_max_bytes", int),
+            "ETAG_CACHE_TTL": ("etag_cache_ttl", float),
+            "QUERY_CACHE": ("query_cache", lambda x: x.lower() in ("true", "1", "yes")),
+            "QUERY_CACHE_TTL": ("query_cache_ttl", float),
+            "QUERY_CACHE_PATH": ("query_cache_path", str),
+            "METADATA_CACHE_PATH": ("metadata_cache_path", str),
+            "SYNC_STATE_PATH": ("sync_state_path", str),
             
             # Proxy settings
             "PROXY_URL": ("proxy_url", str),
@@ -285,6 +330,132 @@ def extract_entity_id(entity_ref: Union[str, Dict[str, Any]]) -> Optional[str]:
     return None
 
 
+_GUID = re.compile(r"^[0-9a-fA-F]{8}-([0-9a-fA-F]{4}-){3}[0-9a-fA-F]{12}$")
+
+
+def is_guid(value: Any) -> bool:
+    """
+    Check whether a value is a GUID in its canonical hyphenated form.
+    
+    Args:
+        value: Value to check
+        
+    Returns:
+        True for a GUID string or UUID
+    """
+    return isinstance(value, uuid.UUID) or (isinstance(value, str) and bool(_GUID.match(value)))
+
+
+_guid_lock = threading.Lock()
+_last_guid_timestamp = 0
+
+
+def generate_sequential_guid() -> str:
+    """
+    Generate a sequential-friendly GUID for a client-assigned primary key.
+    
+    The last six bytes hold a monotonically increasing millisecond
+    timestamp. SQL Server orders uniqueidentifier values by these bytes
+    first, so consecutive IDs are inserted at the end of the clustered index
+    instead of at random pages. The remaining bytes are random.
+    
+    Returns:
+        GUID string
+    """
+    global _last_guid_timestamp
+    
+    with _guid_lock:
+        timestamp = max(int(time.time() * 1000), _last_guid_timestamp + 1)
+        _last_guid_timestamp = timestamp
+    
+    value = int.from_bytes(os.urandom(10) + timestamp.to_bytes(6, "big"), "big")
+    return str(uuid.UUID(int=value, version=4))
+
+
+# Placeholder written for Decimal values and replaced by their exact digits
+_DECIMAL_MARKER = "\x00decimal:"
+_DECIMAL_PLACEHOLDER = re.compile(r'"\\u0000decimal:([^"]+)"')
+
+
+def to_json(data: Any) -> str:
+    """
+    Serialize a request body to JSON.
+    
+    ``Decimal`` values are written as JSON numbers with their exact digits
+    instead of being rounded through ``float``, so Dataverse decimal and
+    money columns receive the value that was validated.
+    
+    Args:
+        data: JSON-compatible data, possibly containing ``Decimal`` values
+        
+    Returns:
+        JSON text
+    """
+    decimals = False
+    
+    def default(value: Any) -> str:
+        nonlocal decimals
+        if isinstance(value, Decimal) and value.is_finite():
+            decimals = True
+            return f"{_DECIMAL_MARKER}{value}"
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+    
+    text = json.dumps(data, default=default, ensure_ascii=False, separators=(",", ":"), allow_nan=False)
+    return _DECIMAL_PLACEHOLDER.sub(r"\1", text) if decimals else text
+
+
+def format_odata_literal(value: Any) -> str:
+    """
+    Format a value as an OData literal.
+    
+    Strings are quoted with embedded single quotes doubled; GUIDs, numbers
+    (including ``Decimal``), booleans and null are emitted bare. Datetimes
+    are converted to UTC and written with a ``Z`` suffix, naive ones being
+    taken as UTC.
+    
+    Args:
+        value: Value to format
+        
+    Returns:
+        OData literal
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float, uuid.UUID)):
+        return str(value)
+    if isinstance(value, Decimal):
+        # Fixed-point notation, e.g. 1E+2 is written as 100
+        return format(value, "f")
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def format_alternate_key(key: Dict[str, Any]) -> str:
+    """
+    Format an alternate key as a URL key segment.
+    
+    Literals are percent-encoded so values containing characters such as
+    ``/``, ``#``, ``?`` or ``&`` address the right record.
+    
+    Args:
+        key: Mapping of key attribute to value
+        
+    Returns:
+        Key segment without parentheses, e.g. ``accountnumber='A%2F1'``
+    """
+    return ",".join(
+        f"{name}=" + quote(format_odata_literal(value), safe="'-:.")
+        for name, value in key.items()
+    )
+
+
 def format_odata_filter(filters: Dict[str, Any]) -> str:
     """
     Format filters as OData $filter query parameter.
@@ -439,6 +610,11 @@ __all__ = [
     "parse_odata_url",
     "chunk_list",
     "extract_entity_id",
+    "is_guid",
+    "generate_sequential_guid",
+    "to_json",
+    "format_odata_literal",
+    "format_alternate_key",
     "format_odata_filter",
     "retry_with_backoff",
     "handle_rate_limit",
@@ -0,0 +1,179 @@
+"""
+Write-behind auto-batching for the Dataverse SDK.
+
+This module queues individual create, update and delete calls made inside a
+batching session and flushes them as ``$batch`` requests, while every caller
+still awaits its own result or error.
+"""
+
+import asyncio
+from contextvars import ContextVar, Token
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+import structlog
+
+from ..batch import BatchProcessor
+from ..exceptions import APIError
+
+
+logger = structlog.get_logger(__name__)
+
+
+_current_batcher: ContextVar[Optional["WriteBatcher"]] = ContextVar(
+    "dataverse_write_batcher", default=None
+)
+
+
+def current_write_batcher() -> Optional["WriteBatcher"]:
+    """Get the write batcher of the active batching session, if any."""
+    return _current_batcher.get()
+
+
+class WriteBatcher:
+    """
+    Queues single-record writes and sends them as batches.
+
+    Inside ``async with`` the batcher becomes the active session for the
+    current task and the tasks it starts, so ``DataverseSDK.create``,
+    ``update`` and ``delete`` are queued instead of sent one by one. A queue
+    is flushed ``max_delay_ms`` after its first write or as soon as it holds
+    ``max_size`` writes, and all writes are flushed before the session exits.
+
+    Example:
+        ```python
+        async with sdk.batching(max_delay_ms=20, max_size=100):
+            await asyncio.gather(*(sdk.create("accounts", a) for a in accounts))
+        ```
+    """
+
+    def __init__(
+        self,
+        batch_processor: BatchProcessor,
+        max_delay_ms: float = 10.0,
+        max_size: int = 100,
+    ) -> None:
+        """
+        Initialize the write batcher.
+
+        Args:
+            batch_processor: Batch processor used to send the writes
+            max_delay_ms: Time to collect writes before sending them
+            max_size: Maximum number of writes per batch
+        """
+        self.batch_processor = batch_processor
+        self.max_delay_ms = max_delay_ms
+        self.max_size = min(max_size, batch_processor.max_batch_size)
+
+        self._queue: List[Tuple[Dict[str, Any], asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._token: Optional[Token] = None
+        self._closed = False
+
+    async def __aenter__(self) -> "WriteBatcher":
+        """Activate the batching session."""
+        self._token = _current_batcher.set(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Deactivate the session and wait for every queued write."""
+        if self._token is not None:
+            _current_batcher.reset(self._token)
+            self._token = None
+        self._closed = True
+        await self.flush()
+
+    async def submit(self, operation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a write and wait for its outcome.
+
+        Args:
+            operation: Operation (method, url, headers, body)
+
+        Returns:
+            Outcome of the operation (status, headers, json, entity_id)
+
+        Raises:
+            APIError: If the operation failed
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((operation, future))
+
+        if self._closed or len(self._queue) >= self.max_size:
+            self._dispatch()
+        elif len(self._queue) == 1:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_delay_ms / 1000, self._dispatch
+            )
+
+        return await asyncio.shield(future)
+
+    async def flush(self) -> None:
+        """Send queued writes now and wait for all batches to finish."""
+        self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self) -> None:
+        """Start sending the queued writes."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        queue, self._queue = self._queue, []
+        if not queue:
+            return
+
+        task = asyncio.ensure_future(self._send(queue))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send(self, queue: List[Tuple[Dict[str, Any], asyncio.Future]]) -> None:
+        """Send writes as a bulk operation and resolve each caller."""
+        operations = [operation for operation, _ in queue]
+
+        def on_outcome(operation_index: int, outcome: Dict[str, Any]) -> None:
+            future = queue[operation_index][1]
+            if future.done():
+                return
+            status = outcome.get("status")
+            if status is not None and status < 400:
+                future.set_result(outcome)
+            else:
+                future.set_exception(self._outcome_error(outcome))
+
+        try:
+            await self.batch_processor.execute_bulk_operation(
+                operations,
+                batch_size=self.max_size,
+                parallel=False,
+                on_outcome=on_outcome,
+            )
+        except Exception as e:
+            for _, future in queue:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for _, future in queue:
+            if not future.done():
+                future.set_exception(APIError("Operation was not executed"))
+
+        logger.debug("Write batch flushed", operation_count=len(operations))
+
+    @staticmethod
+    def _outcome_error(outcome: Dict[str, Any]) -> APIError:
+        """Build the error raised to the caller of a failed write."""
+        error_data = outcome.get("json") or {}
+        status = outcome.get("status")
+        message = error_data.get("error", {}).get("message") or str(
+            outcome.get("error") or f"HTTP {status}"
+        )
+        return APIError(message, status_code=status, response_data=error_data)
+
+
+# Convenience exports
+__all__ = [
+    "WriteBatcher",
+    "current_write_batcher",
+]
@@ -0,0 +1,776 @@
+"""
+Unit tests for the batch module.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from dataverse_sdk.batch import BatchPayload, BatchProcessor
+from dataverse_sdk.exceptions import ConnectionError, APIError, ValidationError
+from dataverse_sdk.hooks import HookManager
+from dataverse_sdk.journal import BulkJournal
+from dataverse_sdk.models import RecordGraph
+from dataverse_sdk.utils import generate_sequential_guid
+
+
+def build_batch_response(
+    parts: List[Dict[str, Any]],
+    boundary: str = "batchresponse_test",
+) -> str:
+    """Build a multipart batch response body from (status, body, headers, content_id) parts."""
+    lines = []
+    for part in parts:
+        lines.extend([
+            f"--{boundary}",
+            "Content-Type: application/http",
+            "Content-Transfer-Encoding: binary",
+        ])
+        if part.get("content_id") is not None:
+            lines.append(f"Content-ID: {part['content_id']}")
+        lines.extend([
+            "",
+            f"HTTP/1.1 {part['status']} {part.get('reason', 'Status')}",
+        ])
+        for key, value in part.get("headers", {}).items():
+            lines.append(f"{key}: {value}")
+        lines.append("")
+        if part.get("body") is not None:
+            lines.append(json.dumps(part["body"]))
+        lines.append("")
+    lines.append(f"--{boundary}--")
+    return "\r\n".join(lines)
+
+
+# First run of a journaled create with generated keys, failing on every request
+INTERRUPTED_CREATE = """
+import asyncio, json, sys
+from unittest.mock import AsyncMock, MagicMock
+from dataverse_sdk.batch import BatchProcessor
+from dataverse_sdk.exceptions import ConnectionError
+from dataverse_sdk.hooks import HookManager
+from dataverse_sdk.journal import BulkJournal
+
+client = MagicMock(api_base_url="https://test.crm.dynamics.com/api/data/v9.2/")
+client.hook_manager = HookManager()
+client._execute_request = AsyncMock(side_effect=ConnectionError("Connection failed"))
+entities = [{"name": "Contoso"}, {"name": "Fabrikam"}]
+with BulkJournal(sys.argv[1], "job") as journal:
+    processor = BatchProcessor(client, max_retries=0, backoff_factor=0)
+    asyncio.run(processor.bulk_create(
+        "accounts", entities, journal=journal, generate_ids=True, primary_id_attribute="accountid"
+    ))
+print(json.dumps([entity["accountid"] for entity in entities]))
+"""
+
+
+def make_response(text: str) -> MagicMock:
+    """Create a mock HTTP response with the given text."""
+    response = MagicMock()
+    response.text = text
+    return response
+
+
+class TestBatchResponseParsing:
+    """Test cases for batch response parsing."""
+
+    @pytest.fixture
+    def processor(self):
+        """Create a batch processor with a mock client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        return BatchProcessor(client)
+
+    def test_parse_sample_response(self, processor, sample_batch_response):
+        """Test parsing responses and errors with their positions."""
+        result = processor._parse_batch_response(sample_batch_response)
+
+        assert result.success_count == 1
+        assert result.error_count == 1
+        assert result.responses[0]["index"] == 0
+        assert result.responses[0]["json"]["name"] == "Test Account"
+        assert result.errors[0]["index"] == 1
+        assert result.errors[0]["status"] == 400
+        assert result.errors[0]["headers"]["OData-Version"] == "4.0"
+
+    def test_parse_changeset_response(self, processor):
+        """Test parsing responses nested inside a changeset."""
+        content = "\r\n".join([
+            "--batchresponse_1",
+            "Content-Type: multipart/mixed; boundary=changesetresponse_2",
+            "",
+            "--changesetresponse_2",
+            "Content-Type: application/http",
+            "Content-Transfer-Encoding: binary",
+            "Content-ID: 1",
+            "",
+            "HTTP/1.1 204 No Content",
+            "OData-EntityId: https://test/api/data/v9.2/accounts(11111111-1111-1111-1111-111111111111)",
+            "",
+            "",
+            "--changesetresponse_2",
+            "Content-Type: application/http",
+            "Content-Transfer-Encoding: binary",
+            "Content-ID: 2",
+            "",
+            "HTTP/1.1 204 No Content",
+            "",
+            "",
+            "--changesetresponse_2--",
+            "--batchresponse_1--",
+        ])
+
+        result = processor._parse_batch_response(content)
+
+        assert [r["index"] for r in result.responses] == [0, 1]
+        assert [r["content_id"] for r in result.responses] == ["1", "2"]
+        assert "OData-EntityId" in result.responses[0]["headers"]
+
+
+class TestBatchPayload:
+    """Test cases for the streaming batch payload."""
+
+    @pytest.mark.asyncio
+    async def test_payload_streams_to_httpx(self):
+        """Test that the payload can be streamed, and resent, by httpx."""
+        received = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            received.append(request.read())
+            return httpx.Response(200)
+
+        payload = BatchPayload("batch_test", [(None, [
+            {"method": "POST", "url": "accounts", "body": {"name": "Contoso"}},
+            {"method": "DELETE", "url": "accounts(1)"},
+        ])])
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            await http.post("https://test/$batch", content=payload)
+            await http.post("https://test/$batch", content=payload)
+
+        assert received[0] == received[1] == payload.to_bytes()
+        assert received[0] == (
+            b"--batch_test\r\n"
+            b"Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+            b"POST accounts HTTP/1.1\r\nContent-Type: application/json\r\n\r\n"
+            b'{"name":"Contoso"}\r\n\r\n'
+            b"--batch_test\r\n"
+            b"Content-Type: application/http\r\nContent-Transfer-Encoding: binary\r\n\r\n"
+            b"DELETE accounts(1) HTTP/1.1\r\n\r\n\r\n"
+            b"--batch_test--"
+        )
+
+
+class TestBulkOperationRetry:
+    """Test cases for partial failure retries in bulk operations."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, default_batch_size=3, backoff_factor=0)
+
+    @staticmethod
+    def operations(count: int) -> List[Dict[str, Any]]:
+        return [
+            {"method": "POST", "url": "accounts", "body": {"name": f"Account {i}"}}
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def sent_names(call) -> List[str]:
+        payload = call.kwargs["content"].to_bytes().decode("utf-8")
+        return [
+            json.loads(line)["name"]
+            for line in payload.split("\r\n")
+            if line.startswith("{")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_only_retryable_operations_are_retried(self, processor, client):
+        """Test that only throttled operations are re-batched."""
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([
+                {"status": 204},
+                {"status": 429, "headers": {"Retry-After": "0"}, "body": {"error": {}}},
+                {"status": 400, "body": {"error": {"message": "Invalid"}}},
+            ])),
+            make_response(build_batch_response([{"status": 204}])),
+        ]
+
+        result = await processor.execute_bulk_operation(self.operations(3))
+
+        assert client._execute_request.call_count == 2
+        assert self.sent_names(client._execute_request.call_args_list[1]) == ["Account 1"]
+        assert result.successful == 2
+        assert result.failed == 1
+        assert result.retried == 1
+        assert len(result.permanent_errors) == 1
+        assert result.permanent_errors[0]["operation_index"] == 2
+        assert result.transient_errors == []
+
+    @pytest.mark.asyncio
+    async def test_unexecuted_operations_are_retried(self, processor, client):
+        """Test that operations without a response are retried."""
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([{"status": 503, "body": {}}])),
+            make_response(build_batch_response([
+                {"status": 204}, {"status": 204}, {"status": 204},
+            ])),
+        ]
+
+        result = await processor.execute_bulk_operation(self.operations(3))
+
+        assert result.successful == 3
+        assert result.retried == 3
+        assert not result.has_errors
+
+    @pytest.mark.asyncio
+    async def test_whole_batch_transport_failure_is_retried(self, processor, client):
+        """Test that transport failures of a whole batch are retried."""
+        client._execute_request.side_effect = [
+            ConnectionError("Connection failed"),
+            make_response(build_batch_response([{"status": 204}, {"status": 204}])),
+        ]
+
+        result = await processor.execute_bulk_operation(self.operations(2))
+
+        assert result.successful == 2
+        assert result.retried == 2
+
+    @pytest.mark.asyncio
+    async def test_whole_batch_client_error_is_permanent(self, processor, client):
+        """Test that a 4xx failure of a whole batch is not retried."""
+        client._execute_request.side_effect = APIError("Bad request", status_code=400)
+
+        result = await processor.execute_bulk_operation(self.operations(2))
+
+        assert client._execute_request.call_count == 1
+        assert result.failed == 2
+        assert result.permanent_errors[0]["operation_indices"] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_retry_budget_limits_retries(self, client):
+        """Test that the retry budget caps the number of retried operations."""
+        processor = BatchProcessor(client, default_batch_size=3, backoff_factor=0, retry_budget=1)
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([
+                {"status": 503, "body": {}},
+                {"status": 503, "body": {}},
+            ])),
+            make_response(build_batch_response([{"status": 204}])),
+        ]
+
+        result = await processor.execute_bulk_operation(self.operations(2))
+
+        assert result.retried == 1
+        assert result.successful == 1
+        assert result.failed == 1
+        assert result.transient_errors[0]["operation_index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_retries_stop_after_max_rounds(self, client):
+        """Test that transient failures are reported after all retry rounds."""
+        processor = BatchProcessor(client, backoff_factor=0, max_retries=2)
+        client._execute_request.return_value = make_response(
+            build_batch_response([{"status": 500, "body": {}}])
+        )
+
+        result = await processor.execute_bulk_operation(self.operations(1))
+
+        assert client._execute_request.call_count == 3
+        assert result.failed == 1
+        assert len(result.transient_errors) == 1
+
+
+class TestBulkJournal:
+    """Test cases for checkpoint/resume of bulk operations."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, default_batch_size=2, backoff_factor=0)
+
+    @staticmethod
+    def entity_response(count: int) -> MagicMock:
+        return make_response(build_batch_response([
+            {
+                "status": 204,
+                "headers": {
+                    "OData-EntityId": "https://test/api/data/v9.2/accounts"
+                    f"(00000000-0000-0000-0000-00000000000{i})"
+                },
+            }
+            for i in range(count)
+        ]))
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_completed_chunks(self, processor, client, tmp_path):
+        """Test that a resumed run only sends operations not yet completed."""
+        operations = TestBulkOperationRetry.operations(4)
+        path = tmp_path / "bulk.journal"
+
+        client._execute_request.side_effect = [
+            self.entity_response(2),
+            ConnectionError("Connection failed"),
+        ]
+        with BulkJournal(path, "job-1") as journal:
+            first = await processor.execute_bulk_operation(
+                operations, parallel=False, max_retries=0, journal=journal
+            )
+        assert first.successful == 2
+        assert first.failed == 2
+
+        client._execute_request.side_effect = [self.entity_response(2)]
+        with BulkJournal(path, "job-1") as journal:
+            second = await processor.execute_bulk_operation(
+                operations, parallel=False, journal=journal
+            )
+            summary = journal.summary()
+            entity_ids = journal.get_entity_ids()
+
+        sent = TestBulkOperationRetry.sent_names(client._execute_request.call_args_list[-1])
+        assert sent == ["Account 2", "Account 3"]
+        assert second.skipped == 2
+        assert second.successful == 2
+        assert summary["succeeded"] == 4
+        assert entity_ids[0] == "00000000-0000-0000-0000-000000000000"
+
+    @pytest.mark.asyncio
+    async def test_in_flight_creates_are_uncertain(self, processor, client, tmp_path):
+        """Test that interrupted non-idempotent operations are not resent."""
+        operations = TestBulkOperationRetry.operations(2)
+        path = tmp_path / "bulk.journal"
+
+        with BulkJournal(path, "job-2") as journal:
+            journal.begin(operations)
+            journal.mark_in_flight(operations, [0, 1])
+
+        with BulkJournal(path, "job-2") as journal:
+            result = await processor.execute_bulk_operation(operations, journal=journal)
+
+        client._execute_request.assert_not_called()
+        assert result.uncertain == [0, 1]
+
+    def test_changed_operations_are_rejected(self, tmp_path):
+        """Test that a journal cannot resume a different set of operations."""
+        path = tmp_path / "bulk.journal"
+
+        with BulkJournal(path, "job-3") as journal:
+            journal.begin(TestBulkOperationRetry.operations(2))
+
+        with BulkJournal(path, "job-3") as journal:
+            with pytest.raises(ValidationError):
+                journal.begin(TestBulkOperationRetry.operations(3))
+
+
+class TestRecordGraphs:
+    """Test cases for creating parent/child record graphs."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, backoff_factor=0)
+
+    @staticmethod
+    def graph(name: str) -> RecordGraph:
+        return RecordGraph(
+            entity_type="accounts",
+            data={"name": name},
+            children=[
+                RecordGraph(
+                    entity_type="contacts",
+                    data={"lastname": f"{name} Contact"},
+                    parent_binding="parentcustomerid_account",
+                ),
+            ],
+        )
+
+    @staticmethod
+    def created(content_id: int, entity_set: str) -> Dict[str, Any]:
+        return {
+            "status": 204,
+            "content_id": str(content_id),
+            "headers": {
+                "OData-EntityId": f"https://test/api/data/v9.2/{entity_set}"
+                f"(00000000-0000-0000-0000-00000000000{content_id})",
+            },
+        }
+
+    @pytest.mark.asyncio
+    async def test_children_bind_to_parent_content_id(self, processor, client):
+        """Test that each graph is a changeset with Content-ID references."""
+        client._execute_request.return_value = make_response(build_batch_response([
+            self.created(1, "accounts"),
+            self.created(2, "contacts"),
+        ]))
+        graph = self.graph("Contoso")
+
+        result = await processor.create_record_graphs([graph])
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert "Content-ID: 1" in payload
+        assert "Content-ID: 2" in payload
+        assert '"parentcustomerid_account@odata.bind":"$1"' in payload
+        assert result.successful == 2
+        assert graph.entity_id == "00000000-0000-0000-0000-000000000001"
+        assert graph.children[0].entity_id == "00000000-0000-0000-0000-000000000002"
+
+    @pytest.mark.asyncio
+    async def test_failed_changeset_is_mapped_to_its_graph(self, processor, client):
+        """Test that a failed changeset does not shift the following graphs."""
+        client._execute_request.return_value = make_response(build_batch_response([
+            {"status": 400, "body": {"error": {"message": "Invalid"}}},
+            self.created(3, "accounts"),
+            self.created(4, "contacts"),
+        ]))
+        graphs = [self.graph("Invalid"), self.graph("Fabrikam")]
+
+        result = await processor.create_record_graphs(graphs)
+
+        assert result.successful == 2
+        assert result.failed == 2
+        assert result.permanent_errors[0]["graph_index"] == 0
+        assert graphs[0].entity_id is None
+        assert graphs[1].entity_id == "00000000-0000-0000-0000-000000000003"
+
+    @pytest.mark.asyncio
+    async def test_child_without_binding_is_rejected(self, processor):
+        """Test that children must declare how they bind to their parent."""
+        graph = RecordGraph(
+            entity_type="accounts",
+            children=[RecordGraph(entity_type="contacts")],
+        )
+
+        with pytest.raises(ValidationError):
+            await processor.create_record_graphs([graph])
+
+
+class TestGeneratedIds:
+    """Test cases for creates with client-generated primary keys."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        client.get = AsyncMock(return_value={"value": [{"PrimaryIdAttribute": "accountid"}]})
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, backoff_factor=0)
+
+    @pytest.mark.asyncio
+    async def test_ids_are_assigned_from_metadata(self, processor, client):
+        """Test that primary keys are generated into the primary ID attribute."""
+        client._execute_request.return_value = make_response(build_batch_response([
+            {"status": 204}, {"status": 204},
+        ]))
+        entities = [{"name": "Contoso"}, {"name": "Fabrikam"}]
+
+        result = await processor.bulk_create("accounts", entities, generate_ids=True)
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert result.successful == 2
+        assert entities[0]["accountid"] != entities[1]["accountid"]
+        assert f"PATCH accounts({entities[0]['accountid']}) HTTP/1.1" in payload
+        assert "If-None-Match: *" in payload
+        client.get.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retried_create_that_exists_succeeds(self, processor, client):
+        """Test that a resent create finding its record counts as created."""
+        client._execute_request.side_effect = [
+            ConnectionError("Connection reset"),
+            make_response(build_batch_response([{"status": 412, "body": {"error": {}}}])),
+        ]
+        entities = [{"name": "Contoso"}]
+
+        result = await processor.bulk_create("accounts", entities, generate_ids=True)
+
+        assert result.successful == 1
+        assert result.retried == 1
+        assert not result.has_errors
+
+    @pytest.mark.asyncio
+    async def test_generated_ids_resume_in_new_process(self, processor, client, tmp_path):
+        """Test that a journaled create resumes with the keys of an earlier process."""
+        path = tmp_path / "bulk.journal"
+        root = Path(__file__).parent.parent.parent
+        first_run = subprocess.run(
+            [sys.executable, "-c", INTERRUPTED_CREATE, str(path)],
+            cwd=root,
+            env=dict(os.environ, PYTHONPATH=str(root)),
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        first_ids = json.loads(first_run.stdout.strip().splitlines()[-1])
+
+        client._execute_request.return_value = make_response(build_batch_response([
+            {"status": 204}, {"status": 204},
+        ]))
+        entities = [{"name": "Contoso"}, {"name": "Fabrikam"}]
+        with BulkJournal(path, "job") as journal:
+            result = await processor.bulk_create(
+                "accounts", entities, journal=journal, generate_ids=True
+            )
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert result.successful == 2
+        assert [entity["accountid"] for entity in entities] == first_ids
+        assert f"PATCH accounts({first_ids[1]}) HTTP/1.1" in payload
+
+    def test_sequential_guids_sort_by_creation(self):
+        """Test that generated GUIDs increase in their trailing bytes."""
+        guids = [generate_sequential_guid() for _ in range(100)]
+
+        assert len(set(guids)) == 100
+        assert [g[-12:] for g in guids] == sorted(g[-12:] for g in guids)
+
+
+class TestBulkUpsert:
+    """Test cases for bulk upserts by alternate key."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        client.get = AsyncMock(return_value={"value": [{"PrimaryIdAttribute": "accountid"}]})
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, backoff_factor=0)
+
+    @pytest.mark.asyncio
+    async def test_duplicate_keys_keep_last_record(self, processor, client):
+        """Test that repeated keys are upserted once with the last record."""
+        client._execute_request.return_value = make_response(build_batch_response([
+            {"status": 201, "body": {"accountid": "00000000-0000-0000-0000-000000000001"}},
+            {"status": 200, "body": {"accountid": "00000000-0000-0000-0000-000000000002"}},
+        ]))
+        records = [
+            {"accountnumber": "O'Brien/1", "name": "First"},
+            {"accountnumber": "A2", "name": "Other"},
+            {"accountnumber": "O'Brien/1", "name": "Last"},
+        ]
+
+        result = await processor.bulk_upsert("accounts", records, key_fields=["accountnumber"])
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert "PATCH accounts(accountnumber='A2')?$select=accountid HTTP/1.1" in payload
+        assert "PATCH accounts(accountnumber='O''Brien%2F1')?$select=accountid HTTP/1.1" in payload
+        assert '"name":"Last"' in payload
+        assert '"name":"First"' not in payload
+        assert result.duplicates == 1
+        assert result.created == 1
+        assert result.updated == 1
+        assert result.records[0] == result.records[2]
+        assert result.records[1].entity_id == "00000000-0000-0000-0000-000000000001"
+        assert result.records[1].was_created
+        assert result.records[2].was_updated
+
+    @pytest.mark.asyncio
+    async def test_missing_key_field_is_rejected(self, processor):
+        """Test that every record must carry the alternate key."""
+        with pytest.raises(ValidationError):
+            await processor.bulk_upsert("accounts", [{"name": "No key"}], ["accountnumber"])
+
+
+class TestBulkAssociation:
+    """Test cases for bulk associate and disassociate."""
+
+    LIST_ID = "00000000-0000-0000-0000-0000000000aa"
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        client.get = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, backoff_factor=0)
+
+    @pytest.mark.asyncio
+    async def test_associate_skips_existing_links(self, processor, client):
+        """Test that already linked pairs are not sent again."""
+        client.get.side_effect = [
+            {"value": [{"PrimaryIdAttribute": "contactid"}]},
+            {"value": [{"contactid": "C1"}], "@odata.nextLink": "next-page"},
+            {"value": [{"contactid": "C2"}]},
+        ]
+        client._execute_request.return_value = make_response(
+            build_batch_response([{"status": 204}])
+        )
+        pairs = iter([(self.LIST_ID, "c1"), (self.LIST_ID, "C2"), (self.LIST_ID, "C3")])
+
+        result = await processor.bulk_associate(
+            "lists", "listcontact_association", "contacts", pairs, skip_existing=True
+        )
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert client.get.call_args_list[2].args[0] == "next-page"
+        assert f"POST lists({self.LIST_ID})/listcontact_association/$ref HTTP/1.1" in payload
+        assert '"@odata.id":"https://test.crm.dynamics.com/api/data/v9.2/contacts(C3)"' in payload
+        assert payload.count("$ref") == 1
+        assert result.successful == 1
+        assert result.skipped == 2
+
+    @pytest.mark.asyncio
+    async def test_disassociate_retries_throttled_pairs(self, processor, client):
+        """Test that disassociations share the partial failure retries."""
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([
+                {"status": 204},
+                {"status": 429, "headers": {"Retry-After": "0"}, "body": {}},
+            ])),
+            make_response(build_batch_response([{"status": 204}])),
+        ]
+
+        result = await processor.bulk_disassociate(
+            "lists", "listcontact_association", "contacts",
+            [(self.LIST_ID, "C1"), (self.LIST_ID, "C2")],
+        )
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert f"DELETE lists({self.LIST_ID})/listcontact_association(C2)/$ref HTTP/1.1" in payload
+        assert result.successful == 2
+        assert result.retried == 1
+
+
+class TestReadMany:
+    """Test cases for reading many records at once."""
+
+    @pytest.fixture
+    def client(self):
+        """Create a mock Dataverse client."""
+        client = MagicMock()
+        client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+        client.hook_manager = HookManager()
+        client._execute_request = AsyncMock()
+        client.get = AsyncMock()
+        return client
+
+    @pytest.fixture
+    def processor(self, client):
+        """Create a batch processor without backoff delays."""
+        return BatchProcessor(client, backoff_factor=0)
+
+    @staticmethod
+    def guid(i: int) -> str:
+        return f"00000000-0000-0000-0000-{i:012d}"
+
+    @pytest.mark.asyncio
+    async def test_ids_are_grouped_under_url_limit(self, processor, client):
+        """Test that IDs are read with grouped queries aligned to the input."""
+        async def get(endpoint, params=None):
+            values = params["$filter"].split("PropertyValues=[")[1].rstrip("])")
+            ids = [v.strip('"') for v in values.split(",")]
+            return {"value": [
+                {"accountid": i.upper(), "name": i} for i in ids if i != self.guid(3)
+            ]}
+
+        client.get.side_effect = get
+        ids = [self.guid(i) for i in range(6)] + [self.guid(1)]
+
+        records = await processor.read_many(
+            "accounts", ids, select=["name"],
+            primary_id_attribute="accountid", max_url_length=300,
+        )
+
+        assert client.get.await_count > 1
+        for call in client.get.await_args_list:
+            assert call.kwargs["params"]["$select"] == "name,accountid"
+        assert [r["name"] if r else None for r in records] == [
+            self.guid(0), self.guid(1), self.guid(2), None,
+            self.guid(4), self.guid(5), self.guid(1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_alternate_keys_use_batch_gets(self, processor, client):
+        """Test that alternate keys are read with batched GET requests."""
+        client._execute_request.return_value = make_response(build_batch_response([
+            {"status": 200, "body": {"accountnumber": "A1", "name": "Contoso"}},
+            {"status": 404, "body": {"error": {"message": "Not found"}}},
+        ]))
+
+        records = await processor.read_many(
+            "accounts",
+            [{"accountnumber": "A1"}, {"accountnumber": "A2"}, {"accountnumber": "A1"}],
+            primary_id_attribute="accountid",
+        )
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert "GET accounts(accountnumber='A1') HTTP/1.1" in payload
+        assert client._execute_request.await_count == 1
+        assert records[0]["name"] == "Contoso"
+        assert records[1] is None
+        assert records[2] is records[0]
+
+    @pytest.mark.asyncio
+    async def test_alternate_key_errors_are_raised(self, client):
+        """Test that failures other than 404 are not reported as missing records."""
+        processor = BatchProcessor(client, max_retries=0, backoff_factor=0)
+        client._execute_request.return_value = make_response(build_batch_response([
+            {"status": 404, "body": {"error": {"message": "Not found"}}},
+            {"status": 401, "body": {"error": {"message": "Unauthorized"}}},
+        ]))
+
+        with pytest.raises(APIError) as exc_info:
+            await processor.read_many(
+                "accounts",
+                [{"accountnumber": "A1"}, {"accountnumber": "A2"}],
+                primary_id_attribute="accountid",
+            )
+
+        assert exc_info.value.status_code == 401
+        assert "Unauthorized" in str(exc_info.value)
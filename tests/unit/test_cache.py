@@ -0,0 +1,354 @@
+"""
+Unit tests for the cache module.
+"""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.auth import DataverseAuthenticator
+from dataverse_sdk import DataverseSDK
+from dataverse_sdk.cache import (
+    DiskQueryCache,
+    ETagCache,
+    MemoryQueryCache,
+    QueryCache,
+    QueryCacheBackend,
+    SingleFlightCache,
+)
+from dataverse_sdk.client import AsyncDataverseClient
+from dataverse_sdk.exceptions import APIError
+from dataverse_sdk.models import QueryOptions
+from dataverse_sdk.utils import Config
+
+
+def make_fetch(results):
+    """Create a slow fetch that returns the given results in order."""
+    calls = iter(results)
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        result = next(calls)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    return AsyncMock(side_effect=fetch)
+
+
+class TestSingleFlightCache:
+    """Test cases for the single-flight GET cache."""
+
+    def test_key_normalization(self):
+        """Test that equivalent requests share a key and others do not."""
+        key = SingleFlightCache.make_key(
+            "get",
+            "HTTPS://Test.crm.dynamics.com/api/data/v9.2/accounts#top",
+            {"$top": 5, "$select": "name"},
+            {"Prefer": "odata.maxpagesize=5", "X-Request-Id": "1"},
+        )
+        same = SingleFlightCache.make_key(
+            "GET",
+            "https://test.crm.dynamics.com/api/data/v9.2/accounts",
+            {"$select": "name", "$top": "5"},
+            {"prefer": "odata.maxpagesize=5", "X-Request-Id": "2"},
+        )
+        other = SingleFlightCache.make_key(
+            "GET",
+            "https://test.crm.dynamics.com/api/data/v9.2/accounts",
+            {"$select": "name", "$top": "5"},
+        )
+
+        assert key == same
+        assert key != other
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_fetch(self):
+        """Test that identical in-flight calls are coalesced."""
+        cache = SingleFlightCache()
+        fetch = make_fetch([{"value": [1]}])
+
+        results = await asyncio.gather(*(cache.get_or_fetch("k", fetch) for _ in range(3)))
+
+        assert fetch.await_count == 1
+        assert results == [{"value": [1]}] * 3
+        assert results[0] is not results[1]
+        assert cache.saved == 2
+        assert cache.metrics == {"requests": 3, "fetches": 1, "coalesced": 2, "hits": 0}
+
+    @pytest.mark.asyncio
+    async def test_fetching_caller_gets_result_uncopied(self):
+        """Test that only joiners and cache hits pay for a copy."""
+        cache = SingleFlightCache()
+        result = {"value": [1]}
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return result
+
+        first, joined = await asyncio.gather(
+            cache.get_or_fetch("k", fetch), cache.get_or_fetch("k", fetch)
+        )
+        first["value"].append(2)
+
+        assert first is result
+        assert joined == {"value": [1]}
+        assert await cache.get_or_fetch("k", fetch) is result
+
+    @pytest.mark.asyncio
+    async def test_cancelled_fetch_is_retried_by_joiners(self):
+        """Test that joiners fetch again when the fetching caller is cancelled."""
+        cache = SingleFlightCache()
+        fetch = make_fetch([{"n": 1}, {"n": 2}])
+
+        first = asyncio.ensure_future(cache.get_or_fetch("k", fetch))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(cache.get_or_fetch("k", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        # The cancelled fetch never got a result, so the retry takes the first one
+        assert await second == {"n": 1}
+        assert first.cancelled()
+        assert fetch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_and_bounds(self):
+        """Test that completed results are reused within the TTL and bounded."""
+        cache = SingleFlightCache(ttl=60, max_entries=1)
+        fetch = make_fetch([{"n": 1}, {"n": 2}, {"n": 3}])
+
+        assert await cache.get_or_fetch("a", fetch) == {"n": 1}
+        assert await cache.get_or_fetch("a", fetch) == {"n": 1}
+        assert cache.metrics["hits"] == 1
+
+        await cache.get_or_fetch("b", fetch)
+        assert await cache.get_or_fetch("a", fetch) == {"n": 3}
+
+        cache.ttl = 0
+        cache.clear()
+        assert cache.saved == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_but_not_cached(self):
+        """Test that a failed fetch reaches every waiter and is retried later."""
+        cache = SingleFlightCache(ttl=60)
+        fetch = make_fetch([APIError("Server error", status_code=500), {"ok": True}])
+
+        results = await asyncio.gather(
+            cache.get_or_fetch("k", fetch),
+            cache.get_or_fetch("k", fetch),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, APIError) for result in results)
+        assert await cache.get_or_fetch("k", fetch) == {"ok": True}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_starts_a_new_fetch(self):
+        """Test that calls made after a write do not join earlier fetches."""
+        cache = SingleFlightCache(ttl=60)
+        fetch = make_fetch([{"n": 1}, {"n": 2}])
+
+        first = asyncio.ensure_future(cache.get_or_fetch("k", fetch))
+        await asyncio.sleep(0)
+        cache.invalidate()
+        second = await cache.get_or_fetch("k", fetch)
+
+        assert await first == {"n": 1}
+        assert second == {"n": 2}
+        assert await cache.get_or_fetch("k", fetch) == {"n": 2}
+
+    @pytest.mark.asyncio
+    async def test_client_get_and_write_invalidation(self, mock_httpx_response):
+        """Test that the client coalesces GETs and invalidates them on writes."""
+        authenticator = MagicMock(spec=DataverseAuthenticator)
+        authenticator.get_token = AsyncMock(return_value="mock-token")
+        client = AsyncDataverseClient(
+            "https://test.crm.dynamics.com", authenticator, Config(get_cache_ttl=60)
+        )
+        client._ensure_client = AsyncMock()
+        client._client = MagicMock()
+        client._client.request = AsyncMock(
+            return_value=mock_httpx_response(200, {"value": []}, content='{"value":[]}')
+        )
+
+        await asyncio.gather(client.get("accounts"), client.get("accounts"))
+        await client.get("accounts")
+        assert client._client.request.await_count == 1
+
+        await client.post("accounts", {"name": "A"})
+        await client.get("accounts")
+        assert client._client.request.await_count == 3
+
+
+def make_response(status_code, body=None):
+    """Create a mock response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(body).encode() if body is not None else b""
+    response.json.return_value = body
+    return response
+
+
+class TestETagCache:
+    """Test cases for the ETag-aware conditional read cache."""
+
+    @pytest.mark.asyncio
+    async def test_revalidates_with_if_none_match(self):
+        """Test that stored records are revalidated and 304 reuses them."""
+        cache = ETagCache()
+        record = {"@odata.etag": 'W/"1"', "name": "USD"}
+        send = AsyncMock(side_effect=[make_response(200, record), make_response(304)])
+
+        first = await cache.fetch("k", "transactioncurrencies", send)
+        second = await cache.fetch("k", "transactioncurrencies", send)
+
+        assert first == second == record
+        assert send.await_args_list[0].args == (None,)
+        assert send.await_args_list[1].args == ('W/"1"',)
+        assert cache.metrics == {"hits": 0, "revalidated": 1, "misses": 1, "evictions": 0}
+
+    @pytest.mark.asyncio
+    async def test_entity_ttl_skips_revalidation(self):
+        """Test that entries within their entity TTL are served locally."""
+        cache = ETagCache(entity_ttls={"pricelevels": 60})
+        send = AsyncMock(return_value=make_response(200, {"@odata.etag": 'W/"1"'}))
+
+        await cache.fetch("a", "pricelevels", send)
+        await cache.fetch("a", "pricelevels", send)
+        await cache.fetch("b", "accounts", send)
+        await cache.fetch("b", "accounts", send)
+
+        assert send.await_count == 3
+        assert cache.metrics["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_invalidation(self):
+        """Test that the cache stays within max_bytes and drops entity sets."""
+        record = {"@odata.etag": 'W/"1"', "name": "x" * 50}
+        size = len(json.dumps(record))
+        cache = ETagCache(max_bytes=size * 2)
+        send = AsyncMock(return_value=make_response(200, record))
+
+        for key in ("a", "b", "c"):
+            await cache.fetch(key, "accounts", send)
+        await cache.fetch("d", "contacts", send)
+        assert cache.size <= cache.max_bytes
+        assert cache.metrics["evictions"] == 2
+
+        cache.invalidate("accounts")
+        assert len(cache) == 1
+
+        send.return_value = make_response(200, {"value": []})
+        await cache.fetch("e", "accounts", send)
+        assert len(cache) == 1
+
+    @pytest.mark.asyncio
+    async def test_client_conditional_reads(self, mock_httpx_response):
+        """Test that the client sends If-None-Match and accepts 304."""
+        authenticator = MagicMock(spec=DataverseAuthenticator)
+        authenticator.get_token = AsyncMock(return_value="mock-token")
+        client = AsyncDataverseClient(
+            "https://test.crm.dynamics.com", authenticator, Config(etag_cache=True)
+        )
+        client._ensure_client = AsyncMock()
+        client._client = MagicMock()
+        record = {"@odata.etag": 'W/"7"', "name": "Unit"}
+        client._client.request = AsyncMock(side_effect=[
+            mock_httpx_response(200, record, content=json.dumps(record)),
+            mock_httpx_response(304),
+            mock_httpx_response(204),
+        ])
+
+        assert await client.get("businessunits(1)") == record
+        assert await client.get("businessunits(1)") == record
+
+        headers = client._client.request.await_args_list[1].kwargs["headers"]
+        assert headers["If-None-Match"] == 'W/"7"'
+
+        await client.patch("businessunits(1)", {"name": "Other"})
+        assert len(client.etag_cache) == 0
+
+
+class TestQueryCache:
+    """Test cases for the query result cache."""
+
+    def test_key_normalization(self):
+        """Test that equivalent queries share a key."""
+        key = QueryCache.make_key(
+            "accounts", QueryOptions(select=["name", "accountid"], top=5).to_odata_params()
+        )
+        same = QueryCache.make_key("accounts", {"$top": "5", "$select": "accountid, name"})
+        other = QueryCache.make_key("contacts", {"$top": "5", "$select": "accountid,name"})
+
+        assert key == same
+        assert key != other
+
+    def test_memory_backend_eviction_and_invalidation(self):
+        """Test LRU eviction, TTL expiry and invalidation by entity set."""
+        backend = MemoryQueryCache(max_entries=2)
+        backend.set("a", "accounts", {"value": [1]}, ttl=60)
+        backend.set("b", "contacts", {"value": [2]}, ttl=60)
+        assert backend.get("a") == {"value": [1]}
+
+        backend.set("c", "accounts", {"value": [3]}, ttl=60)
+        assert backend.get("b") is None
+
+        backend.set("d", "leads", {}, ttl=0)
+        assert backend.get("d") is None
+
+        backend.invalidate("accounts")
+        assert len(backend) == 0
+
+    def test_incomplete_backend_is_rejected(self):
+        """Test that a backend missing a method cannot be instantiated."""
+        class GetOnly(QueryCacheBackend):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            GetOnly()
+
+    def test_disk_backend(self, tmp_path):
+        """Test that the disk backend persists results and evicts the oldest."""
+        backend = DiskQueryCache(tmp_path / "queries.db", max_entries=2)
+        backend.set("a", "accounts", {"value": [1]}, ttl=60)
+        backend.set("b", "contacts", {"value": [2]}, ttl=60)
+        backend.set("c", "contacts", {"value": [3]}, ttl=60)
+        backend.close()
+
+        reopened = DiskQueryCache(tmp_path / "queries.db")
+        assert reopened.get("a") is None
+        assert reopened.get("c") == {"value": [3]}
+
+        reopened.invalidate("contacts")
+        assert reopened.get("b") is None
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_sdk_query_cache(self, mock_auth_config, mock_httpx_response):
+        """Test that repeated queries are cached until the SDK writes."""
+        sdk = DataverseSDK(**mock_auth_config)
+        sdk.authenticator.get_token = AsyncMock(return_value="mock-token")
+        sdk.client._ensure_client = AsyncMock()
+        sdk.client._client = MagicMock()
+        body = {"value": [{"name": "A"}]}
+        sdk.client._client.request = AsyncMock(
+            return_value=mock_httpx_response(200, body, content=json.dumps(body))
+        )
+        cache = sdk.enable_query_cache(ttl=60)
+
+        options = QueryOptions(select=["name"], filter="statecode eq 0")
+        first = await sdk.query("accounts", options)
+        second = await sdk.query("accounts", {"select": ["name"], "filter": "statecode eq 0"})
+
+        assert first.value == second.value == body["value"]
+        assert sdk.client._client.request.await_count == 1
+        assert cache.metrics == {"hits": 1, "misses": 1}
+
+        await sdk.client.delete("accounts(1)")
+        await sdk.query("accounts", options)
+        assert sdk.client._client.request.await_count == 3
@@ -0,0 +1,125 @@
+"""
+Unit tests for the CLI session daemon.
+"""
+
+import socket
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from cli import daemon
+from cli import main as cli
+
+
+@pytest.fixture
+def server(tmp_path):
+    """Run a daemon on a temporary socket."""
+    server = daemon.DaemonServer(tmp_path / "cli.sock", idle_timeout=5.0)
+    thread = threading.Thread(target=server.serve, daemon=True)
+    thread.start()
+    yield server
+    if server.running:
+        daemon.send({"command": "shutdown"}, server.socket_path, timeout=5.0)
+    thread.join(timeout=5)
+
+
+class TestDaemon:
+    """Test cases for the session daemon."""
+
+    def test_forward_and_shutdown(self, server, capsys, monkeypatch):
+        """Test that commands run in the daemon and their output is returned."""
+        monkeypatch.setenv("DATAVERSE_URL", "https://client.crm.dynamics.com")
+
+        with patch.object(cli, "show_version", side_effect=lambda: cli.console.print(
+            "url", cli.os.getenv("DATAVERSE_URL")
+        )):
+            assert daemon.forward(["version"], server.socket_path) == 0
+        assert capsys.readouterr().out == "url https://client.crm.dynamics.com\n"
+
+        assert daemon.forward(["entity", "--bogus"], server.socket_path) == 2
+        assert "bogus" in capsys.readouterr().out
+
+        status = daemon.send({"command": "ping"}, server.socket_path, timeout=5.0)
+        assert status["requests"] == 2
+        assert (server.socket_path.stat().st_mode & 0o777) == 0o600
+
+        daemon.send({"command": "shutdown"}, server.socket_path, timeout=5.0)
+        deadline = time.monotonic() + 5
+        while server.socket_path.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert daemon.forward(["version"], server.socket_path) is None
+
+    def test_dropped_request_is_not_run_locally(self, tmp_path, capsys):
+        """Test that a request lost after it was sent fails instead of falling back."""
+        socket_path = tmp_path / "cli.sock"
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(str(socket_path))
+        listener.listen(1)
+
+        def drop():
+            connection, _ = listener.accept()
+            connection.recv(65536)
+            connection.close()
+
+        thread = threading.Thread(target=drop, daemon=True)
+        thread.start()
+        try:
+            assert daemon.forward(["version"], socket_path) == 1
+        finally:
+            thread.join(timeout=5)
+            listener.close()
+        assert "without a response" in capsys.readouterr().err
+
+    def test_run_cli_falls_back_only_when_unreachable(self, tmp_path, monkeypatch):
+        """Test that the command runs locally when no daemon is listening."""
+        monkeypatch.setenv("DV_CLI_DAEMON", "1")
+        monkeypatch.setenv("DV_CLI_SOCKET", str(tmp_path / "missing.sock"))
+        monkeypatch.setattr(daemon.sys, "argv", ["dv-cli", "version"])
+
+        with patch.object(cli, "main") as main:
+            daemon.run_cli()
+        main.assert_called_once()
+
+    def test_config_is_reset_between_requests(self):
+        """Test that a request does not reuse the credentials of the previous one."""
+        session = daemon.Session()
+        seen = []
+
+        def record():
+            seen.append(cli.cli_config.dataverse_url)
+            cli.cli_config.dataverse_url = "https://previous.crm.dynamics.com"
+
+        try:
+            with patch.object(cli, "show_version", side_effect=record):
+                for _ in range(2):
+                    daemon.execute(session, {"argv": ["version"], "env": {}})
+        finally:
+            session.close()
+
+        assert seen == [None, None]
+        assert cli.cli_config.dataverse_url is None
+
+    def test_session_reuses_sdk(self):
+        """Test that commands share one open SDK per set of credentials."""
+        session = daemon.Session()
+        config = MagicMock(dataverse_url="https://a", client_id="c", client_secret="s", tenant_id="t")
+        try:
+            first = session.get_sdk(config)
+            assert session.get_sdk(config) is first
+
+            first._sdk.__aenter__ = AsyncMock()
+            first._sdk.__aexit__ = AsyncMock()
+
+            async def command():
+                async with first as sdk:
+                    return sdk
+
+            assert session.run(command()) is first._sdk
+            session.run(command())
+            assert first._sdk.__aenter__.await_count == 1
+            assert first._sdk.__aexit__.await_count == 0
+        finally:
+            session.close()
+        assert first._sdk.__aexit__.await_count == 1
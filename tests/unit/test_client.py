@@ -3,6 +3,7 @@ Unit tests for the async client module.
 """
 
 import pytest
+from decimal import Decimal
 from unittest.mock import AsyncMock, MagicMock, patch
 import httpx
 
@@ -73,6 +74,62 @@ class TestAsyncDataverseClient:
         assert isinstance(client._client, httpx.AsyncClient)
         assert not client.is_closed()
     
+    @pytest.mark.asyncio
+    async def test_custom_transport(self, mock_authenticator):
+        """Test that requests go through a configured transport."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.headers["Authorization"] == "Bearer mock-token"
+            return httpx.Response(200, json={"url": str(request.url)})
+        
+        client = AsyncDataverseClient(
+            dataverse_url="https://test.crm.dynamics.com",
+            authenticator=mock_authenticator,
+            config=Config(transport=httpx.MockTransport(handler)),
+        )
+        async with client:
+            result = await client.get("accounts")
+        
+        assert result == {"url": "https://test.crm.dynamics.com/api/data/v9.2/accounts"}
+    
+    @pytest.mark.asyncio
+    async def test_next_link_query_is_kept(self, mock_authenticator):
+        """Test that pages are requested with the query of their next link."""
+        def handler(request: httpx.Request) -> httpx.Response:
+            token = int(request.url.params.get("$skiptoken", 0))
+            page = {"value": [{"page": token}]}
+            if token < 2:
+                page["@odata.nextLink"] = f"{request.url.copy_with(query=None)}?$skiptoken={token + 1}"
+            return httpx.Response(200, json=page)
+        
+        client = AsyncDataverseClient(
+            dataverse_url="https://test.crm.dynamics.com",
+            authenticator=mock_authenticator,
+            config=Config(transport=httpx.MockTransport(handler)),
+        )
+        async with client:
+            pages = [page async for page in client.get_pages("accounts", params={"$top": 3})]
+        
+        assert pages == [[{"page": 0}], [{"page": 1}], [{"page": 2}]]
+    
+    @pytest.mark.asyncio
+    async def test_decimal_body_is_exact(self, mock_authenticator):
+        """Test that Decimal values are sent with their exact digits."""
+        bodies = []
+        
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(request.content)
+            return httpx.Response(204)
+        
+        client = AsyncDataverseClient(
+            dataverse_url="https://test.crm.dynamics.com",
+            authenticator=mock_authenticator,
+            config=Config(transport=httpx.MockTransport(handler)),
+        )
+        async with client:
+            await client.post("accounts", {"revenue": Decimal("0.10"), "name": "Contoso"})
+        
+        assert bodies == [b'{"revenue":0.10,"name":"Contoso"}']
+    
     @pytest.mark.asyncio
     async def test_get_auth_headers(self, client, mock_authenticator):
         """Test authentication header generation."""
@@ -0,0 +1,126 @@
+"""
+Unit tests for the streaming export module.
+"""
+
+import csv
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.exceptions import ValidationError
+from dataverse_sdk.export import StreamingExporter, detect_format
+
+
+def account(index):
+    """Create an account record."""
+    return {"accountid": f"a{index}", "name": f"Account {index}", "address": {"city": "Lisbon"}}
+
+
+class FailingPages:
+    """Serves pages of records, optionally failing after some of them."""
+
+    def __init__(self, pages, fail_after=None):
+        self.pages = pages
+        self.fail_after = fail_after
+        self.params = []
+
+    def __call__(self, endpoint, params=None, page_size=None):
+        self.params.append(params)
+
+        async def iterate():
+            for number, page in enumerate(self.pages):
+                if number == self.fail_after:
+                    raise ConnectionError("connection reset")
+                yield page
+
+        return iterate()
+
+
+@pytest.fixture
+def exporter():
+    """Create an exporter over a mock client."""
+    metadata = MagicMock()
+    metadata.primary_id_attribute = AsyncMock(return_value="accountid")
+    return StreamingExporter(MagicMock(), metadata)
+
+
+class TestStreamingExporter:
+    """Test cases for streaming exports."""
+
+    def test_detect_format(self):
+        """Test that the format and compression follow the file name."""
+        assert detect_format("a.ndjson.gz") == ("ndjson", "gzip")
+        assert detect_format("a.CSV") == ("csv", None)
+        assert detect_format("a.backup.json.bz2") == ("json", "bz2")
+        assert detect_format("a") == (None, None)
+
+    @pytest.mark.asyncio
+    async def test_ndjson_pages_in_primary_key_order(self, exporter, tmp_path):
+        """Test that each page is appended as NDJSON lines."""
+        pages = FailingPages([[account(1), account(2)], [account(3)]])
+        exporter.client.get_pages = MagicMock(side_effect=pages)
+        seen = []
+
+        result = await exporter.export(
+            "accounts", tmp_path / "accounts.ndjson", {"select": ["name"]}, progress=seen.append
+        )
+
+        lines = (tmp_path / "accounts.ndjson").read_text().splitlines()
+        assert [json.loads(line)["accountid"] for line in lines] == ["a1", "a2", "a3"]
+        assert result.records == 3 and seen == [2, 3]
+        assert pages.params[0] == {"$select": "name,accountid", "$orderby": "accountid asc"}
+        assert not (tmp_path / "accounts.ndjson.checkpoint").exists()
+
+    @pytest.mark.asyncio
+    async def test_resume_compressed_export(self, exporter, tmp_path):
+        """Test that an interrupted gzip export continues after its last page."""
+        path = tmp_path / "accounts.ndjson.gz"
+        exporter.client.get_pages = MagicMock(side_effect=FailingPages(
+            [[account(1), account(2)], [account(3)]], fail_after=1
+        ))
+        with pytest.raises(ConnectionError):
+            await exporter.export("accounts", path, {"filter": "statecode eq 0"})
+
+        # Bytes written after the checkpoint are discarded on resume
+        with open(path, "ab") as f:
+            f.write(b"partial")
+
+        pages = FailingPages([[account(3)]])
+        exporter.client.get_pages = MagicMock(side_effect=pages)
+        result = await exporter.export("accounts", path, {"filter": "statecode eq 0"}, resume=True)
+
+        assert pages.params[0]["$filter"] == "(statecode eq 0) and accountid gt a2"
+        assert result.resumed and result.records == 3
+        with gzip.open(path, "rt") as f:
+            assert [json.loads(line)["accountid"] for line in f] == ["a1", "a2", "a3"]
+
+    @pytest.mark.asyncio
+    async def test_csv_and_json_arrays(self, exporter, tmp_path):
+        """Test the CSV header, nested values and JSON array framing."""
+        exporter.client.get_pages = MagicMock(side_effect=FailingPages([[account(1)], [account(2)]]))
+        await exporter.export("accounts", tmp_path / "accounts.csv")
+
+        with open(tmp_path / "accounts.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert [row["accountid"] for row in rows] == ["a1", "a2"]
+        assert json.loads(rows[0]["address"]) == {"city": "Lisbon"}
+
+        exporter.client.get_pages = MagicMock(side_effect=FailingPages([[account(1)], [account(2)]]))
+        await exporter.export("accounts", tmp_path / "accounts.json")
+        assert len(json.loads((tmp_path / "accounts.json").read_text())) == 2
+
+        exporter.client.get_pages = MagicMock(side_effect=FailingPages([]))
+        await exporter.export("accounts", tmp_path / "empty.json")
+        assert json.loads((tmp_path / "empty.json").read_text()) == []
+
+    @pytest.mark.asyncio
+    async def test_invalid_requests(self, exporter, tmp_path):
+        """Test that unsupported combinations are rejected."""
+        with pytest.raises(ValidationError):
+            await exporter.export("accounts", tmp_path / "a.xml", format="xml")
+        with pytest.raises(ValidationError):
+            await exporter.export("accounts", tmp_path / "a.parquet", resume=True)
+        with pytest.raises(ValidationError):
+            await exporter.export("accounts", tmp_path / "a.ndjson", {"top": 10})
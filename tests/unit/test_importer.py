@@ -0,0 +1,177 @@
+"""
+Unit tests for the streaming import module.
+"""
+
+import bz2
+import gzip
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.exceptions import ValidationError
+from dataverse_sdk.importer import RecordReader, StreamingImporter
+from dataverse_sdk.models import BulkOperationResult, BulkUpsertResult, UpsertResult
+
+
+@pytest.fixture
+def sdk():
+    """Create a mock SDK."""
+    sdk = MagicMock()
+    sdk.metadata.primary_id_attribute = AsyncMock(return_value="accountid")
+    return sdk
+
+
+class TestRecordReader:
+    """Test cases for reading import files."""
+
+    def test_formats(self, tmp_path):
+        """Test that every format yields the same records."""
+        records = [{"name": "A", "@import.row": 4}, {"name": "B \\u00e9"}]
+        (tmp_path / "a.ndjson").write_text("\ufeff" + "\n".join(json.dumps(r) for r in records) + "\n\n")
+        (tmp_path / "a.json").write_text(json.dumps(records, indent=2))
+        (tmp_path / "a.csv").write_text('name,notes\nA,\n"B \\u00e9","multi\nline"\n')
+        with gzip.open(tmp_path / "a.ndjson.gz", "wt") as f:
+            f.write("\n".join(json.dumps(r) for r in records))
+        with bz2.open(tmp_path / "a.json.bz2", "wt") as f:
+            json.dump(records, f)
+
+        expected = [(1, {"name": "A"}), (2, {"name": "B \\u00e9"})]
+        for name in ("a.ndjson", "a.json", "a.ndjson.gz", "a.json.bz2"):
+            reader = RecordReader(tmp_path / name)
+            assert list(reader) == expected, name
+            assert reader.position == reader.size
+
+        assert list(RecordReader(tmp_path / "a.csv")) == [
+            (1, {"name": "A"}),
+            (2, {"name": "B \\u00e9", "notes": "multi\nline"}),
+        ]
+
+    def test_json_array_across_chunks(self, tmp_path, monkeypatch):
+        """Test that array elements split across read chunks are decoded."""
+        monkeypatch.setattr("dataverse_sdk.importer._JSON_CHUNK_SIZE", 7)
+        records = [{"value": 12345678, "name": "çã"} for _ in range(5)]
+        (tmp_path / "a.json").write_text(json.dumps(records), encoding="utf-8")
+
+        assert [record for _, record in RecordReader(tmp_path / "a.json")] == records
+
+    def test_invalid_input(self, tmp_path):
+        """Test that unsupported files are rejected."""
+        (tmp_path / "a.json").write_text('{"name": "A"}')
+        (tmp_path / "a.ndjson").write_text("[1]\n")
+
+        with pytest.raises(ValidationError):
+            list(RecordReader(tmp_path / "a.json"))
+        with pytest.raises(ValidationError):
+            list(RecordReader(tmp_path / "a.ndjson"))
+        with pytest.raises(ValidationError):
+            RecordReader(tmp_path / "a.json", format="xml")
+
+
+class TestStreamingImporter:
+    """Test cases for streaming bulk imports."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_and_dead_letter(self, sdk, tmp_path):
+        """Test that failed rows are dead-lettered and can be replayed."""
+        source = tmp_path / "accounts.ndjson"
+        source.write_text("".join(json.dumps({"name": f"A{i}"}) + "\n" for i in range(5)))
+        sdk.bulk_create = AsyncMock(side_effect=[
+            BulkOperationResult(
+                total_processed=2,
+                successful=1,
+                failed=1,
+                errors=[{"batch_index": 0, "operation_index": 1, "error": {"status": 400}}],
+            ),
+            BulkOperationResult(total_processed=2, successful=2),
+            BulkOperationResult(
+                total_processed=1,
+                failed=1,
+                errors=[{"batch_index": 0, "operation_indices": [0], "error": {"status": 503}}],
+            ),
+        ])
+        reports = []
+        importer = StreamingImporter(
+            sdk, chunk_size=2, dead_letter=tmp_path / "failed.ndjson",
+            progress=lambda *args: reports.append(args),
+        )
+
+        result = await importer.run("create", "accounts", source, validate=True)
+
+        assert [call.args[1] for call in sdk.bulk_create.await_args_list] == [
+            [{"name": "A0"}, {"name": "A1"}],
+            [{"name": "A2"}, {"name": "A3"}],
+            [{"name": "A4"}],
+        ]
+        assert sdk.bulk_create.await_args.kwargs["validate"] is True
+        assert (result.total_processed, result.successful, result.failed) == (5, 3, 2)
+        assert reports[-1][:2] == (5, 2)
+
+        failed = [json.loads(line) for line in (tmp_path / "failed.ndjson").read_text().splitlines()]
+        assert [(row["name"], row["@import.row"]) for row in failed] == [("A1", 2), ("A4", 5)]
+        assert failed[1]["@import.error"] == {"status": 503}
+        assert [record for _, record in RecordReader(tmp_path / "failed.ndjson")] == [
+            {"name": "A1"}, {"name": "A4"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_rows_are_dead_lettered(self, sdk, tmp_path):
+        """Test that undecodable rows are dead-lettered without aborting the import."""
+        source = tmp_path / "accounts.ndjson"
+        source.write_text('{"name": "A0"}\n{"name": \n[1]\n{"name": "A3"}\n')
+        sdk.bulk_create = AsyncMock(return_value=BulkOperationResult(total_processed=2, successful=2))
+        importer = StreamingImporter(sdk, dead_letter=tmp_path / "failed.ndjson")
+
+        result = await importer.run("create", "accounts", source)
+
+        assert sdk.bulk_create.await_args.args[1] == [{"name": "A0"}, {"name": "A3"}]
+        assert (result.total_processed, result.successful, result.failed) == (4, 2, 2)
+        failed = [json.loads(line) for line in (tmp_path / "failed.ndjson").read_text().splitlines()]
+        assert [(row["@import.row"], row["@import.raw"]) for row in failed] == [(2, '{"name": '), (3, [1])]
+        assert failed[0]["@import.error"]["message"].startswith("Invalid JSON")
+
+        # Replaying the dead-letter file unchanged does not send empty records
+        sdk.bulk_create.reset_mock()
+        replay = await StreamingImporter(sdk).run("create", "accounts", tmp_path / "failed.ndjson")
+        assert replay.failed == 2
+        sdk.bulk_create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_update_and_delete_ids(self, sdk, tmp_path):
+        """Test that rows are identified by id or primary key."""
+        source = tmp_path / "accounts.csv"
+        source.write_text("accountid,name\n1,A\n,B\n")
+        sdk.bulk_update = AsyncMock(return_value=BulkOperationResult(total_processed=1, successful=1))
+        sdk.bulk_delete = AsyncMock(return_value=BulkOperationResult(total_processed=1, successful=1))
+        importer = StreamingImporter(sdk, dead_letter=tmp_path / "failed.ndjson")
+
+        result = await importer.run("update", "accounts", source)
+        assert sdk.bulk_update.await_args.args[1] == [{"name": "A", "id": "1"}]
+        assert result.failed == 1
+        assert "accountid" in json.loads((tmp_path / "failed.ndjson").read_text())["@import.error"]["message"]
+
+        await importer.run("delete", "accounts", source)
+        assert sdk.bulk_delete.await_args.args[1] == ["1"]
+
+    @pytest.mark.asyncio
+    async def test_upsert_duplicates_share_failures(self, sdk, tmp_path):
+        """Test that upsert failures map back to every row of the key."""
+        source = tmp_path / "accounts.ndjson"
+        source.write_text("".join(json.dumps(r) + "\n" for r in [
+            {"code": "X", "name": "1"},
+            {"code": "Y", "name": "2"},
+            {"code": "X", "name": "3"},
+            {"name": "no key"},
+        ]))
+        sdk.bulk_upsert = AsyncMock(return_value=BulkUpsertResult(
+            total_processed=2,
+            successful=1,
+            failed=1,
+            errors=[{"batch_index": 0, "operation_index": 1, "error": {"status": 412}}],
+            records=[None, UpsertResult(entity_id="y", created=True), None],
+        ))
+
+        result = await StreamingImporter(sdk).run("upsert", "accounts", source, key_fields=["code"])
+
+        assert sdk.bulk_upsert.await_args.args[2] == ["code"]
+        assert (result.successful, result.failed) == (1, 3)
@@ -0,0 +1,73 @@
+"""
+Unit tests for lazy package imports.
+"""
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import dataverse_sdk
+
+
+ROOT = Path(__file__).parent.parent.parent
+
+
+def run_python(code):
+    """Run code in a fresh interpreter and return its JSON output."""
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=ROOT,
+        env=dict(os.environ, PYTHONPATH=str(ROOT)),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+class TestLazyImports:
+    """Test cases for lazy loading of the package."""
+
+    def test_import_has_no_side_effects(self):
+        """Test that importing the SDK loads and changes nothing it does not need."""
+        result = run_python(
+            "import json, os, ssl, sys\n"
+            "env, context = dict(os.environ), ssl.create_default_context\n"
+            "import dataverse_sdk\n"
+            "loaded = [m for m in ('dataverse_sdk.client', 'pydantic') if m in sys.modules]\n"
+            "from dataverse_sdk import DataverseSDK\n"
+            "print(json.dumps({\n"
+            "    'package': loaded,\n"
+            "    'sdk': [m for m in ('msal', 'urllib3', 'dotenv', 'dataverse_sdk.export') if m in sys.modules],\n"
+            "    'environ': dict(os.environ) == env,\n"
+            "    'ssl': ssl.create_default_context is context,\n"
+            "}))"
+        )
+
+        assert result == {"package": [], "sdk": [], "environ": True, "ssl": True}
+
+    def test_public_names(self):
+        """Test that every exported name resolves to its submodule's object."""
+        from dataverse_sdk.sdk import DataverseSDK
+        from dataverse_sdk.sync import WatermarkExtractor
+
+        assert dataverse_sdk.DataverseSDK is DataverseSDK
+        assert dataverse_sdk.WatermarkExtractor is WatermarkExtractor
+        assert all(hasattr(dataverse_sdk, name) for name in dataverse_sdk.__all__)
+        assert "DataverseMirror" in dir(dataverse_sdk)
+
+    def test_msal_loaded_on_first_use(self):
+        """Test that MSAL classes are imported when the application is created."""
+        from dataverse_sdk.auth import DataverseAuthenticator
+
+        authenticator = DataverseAuthenticator(
+            client_id="client",
+            tenant_id="tenant",
+            dataverse_url="https://test.crm.dynamics.com",
+            client_secret="secret",
+        )
+        with patch("dataverse_sdk.auth.ConfidentialClientApplication") as application:
+            assert authenticator._get_msal_app() is application.return_value
@@ -0,0 +1,115 @@
+"""
+Unit tests for the read loader module.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk import DataverseSDK
+from dataverse_sdk.exceptions import APIError, EntityNotFoundError
+from dataverse_sdk.loader import ReadLoader
+
+
+@pytest.fixture
+def processor():
+    """Create a mock batch processor."""
+    processor = MagicMock()
+
+    async def read_many(entity_type, ids, select=None):
+        return [None if i == "missing" else {"accountid": i, "name": f"Account {i}"} for i in ids]
+
+    processor.read_many = AsyncMock(side_effect=read_many)
+    return processor
+
+
+class TestReadLoader:
+    """Test cases for read coalescing."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_share_one_query(self, processor):
+        """Test that concurrent reads are deduplicated into one batch."""
+        loader = ReadLoader(processor, max_delay_ms=5)
+
+        results = await asyncio.gather(
+            loader.load("accounts", "A"),
+            loader.load("accounts", "B"),
+            loader.load("accounts", "{A}"),
+        )
+
+        processor.read_many.assert_awaited_once_with("accounts", ["a", "b"], None)
+        assert [r["name"] for r in results] == ["Account a", "Account b", "Account a"]
+        assert results[0] is not results[2]
+        assert loader.metrics == {"requests": 3, "deduplicated": 1, "batches": 1}
+
+    @pytest.mark.asyncio
+    async def test_groups_by_entity_and_select(self, processor):
+        """Test that reads with different fields are loaded separately."""
+        loader = ReadLoader(processor, max_delay_ms=5)
+
+        await asyncio.gather(
+            loader.load("accounts", "a", select=["name"]),
+            loader.load("accounts", "b"),
+            loader.load("contacts", "c"),
+        )
+
+        assert processor.read_many.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_full_group_is_sent_immediately(self, processor):
+        """Test that a group reaching the size limit does not wait."""
+        loader = ReadLoader(processor, max_delay_ms=60_000, max_batch_size=2)
+
+        results = await asyncio.wait_for(
+            asyncio.gather(loader.load("accounts", "a"), loader.load("accounts", "b")),
+            timeout=1,
+        )
+
+        assert len(results) == 2
+
+    @pytest.mark.asyncio
+    async def test_misses_and_errors_reach_each_caller(self, processor):
+        """Test that missing records and failures are raised to the callers."""
+        loader = ReadLoader(processor, max_delay_ms=1)
+
+        with pytest.raises(EntityNotFoundError):
+            await loader.load("accounts", "missing")
+
+        processor.read_many.side_effect = APIError("Server error", status_code=500)
+        results = await asyncio.gather(
+            loader.load("accounts", "a"),
+            loader.load("accounts", "b"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, APIError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_sdk_reads_non_guid_ids_directly(self, processor, mock_auth_config):
+        """Test that alternate keys and malformed IDs do not join the coalesced query."""
+        sdk = DataverseSDK(**mock_auth_config)
+        sdk.enable_read_coalescing(max_delay_ms=5)
+        sdk.read_loader.batch_processor = processor
+        sdk.client.get = AsyncMock(side_effect=[
+            {"accountid": "k", "name": "Keyed"},
+            APIError("Bad request", status_code=400),
+        ])
+        guids = ["00000000-0000-0000-0000-000000000001", "00000000-0000-0000-0000-000000000002"]
+
+        results = await asyncio.gather(
+            sdk.read("accounts", guids[0]),
+            sdk.read("accounts", "accountnumber='A1'"),
+            sdk.read("accounts", "not-a-guid"),
+            sdk.read("accounts", guids[1]),
+            return_exceptions=True,
+        )
+
+        assert [r["accountid"] for r in (results[0], results[3])] == guids
+        assert results[1]["name"] == "Keyed"
+        assert isinstance(results[2], APIError)
+        assert processor.read_many.await_args.args[1] == guids
+        assert [c.args[0] for c in sdk.client.get.await_args_list] == [
+            "accounts(accountnumber='A1')",
+            "accounts(not-a-guid)",
+        ]
@@ -0,0 +1,228 @@
+"""
+Unit tests for the metadata cache module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.exceptions import APIError, MetadataError
+from dataverse_sdk.metadata import MetadataCache
+
+
+ENTITIES = [
+    {
+        "LogicalName": "account",
+        "EntitySetName": "accounts",
+        "PrimaryIdAttribute": "accountid",
+    },
+    {
+        "LogicalName": "contact",
+        "EntitySetName": "contacts",
+        "PrimaryIdAttribute": "contactid",
+    },
+]
+
+ATTRIBUTES = [
+    {"LogicalName": "accountid", "AttributeType": "Uniqueidentifier"},
+    {"LogicalName": "name", "AttributeType": "String"},
+]
+
+
+@pytest.fixture
+def client():
+    """Create a mock Dataverse client serving entity definitions."""
+    client = MagicMock()
+    client.dataverse_url = "https://test.crm.dynamics.com"
+
+    async def get(endpoint, params=None):
+        if endpoint == "EntityDefinitions":
+            return {"value": ENTITIES}
+        if endpoint.endswith("/Attributes"):
+            return {"value": ATTRIBUTES}
+        return {"LogicalName": "account", "EntitySetName": "accounts", "DisplayName": {}}
+
+    client.get = AsyncMock(side_effect=get)
+    return client
+
+
+class TestMetadataCache:
+    """Test cases for the metadata cache."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_load_once(self, client):
+        """Test that one bulk load backs every entity lookup."""
+        cache = MetadataCache(client)
+
+        assert await cache.entity_set_name("account") == "accounts"
+        assert await cache.resolve("contacts") == "contact"
+        assert await cache.primary_id_attribute("contacts") == "contactid"
+        assert client.get.await_count == 1
+
+        params = client.get.await_args.kwargs["params"]
+        assert "EntitySetName" in params["$select"]
+
+        with pytest.raises(MetadataError):
+            await cache.resolve("missing")
+        assert client.get.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_attribute_lookups(self, client):
+        """Test that attributes are loaded once per entity."""
+        cache = MetadataCache(client)
+
+        assert await cache.attribute_type("accounts", "name") == "String"
+        assert (await cache.get_attribute("account", "accountid"))["AttributeType"] == "Uniqueidentifier"
+        assert client.get.await_count == 2
+
+        with pytest.raises(MetadataError):
+            await cache.get_attribute("account", "missing")
+
+    @pytest.mark.asyncio
+    async def test_selected_entities_with_attributes(self, client):
+        """Test that selected entities are loaded with expanded attributes."""
+        client.get.side_effect = None
+        client.get.return_value = {"value": [dict(ENTITIES[0], Attributes=ATTRIBUTES)]}
+        cache = MetadataCache(client)
+
+        await cache.load(["account"], attributes=True)
+        await cache.load(["account"], attributes=True)
+
+        params = client.get.await_args.kwargs["params"]
+        assert params["$filter"] == "LogicalName eq 'account'"
+        assert params["$expand"].startswith("Attributes($select=")
+        assert client.get.await_count == 1
+        assert set(await cache.get_attributes("account")) == {"accountid", "name"}
+        assert not cache.complete
+
+    @pytest.mark.asyncio
+    async def test_persisted_per_org(self, client, tmp_path):
+        """Test that definitions are reused from disk by a new cache without requests."""
+        cache = MetadataCache(client, path=tmp_path)
+        await cache.entity_set_name("account")
+        await cache.get_definition("account")
+
+        assert cache.cache_file.name == "test.crm.dynamics.com.json"
+
+        client.get.reset_mock()
+        restored = MetadataCache(client, path=tmp_path)
+        assert await restored.entity_set_name("contact") == "contacts"
+        assert "DisplayName" in await restored.get_definition("accounts")
+        client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_definition_by_entity_set_name(self, client):
+        """Test that a cold cache requests a definition by its logical name."""
+        cache = MetadataCache(client)
+
+        assert "DisplayName" in await cache.get_definition("accounts")
+        assert client.get.await_args.args[0] == "EntityDefinitions(LogicalName='account')"
+        assert await cache.get_definition("account") is await cache.get_definition("accounts")
+
+
+class TestMetadataChanges:
+    """Test cases for incremental refresh with RetrieveMetadataChanges."""
+
+    @pytest.mark.asyncio
+    async def test_full_then_incremental_refresh(self, client, tmp_path):
+        """Test that later refreshes only apply changes since the stamp."""
+        account = dict(ENTITIES[0], MetadataId="e1", Attributes=[
+            {"MetadataId": "a1", "LogicalName": "name", "AttributeType": "String"},
+            {"MetadataId": "a2", "LogicalName": "old", "AttributeType": "String"},
+        ])
+        contact = dict(ENTITIES[1], MetadataId="e2", Attributes=[])
+        responses = [
+            {"EntityMetadata": [account, contact], "ServerVersionStamp": "s1"},
+            {
+                "EntityMetadata": [{
+                    "MetadataId": "e1",
+                    "LogicalName": "account",
+                    "EntitySetName": None,
+                    "Attributes": [{"MetadataId": "a1", "LogicalName": "name", "AttributeType": "Memo"}],
+                }],
+                "DeletedMetadata": {"Keys": ["Entity", "Attribute"], "Values": [["e2"], ["a2"]]},
+                "ServerVersionStamp": "s2",
+            },
+        ]
+        client.get.side_effect = responses
+        cache = MetadataCache(client, path=tmp_path)
+
+        await cache.refresh()
+        assert cache.complete
+        assert cache.version_stamp == "s1"
+        assert "@s" not in client.get.await_args.kwargs["params"]
+
+        stats = await cache.refresh()
+        params = client.get.await_args.kwargs["params"]
+        assert params["@s"] == "'s1'"
+        assert stats == {"changed_entities": 1, "deleted_entities": 1, "deleted_attributes": 1}
+        assert await cache.entity_set_name("account") == "accounts"
+        assert await cache.attribute_type("account", "name") == "Memo"
+        assert "contact" not in cache.entities
+
+        client.get.reset_mock()
+        restored = MetadataCache(client, path=tmp_path)
+        await restored.entity_set_name("account")
+        assert restored.version_stamp == "s2"
+        client.get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_stamp_triggers_full_sync(self, client):
+        """Test that an expired version stamp falls back to a full sync."""
+        client.get.side_effect = [
+            APIError(
+                "Expired",
+                status_code=400,
+                response_data={"error": {"code": "0x80044352"}},
+            ),
+            {"EntityMetadata": [dict(ENTITIES[0], MetadataId="e1")], "ServerVersionStamp": "s9"},
+        ]
+        cache = MetadataCache(client)
+        cache.version_stamp = "old"
+
+        await cache.refresh(attributes=False)
+
+        assert cache.version_stamp == "s9"
+        assert "@s" not in client.get.await_args.kwargs["params"]
+        assert list(cache.entities) == ["account"]
+
+
+class TestAttributeSchema:
+    """Test cases for type-specific attribute metadata."""
+
+    @pytest.mark.asyncio
+    async def test_schema_details(self, client):
+        """Test that type-specific attribute properties are merged once."""
+        base_get = client.get.side_effect
+
+        async def get(endpoint, params=None):
+            if endpoint.endswith("StringAttributeMetadata"):
+                return {"value": [{"LogicalName": "name", "MaxLength": 160}]}
+            if endpoint.endswith("PicklistAttributeMetadata"):
+                return {"value": [{
+                    "LogicalName": "name",
+                    "OptionSet": {"Options": [
+                        {"Value": 1, "Label": {"UserLocalizedLabel": {"Label": "Retail"}}},
+                    ]},
+                }]}
+            if endpoint.endswith("ManyToOneRelationships"):
+                return {"value": [{
+                    "ReferencingAttribute": "accountid",
+                    "ReferencedEntity": "contact",
+                    "ReferencingEntityNavigationPropertyName": "nav",
+                }]}
+            if "Microsoft.Dynamics.CRM" in endpoint:
+                return {"value": []}
+            return await base_get(endpoint, params)
+
+        client.get.side_effect = get
+        cache = MetadataCache(client)
+
+        schema = await cache.get_schema("accounts")
+        calls = client.get.await_count
+        await cache.get_schema("account")
+
+        assert client.get.await_count == calls
+        assert schema["name"]["MaxLength"] == 160
+        assert schema["name"]["Options"] == {"retail": 1}
+        assert schema["accountid"]["Navigation"] == {"contact": "nav"}
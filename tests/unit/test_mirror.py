@@ -0,0 +1,192 @@
+"""
+Unit tests for the local mirror module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.exceptions import APIError, ValidationError
+from dataverse_sdk.mirror import DataverseMirror
+
+
+BASE = "https://test.crm.dynamics.com/api/data/v9.2/"
+
+CURRENCIES = [
+    {"currencyid": "c1", "isocurrencycode": "EUR", "currencyname": "Euro", "exchangerate": 1.0, "isactive": True},
+    {"currencyid": "c2", "isocurrencycode": "USD", "currencyname": "US Dollar", "exchangerate": 1.1, "isactive": True},
+    {"currencyid": "c3", "isocurrencycode": "GBP", "currencyname": "Pound_Sterling", "exchangerate": 0.8, "isactive": False},
+]
+
+
+@pytest.fixture
+def client():
+    """Create a mock Dataverse client."""
+    client = MagicMock()
+    client.get = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def metadata():
+    """Create a mock metadata cache."""
+    metadata = MagicMock()
+    metadata.primary_id_attribute = AsyncMock(return_value="currencyid")
+    return metadata
+
+
+@pytest.fixture
+async def mirror(client, metadata, tmp_path):
+    """Create a mirror loaded with currencies."""
+    mirror = DataverseMirror(client, metadata, tmp_path / "mirror.db")
+    mirror.add_table("currencies", indexes=["isocurrencycode", ("isactive", "exchangerate")])
+    client.get.side_effect = [
+        {"value": CURRENCIES, "@odata.deltaLink": f"{BASE}currencies?$deltatoken=A"},
+    ]
+    await mirror.sync()
+    yield mirror
+    mirror.close()
+
+
+class TestDataverseMirror:
+    """Test cases for the SQLite mirror."""
+
+    @pytest.mark.asyncio
+    async def test_full_load_then_delta(self, mirror, client):
+        """Test that deltas update and delete mirrored rows."""
+        assert mirror.count("currencies") == 3
+
+        client.get.side_effect = [{
+            "value": [
+                {"currencyid": "c2", "isocurrencycode": "USD", "exchangerate": 1.2},
+                {"@odata.context": f"{BASE}$metadata#currencies/$deletedEntity", "id": "c3"},
+            ],
+            "@odata.deltaLink": f"{BASE}currencies?$deltatoken=B",
+        }]
+        assert await mirror.sync("currencies") == {"currencies": 2}
+
+        assert client.get.await_args.args[0].endswith("$deltatoken=A")
+        assert mirror.get("currencies", "C2")["exchangerate"] == 1.2
+        assert mirror.get("currencies", "c3") is None
+
+    @pytest.mark.asyncio
+    async def test_local_queries(self, mirror, client):
+        """Test that filters, ordering and paging run locally."""
+        calls = client.get.await_count
+
+        result = mirror.query("currencies", {
+            "filter": "isactive eq true and (exchangerate ge 1.05 or isocurrencycode eq 'EUR')",
+            "order_by": ["exchangerate desc"],
+            "select": ["isocurrencycode"],
+            "count": True,
+        })
+        assert result.value == [{"isocurrencycode": "USD"}, {"isocurrencycode": "EUR"}]
+        assert result.count == 2
+
+        assert [r["currencyid"] for r in mirror.query("currencies", {
+            "filter": "contains(currencyname,'_') or startswith(currencyname,'US')",
+            "order_by": ["currencyid"],
+            "top": 1,
+            "skip": 1,
+        }).value] == ["c3"]
+        assert mirror.query("currencies", {"filter": "not (currencyname ne null)"}).value == []
+        assert client.get.await_count == calls
+
+        plan = mirror._connect().execute(
+            "EXPLAIN QUERY PLAN SELECT data FROM currencies WHERE "
+            + mirror._column("isocurrencycode") + " = 'EUR'"
+        ).fetchall()
+        assert "ix_currencies_isocurrencycode" in str(plan)
+
+        with pytest.raises(ValidationError):
+            mirror.query("currencies", {"filter": "isocurrencycode in ('EUR')"})
+        with pytest.raises(ValidationError):
+            mirror.query("accounts")
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_previous_position(self, mirror, client, metadata, tmp_path):
+        """Test that a failed delta sync is rolled back and retried."""
+        client.get.side_effect = [
+            {"value": [{"currencyid": "c4"}], "@odata.nextLink": f"{BASE}currencies?$skiptoken=1"},
+            APIError("Server error", status_code=500),
+        ]
+        with pytest.raises(APIError):
+            await mirror.sync()
+        assert mirror.get("currencies", "c4") is None
+
+        reopened = DataverseMirror(client, metadata, tmp_path / "mirror.db")
+        reopened.add_table("currencies")
+        client.get.side_effect = [
+            {"value": [{"currencyid": "c4"}], "@odata.deltaLink": f"{BASE}currencies?$deltatoken=B"},
+        ]
+        await reopened.sync()
+        assert client.get.await_args.args[0].endswith("$deltatoken=A")
+        assert reopened.count("currencies") == 4
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_reload_removes_vanished_rows(self, mirror, client):
+        """Test that a new full load drops rows it did not see."""
+        client.get.side_effect = [
+            {"value": CURRENCIES[:1], "@odata.deltaLink": f"{BASE}currencies?$deltatoken=C"},
+        ]
+
+        assert await mirror.reload("currencies") == 1
+        assert client.get.await_args.args[0] == "currencies"
+        assert mirror.count("currencies") == 1
+
+    @pytest.mark.asyncio
+    async def test_watermark_table(self, client, metadata):
+        """Test that tables without change tracking sync by watermark."""
+        mirror = DataverseMirror(client, metadata)
+        mirror.add_table("currencies", track_changes=False, filter="statecode eq 0")
+        batches = [[[dict(CURRENCIES[0], modifiedon="2024-01-01T00:00:00Z")]]]
+
+        def get_pages(endpoint, params=None, page_size=None):
+            async def iterate():
+                for page in batches.pop(0):
+                    yield page
+            return iterate()
+
+        client.get_pages = MagicMock(side_effect=get_pages)
+
+        assert await mirror.sync() == {"currencies": 1}
+        assert mirror.get("currencies", "c1")["isocurrencycode"] == "EUR"
+        assert client.get_pages.call_args.args[1]["$filter"] == "(statecode eq 0)"
+
+        with pytest.raises(ValidationError):
+            mirror.add_table("accounts", filter="statecode eq 0")
+
+    @pytest.mark.asyncio
+    async def test_interrupted_watermark_reload(self, client, metadata, tmp_path):
+        """Test that the sync after an interrupted reload still drops vanished rows."""
+        mirror = DataverseMirror(client, metadata, tmp_path / "mirror.db")
+        mirror.add_table("currencies", track_changes=False)
+        stamped = [dict(c, modifiedon=f"2024-01-0{i + 1}T00:00:00Z") for i, c in enumerate(CURRENCIES)]
+        reloaded = [dict(c, modifiedon=f"2024-02-0{i + 1}T00:00:00Z") for i, c in enumerate(CURRENCIES[:2])]
+        batches = [
+            [stamped],
+            [[reloaded[0]], [reloaded[1]], APIError("Server error", status_code=500)],
+            [[reloaded[1]]],
+        ]
+
+        def get_pages(endpoint, params=None, page_size=None):
+            async def iterate():
+                for page in batches.pop(0):
+                    if isinstance(page, Exception):
+                        raise page
+                    yield page
+            return iterate()
+
+        client.get_pages = MagicMock(side_effect=get_pages)
+        await mirror.sync()
+        assert mirror.count("currencies") == 3
+
+        with pytest.raises(APIError):
+            await mirror.reload("currencies")
+        assert mirror.count("currencies") == 3
+
+        await mirror.sync()
+        assert mirror.count("currencies") == 2
+        assert mirror.get("currencies", "c3") is None
+        mirror.close()
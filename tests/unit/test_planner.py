@@ -0,0 +1,168 @@
+"""
+Unit tests for the import planner module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.batch import BatchProcessor
+from dataverse_sdk.exceptions import ValidationError
+from dataverse_sdk.hooks import HookManager
+from dataverse_sdk.models import ImportDataset, LookupReference
+from dataverse_sdk.planner import ImportPlanner
+from tests.unit.test_batch import build_batch_response, make_response
+
+
+ACCOUNT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.fixture
+def client():
+    """Create a mock Dataverse client."""
+    client = MagicMock()
+    client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+    client.hook_manager = HookManager()
+    client._execute_request = AsyncMock()
+    client.get = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def processor(client):
+    """Create a batch processor without backoff delays."""
+    return BatchProcessor(client, backoff_factor=0)
+
+
+def accounts_dataset() -> ImportDataset:
+    return ImportDataset(
+        entity_type="accounts",
+        logical_name="account",
+        key_field="source_id",
+        records=[{"source_id": "A1", "name": "Contoso"}],
+    )
+
+
+def contacts_dataset(**lookup) -> ImportDataset:
+    return ImportDataset(
+        entity_type="contacts",
+        logical_name="contact",
+        key_field="source_id",
+        records=[
+            {"source_id": "C1", "lastname": "Smith", "parentcustomerid": "A1"},
+            {"source_id": "C2", "lastname": "Jones", "parentcustomerid": "A9"},
+        ],
+        lookups=[LookupReference(field="parentcustomerid", target="accounts", **lookup)],
+    )
+
+
+class TestImportPlan:
+    """Test cases for import wave planning."""
+
+    def test_waves_follow_lookups(self, processor):
+        """Test that referenced datasets are imported in earlier waves."""
+        planner = ImportPlanner(processor, [
+            contacts_dataset(navigation_property="parentcustomerid_account"),
+            accounts_dataset(),
+            ImportDataset(entity_type="products", records=[]),
+        ])
+
+        assert planner.plan() == [["accounts", "products"], ["contacts"]]
+
+    def test_cyclic_lookups_are_rejected(self, processor):
+        """Test that cycles must be broken with deferred lookups."""
+        accounts = accounts_dataset()
+        accounts.lookups.append(LookupReference(
+            field="primarycontactid",
+            target="contacts",
+            navigation_property="primarycontactid",
+        ))
+        planner = ImportPlanner(processor, [
+            accounts,
+            contacts_dataset(navigation_property="parentcustomerid_account"),
+        ])
+
+        with pytest.raises(ValidationError):
+            planner.plan()
+
+        accounts.lookups[0].deferred = True
+        assert planner.plan() == [["accounts"], ["contacts"]]
+
+
+class TestImportRun:
+    """Test cases for running planned imports."""
+
+    @pytest.mark.asyncio
+    async def test_lookups_bind_to_created_ids(self, processor, client):
+        """Test that later waves bind lookups to IDs created earlier."""
+        client.get.side_effect = [
+            {"value": []},
+            {"value": [{
+                "ReferencingAttribute": "parentcustomerid",
+                "ReferencedEntity": "account",
+                "ReferencingEntityNavigationPropertyName": "parentcustomerid_account",
+            }]},
+        ]
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([{
+                "status": 204,
+                "headers": {"OData-EntityId": f"https://test/api/data/v9.2/accounts({ACCOUNT_ID})"},
+            }])),
+            make_response(build_batch_response([{"status": 204}])),
+        ]
+        planner = ImportPlanner(processor, [accounts_dataset(), contacts_dataset()])
+
+        result = await planner.run()
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert f'"parentcustomerid_account@odata.bind":"/accounts({ACCOUNT_ID})"' in payload
+        assert '"source_id"' not in payload
+        assert result.entity_ids["accounts"] == {"A1": ACCOUNT_ID}
+        assert result.results["contacts"].successful == 1
+        assert result.results["contacts"].failed == 1
+        assert result.results["contacts"].errors[0]["record_index"] == 1
+
+    def test_key_field_column_is_kept(self, processor):
+        """Test that a key field that is also a column stays in the create body."""
+        accounts = accounts_dataset()
+        planner = ImportPlanner(processor, [accounts])
+        record = accounts.records[0]
+
+        assert planner._build_body(accounts, record, {}) == ({"name": "Contoso"}, None)
+
+        accounts.key_field_is_column = True
+        assert planner._build_body(accounts, record, {}) == (record, None)
+
+    @pytest.mark.asyncio
+    async def test_unresolved_deferred_lookups_are_reported(self, processor, client):
+        """Test that a deferred lookup to a record that was not created is an error."""
+        parent_id = "00000000-0000-0000-0000-000000000002"
+        accounts = ImportDataset(
+            entity_type="accounts",
+            key_field="source_id",
+            records=[
+                {"source_id": "A1", "name": "Contoso", "parent": "A2"},
+                {"source_id": "A2", "name": "Fabrikam", "parent": "A9"},
+            ],
+            lookups=[LookupReference(
+                field="parent", target="accounts", navigation_property="parentaccountid", deferred=True,
+            )],
+        )
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([
+                {"status": 204, "headers": {"OData-EntityId": f"https://test/api/data/v9.2/accounts({ACCOUNT_ID})"}},
+                {"status": 204, "headers": {"OData-EntityId": f"https://test/api/data/v9.2/accounts({parent_id})"}},
+            ])),
+            make_response(build_batch_response([{"status": 204}])),
+        ]
+
+        result = await ImportPlanner(processor, [accounts]).run()
+
+        payload = client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert f"PATCH accounts({ACCOUNT_ID}) HTTP/1.1" in payload
+        assert result.deferred.successful == 1
+        assert result.deferred.failed == 1
+        assert result.deferred.errors[0]["dataset"] == "accounts"
+        assert result.deferred.errors[0]["record_index"] == 1
+        assert "'A9'" in result.deferred.errors[0]["error"]
+        assert result.has_errors
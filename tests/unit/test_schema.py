@@ -0,0 +1,200 @@
+"""
+Unit tests for the schema encoder module.
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk import DataverseSDK
+from dataverse_sdk.exceptions import ConnectionError, ValidationError
+from dataverse_sdk.journal import BulkJournal
+from dataverse_sdk.metadata import MetadataCache
+from dataverse_sdk.models import BulkOperationResult, EntityReference
+from dataverse_sdk.schema import EntityEncoder, SchemaCompiler
+from tests.unit.test_batch import build_batch_response, make_response
+
+
+CONTACT_ID = "00000000-0000-0000-0000-000000000002"
+
+ATTRIBUTES = {
+    "accountid": {"AttributeType": "Uniqueidentifier", "IsValidForUpdate": False},
+    "name": {"AttributeType": "String", "MaxLength": 10},
+    "numberofemployees": {"AttributeType": "Integer", "MinValue": 0, "MaxValue": 1000},
+    "revenue": {"AttributeType": "Money", "Precision": 2},
+    "donotemail": {"AttributeType": "Boolean"},
+    "foundedon": {"AttributeType": "DateTime", "Format": "DateOnly"},
+    "lastcontactedon": {"AttributeType": "DateTime", "Format": "DateAndTime"},
+    "industrycode": {"AttributeType": "Picklist", "Options": {"accounting": 1, "retail": 2}},
+    "regions": {"AttributeType": "Virtual", "MultiSelect": True, "Options": {"north": 1, "south": 2}},
+    "primarycontactid": {
+        "AttributeType": "Lookup",
+        "Targets": ["contact"],
+        "Navigation": {"contact": "primarycontactid"},
+    },
+    "parentid": {
+        "AttributeType": "Customer",
+        "Targets": ["account", "contact"],
+        "Navigation": {"account": "parentid_account", "contact": "parentid_contact"},
+    },
+    "primarycontactidname": {"AttributeType": "String", "AttributeOf": "primarycontactid"},
+    "createdon": {"AttributeType": "DateTime", "IsValidForCreate": False, "IsValidForUpdate": False},
+}
+
+ENTITY_SETS = {"account": "accounts", "contact": "contacts"}
+
+
+@pytest.fixture
+def encoder():
+    """Create an account encoder."""
+    return EntityEncoder("account", ATTRIBUTES, ENTITY_SETS)
+
+
+class TestEntityEncoder:
+    """Test cases for schema-compiled encoders."""
+
+    def test_coercion(self, encoder):
+        """Test that values are converted to their Web API form."""
+        payload = encoder.encode({
+            "name": "Contoso",
+            "numberofemployees": "12",
+            "revenue": Decimal("10.005"),
+            "donotemail": "yes",
+            "foundedon": datetime(2020, 5, 1, 13, 0),
+            "lastcontactedon": datetime(2024, 1, 2, 3, 4, 5),
+            "industrycode": "Retail",
+            "regions": ["north", 2],
+            "primarycontactid": CONTACT_ID,
+            "parentid": EntityReference(entity_type="contacts", entity_id=CONTACT_ID),
+            "ownerid@odata.bind": "/systemusers(1)",
+        })
+
+        assert payload == {
+            "name": "Contoso",
+            "numberofemployees": 12,
+            "revenue": 10.0,
+            "donotemail": True,
+            "foundedon": "2020-05-01",
+            "lastcontactedon": "2024-01-02T03:04:05Z",
+            "industrycode": 2,
+            "regions": "1,2",
+            "primarycontactid@odata.bind": f"/contacts({CONTACT_ID})",
+            "parentid_contact@odata.bind": f"/contacts({CONTACT_ID})",
+            "ownerid@odata.bind": "/systemusers(1)",
+        }
+        assert payload["revenue"] == Decimal("10.00")
+        assert str(payload["revenue"]) == "10.00"
+
+    def test_drops_read_only_and_unknown(self, encoder):
+        """Test that attributes that cannot be written are dropped."""
+        record = {
+            "accountid": CONTACT_ID,
+            "createdon": date(2024, 1, 1),
+            "primarycontactidname": "Jane",
+            "unknown": 1,
+        }
+
+        assert encoder.encode(record) == {"accountid": CONTACT_ID}
+        assert encoder.encode(record, for_update=True) == {}
+
+    def test_invalid_values(self, encoder):
+        """Test that every invalid value is reported."""
+        with pytest.raises(ValidationError) as exc_info:
+            encoder.encode({
+                "name": "x" * 11,
+                "numberofemployees": 5000,
+                "industrycode": 9,
+                "parentid": CONTACT_ID,
+                "primarycontactid": ("account", CONTACT_ID),
+            })
+
+        assert len(exc_info.value.details["errors"]) == 5
+
+    def test_encode_many_separates_rejected(self, encoder):
+        """Test that invalid records are rejected without stopping the rest."""
+        encoded = encoder.encode_many([
+            {"name": "A"},
+            {"name": "x" * 20},
+            {"donotemail": "maybe"},
+            {"name": "D"},
+        ])
+
+        assert encoded.records == [{"name": "A"}, {"name": "D"}]
+        assert encoded.indices == [0, 3]
+        assert [r["index"] for r in encoded.rejected] == [1, 2]
+
+
+class TestSchemaCompiler:
+    """Test cases for encoder compilation and bulk validation."""
+
+    @pytest.mark.asyncio
+    async def test_encoders_are_compiled_once(self):
+        """Test that the compiled encoder is reused until metadata changes."""
+        metadata = MagicMock(spec=MetadataCache)
+        metadata.schemas = {"account"}
+        metadata.resolve = AsyncMock(return_value="account")
+        metadata.get_schema = AsyncMock(return_value=ATTRIBUTES)
+        metadata.entity_set_name = AsyncMock(side_effect=lambda name: ENTITY_SETS[name])
+        compiler = SchemaCompiler(metadata)
+
+        first = await compiler.get_encoder("accounts")
+        assert await compiler.get_encoder("account") is first
+        assert metadata.get_schema.await_count == 1
+
+        metadata.schemas = set()
+        assert await compiler.get_encoder("account") is not first
+
+    @pytest.mark.asyncio
+    async def test_bulk_create_rejects_invalid_rows(self, mock_auth_config):
+        """Test that invalid rows are reported at their input position."""
+        sdk = DataverseSDK(**mock_auth_config)
+        sdk.schema.get_encoder = AsyncMock(return_value=EntityEncoder("account", ATTRIBUTES, ENTITY_SETS))
+        sdk.batch_processor.bulk_create = AsyncMock(return_value=BulkOperationResult(
+            total_processed=2,
+            successful=1,
+            failed=1,
+            errors=[{"batch_index": 0, "operation_index": 1, "error": {"status": 400}}],
+        ))
+
+        result = await sdk.bulk_create(
+            "accounts",
+            [{"name": "A"}, {"name": "x" * 20}, {"name": "C"}],
+            validate=True,
+        )
+
+        sent = sdk.batch_processor.bulk_create.await_args.args[1]
+        assert sent == [{"name": "A"}, {"name": "C"}]
+        assert result.total_processed == 3
+        assert result.failed == 2
+        assert [error["operation_index"] for error in result.errors] == [2, 1]
+        assert "validation_errors" in result.permanent_errors[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_validated_create_resumes_with_journaled_ids(self, mock_auth_config, tmp_path):
+        """Test that a validated create reuses the keys of an interrupted run."""
+        sdk = DataverseSDK(**mock_auth_config)
+        sdk.schema.get_encoder = AsyncMock(return_value=EntityEncoder("account", ATTRIBUTES, ENTITY_SETS))
+        sdk.batch_processor.get_primary_id_attribute = AsyncMock(return_value="accountid")
+        sdk.batch_processor.max_retries = 0
+        sdk.batch_processor.backoff_factor = 0
+        sdk.client._execute_request = AsyncMock(side_effect=ConnectionError("Connection failed"))
+        path = tmp_path / "bulk.journal"
+
+        first = [{"name": "A"}, {"name": "x" * 20}, {"name": "C"}]
+        with BulkJournal(path, "job") as journal:
+            await sdk.bulk_create("accounts", first, validate=True, generate_ids=True, journal=journal)
+
+        sdk.client._execute_request = AsyncMock(return_value=make_response(build_batch_response([
+            {"status": 204}, {"status": 204},
+        ])))
+        second = [{"name": "A"}, {"name": "x" * 20}, {"name": "C"}]
+        with BulkJournal(path, "job") as journal:
+            result = await sdk.bulk_create("accounts", second, validate=True, generate_ids=True, journal=journal)
+
+        payload = sdk.client._execute_request.call_args.kwargs["content"].to_bytes().decode("utf-8")
+        assert [entity["accountid"] for entity in second] == [entity["accountid"] for entity in first]
+        assert f"PATCH accounts({first[2]['accountid']}) HTTP/1.1" in payload
+        assert result.successful == 2
+        assert result.failed == 1
@@ -0,0 +1,274 @@
+"""
+Unit tests for the incremental sync module.
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.exceptions import APIError, ConfigurationError
+from dataverse_sdk.sync import (
+    ChangeTracker,
+    FileStateStore,
+    MemoryStateStore,
+    SyncStateStore,
+    WatermarkExtractor,
+)
+
+
+BASE = "https://test.crm.dynamics.com/api/data/v9.2/"
+
+
+@pytest.fixture
+def client():
+    """Create a mock Dataverse client."""
+    client = MagicMock()
+    client.get = AsyncMock()
+    return client
+
+
+async def collect(tracker, **kwargs):
+    """Collect every change of a sync run."""
+    return [change async for change in tracker.changes("accounts", **kwargs)]
+
+
+class TestChangeTracker:
+    """Test cases for change tracking syncs."""
+
+    @pytest.mark.asyncio
+    async def test_full_load_then_delta(self, client):
+        """Test that the delta link of a full load is followed next time."""
+        store = MemoryStateStore()
+        tracker = ChangeTracker(client, store)
+        client.get.side_effect = [
+            {"value": [{"accountid": "1"}], "@odata.nextLink": f"{BASE}accounts?$skiptoken=1"},
+            {"value": [{"accountid": "2"}], "@odata.deltaLink": f"{BASE}accounts?$deltatoken=A"},
+            {
+                "value": [
+                    {"accountid": "3", "name": "New"},
+                    {"@odata.context": f"{BASE}$metadata#accounts/$deletedEntity", "id": "1", "reason": "deleted"},
+                ],
+                "@odata.deltaLink": f"{BASE}accounts?$deltatoken=B",
+            },
+        ]
+
+        first = await collect(tracker, select=["name"], primary_id_attribute="accountid")
+        assert [c.entity_id for c in first] == ["1", "2"]
+        assert all(c.full_load for c in first)
+        first_call = client.get.await_args_list[0]
+        assert first_call.args[0] == "accounts"
+        assert first_call.kwargs["params"] == {"$select": "name"}
+        assert "odata.track-changes" in first_call.kwargs["headers"]["Prefer"]
+
+        second = await collect(tracker, select=["name"], primary_id_attribute="accountid")
+        assert client.get.await_args.args[0].endswith("$deltatoken=A")
+        assert [(c.change_type, c.entity_id) for c in second] == [("upsert", "3"), ("delete", "1")]
+        assert not second[0].full_load
+        assert store.get(ChangeTracker.state_key("accounts", ["name"]))["delta_link"].endswith("=B")
+
+    @pytest.mark.asyncio
+    async def test_resumes_from_last_completed_page(self, client, tmp_path):
+        """Test that a failed sync resumes from the stored next link."""
+        store = FileStateStore(tmp_path / "state.json")
+        client.get.side_effect = [
+            {"value": [{"accountid": "1"}], "@odata.nextLink": f"{BASE}accounts?$skiptoken=1"},
+            APIError("Server error", status_code=500),
+        ]
+
+        with pytest.raises(APIError):
+            await collect(ChangeTracker(client, store))
+
+        client.get.side_effect = [
+            {"value": [{"accountid": "2"}], "@odata.deltaLink": f"{BASE}accounts?$deltatoken=A"},
+        ]
+        resumed = await collect(ChangeTracker(client, FileStateStore(tmp_path / "state.json")))
+
+        assert client.get.await_args.args[0].endswith("$skiptoken=1")
+        assert len(resumed) == 1 and resumed[0].full_load
+
+    @pytest.mark.asyncio
+    async def test_expired_delta_link_restarts_full_load(self, client):
+        """Test that an expired delta token triggers a new full load."""
+        store = MemoryStateStore()
+        store.set(ChangeTracker.state_key("accounts"), {"delta_link": f"{BASE}accounts?$deltatoken=old"})
+        client.get.side_effect = [
+            APIError("The delta token has expired", status_code=400),
+            {"value": [{"accountid": "1"}], "@odata.deltaLink": f"{BASE}accounts?$deltatoken=new"},
+        ]
+
+        changes = await collect(ChangeTracker(client, store))
+
+        assert client.get.await_args.args[0] == "accounts"
+        assert changes[0].full_load
+
+    @pytest.mark.asyncio
+    async def test_missing_delta_link_is_an_error(self, client):
+        """Test that a table without change tracking is reported instead of stored."""
+        store = MemoryStateStore()
+        client.get.side_effect = [
+            {"value": [{"accountid": "1"}], "@odata.nextLink": f"{BASE}accounts?$skiptoken=1"},
+            {"value": [{"accountid": "2"}]},
+        ]
+        tracker = ChangeTracker(client, store)
+
+        with pytest.raises(ConfigurationError, match="not enabled for accounts"):
+            await collect(tracker)
+        assert store.get(tracker.state_key("accounts")) is None
+
+    def test_incomplete_state_store_is_rejected(self):
+        """Test that a state store missing a method cannot be instantiated."""
+        class ReadOnlyStore(SyncStateStore):
+            def get(self, key):
+                return None
+
+        with pytest.raises(TypeError):
+            ReadOnlyStore()
+
+
+def pages(*responses):
+    """Create a get_pages mock serving one list of pages per call."""
+    calls = []
+
+    def get_pages(endpoint, params=None, page_size=None):
+        calls.append(params)
+        batch = responses[len(calls) - 1]
+
+        async def iterate():
+            for page in batch:
+                if isinstance(page, Exception):
+                    raise page
+                yield page
+
+        return iterate()
+
+    return MagicMock(side_effect=get_pages), calls
+
+
+def reading(id, modified):
+    """Create a record with a modification time."""
+    return {"readingid": id, "modifiedon": f"2024-01-01T00:00:{modified:02d}Z"}
+
+
+class TestWatermarkExtractor:
+    """Test cases for watermark-based incremental extraction."""
+
+    @pytest.mark.asyncio
+    async def test_watermark_committed_after_sink(self, client):
+        """Test that a failing sink does not advance the watermark."""
+        store = MemoryStateStore()
+        client.get_pages, calls = pages(
+            [[reading("a", 1), reading("b", 2)], [reading("c", 3)]],
+            [[reading("c", 3), reading("d", 4)]],
+        )
+        extractor = WatermarkExtractor(client, store, "readings", "readingid", overlap=0)
+        received = []
+
+        async def sink(records):
+            if records[0]["readingid"] == "c" and not received[1:]:
+                received.append(None)
+                raise RuntimeError("sink down")
+            received.append(records)
+
+        with pytest.raises(RuntimeError):
+            await extractor.run(sink)
+        assert store.get(extractor.key) == {
+            "watermark": "2024-01-01T00:00:02Z", "delivered_ids": ["b"]
+        }
+        assert calls[0]["$orderby"] == "modifiedon asc,readingid asc"
+        assert "$filter" not in calls[0]
+
+        assert await extractor.run(sink) == 2
+        assert calls[1]["$filter"] == "modifiedon ge 2024-01-01T00:00:02Z"
+        assert store.get(extractor.key)["delivered_ids"] == ["d"]
+
+    @pytest.mark.asyncio
+    async def test_overlap_and_tie_break(self, client):
+        """Test the overlap window and the records skipped at the watermark."""
+        store = MemoryStateStore()
+        client.get_pages, calls = pages(
+            [[reading("B", 5), reading("a", 5), reading("b", 5), reading("c", 6)]],
+            [[reading("a", 5)]],
+        )
+        store.set("k", {"watermark": "2024-01-01T00:00:05Z", "delivered_ids": ["a"]})
+
+        exact = WatermarkExtractor(client, store, "readings", "readingid", overlap=0, key="k")
+        received = []
+
+        async def sink(records):
+            received.extend(r["readingid"] for r in records)
+
+        assert await exact.run(sink) == 3
+        assert received == ["B", "b", "c"]
+        assert calls[0]["$filter"] == "modifiedon ge 2024-01-01T00:00:05Z"
+
+        overlapping = WatermarkExtractor(
+            client, store, "readings", "readingid", filter="statecode eq 0", overlap=30, key="k"
+        )
+        await overlapping.run(sink)
+        assert calls[1]["$filter"] == "(statecode eq 0) and modifiedon ge 2023-12-31T23:59:36Z"
+
+    @pytest.mark.asyncio
+    async def test_partitioned_backfill(self, client):
+        """Test that the first run is split into parallel time ranges."""
+        store = MemoryStateStore()
+        client.get.return_value = {"value": [{"modifiedon": "2020-01-01T00:00:00Z"}]}
+        client.get_pages, calls = pages([[reading("a", 1)]], [[reading("b", 2)]], [[]], [[]])
+        extractor = WatermarkExtractor(client, store, "readings", "readingid", select=["value"])
+        received = []
+
+        async def sink(records):
+            received.extend(records)
+
+        assert await extractor.run(sink, partitions=4) == 2
+
+        filters = [params["$filter"] for params in calls]
+        assert "ge" not in filters[0] and "lt" in filters[0]
+        assert all(" ge " in f and " lt " in f for f in filters[1:])
+        assert calls[0]["$select"] == "value,modifiedon,readingid"
+        state = store.get(extractor.key)
+        assert "partitions" not in state
+        assert state["watermark"] == filters[-1].split(" lt ")[1]
+
+    @pytest.mark.asyncio
+    async def test_same_second_records_across_pages(self, client):
+        """Test that records sharing the watermark second are neither lost nor repeated."""
+        store = MemoryStateStore()
+        client.get_pages, calls = pages(
+            [[reading("f", 7), reading("0", 7)], [reading("c", 7)]],
+            [[reading("f", 7), reading("0", 7), reading("c", 7), reading("1", 7)]],
+        )
+        extractor = WatermarkExtractor(client, store, "readings", "readingid", overlap=0)
+        received = []
+
+        async def sink(records):
+            received.extend(r["readingid"] for r in records)
+
+        await extractor.run(sink)
+        assert store.get(extractor.key)["delivered_ids"] == ["f", "0", "c"]
+
+        await extractor.run(sink)
+        assert received == ["f", "0", "c", "1"]
+        assert store.get(extractor.key)["delivered_ids"] == ["f", "0", "c", "1"]
+
+    @pytest.mark.asyncio
+    async def test_backfill_partition_resumes_at_watermark(self, client):
+        """Test that an interrupted partition re-reads its watermark second inclusively."""
+        store = MemoryStateStore()
+        store.set("k", {
+            "upper": "2024-01-02T00:00:00Z",
+            "partitions": [
+                {"lower": None, "upper": "2024-01-02T00:00:00Z",
+                 "watermark": "2024-01-01T00:00:07Z", "delivered_ids": ["f"]},
+            ],
+        })
+        client.get_pages, calls = pages([[reading("0", 7), reading("f", 7), reading("g", 8)]])
+        extractor = WatermarkExtractor(client, store, "readings", "readingid", key="k")
+        received = []
+
+        async def sink(records):
+            received.extend(r["readingid"] for r in records)
+
+        assert await extractor.run(sink) == 2
+        assert received == ["0", "g"]
+        assert "modifiedon ge 2024-01-01T00:00:07Z" in calls[0]["$filter"]
+        assert store.get("k") == {"watermark": "2024-01-02T00:00:00Z", "delivered_ids": []}
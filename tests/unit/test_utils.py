@@ -0,0 +1,46 @@
+"""
+Unit tests for the utils module.
+"""
+
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+
+from dataverse_sdk.utils import format_alternate_key, format_odata_literal, is_guid
+
+
+class TestODataLiterals:
+    """Test cases for OData literal formatting."""
+
+    def test_numbers_and_strings(self):
+        """Test that numbers are bare and strings are quoted."""
+        guid = uuid.UUID(int=1)
+
+        assert format_odata_literal(None) == "null"
+        assert format_odata_literal(True) == "true"
+        assert format_odata_literal(12) == "12"
+        assert format_odata_literal(Decimal("12.50")) == "12.50"
+        assert format_odata_literal(Decimal("1E+2")) == "100"
+        assert format_odata_literal(guid) == str(guid)
+        assert format_odata_literal("O'Neil") == "'O''Neil'"
+
+    def test_datetimes_are_utc(self):
+        """Test that datetimes are written in UTC with a Z suffix."""
+        offset = timezone(timedelta(hours=-3))
+
+        assert format_odata_literal(datetime(2024, 1, 2, 3, 4, 5)) == "2024-01-02T03:04:05Z"
+        assert format_odata_literal(datetime(2024, 1, 2, 3, 4, 5, tzinfo=offset)) == "2024-01-02T06:04:05Z"
+        assert format_odata_literal(date(2024, 1, 2)) == "2024-01-02"
+        assert format_alternate_key({"modifiedon": datetime(2024, 1, 2)}) == "modifiedon=2024-01-02T00:00:00Z"
+
+
+class TestGuids:
+    """Test cases for GUID recognition."""
+
+    def test_is_guid(self):
+        """Test that only canonical GUIDs are recognized."""
+        assert is_guid("00000000-0000-0000-0000-00000000000A")
+        assert is_guid(uuid.UUID(int=1))
+        assert not is_guid("{00000000-0000-0000-0000-000000000001}")
+        assert not is_guid("accountnumber='A1'")
+        assert not is_guid(None)
@@ -0,0 +1,100 @@
+"""
+Unit tests for the write batcher module.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from dataverse_sdk.batch import BatchProcessor
+from dataverse_sdk.exceptions import APIError
+from dataverse_sdk.hooks import HookManager
+from dataverse_sdk.writer import WriteBatcher, current_write_batcher
+from tests.unit.test_batch import build_batch_response, make_response
+
+
+ACCOUNT_ID = "00000000-0000-0000-0000-000000000001"
+
+
+@pytest.fixture
+def client():
+    """Create a mock Dataverse client."""
+    client = MagicMock()
+    client.api_base_url = "https://test.crm.dynamics.com/api/data/v9.2/"
+    client.hook_manager = HookManager()
+    client._execute_request = AsyncMock()
+    return client
+
+
+@pytest.fixture
+def processor(client):
+    """Create a batch processor without backoff delays."""
+    return BatchProcessor(client, backoff_factor=0)
+
+
+class TestWriteBatcher:
+    """Test cases for write-behind auto-batching."""
+
+    @pytest.mark.asyncio
+    async def test_writes_share_one_batch(self, processor, client):
+        """Test that queued writes are sent together and resolved separately."""
+        client._execute_request.return_value = make_response(build_batch_response([
+            {
+                "status": 204,
+                "headers": {"OData-EntityId": f"https://test/api/data/v9.2/accounts({ACCOUNT_ID})"},
+            },
+            {"status": 204},
+            {"status": 404, "body": {"error": {"message": "Does not exist"}}},
+        ]))
+
+        async with WriteBatcher(processor, max_delay_ms=5) as batcher:
+            assert current_write_batcher() is batcher
+            results = await asyncio.gather(
+                batcher.submit({"method": "POST", "url": "accounts", "body": {"name": "A"}}),
+                batcher.submit({"method": "PATCH", "url": f"accounts({ACCOUNT_ID})", "body": {"name": "B"}}),
+                batcher.submit({"method": "DELETE", "url": "accounts(missing)"}),
+                return_exceptions=True,
+            )
+
+        assert current_write_batcher() is None
+        assert client._execute_request.await_count == 1
+        assert results[0]["entity_id"] == ACCOUNT_ID
+        assert results[1]["status"] == 204
+        assert isinstance(results[2], APIError)
+        assert results[2].status_code == 404
+        assert results[2].message == "Does not exist"
+
+    @pytest.mark.asyncio
+    async def test_exit_flushes_pending_writes(self, processor, client):
+        """Test that writes still queued are sent when the session exits."""
+        client._execute_request.return_value = make_response(
+            build_batch_response([{"status": 204}])
+        )
+
+        async with WriteBatcher(processor, max_delay_ms=60_000) as batcher:
+            task = asyncio.ensure_future(batcher.submit({"method": "DELETE", "url": "accounts(1)"}))
+            await asyncio.sleep(0)
+
+        assert (await task)["status"] == 204
+
+    @pytest.mark.asyncio
+    async def test_full_queue_is_sent_immediately(self, processor, client):
+        """Test that the queue is flushed as soon as it reaches max_size."""
+        client._execute_request.side_effect = [
+            make_response(build_batch_response([{"status": 204}, {"status": 204}])),
+            make_response(build_batch_response([{"status": 204}])),
+        ]
+
+        async with WriteBatcher(processor, max_delay_ms=60_000, max_size=2) as batcher:
+            first = asyncio.ensure_future(asyncio.gather(
+                batcher.submit({"method": "DELETE", "url": "accounts(1)"}),
+                batcher.submit({"method": "DELETE", "url": "accounts(2)"}),
+            ))
+            await asyncio.wait_for(first, timeout=1)
+            await asyncio.gather(
+                batcher.submit({"method": "DELETE", "url": "accounts(3)"}),
+                batcher.flush(),
+            )
+
+        assert client._execute_request.await_count == 2